@@ -92,6 +92,15 @@ fi
 # -----------------------------------------------------------------------
 EVENTS_FILE="$WORKSPACE/events/events.jsonl"
 
+# Append one event line under the same flock the engine's writers take, so
+# repair_event_log never mistakes an in-flight hook write for a torn tail.
+append_event() {
+  python3 -c 'import fcntl, sys
+with open(sys.argv[1], "a") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    f.write(sys.argv[2] + "\n")' "$1" "$2"
+}
+
 # Ensure events directory exists
 mkdir -p "$(dirname "$EVENTS_FILE")"
 
@@ -113,7 +122,7 @@ EVENT=$(jq -nc \
     tool: $tool
   }')
 
-echo "$EVENT" >> "$EVENTS_FILE"
+append_event "$EVENTS_FILE" "$EVENT"
 
 # -----------------------------------------------------------------------
 # First-write detection: emit edge_started on first write to new asset type
@@ -152,7 +161,7 @@ if [ ! -f "$SESSION_FILE" ] || ! grep -q "^${ASSET_TYPE}$" "$SESSION_FILE" 2>/de
       first_file: $fp
     }')
 
-  echo "$EDGE_EVENT" >> "$EVENTS_FILE"
+  append_event "$EVENTS_FILE" "$EDGE_EVENT"
 fi
 
 exit 0
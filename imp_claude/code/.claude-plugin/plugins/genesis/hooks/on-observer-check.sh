@@ -38,6 +38,15 @@ if [ ! -d "$WORKSPACE" ]; then
 fi
 
 EVENTS_FILE="$WORKSPACE/events/events.jsonl"
+
+# Append one event line under the same flock the engine's writers take, so
+# repair_event_log never mistakes an in-flight hook write for a torn tail.
+append_event() {
+  python3 -c 'import fcntl, sys
+with open(sys.argv[1], "a") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    f.write(sys.argv[2] + "\n")' "$1" "$2"
+}
 TIMESTAMP=$(date -u "+%Y-%m-%dT%H:%M:%SZ")
 
 # Resolve project name for events
@@ -53,7 +62,7 @@ emit_event() {
 
   if [ -d "$WORKSPACE/events" ]; then
     EVENT="{\"event_type\":\"${event_type}\",\"timestamp\":\"${ts}\",\"project\":\"${PROJ_NAME}\",\"observer_id\":\"${observer_id}\",\"data\":{\"trigger\":\"${TRIGGER_EVENT}\",\"context\":\"${context}\",\"hook\":\"on-observer-check.sh\"}}"
-    echo "$EVENT" >> "${EVENTS_FILE:-$WORKSPACE/events/events.jsonl}"
+    append_event "${EVENTS_FILE:-$WORKSPACE/events/events.jsonl}" "$EVENT"
   fi
 }
 
@@ -33,6 +33,15 @@ fi
 rm -f "$WORKSPACE/.session_assets_seen"
 
 EVENTS_FILE="$WORKSPACE/events/events.jsonl"
+
+# Append one event line under the same flock the engine's writers take, so
+# repair_event_log never mistakes an in-flight hook write for a torn tail.
+append_event() {
+  python3 -c 'import fcntl, sys
+with open(sys.argv[1], "a") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    f.write(sys.argv[2] + "\n")' "$1" "$2"
+}
 ISSUES=""
 ISSUE_COUNT=0
 
@@ -124,7 +133,7 @@ if [ -f "$EDGE_FILE" ]; then
     PROJ_NAME=$(grep 'name:' "$WORKSPACE"/*/context/project_constraints.yml 2>/dev/null | head -1 | sed 's/.*name: *"\{0,1\}\([^"]*\)"\{0,1\}/\1/' || echo "unknown")
     TIMESTAMP=$(date -u "+%Y-%m-%dT%H:%M:%SZ")
     EVENT="{\"event_type\":\"iteration_abandoned\",\"timestamp\":\"$TIMESTAMP\",\"project\":\"$PROJ_NAME\",\"feature\":\"\",\"edge\":\"$ABANDONED_EDGE\",\"data\":{\"last_iteration\":$LAST_ITER,\"seconds_since_last_event\":$SECONDS_SINCE}}"
-    echo "$EVENT" >> "${EVENTS_FILE:-$WORKSPACE/events/events.jsonl}"
+    append_event "${EVENTS_FILE:-$WORKSPACE/events/events.jsonl}" "$EVENT"
   fi
 
   ISSUES="${ISSUES}  [!] Abandoned iteration: edge '${ABANDONED_EDGE}' was in progress when previous session ended\n"
@@ -28,6 +28,15 @@ CWD=$(echo "$INPUT" | jq -r '.cwd // empty')
 REVIEW_ID=$(echo "$INPUT" | jq -r '.review_id // empty')
 EVENTS_FILE="${CWD}/.ai-workspace/events/events.jsonl"
 
+# Append one event line under the same flock the engine's writers take, so
+# repair_event_log never mistakes an in-flight hook write for a torn tail.
+append_event() {
+  python3 -c 'import fcntl, sys
+with open(sys.argv[1], "a") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    f.write(sys.argv[2] + "\n")' "$1" "$2"
+}
+
 if [ -z "$CWD" ] || [ -z "$REVIEW_ID" ]; then
   echo "[on-vote-received] ERROR: cwd and review_id are required" >&2
   exit 1
@@ -205,7 +214,7 @@ if [ "$CONVERGED" = "true" ]; then
       }
     }')
 
-  echo "$EVENT" >> "$EVENTS_FILE"
+  append_event "$EVENTS_FILE" "$EVENT"
   echo "[on-vote-received] → consensus_reached written to events.jsonl"
 
   # 2. If artifact is an ADR markdown file, update Status → Accepted
@@ -261,7 +270,7 @@ else
         }
       }')
 
-    echo "$EVENT" >> "$EVENTS_FILE"
+    append_event "$EVENTS_FILE" "$EVENT"
     echo "[on-vote-received] → consensus_failed written to events.jsonl"
     echo ""
     echo "✗ consensus_failed — $FAILURE_REASON. Available: $AVAILABLE_PATHS"
@@ -29,6 +29,15 @@ REPO_ROOT=$(git rev-parse --show-toplevel 2>/dev/null) || exit 0
 WORKSPACE="$REPO_ROOT/.ai-workspace"
 EVENTS_FILE="$WORKSPACE/events/events.jsonl"
 
+# Append one event line under the same flock the engine's writers take, so
+# repair_event_log never mistakes an in-flight hook write for a torn tail.
+append_event() {
+  python3 -c 'import fcntl, sys
+with open(sys.argv[1], "a") as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    f.write(sys.argv[2] + "\n")' "$1" "$2"
+}
+
 # Only activate if .ai-workspace exists (project is initialised)
 if [ ! -d "$WORKSPACE" ]; then
   exit 0
@@ -122,7 +131,7 @@ while IFS= read -r FILE; do
       actor:            $actor
     }')
 
-  echo "$EVENT" >> "$EVENTS_FILE"
+  append_event "$EVENTS_FILE" "$EVENT"
 
 done <<< "$CHANGED_SPEC_FILES"
 
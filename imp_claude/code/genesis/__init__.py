@@ -22,7 +22,7 @@ from .config_loader import (
     resolve_variables,
     resolve_checklist,
 )
-from .fd_evaluate import evaluate_checklist, run_check
+from .fd_evaluate import evaluate_checklist, run_check, run_checks
 from .ol_event import emit_ol_event, make_ol_event, normalize_event
 from .fd_classify import (
     classify_req_tag,
@@ -71,6 +71,7 @@ __all__ = [
     "resolve_checklist",
     # Evaluate
     "run_check",
+    "run_checks",
     "evaluate_checklist",
     # Emit (OL format)
     "emit_ol_event",
@@ -138,17 +138,43 @@ def _emit_command_error(
         pass  # Observation failure must not block error reporting
 
 
+def _recover_event_log(workspace: Path, project: str) -> None:
+    """Repair a torn final line in events.jsonl left by a crashed writer (REQ-ROBUST-003).
+
+    Emits event_log_repaired when a repair was made, then seals the active
+    segment if a segment threshold is configured. Idempotent.
+    """
+    from .event_segments import maybe_seal_segment
+    from .ol_event import recover_event_log
+
+    events_path = workspace / ".ai-workspace" / "events" / "events.jsonl"
+    try:
+        repair = recover_event_log(events_path, project)
+        # Seal the active segment when GENESIS_EVENT_SEGMENT_* thresholds are set
+        maybe_seal_segment(events_path)
+    except Exception:
+        return  # Observation failure must not block engine startup
+    if repair:
+        print(
+            f"genesis: repaired torn final line in events.jsonl "
+            f"({repair['action']}, {repair['dropped_bytes']} bytes dropped)",
+            file=sys.stderr,
+        )
+
+
 def _check_session_gaps(workspace: Path, project: str) -> None:
     """Detect and emit events for abandoned iterations (REQ-ROBUST-008).
 
-    Scans the event log for edge_started events with no subsequent completion.
+    Repairs a torn final line first, then scans the event log for
+    edge_started events with no subsequent completion.
     Emits iteration_abandoned events for each detected gap. Idempotent.
     """
     from .ol_event import emit_ol_event, make_ol_event
-    from .workspace_state import detect_abandoned_iterations, load_events
+    from .workspace_state import load_abandoned_iterations
+
+    _recover_event_log(workspace, project)
 
-    events = load_events(workspace)
-    abandoned = detect_abandoned_iterations(events)
+    abandoned = load_abandoned_iterations(workspace)
 
     if not abandoned:
         return
@@ -568,6 +594,8 @@ def cmd_start(args: argparse.Namespace) -> int:
         except Exception:
             pass
 
+    _recover_event_log(workspace, project_name)
+
     # --- Find targets ---------------------------------------------------------
     # 1. Pending intents first (homeostatic loop)
     targets = get_pending_dispatches(workspace)
@@ -801,7 +829,11 @@ def cmd_context(args: argparse.Namespace) -> int:
     events_path = ws / "events" / "events.jsonl"
     recent_events: list[str] = []
     if events_path.exists():
-        lines = events_path.read_text().splitlines()
+        from .event_segments import logical_size, read_logical
+
+        # The log's tail, which may reach back into sealed segments
+        tail = read_logical(events_path, max(0, logical_size(events_path) - 65536))
+        lines = tail.decode("utf-8", errors="replace").splitlines()
         for line in reversed(lines[-20:]):
             try:
                 e = json.loads(line)
@@ -921,6 +953,50 @@ def cmd_emit_event(args: argparse.Namespace) -> int:
     return 0
 
 
+# ── compact-events subcommand ────────────────────────────────────
+# Implements: REQ-EVENT-001 (Event Log as Source of Truth)
+
+
+def cmd_compact_events(args: argparse.Namespace) -> int:
+    """Write columnar archives (.gevc) of historical event files.
+
+    With no paths, archives every sealed segment of the workspace log that
+    lacks one. Paths may be JSONL files or directories holding an events
+    log (e.g. archived e2e run directories). Prints one JSON stats record
+    per archive written.
+
+    Usage:
+        python -m genesis compact-events
+        python -m genesis compact-events tests/e2e/runs/e2e_*/
+    """
+    from dataclasses import asdict
+
+    from .event_archive import compact_jsonl
+    from .event_segments import compact_segments
+
+    try:
+        if args.paths:
+            written = [compact_jsonl(_events_file_for(Path(raw))) for raw in args.paths]
+        else:
+            workspace = Path(args.workspace) if args.workspace else _find_workspace(Path.cwd())
+            written = compact_segments(workspace / ".ai-workspace" / "events" / "events.jsonl")
+    except (OSError, ValueError) as exc:
+        print(json.dumps({"error": f"compaction failed: {exc}"}), file=sys.stderr)
+        return 1
+
+    for stats in written:
+        print(json.dumps(asdict(stats)))
+    return 0
+
+
+def _events_file_for(path: Path) -> Path:
+    """Resolve a run/workspace directory to its events.jsonl; files pass through."""
+    if not path.is_dir():
+        return path
+    nested = path / ".ai-workspace" / "events" / "events.jsonl"
+    return nested if nested.exists() else path / "events.jsonl"
+
+
 # \u2500\u2500 Shared CLI args \u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500
 
 
@@ -1104,6 +1180,20 @@ def main() -> int:
         help="Workspace root (auto-detected if omitted)",
     )
 
+    # compact-events subcommand — columnar archives of sealed history
+    compact_parser = subparsers.add_parser(
+        "compact-events",
+        help="Write compact columnar archives (.gevc) of sealed event history",
+    )
+    compact_parser.add_argument(
+        "paths", nargs="*",
+        help="JSONL files or run directories (default: the workspace's sealed segments)",
+    )
+    compact_parser.add_argument(
+        "--workspace", default=None,
+        help="Workspace root (auto-detected if omitted)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "evaluate":
@@ -1120,6 +1210,8 @@ def main() -> int:
         return cmd_check_tags(args)
     elif args.command == "emit-event":
         return cmd_emit_event(args)
+    elif args.command == "compact-events":
+        return cmd_compact_events(args)
     else:
         parser.print_help()
         return 1
@@ -0,0 +1,223 @@
+# Implements: REQ-EVAL-002 (Evaluator Composition), REQ-ITER-003 (Functor Encoding Tracking)
+"""Content-addressed cache of deterministic check results.
+
+A deterministic check is a pure function of its command, its pass
+criterion, the files it reads and a few environment variables. When none of
+those changed since the last run, its result is reused instead of running
+the subprocess again — re-entering an edge after a fold-back that only
+touched docs does not re-run the test suite.
+
+Only checks that declare their inputs are cached (edge_params):
+
+    - name: tests_pass
+      command: "$tools.test_runner.command $tools.test_runner.args"
+      inputs: "$tools.test_runner.inputs"      # globs: list or space-separated
+      input_env: [DATABASE_URL]                 # optional env vars that matter
+
+Key = sha256 of (command, pass_criterion, input-file hash, input_env values,
+Python version, installed distributions). The input-file hash covers every
+file matching the globs under the working directory — relative path and
+content — skipping VCS, workspace and tool-cache directories and coverage
+output. The project template declares ``inputs: "**"``: tests read
+fixtures and data files, not just ``*.py``. The distribution set (name and
+version of everything importlib.metadata sees in the engine's environment)
+makes a package upgrade a miss. Content hashes come from the
+workspace StatCache (workspace_fingerprint), so computing a key costs one
+stat() per matching file and re-reads only files whose stat changed. An
+unresolvable ``inputs`` variable makes the check uncacheable, never skipped.
+
+Entries live under .ai-workspace/cache/checks/<key[:2]>/<key>.json and hold
+the CheckResult with stdout/stderr tails. Only PASS and FAIL are stored:
+ERROR (stall, wall ceiling, spawn failure) is treated as transient. The
+cache is disposable — deleting the directory is always safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .models import CheckOutcome, CheckResult, ResolvedCheck
+from .workspace_fingerprint import StatCache, default_cache_dir
+
+CACHE_VERSION = 2
+TAIL_CHARS = 4000  # stdout/stderr/message characters kept per entry
+
+# Directories never hashed as check inputs
+_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".ai-workspace", "__pycache__", "node_modules", ".venv", "venv",
+    ".tox", ".nox", ".pytest_cache", ".mypy_cache", ".ruff_cache", "htmlcov",
+})
+# Files checks write into the tree themselves (coverage data and reports)
+_SKIP_FILE = re.compile(r"\.coverage(?:\..*)?\Z|coverage\.xml\Z")
+_CACHED_OUTCOMES = (CheckOutcome.PASS, CheckOutcome.FAIL)
+
+
+def input_patterns(inputs: Union[str, list[str], None]) -> Optional[list[str]]:
+    """Normalise an ``inputs`` declaration to a list of globs (None if absent)."""
+    if inputs is None:
+        return None
+    if isinstance(inputs, str):
+        return inputs.split()
+    return [str(p) for p in inputs]
+
+
+@lru_cache(maxsize=256)
+def _glob_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a glob over relative POSIX paths. ``**/`` spans zero or more directories."""
+    out, i = [], 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+def hash_inputs(cwd: Path, patterns: list[str], stat_cache: Optional[StatCache] = None) -> str:
+    """sha256 over (relative path, content hash) of every file matching *patterns*.
+
+    File contents are hashed through *stat_cache* (an in-memory one if None).
+    """
+    stat_cache = stat_cache if stat_cache is not None else StatCache()
+    regexes = [_glob_regex(p) for p in patterns]
+    matched: list[str] = []
+    for root, dirs, files in os.walk(cwd):
+        dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS)
+        rel_root = os.path.relpath(root, cwd)
+        for name in files:
+            if _SKIP_FILE.match(name):
+                continue
+            rel = name if rel_root == "." else f"{rel_root}/{name}".replace(os.sep, "/")
+            if any(r.match(rel) for r in regexes):
+                matched.append(rel)
+
+    digest = hashlib.sha256()
+    for rel in sorted(matched):
+        try:
+            content = stat_cache.sha256(Path(cwd) / rel)
+        except OSError:
+            content = "unreadable"
+        digest.update(f"{rel}\0{content}\n".encode())
+    return digest.hexdigest()
+
+
+def dependency_fingerprint() -> str:
+    """sha256 over the (name, version) of every installed distribution."""
+    installed = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.add(f"{name.lower()}=={dist.version}")
+    return hashlib.sha256("\n".join(sorted(installed)).encode()).hexdigest()
+
+
+class CheckCache:
+    """Result cache for one workspace. Safe to share between run_checks() threads."""
+
+    def __init__(self, workspace: Path) -> None:
+        self.dir = Path(workspace) / ".ai-workspace" / "cache" / "checks"
+        self.stat_cache = StatCache(default_cache_dir(Path(workspace)) / "stat_cache.json")
+        self.hits = 0
+        self.misses = 0
+        self._dependencies: Optional[str] = None  # computed on first key()
+
+    def key(self, check: ResolvedCheck, cwd: Path) -> Optional[str]:
+        """Cache key for *check* run in *cwd*, or None if it is not cacheable."""
+        if (
+            check.check_type != "deterministic"
+            or not check.command
+            or check.unresolved
+            or check.inputs is None
+        ):
+            return None
+        material = {
+            "version": CACHE_VERSION,
+            "command": check.command,
+            "pass_criterion": check.pass_criterion,
+            "inputs": hash_inputs(Path(cwd), check.inputs, self.stat_cache),
+            "env": {name: os.environ.get(name) for name in sorted(check.input_env)},
+            "python": sys.version,
+            "dependencies": self.dependencies(),
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+    def dependencies(self) -> str:
+        """dependency_fingerprint(), taken once per cache instance (one edge run)."""
+        if self._dependencies is None:
+            self._dependencies = dependency_fingerprint()
+        return self._dependencies
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, check: ResolvedCheck) -> Optional[CheckResult]:
+        """Cached result for *key*, labelled with *check*'s name and flags."""
+        try:
+            entry = json.loads(self._path(key).read_text())
+            outcome = CheckOutcome(entry["outcome"])
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CheckResult(
+            name=check.name,
+            outcome=outcome,
+            required=check.required,
+            check_type=check.check_type,
+            functional_unit=check.functional_unit,
+            message=entry.get("message", ""),
+            command=check.command or "",
+            exit_code=entry.get("exit_code"),
+            stdout=entry.get("stdout", ""),
+            stderr=entry.get("stderr", ""),
+            cached=True,
+        )
+
+    def put(self, key: str, result: CheckResult) -> None:
+        """Store *result* under *key* if its outcome is cacheable. Best-effort."""
+        if result.outcome not in _CACHED_OUTCOMES:
+            return
+        entry: dict[str, Any] = {
+            "outcome": result.outcome.value,
+            "exit_code": result.exit_code,
+            "message": result.message[-TAIL_CHARS:],
+            "stdout": result.stdout[-TAIL_CHARS:],
+            "stderr": result.stderr[-TAIL_CHARS:],
+        }
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(entry))
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def save(self) -> None:
+        """Persist file hashes learned while computing keys. Best-effort."""
+        self.stat_cache.save()
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        for path in self.dir.glob("*/*.json"):
+            path.unlink(missing_ok=True)
@@ -12,15 +12,19 @@ from typing import Optional, Any
 
 import yaml
 
+from . import yaml_cache
+from .check_cache import input_patterns
 from .models import ResolvedCheck
 
 _VAR_PATTERN = re.compile(r"\$(\w+(?:\.\w+)*)")
 
 
 def load_yaml(path: pathlib.Path) -> dict:
-    """Load a YAML file, merging multiple documents into one dict."""
-    with open(path) as f:
-        docs = list(yaml.safe_load_all(f))
+    """Load a YAML file, merging multiple documents into one dict.
+
+    Parsed through yaml_cache, so unchanged files are not re-parsed.
+    """
+    docs = yaml_cache.load(path, all_documents=True)
     result = {}
     for doc in docs:
         if doc is not None:
@@ -168,27 +172,28 @@ def load_six_level_context(
 
 import hashlib
 
+from .workspace_fingerprint import StatCache
 
-def _sha256_file(path: pathlib.Path) -> str:
-    """Return the hex SHA-256 digest of a file's contents."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+# Process-wide stat cache: unchanged context files are not re-read per manifest
+_MANIFEST_STAT_CACHE = StatCache()
 
 
 def generate_context_manifest(
     context_files: list[pathlib.Path],
+    stat_cache: Optional[StatCache] = None,
 ) -> dict[str, Any]:
     """Generate a context manifest for reproducibility (ADR-S-022 §2).
 
     Scans the provided paths, hashes each existing file, then computes an
-    aggregate hash over the sorted ``{path: sha256}`` mapping.
+    aggregate hash over the sorted ``{path: sha256}`` mapping. File hashes
+    come from *stat_cache* (default: a process-wide in-memory cache), so a
+    file is only re-read when its size, mtime or inode changed.
 
     Args:
         context_files: The context paths that were (or should be) loaded.
             Missing files are recorded as ``null`` hash.
+        stat_cache: Optional persisted cache, e.g.
+            ``StatCache(default_cache_dir(workspace) / "stat_cache.json")``.
 
     Returns:
         Dict with keys:
@@ -197,11 +202,12 @@ def generate_context_manifest(
         - ``file_count``: total paths in the manifest
         - ``present_count``: number of files actually found
     """
+    cache = stat_cache if stat_cache is not None else _MANIFEST_STAT_CACHE
     file_entries: dict[str, Optional[str]] = {}
     for path in sorted(context_files, key=str):
-        if path.exists():
-            file_entries[str(path)] = _sha256_file(path)
-        else:
+        try:
+            file_entries[str(path)] = cache.sha256(path)
+        except OSError:
             file_entries[str(path)] = None
 
     # Aggregate hash: sha256 of all present entries joined as "path:hash\n"
@@ -209,6 +215,8 @@ def generate_context_manifest(
         f"{p}:{h}" for p, h in file_entries.items() if h is not None
     )
     agg = hashlib.sha256("\n".join(present_pairs).encode()).hexdigest()
+    if stat_cache is not None:
+        stat_cache.save()
 
     return {
         "files": file_entries,
@@ -321,6 +329,18 @@ def resolve_checklist(edge_config: dict, constraints: dict) -> list[ResolvedChec
             pass_criterion, unr = resolve_variables(pass_criterion, constraints)
             all_unresolved.extend(unr)
 
+        # Resolve cache inputs — unresolvable inputs make the check uncacheable, not skipped
+        inputs = input_patterns(entry.get("inputs"))
+        if inputs is not None:
+            resolved_inputs = []
+            for pattern in inputs:
+                value, unr = resolve_variables(pattern, constraints)
+                if unr:
+                    resolved_inputs = None
+                    break
+                resolved_inputs.extend(value.split())
+            inputs = resolved_inputs
+
         # Resolve required (can be a $variable string like "$tools.type_checker.required")
         required_raw = entry.get("required", True)
         if isinstance(required_raw, str):
@@ -341,6 +361,10 @@ def resolve_checklist(edge_config: dict, constraints: dict) -> list[ResolvedChec
                 command=command,
                 pass_criterion=pass_criterion,
                 unresolved=all_unresolved,
+                exclusive=bool(entry.get("exclusive", False)),
+                group=str(entry["group"]) if entry.get("group") else None,
+                inputs=inputs,
+                input_env=input_patterns(entry.get("input_env")) or [],
             )
         )
 
@@ -32,6 +32,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from .event_index import EventIndex
 
 # ── Types ─────────────────────────────────────────────────────────────────────
 
@@ -287,7 +288,7 @@ def _effective_votes(all_votes: list[Vote]) -> list[Vote]:
 
 
 def project_review_state(
-    events: list[dict],
+    events: list[dict] | EventIndex,
     review_id: str,
     review_closes_at: datetime,
 ) -> tuple[list[Vote], list[Comment]]:
@@ -306,14 +307,18 @@ def project_review_state(
       `materiality: material` resets all prior votes. Comments are unaffected.
 
     Args:
-        events:           All events from events.jsonl (already parsed)
+        events:           All events from events.jsonl (already parsed), or an
+                          EventIndex over them — then only review_id's events are read
         review_id:        The review session key
         review_closes_at: Determines gating status of each comment
 
     Returns:
         (votes, comments) — inputs to evaluate_quorum(), votes already deduplicated
     """
-    scoped = [e for e in events if e.get("review_id") == review_id]
+    if isinstance(events, EventIndex):
+        scoped = events.lookup(review_id=review_id)
+    else:
+        scoped = [e for e in events if e.get("review_id") == review_id]
 
     raw_votes: list[Vote] = []
     comments: list[Comment] = []
@@ -12,23 +12,49 @@ Design decisions:
 - Deduplication: edge_started as idempotency marker prevents double-dispatch
 - Summary tracking: {rounds, dispatched, converged, fp_dispatched, fh_required, stuck}
 - Graceful degradation: errors in one target don't stop others
+
+Parallel mode (max_workers > 1, or $GENESIS_DISPATCH_WORKERS):
+- Pending targets are grouped by feature, then partitioned into orthogonal
+  groups (feature_parallelism.find_orthogonal_groups) — features in a group
+  share no modules. Groups run one after another; the features of a group
+  run concurrently in a process pool, each feature's edges in order.
+- Modules come from feature_module_map, else each feature vector's
+  ``modules`` list. A feature that declares none conflicts with every
+  other feature, so it never runs alongside anything.
+- Edges are claimed through the ADR-013 serialiser (stage_claim +
+  process_inbox) before a group starts and released after it, even if the
+  group fails; a target whose claim another agent holds is deferred to a
+  later round.
+- Pool workers append to events.jsonl themselves, through the flocked
+  append path like every other writer, so each feature's runner and engine
+  events land in the order they happened — the same order as a sequential
+  run — and a dispatcher killed mid-group loses nothing already emitted.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .edge_runner import EdgeRunResult, run_edge
+from .event_log import EventLog, read_events_from
+from .feature_parallelism import find_orthogonal_groups
 from .intent_observer import DispatchTarget, get_pending_dispatches
-from .ol_event import emit_ol_event, make_ol_event
+from .ol_event import emit_ol_event, make_ol_event, normalize_event
+from .projections import load_projection
+from .serialiser import ACTIVE_CLAIMS, process_inbox, stage_claim, stage_release
 
 _log = logging.getLogger(__name__)
 
+DEFAULT_DISPATCH_WORKERS = 1  # sequential unless configured
+DISPATCH_AGENT_ID = "dispatch-loop"
+
 
 # ── Data classes ───────────────────────────────────────────────────────────────
 
@@ -44,14 +70,67 @@ class DispatchSummary:
     fh_required: int = 0
     stuck: int = 0
     errors: int = 0
+    deferred: int = 0
     results: list[EdgeRunResult] = field(default_factory=list)
 
+    def record(self, result: EdgeRunResult | None) -> bool:
+        """Count one dispatched target; return True if it converged."""
+        self.dispatched += 1
+        if result is None:
+            self.errors += 1
+            return False
+        self.results.append(result)
+        if result.status == "converged":
+            self.converged += 1
+            return True
+        if result.status == "fp_dispatched":
+            self.fp_dispatched += 1  # cannot progress without LLM actor
+        elif result.status == "fh_required":
+            self.fh_required += 1  # cannot progress without human
+        elif result.status == "stuck":
+            self.stuck += 1
+        return False
+
 
 # ── Quiescence ─────────────────────────────────────────────────────────────────
 
 # Event types that close an fh_required gate for a (feature, edge)
 _FH_RESOLUTION_EVENTS = {"consensus_reached", "review_approved", "edge_converged"}
 
+# Event types that can create dispatch work: new intents, resolved gates,
+# and claims freed by another agent
+DISPATCH_TRIGGER_EVENTS = _FH_RESOLUTION_EVENTS | {
+    "intent_raised",
+    "vote_cast",
+    "feature_proposal_approved",
+    "edge_released",
+    "claim_expired",
+}
+
+
+def appended_triggers_dispatch(events_path: Path, appended: tuple[int, int]) -> bool:
+    """True if the logical byte range *appended* holds a DISPATCH_TRIGGER_EVENTS event.
+
+    Only the appended bytes are read — the rest of the log is not examined.
+    """
+    return _scan_appended(events_path, appended)[0]
+
+
+def _scan_appended(events_path: Path, appended: tuple[int, int]) -> tuple[bool, int]:
+    """(triggers dispatch, end of the last complete line read) for *appended*."""
+    start, end = appended
+    raw, consumed = read_events_from(events_path, start, end)
+    triggered = False
+    for ev in raw:
+        try:
+            event_type = normalize_event(ev).get("event_type")
+        except (AttributeError, TypeError):
+            event_type = ev.get("event_type")
+        if event_type in DISPATCH_TRIGGER_EVENTS:
+            triggered = True
+            break
+    return triggered, consumed
+
 
 def _has_unresolved_fh_gates(events_path: Path) -> bool:
     """Return True if any fh_required escalation has no matching resolution event.
@@ -65,15 +144,7 @@ def _has_unresolved_fh_gates(events_path: Path) -> bool:
     if not events_path.exists():
         return False
 
-    events: list[dict] = []
-    for line in events_path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(json.loads(line))
-        except Exception:
-            continue
+    events = EventLog.shared(events_path).raw_events()
 
     # Collect open gates in order
     open_gates: list[tuple[str, str]] = []  # (feature, edge) for each unresolved gate
@@ -233,6 +304,120 @@ def _run_target_safely(
         return None
 
 
+def _run_targets(
+    targets: list[DispatchTarget],
+    workspace_root: Path,
+    events_path: Path,
+    project_name: str,
+) -> list[EdgeRunResult | None]:
+    """Run one feature's targets in order (process-pool entry point)."""
+    return [
+        _run_target_safely(target, workspace_root, events_path, project_name)
+        for target in targets
+    ]
+
+
+# ── Parallel mode ──────────────────────────────────────────────────────────────
+
+
+def dispatch_workers(workers: int | None = None) -> int:
+    """Effective pool size: *workers*, else $GENESIS_DISPATCH_WORKERS, else 1."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("GENESIS_DISPATCH_WORKERS", DEFAULT_DISPATCH_WORKERS))
+        except ValueError:
+            workers = DEFAULT_DISPATCH_WORKERS
+    return max(1, workers)
+
+
+def _feature_module_map(features: dict[str, list[DispatchTarget]]) -> dict[str, list[str]]:
+    """Modules per feature from feature vectors; undeclared features conflict with all."""
+    declared: dict[str, list[str]] = {}
+    for feature, targets in features.items():
+        modules = (targets[0].feature_vector or {}).get("modules")
+        if isinstance(modules, list):
+            declared[feature] = [str(m) for m in modules]
+    everything = sorted({m for mods in declared.values() for m in mods} | {"*"})
+    return {f: declared.get(f, everything) for f in features}
+
+
+def _claim_targets(
+    targets: list[DispatchTarget],
+    workspace_root: Path,
+    events_path: Path,
+    project_name: str,
+) -> set[tuple[str, str]]:
+    """Claim (feature, edge) for each target via the serialiser; return those granted."""
+    for target in targets:
+        stage_claim(workspace_root, DISPATCH_AGENT_ID, target.feature_id, target.edge)
+    process_inbox(workspace_root, project_name, instance_id=DISPATCH_AGENT_ID)
+    claims = load_projection(events_path, ACTIVE_CLAIMS)
+    return {key for key, agent in claims.items() if agent == DISPATCH_AGENT_ID}
+
+
+def _release_targets(
+    targets: list[DispatchTarget],
+    workspace_root: Path,
+    project_name: str,
+) -> None:
+    for target in targets:
+        stage_release(workspace_root, DISPATCH_AGENT_ID, target.feature_id, target.edge)
+    process_inbox(workspace_root, project_name, instance_id=DISPATCH_AGENT_ID)
+
+
+def _run_round_parallel(
+    targets: list[DispatchTarget],
+    workspace_root: Path,
+    events_path: Path,
+    project_name: str,
+    workers: int,
+    summary: DispatchSummary,
+    feature_module_map: dict[str, list[str]] | None = None,
+) -> bool:
+    """Run one round of targets group by group; return True if any converged."""
+    by_feature: dict[str, list[DispatchTarget]] = {}
+    for target in targets:
+        by_feature.setdefault(target.feature_id, []).append(target)
+    modules = feature_module_map if feature_module_map is not None else _feature_module_map(by_feature)
+    groups = find_orthogonal_groups(list(by_feature), modules)
+
+    made_progress = False
+    with ProcessPoolExecutor(max_workers=min(workers, len(groups[0]))) as pool:
+        for group in groups:
+            group_targets = [t for feature in group for t in by_feature[feature]]
+            granted = _claim_targets(group_targets, workspace_root, events_path, project_name)
+            runnable: dict[str, list[DispatchTarget]] = {}
+            deferred = 0
+            for target in group_targets:
+                if (target.feature_id, target.edge) in granted:
+                    runnable.setdefault(target.feature_id, []).append(target)
+                else:
+                    deferred += 1
+            summary.deferred += deferred
+            _log.info(f'dispatch_group features={sorted(runnable)} deferred={deferred}')
+
+            try:
+                futures = {
+                    feature: pool.submit(_run_targets, feature_targets, workspace_root, events_path, project_name)
+                    for feature, feature_targets in runnable.items()
+                }
+                for feature, future in futures.items():
+                    try:
+                        results = future.result()
+                    except Exception as exc:  # worker died — count every target as an error
+                        _log.warning(f'dispatch_worker_failed req="{feature}" error="{exc}"')
+                        results = [None] * len(runnable[feature])
+                    for result in results:
+                        made_progress = summary.record(result) or made_progress
+            finally:
+                _release_targets(
+                    [t for feature_targets in runnable.values() for t in feature_targets],
+                    workspace_root,
+                    project_name,
+                )
+    return made_progress
+
+
 # ── Public API ─────────────────────────────────────────────────────────────────
 
 
@@ -241,12 +426,16 @@ def run_dispatch_loop(
     events_path: Path | None = None,
     project_name: str = "ai_sdlc_method",
     max_rounds: int = 10,
+    max_workers: int | None = None,
+    feature_module_map: dict[str, list[str]] | None = None,
+    appended: tuple[int, int] | None = None,
 ) -> dict:
     """Main dispatch loop: IntentObserver → EDGE_RUNNER, repeating until quiescent.
 
     Each round:
     1. Get all pending dispatches (IntentObserver)
-    2. For each target: run EDGE_RUNNER
+    2. For each target: run EDGE_RUNNER — sequentially, or in parallel mode
+       (dispatch_workers(max_workers) > 1) concurrently across orthogonal features
     3. Accumulate results
     4. Repeat if new dispatches appeared (converged edges may unblock others)
 
@@ -255,6 +444,13 @@ def run_dispatch_loop(
     - max_rounds exhausted
     - All dispatches are fp_dispatched or fh_required (waiting on external actor)
 
+    appended: logical (start, end) byte range of events the caller has just
+    seen appended (dispatch_monitor). If none of them can create dispatch
+    work (DISPATCH_TRIGGER_EVENTS), the loop returns without reading the
+    rest of the log: ``skipped`` is True and ``quiescent`` is None (unknown).
+    ``appended_end`` is where the complete lines of that range end — a torn
+    final line is left for the caller's next range.
+
     Returns summary dict:
     {
         "rounds": int,
@@ -264,13 +460,27 @@ def run_dispatch_loop(
         "fh_required": int,
         "stuck": int,
         "errors": int,
+        "deferred": int,        # parallel mode: claim held by another agent
         "quiescent": bool,
+        "skipped": bool,        # appended range held no trigger event
+        "appended_end": int | None,  # consumed end of *appended*
     }
     """
     if events_path is None:
         events_path = workspace_root / ".ai-workspace" / "events" / "events.jsonl"
 
+    appended_end = None
+    if appended is not None:
+        triggered, appended_end = _scan_appended(events_path, appended)
+        if not triggered:
+            return {
+                "rounds": 0, "dispatched": 0, "converged": 0, "fp_dispatched": 0,
+                "fh_required": 0, "stuck": 0, "errors": 0, "deferred": 0,
+                "quiescent": None, "skipped": True, "appended_end": appended_end,
+            }
+
     summary = DispatchSummary()
+    workers = dispatch_workers(max_workers)
 
     for round_num in range(1, max_rounds + 1):
         pending = get_pending_dispatches(workspace_root)
@@ -290,26 +500,15 @@ def run_dispatch_loop(
         _emit_dispatch_started(events_path, workspace_root, project_name, round_num, len(actionable))
 
         made_progress = False
-        for target in actionable:
-            result = _run_target_safely(target, workspace_root, events_path, project_name)
-            summary.dispatched += 1
-
-            if result is None:
-                summary.errors += 1
-                continue
-
-            summary.results.append(result)
-            if result.status == "converged":
-                summary.converged += 1
-                made_progress = True
-            elif result.status == "fp_dispatched":
-                summary.fp_dispatched += 1
-                # Cannot make further progress without LLM actor
-            elif result.status == "fh_required":
-                summary.fh_required += 1
-                # Cannot make further progress without human
-            elif result.status == "stuck":
-                summary.stuck += 1
+        if workers > 1:
+            made_progress = _run_round_parallel(
+                actionable, workspace_root, events_path, project_name,
+                workers, summary, feature_module_map,
+            )
+        else:
+            for target in actionable:
+                result = _run_target_safely(target, workspace_root, events_path, project_name)
+                made_progress = summary.record(result) or made_progress
 
         _emit_dispatch_completed(events_path, project_name, round_num, summary)
 
@@ -325,7 +524,10 @@ def run_dispatch_loop(
         "fh_required": summary.fh_required,
         "stuck": summary.stuck,
         "errors": summary.errors,
+        "deferred": summary.deferred,
         "quiescent": _compute_quiescence(workspace_root),
+        "skipped": False,
+        "appended_end": appended_end,
     }
 
 
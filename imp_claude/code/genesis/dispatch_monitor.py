@@ -11,20 +11,31 @@ Two modes:
 
 Design:
 - Checks mtime on events.jsonl — if changed since last check, calls dispatch loop
-- Does not use watchdog or inotify — stdlib only (no new dependencies)
-- Daemon mode: polls every poll_interval_s seconds (default 0.5s)
+- Passes the logical byte range appended since the last check to the dispatch
+  loop, which returns immediately unless those bytes hold an intent_raised
+  or gate-resolution event — the rest of the log is not re-examined
+- Daemon mode blocks on inotify (Linux, via libc — no new dependencies) and
+  coalesces bursts of appends within debounce_s (for at most max_debounce_s,
+  so a steady stream still dispatches); elsewhere, or if inotify is
+  unavailable, it polls every poll_interval_s seconds (default 0.5s)
 - Terminates on KeyboardInterrupt or when max_rounds reached
 """
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import json
 import os
+import select
+import struct
+import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from .dispatch_loop import run_dispatch_loop
+from .event_segments import logical_size, read_logical
 
 
 # ── State ─────────────────────────────────────────────────────────────────────
@@ -35,6 +46,8 @@ class MonitorState:
     """Mutable state for the file watcher."""
     last_mtime: float = 0.0
     last_size: int = 0
+    last_offset: int = -1     # end of the last complete line examined (-1: none yet)
+    quiescent: bool = False   # as of the last dispatch that actually ran
     rounds_fired: int = 0
     total_dispatched: int = 0
     total_converged: int = 0
@@ -54,20 +67,15 @@ FH_RESOLUTION_EVENTS = {
 
 
 def _events_since(events_path: Path, offset: int) -> list[dict]:
-    """Read new events appended after byte offset."""
+    """Read new events appended after logical byte offset."""
     events = []
-    try:
-        with open(events_path, "r") as f:
-            f.seek(offset)
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
-    except (FileNotFoundError, OSError):
-        pass
+    for line in read_logical(events_path, offset).splitlines():
+        line = line.strip()
+        if line:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
     return events
 
 
@@ -125,18 +133,32 @@ def check_and_dispatch(
         return {"fired": False, "dispatched": 0, "converged": 0,
                 "fh_required": 0, "fp_dispatched": 0, "quiescent": True}
 
-    # Change detected — update state and run dispatch loop
+    # Change detected — update state and run dispatch loop on the appended range
     state.last_mtime = current_mtime
     state.last_size = current_size
-    state.rounds_fired += 1
+    end = logical_size(events_path)
+    appended = (state.last_offset, end) if 0 <= state.last_offset <= end else None
 
     result = run_dispatch_loop(
         workspace_root=workspace_root,
         events_path=events_path,
         project_name=project_name,
         max_rounds=max_rounds,
+        appended=appended,
     )
+    # Resume after the last complete line: a line still being written is
+    # examined in full on the next check instead of being skipped
+    if appended is not None and result.get("appended_end") is not None:
+        state.last_offset = result["appended_end"]
+    else:
+        state.last_offset = _last_line_end(events_path, end)
+    if result.get("skipped"):
+        # Nothing in the new bytes can create work — state is unchanged
+        return {"fired": False, "dispatched": 0, "converged": 0,
+                "fh_required": 0, "fp_dispatched": 0, "quiescent": state.quiescent}
 
+    state.rounds_fired += 1
+    state.quiescent = bool(result.get("quiescent", False))
     state.total_dispatched += result.get("dispatched", 0)
     state.total_converged += result.get("converged", 0)
     if result.get("fh_required", 0):
@@ -154,7 +176,93 @@ def check_and_dispatch(
     }
 
 
-# ── Daemon mode (future: persistent background watcher) ───────────────────────
+def _last_line_end(events_path: Path, end: int) -> int:
+    """Logical offset just past the last newline before *end* (0 if none)."""
+    window = 4096
+    while True:
+        start = max(0, end - window)
+        newline = read_logical(events_path, start, end).rfind(b"\n")
+        if newline >= 0 or start == 0:
+            return start + newline + 1
+        window *= 4
+
+
+# ── Change notification ───────────────────────────────────────────────────────
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_Q_OVERFLOW = 0x4000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (+ name[len])
+
+
+class InotifyWatcher:
+    """Blocks until events.jsonl changes, using Linux inotify through libc.
+
+    Watches the events directory rather than the file, so rotation, seals
+    and a not-yet-created log are all seen. Raises OSError where inotify is
+    unavailable — callers fall back to polling.
+    """
+
+    def __init__(self, events_path: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(fd, os.fsencode(events_path.parent), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {events_path.parent}")
+        self.fd = fd
+        self.name = os.fsencode(events_path.name)
+
+    def wait(self, timeout: float) -> bool:
+        """True once the events file changes; False if *timeout* seconds pass first."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return False
+            if self._drain():
+                return True
+
+    def _drain(self) -> bool:
+        changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changed
+            pos = 0
+            while pos + _INOTIFY_EVENT.size <= len(data):
+                _wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, pos)
+                name = data[pos + _INOTIFY_EVENT.size:pos + _INOTIFY_EVENT.size + length]
+                pos += _INOTIFY_EVENT.size + length
+                if mask & _IN_Q_OVERFLOW or name.rstrip(b"\0") == self.name:
+                    changed = True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _open_watcher(events_path: Path, watch: str) -> InotifyWatcher | None:
+    """InotifyWatcher for watch="inotify"/"auto", or None to poll."""
+    if watch == "poll":
+        return None
+    try:
+        return InotifyWatcher(events_path)
+    except (OSError, AttributeError):
+        if watch == "inotify":
+            raise
+        return None
+
+
+# ── Daemon mode ───────────────────────────────────────────────────────────────
 
 
 def run_monitor(
@@ -165,6 +273,10 @@ def run_monitor(
     max_rounds_per_fire: int = 5,
     max_total_fires: int = 1000,
     on_fh_required: callable | None = None,
+    watch: str = "auto",
+    debounce_s: float = 0.05,
+    heartbeat_s: float = 5.0,
+    max_debounce_s: float = 1.0,
 ) -> None:
     """Daemon mode: watch events.jsonl and dispatch on every append.
 
@@ -174,16 +286,22 @@ def run_monitor(
         workspace_root: Path to .ai-workspace parent
         events_path: path to events.jsonl
         project_name: for OL events
-        poll_interval_s: how often to check for changes (seconds)
+        poll_interval_s: how often to check for changes when polling (seconds)
         max_rounds_per_fire: passed to run_dispatch_loop per fire
         max_total_fires: safety limit on total dispatch runs
         on_fh_required: optional callback(fh_count) when F_H gates pending
+        watch: "auto" (inotify if available, else poll) | "inotify" | "poll"
+        debounce_s: inotify — keep waiting while appends arrive this close together
+        heartbeat_s: inotify — re-check at least this often even without events
+        max_debounce_s: inotify — dispatch after this long even if appends keep arriving
     """
     if events_path is None:
         events_path = workspace_root / ".ai-workspace" / "events" / "events.jsonl"
 
     state = MonitorState()
-    print(f"dispatch_monitor: watching {events_path} (poll={poll_interval_s}s)")
+    watcher = _open_watcher(events_path, watch)
+    mode = "inotify" if watcher is not None else f"poll={poll_interval_s}s"
+    print(f"dispatch_monitor: watching {events_path} ({mode})")
 
     try:
         fires = 0
@@ -207,9 +325,19 @@ def run_monitor(
                 if result["fh_required"] and on_fh_required:
                     on_fh_required(result["fh_required"])
 
-            time.sleep(poll_interval_s)
+            if watcher is None:
+                time.sleep(poll_interval_s)
+            elif not result["fired"] and watcher.wait(heartbeat_s):
+                # Coalesce a burst of appends into one dispatch, bounded so a
+                # steady stream of appends cannot postpone it forever
+                settle_by = time.monotonic() + max_debounce_s
+                while time.monotonic() < settle_by and watcher.wait(debounce_s):
+                    pass
 
     except KeyboardInterrupt:
         print(f"\ndispatch_monitor: stopped. Fired {fires} times, "
               f"total dispatched={state.total_dispatched}, "
               f"total converged={state.total_converged}")
+    finally:
+        if watcher is not None:
+            watcher.close()
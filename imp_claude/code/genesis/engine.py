@@ -29,12 +29,19 @@ from typing import Optional
 
 _log = logging.getLogger(__name__)
 
+from .check_cache import CheckCache
 from .config_loader import load_yaml, resolve_checklist
 from .contracts import Intent
-from .ol_event import emit_ol_event, make_ol_event
-from .fd_evaluate import run_check as fd_run_check
+from .ol_event import EventBatch, emit_ol_event, make_ol_event
+from .fd_evaluate import run_checks as fd_run_checks
 from .fd_route import select_next_edge, select_profile
 from .fp_functor import FpFunctor
+from .impact_selection import (
+    SELECTED_TESTS_VAR,
+    ImpactSelector,
+    full_suite_every,
+    references_selected_tests,
+)
 from .models import (
     CheckOutcome,
     CheckResult,
@@ -58,6 +65,8 @@ class EngineConfig:
     claude_timeout: int = 300  # headless sessions need more time than -p calls
     deterministic_only: bool = False
     fd_timeout: int = 120
+    fd_workers: Optional[int] = None  # None → $GENESIS_FD_WORKERS or fd_evaluate.DEFAULT_WORKERS
+    check_cache: bool = True  # reuse results of checks whose declared inputs are unchanged
     stall_timeout: int = 60
     sanitize_env: bool = True
     budget_usd: float = 2.0
@@ -94,6 +103,7 @@ def iterate_edge(
     1. (Optional) F_P: Construct artifact via Claude Code CLI
     2. Resolve checklist ($variables)
     3. Evaluate each check (dispatch by type: F_D subprocess or F_P Claude Code)
+       - F_D checks run concurrently on a bounded pool (fd_evaluate.run_checks)
        - When construct=True, batched F_P evaluations replace per-check agent calls
     4. Compute delta (deterministic)
     5. Emit event (deterministic — ALWAYS fires)
@@ -136,80 +146,28 @@ def iterate_edge(
         ),
     )
 
-    # 1. F_P: Construct artifact via MCP actor (ADR-024)
-    if construct:
-        intent = Intent(
-            edge=edge,
-            feature=feature_id,
-            grain="iteration",
-            constraints=config.constraints,
-            failures=prior_failures or [],
-            budget_usd=config.budget_usd,
-        )
-        fp_outcome = FpFunctor().invoke(intent, config.workspace_path)
-
-        if isinstance(fp_outcome, FpSkipped):
-            # MCP unavailable — F_D-only mode (ADR-019). Not an error; no event needed.
-            fp_result = None
-        elif isinstance(fp_outcome, FpPending):
-            # Manifest written but no fold-back result yet — observable gap (T-007).
-            emit_ol_event(
-                events_path,
-                make_ol_event(
-                    "FpFailure",
-                    edge,
-                    config.project_name,
-                    feature_id,
-                    "genesis-engine",
-                    causation_id=iter_run_id,
-                    correlation_id=edge_correlation_id,
-                    payload={
-                        "feature": feature_id,
-                        "edge": edge,
-                        "iteration": iteration,
-                        "transport": "mcp",
-                        "cost_usd": 0.0,
-                        "duration_ms": 0,
-                        "phase": "construct",
-                        "error": f"Actor not yet invoked — manifest at {fp_outcome.manifest_path}",
-                    },
-                ),
+    # Everything after IterationStarted is appended in one locked write at the
+    # end of the iteration. IterationStarted itself is written immediately: it
+    # is the crash marker abandoned-iteration detection relies on.
+    with EventBatch(events_path) as batch:
+        # 1. F_P: Construct artifact via MCP actor (ADR-024)
+        if construct:
+            intent = Intent(
+                edge=edge,
+                feature=feature_id,
+                grain="iteration",
+                constraints=config.constraints,
+                failures=prior_failures or [],
+                budget_usd=config.budget_usd,
             )
-            fp_result = None
-        elif isinstance(fp_outcome, FpFailed):
-            # Actor invocation or result-parse error — emit and continue F_D only.
-            emit_ol_event(
-                events_path,
-                make_ol_event(
-                    "FpFailure",
-                    edge,
-                    config.project_name,
-                    feature_id,
-                    "genesis-engine",
-                    causation_id=iter_run_id,
-                    correlation_id=edge_correlation_id,
-                    payload={
-                        "feature": feature_id,
-                        "edge": edge,
-                        "iteration": iteration,
-                        "transport": "mcp",
-                        "cost_usd": 0.0,
-                        "duration_ms": 0,
-                        "phase": "construct",
-                        "error": fp_outcome.error,
-                    },
-                ),
-            )
-            fp_result = None
-        else:
-            # FpReturned — actor completed with fold-back result.
-            assert isinstance(fp_outcome, FpReturned)
-            fp_result = fp_outcome.result  # dict: converged, delta, cost_usd, artifacts, spawns, audit
-
-            # Emit FpFailure if actor returned but did not converge (REQ-ROBUST-007)
-            if not fp_result.get("converged") and fp_result.get("delta", 0) > 0:
-                emit_ol_event(
-                    events_path,
+            fp_outcome = FpFunctor().invoke(intent, config.workspace_path)
+
+            if isinstance(fp_outcome, FpSkipped):
+                # MCP unavailable — F_D-only mode (ADR-019). Not an error; no event needed.
+                fp_result = None
+            elif isinstance(fp_outcome, FpPending):
+                # Manifest written but no fold-back result yet — observable gap (T-007).
+                batch.emit(
                     make_ol_event(
                         "FpFailure",
                         edge,
@@ -222,184 +180,260 @@ def iterate_edge(
                             "feature": feature_id,
                             "edge": edge,
                             "iteration": iteration,
-                            "transport": (fp_result.get("audit") or {}).get("transport", "mcp"),
-                            "cost_usd": fp_result.get("cost_usd", 0.0),
+                            "transport": "mcp",
+                            "cost_usd": 0.0,
                             "duration_ms": 0,
                             "phase": "construct",
+                            "error": f"Actor not yet invoked — manifest at {fp_outcome.manifest_path}",
                         },
                     ),
                 )
-
-    # 2. F_D: Resolve checklist
-    checks = resolve_checklist(edge_config, config.constraints)
-
-    # 3. Evaluate each check — dispatch by type
-    results: list[CheckResult] = []
-    escalations: list[str] = []
-
-    for check in checks:
-        if check.check_type == "deterministic":
-            cr = fd_run_check(check, config.workspace_path, timeout=config.fd_timeout)
-        elif check.check_type == "agent":
-            # ADR-024: agent checks belong to the actor, not the engine.
-            # The actor self-evaluates against these criteria when invoked.
-            # The engine always skips agent checks — F_D only.
-            cr = CheckResult(
-                name=check.name,
-                outcome=CheckOutcome.SKIP,
-                required=check.required,
-                check_type=check.check_type,
-                functional_unit=check.functional_unit,
-                message="Skipped: agent check — actor self-evaluates (ADR-024)",
-            )
-        elif check.check_type == "human":
-            cr = CheckResult(
-                name=check.name,
-                outcome=CheckOutcome.SKIP,
-                required=check.required,
-                check_type=check.check_type,
-                functional_unit=check.functional_unit,
-                message="Skipped: human check (interactive mode not available)",
+                fp_result = None
+            elif isinstance(fp_outcome, FpFailed):
+                # Actor invocation or result-parse error — emit and continue F_D only.
+                batch.emit(
+                    make_ol_event(
+                        "FpFailure",
+                        edge,
+                        config.project_name,
+                        feature_id,
+                        "genesis-engine",
+                        causation_id=iter_run_id,
+                        correlation_id=edge_correlation_id,
+                        payload={
+                            "feature": feature_id,
+                            "edge": edge,
+                            "iteration": iteration,
+                            "transport": "mcp",
+                            "cost_usd": 0.0,
+                            "duration_ms": 0,
+                            "phase": "construct",
+                            "error": fp_outcome.error,
+                        },
+                    ),
+                )
+                fp_result = None
+            else:
+                # FpReturned — actor completed with fold-back result.
+                assert isinstance(fp_outcome, FpReturned)
+                fp_result = fp_outcome.result  # dict: converged, delta, cost_usd, artifacts, spawns, audit
+
+                # Emit FpFailure if actor returned but did not converge (REQ-ROBUST-007)
+                if not fp_result.get("converged") and fp_result.get("delta", 0) > 0:
+                    batch.emit(
+                        make_ol_event(
+                            "FpFailure",
+                            edge,
+                            config.project_name,
+                            feature_id,
+                            "genesis-engine",
+                            causation_id=iter_run_id,
+                            correlation_id=edge_correlation_id,
+                            payload={
+                                "feature": feature_id,
+                                "edge": edge,
+                                "iteration": iteration,
+                                "transport": (fp_result.get("audit") or {}).get("transport", "mcp"),
+                                "cost_usd": fp_result.get("cost_usd", 0.0),
+                                "duration_ms": 0,
+                                "phase": "construct",
+                            },
+                        ),
+                    )
+
+        # 2. F_D: Resolve checklist — $selected_tests narrows test runs to the
+        # tests this feature's REQ keys and changed files reach
+        constraints = config.constraints
+        selector = None
+        if references_selected_tests(edge_config):
+            selector = ImpactSelector(config.workspace_path, full_suite_every(constraints))
+            selection = selector.select(feature_id)
+            _log.info(
+                f'test_selection req="{feature_id}" edge="{edge}" full={selection.full} '
+                f'tests={len(selection.tests)} reason="{selection.reason}"'
             )
-        else:
-            cr = CheckResult(
-                name=check.name,
-                outcome=CheckOutcome.SKIP,
-                required=check.required,
-                check_type=check.check_type,
-                functional_unit=check.functional_unit,
-                message=f"Skipped: unknown check type '{check.check_type}'",
+            constraints = {**constraints, SELECTED_TESTS_VAR: selection.argument}
+        checks = resolve_checklist(edge_config, constraints)
+
+        # 3. Evaluate each check — dispatch by type
+        # F_D checks run concurrently up front (group/exclusive honoured); results
+        # and events below still follow declared checklist order.
+        fd_results = iter(
+            fd_run_checks(
+                [check for check in checks if check.check_type == "deterministic"],
+                config.workspace_path,
+                timeout=config.fd_timeout,
+                workers=config.fd_workers,
+                cache=CheckCache(config.workspace_path) if config.check_cache else None,
             )
+        )
+        results: list[CheckResult] = []
+        escalations: list[str] = []
+
+        for check in checks:
+            if check.check_type == "deterministic":
+                cr = next(fd_results)
+            elif check.check_type == "agent":
+                # ADR-024: agent checks belong to the actor, not the engine.
+                # The actor self-evaluates against these criteria when invoked.
+                # The engine always skips agent checks — F_D only.
+                cr = CheckResult(
+                    name=check.name,
+                    outcome=CheckOutcome.SKIP,
+                    required=check.required,
+                    check_type=check.check_type,
+                    functional_unit=check.functional_unit,
+                    message="Skipped: agent check — actor self-evaluates (ADR-024)",
+                )
+            elif check.check_type == "human":
+                cr = CheckResult(
+                    name=check.name,
+                    outcome=CheckOutcome.SKIP,
+                    required=check.required,
+                    check_type=check.check_type,
+                    functional_unit=check.functional_unit,
+                    message="Skipped: human check (interactive mode not available)",
+                )
+            else:
+                cr = CheckResult(
+                    name=check.name,
+                    outcome=CheckOutcome.SKIP,
+                    required=check.required,
+                    check_type=check.check_type,
+                    functional_unit=check.functional_unit,
+                    message=f"Skipped: unknown check type '{check.check_type}'",
+                )
 
-        results.append(cr)
+            results.append(cr)
 
-        # Emit EvaluatorDetail event for failing checks (REQ-ROBUST-007)
-        if cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR):
-            emit_ol_event(
-                events_path,
-                make_ol_event(
-                    "EvaluatorDetail",
-                    edge,
-                    config.project_name,
-                    feature_id,
-                    "genesis-engine",
-                    causation_id=iter_run_id,
-                    correlation_id=edge_correlation_id,
-                    payload={
-                        "feature": feature_id,
-                        "edge": edge,
-                        "iteration": iteration,
-                        "check_name": cr.name,
-                        "check_type": cr.check_type,
-                        "outcome": cr.outcome.value,
-                        "required": cr.required,
-                        "message": cr.message[:500] if cr.message else "",
-                    },
-                ),
-            )
+            # Emit EvaluatorDetail event for failing checks (REQ-ROBUST-007)
+            # and for cached results, so a reused outcome is never silent
+            if cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR) or cr.cached:
+                batch.emit(
+                    make_ol_event(
+                        "EvaluatorDetail",
+                        edge,
+                        config.project_name,
+                        feature_id,
+                        "genesis-engine",
+                        causation_id=iter_run_id,
+                        correlation_id=edge_correlation_id,
+                        payload={
+                            "feature": feature_id,
+                            "edge": edge,
+                            "iteration": iteration,
+                            "check_name": cr.name,
+                            "check_type": cr.check_type,
+                            "outcome": cr.outcome.value,
+                            "required": cr.required,
+                            "message": cr.message[:500] if cr.message else "",
+                            **({"cached": True} if cr.cached else {}),
+                        },
+                    ),
+                )
 
-        # η detection
-        if cr.required and cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR):
-            if cr.check_type == "deterministic":
-                escalations.append(f"η_D→P: {cr.name} — deterministic failure")
-            elif cr.check_type == "agent":
-                escalations.append(f"η_P→H: {cr.name} — agent evaluation failed")
-
-    # 4. F_D: Compute delta — DETERMINISTIC
-    delta = sum(
-        1
-        for cr in results
-        if cr.required and cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR)
-    )
-    converged = delta == 0
-    _log.info(
-        f'iteration_result req="{feature_id}" edge="{edge}" iteration={iteration} '
-        f'delta={delta} converged={converged}'
-    )
+            # η detection
+            if cr.required and cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR):
+                if cr.check_type == "deterministic":
+                    escalations.append(f"η_D→P: {cr.name} — deterministic failure")
+                elif cr.check_type == "agent":
+                    escalations.append(f"η_P→H: {cr.name} — agent evaluation failed")
+
+        # 4. F_D: Compute delta — DETERMINISTIC
+        delta = sum(
+            1
+            for cr in results
+            if cr.required and cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR)
+        )
+        converged = delta == 0
+        _log.info(
+            f'iteration_result req="{feature_id}" edge="{edge}" iteration={iteration} '
+            f'delta={delta} converged={converged}'
+        )
 
-    evaluation = EvaluationResult(
-        edge=edge,
-        checks=results,
-        delta=delta,
-        converged=converged,
-        escalations=escalations,
-    )
+        evaluation = EvaluationResult(
+            edge=edge,
+            checks=results,
+            delta=delta,
+            converged=converged,
+            escalations=escalations,
+        )
 
-    # 5. F_D: Emit event — THIS ALWAYS FIRES
-    check_summary = [
-        {
-            "name": cr.name,
-            "type": cr.check_type,
-            "outcome": cr.outcome.value,
-            "required": cr.required,
-        }
-        for cr in results
-    ]
-
-    passed = sum(1 for cr in results if cr.outcome == CheckOutcome.PASS)
-    failed = sum(
-        1 for cr in results if cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR)
-    )
-    skipped = sum(1 for cr in results if cr.outcome == CheckOutcome.SKIP)
+        # 5. F_D: Emit event — THIS ALWAYS FIRES
+        check_summary = [
+            {
+                "name": cr.name,
+                "type": cr.check_type,
+                "outcome": cr.outcome.value,
+                "required": cr.required,
+            }
+            for cr in results
+        ]
 
-    event_data = dict(
-        feature=feature_id,
-        edge=edge,
-        iteration=iteration,
-        delta=delta,
-        status="converged" if converged else "iterating",
-        evaluators={
-            "passed": passed,
-            "failed": failed,
-            "skipped": skipped,
-            "total": len(results),
-            "details": check_summary,
-        },
-        checks=check_summary,
-        escalations=escalations,
-    )
+        passed = sum(1 for cr in results if cr.outcome == CheckOutcome.PASS)
+        failed = sum(
+            1 for cr in results if cr.outcome in (CheckOutcome.FAIL, CheckOutcome.ERROR)
+        )
+        skipped = sum(1 for cr in results if cr.outcome == CheckOutcome.SKIP)
 
-    if fp_result is not None:
-        # fp_result is now a dict from FpReturned.result
-        audit = fp_result.get("audit") or {}
-        event_data["fp_actor"] = {
-            "transport": audit.get("transport", "mcp"),
-            "converged": fp_result.get("converged", False),
-            "cost_usd": fp_result.get("cost_usd", 0.0),
-            "duration_ms": 0,
-            "artifacts": len(fp_result.get("artifacts", [])),
-            "spawns": len(fp_result.get("spawns", [])),
-        }
-
-    completed_run_id = emit_ol_event(
-        events_path,
-        make_ol_event(
-            "IterationCompleted",
-            edge,
-            config.project_name,
-            feature_id,
-            "genesis-engine",
-            causation_id=iter_run_id,
-            correlation_id=edge_correlation_id,
-            payload=event_data,
-        ),
-    )
+        event_data = dict(
+            feature=feature_id,
+            edge=edge,
+            iteration=iteration,
+            delta=delta,
+            status="converged" if converged else "iterating",
+            evaluators={
+                "passed": passed,
+                "failed": failed,
+                "skipped": skipped,
+                "total": len(results),
+                "details": check_summary,
+            },
+            checks=check_summary,
+            escalations=escalations,
+        )
 
-    if converged:
-        emit_ol_event(
-            events_path,
+        if fp_result is not None:
+            # fp_result is now a dict from FpReturned.result
+            audit = fp_result.get("audit") or {}
+            event_data["fp_actor"] = {
+                "transport": audit.get("transport", "mcp"),
+                "converged": fp_result.get("converged", False),
+                "cost_usd": fp_result.get("cost_usd", 0.0),
+                "duration_ms": 0,
+                "artifacts": len(fp_result.get("artifacts", [])),
+                "spawns": len(fp_result.get("spawns", [])),
+            }
+
+        completed_run_id = batch.emit(
             make_ol_event(
-                "EdgeConverged",
+                "IterationCompleted",
                 edge,
                 config.project_name,
                 feature_id,
                 "genesis-engine",
-                causation_id=completed_run_id,
+                causation_id=iter_run_id,
                 correlation_id=edge_correlation_id,
-                payload={"feature": feature_id, "edge": edge, "iteration": iteration},
+                payload=event_data,
             ),
         )
 
+        if converged:
+            if selector is not None:
+                selector.record_converged(feature_id)
+            batch.emit(
+                make_ol_event(
+                    "EdgeConverged",
+                    edge,
+                    config.project_name,
+                    feature_id,
+                    "genesis-engine",
+                    causation_id=completed_run_id,
+                    correlation_id=edge_correlation_id,
+                    payload={"feature": feature_id, "edge": edge, "iteration": iteration},
+                ),
+            )
+
     # 6. Return the record — spawn decisions are orchestrator responsibility (ADR-019)
     return IterationRecord(
         edge=edge,
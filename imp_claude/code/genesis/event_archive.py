@@ -0,0 +1,337 @@
+# Implements: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+"""Compact columnar archives of historical (sealed) events.
+
+Cold loads of multi-MB histories spend their time in json.loads and
+normalize_event, line by line. An archive stores the normalized events
+column by column instead, each column zlib-compressed on its own:
+
+  event_type, project,        dictionary-encoded (uint32 code → string table)
+    feature, edge
+  delta                       int64
+  timestamp                   int64 epoch microseconds + a format-style code
+  shape                       dictionary-encoded key order of each event
+  rest                        every other field, one JSON array for the file
+
+read_archive() yields the same normalized dicts — equal values, same key
+order — as normalize_event() over the source lines. Values that do not fit
+their column (a float delta, a non-ISO timestamp) are kept verbatim in
+"rest", so the round trip is exact.
+
+Layout:
+    b"GEVC" | version (u8) | header length (u32 LE) | header JSON | column blobs
+
+The header carries the string tables, shapes, format styles, row count and
+(offset, length) of each compressed column. Archives are immutable; the
+sealed JSONL segments remain the source of truth (see event_segments).
+
+Contract:
+  write_archive(events, path)      → ArchiveStats   (events: normalized dicts)
+  read_archive(path)               → Iterator[dict] (normalized dicts, file order)
+  compact_jsonl(src, dest=None)    → ArchiveStats   (src.jsonl → src.gevc)
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import os
+import re
+import struct
+import sys
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .ol_event import normalize_event
+
+ARCHIVE_SUFFIX = ".gevc"
+_MAGIC = b"GEVC"
+_VERSION = 1
+_PREAMBLE = struct.Struct("<4sBI")
+
+_DICT_COLUMNS = ("event_type", "project", "feature", "edge")
+_ABSENT = -(2**63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ISO = re.compile(r"^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(\.\d{1,6})?(Z|[+-]\d\d:\d\d)?$")
+
+
+class ArchiveError(ValueError):
+    """The file is not a readable event archive."""
+
+
+@dataclass
+class ArchiveStats:
+    """Outcome of writing one archive."""
+
+    path: str
+    rows: int
+    archive_bytes: int
+    source_bytes: int = 0
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# TIMESTAMPS
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _encode_timestamp(value: str) -> Optional[tuple[int, str]]:
+    """(epoch microseconds, style) if *value* re-renders exactly, else None.
+
+    Style is "<fraction digits><zone>" — e.g. "6+00:00", "3Z", "0" (naive).
+    """
+    m = _ISO.match(value)
+    if not m:
+        return None
+    fraction, zone = m.group(2) or "", m.group(3) or ""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    aware = dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    delta = aware - _EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    style = f"{max(len(fraction) - 1, 0)}{zone}"
+    if _render_timestamp(micros, style) != value:
+        return None
+    return micros, style
+
+
+def _render_timestamp(micros: int, style: str) -> str:
+    seconds, fraction = divmod(micros, 1_000_000)
+    return _render_seconds(seconds, style) + _render_fraction(fraction, style)
+
+
+def _render_seconds(seconds: int, style: str) -> str:
+    zone = style[1:]
+    tz = timezone.utc
+    if zone and zone != "Z":
+        sign = -1 if zone[0] == "-" else 1
+        tz = timezone(sign * timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6])))
+    return (_EPOCH + timedelta(seconds=seconds)).astimezone(tz).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _render_fraction(fraction: int, style: str) -> str:
+    digits = int(style[0])
+    return ("." + f"{fraction:06d}"[:digits] if digits else "") + style[1:]
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# WRITE
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _pack(values: array.array) -> bytes:
+    if sys.byteorder == "big":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return zlib.compress(values.tobytes(), 6)
+
+
+def _unpack(typecode: str, blob: bytes) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(zlib.decompress(blob))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class _Table:
+    """String → code dictionary; code 0 is reserved for "not in this column"."""
+
+    def __init__(self) -> None:
+        self.codes: dict[Any, int] = {}
+        self.values: list[Any] = []
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            self.values.append(value)
+            code = self.codes[value] = len(self.values)
+        return code
+
+
+def write_archive(events: Iterable[dict[str, Any]], path: Path) -> ArchiveStats:
+    """Write normalized *events* to a columnar archive at *path* (atomically)."""
+    path = Path(path)
+    tables = {name: _Table() for name in _DICT_COLUMNS}
+    codes = {name: array.array("I") for name in _DICT_COLUMNS}
+    deltas = array.array("q")
+    stamps = array.array("q")
+    styles, shapes = _Table(), _Table()
+    style_codes, shape_codes = array.array("I"), array.array("I")
+    rest: list[list[Any]] = []
+
+    for ev in events:
+        shape: list[tuple[str, int]] = []
+        extra: list[Any] = []
+        column = {name: 0 for name in _DICT_COLUMNS}
+        delta, stamp, style = _ABSENT, _ABSENT, 0
+        for key, value in ev.items():
+            if key in column and isinstance(value, str):
+                column[key] = tables[key].code(value)
+            elif key == "delta" and type(value) is int and _ABSENT < value < 2**63:
+                delta = value
+            elif key == "timestamp" and isinstance(value, str) and (encoded := _encode_timestamp(value)):
+                stamp, style = encoded[0], styles.code(encoded[1])
+            else:
+                extra.append(value)
+                shape.append((key, 0))
+                continue
+            shape.append((key, 1))
+        for name in _DICT_COLUMNS:
+            codes[name].append(column[name])
+        deltas.append(delta)
+        stamps.append(stamp)
+        style_codes.append(style)
+        shape_codes.append(shapes.code(tuple(shape)))
+        rest.append(extra)
+
+    blobs = {name: _pack(codes[name]) for name in _DICT_COLUMNS}
+    blobs["delta"] = _pack(deltas)
+    blobs["timestamp"] = _pack(stamps)
+    blobs["style"] = _pack(style_codes)
+    blobs["shape"] = _pack(shape_codes)
+    blobs["rest"] = zlib.compress(
+        json.dumps(rest, separators=(",", ":"), ensure_ascii=False).encode(), 6
+    )
+
+    columns: dict[str, list[int]] = {}
+    offset = 0
+    for name, blob in blobs.items():
+        columns[name] = [offset, len(blob)]
+        offset += len(blob)
+    header = json.dumps(
+        {
+            "version": _VERSION,
+            "rows": len(rest),
+            "strings": {name: tables[name].values for name in _DICT_COLUMNS},
+            "styles": styles.values,
+            "shapes": [[list(item) for item in shape] for shape in shapes.values],
+            "columns": columns,
+        },
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode()
+
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREAMBLE.pack(_MAGIC, _VERSION, len(header)))
+        f.write(header)
+        for blob in blobs.values():
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return ArchiveStats(path=str(path), rows=len(rest), archive_bytes=path.stat().st_size)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# READ
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def read_archive(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the archived events as normalized dicts, in file order.
+
+    Raises ArchiveError if *path* is not a version-1 archive.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < _PREAMBLE.size:
+        raise ArchiveError(f"{path}: truncated archive")
+    magic, version, header_len = _PREAMBLE.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ArchiveError(f"{path}: not a version {_VERSION} event archive")
+    start = _PREAMBLE.size + header_len
+    try:
+        header = json.loads(data[_PREAMBLE.size:start])
+        blob = {
+            name: data[start + off:start + off + length]
+            for name, (off, length) in header["columns"].items()
+        }
+        codes = {name: _unpack("I", blob[name]) for name in _DICT_COLUMNS}
+        deltas = _unpack("q", blob["delta"])
+        stamps = _unpack("q", blob["timestamp"])
+        style_codes = _unpack("I", blob["style"])
+        shape_codes = _unpack("I", blob["shape"])
+        rest = json.loads(zlib.decompress(blob["rest"]))
+    except (KeyError, ValueError, zlib.error) as exc:
+        raise ArchiveError(f"{path}: corrupt archive ({exc})") from exc
+
+    # Decode each column once, then assemble rows from the decoded lists
+    values: dict[str, list[Any]] = {}
+    for name in _DICT_COLUMNS:
+        table = [None] + header["strings"][name]
+        values[name] = [table[code] for code in codes[name]]
+    values["delta"] = deltas.tolist()
+    values["timestamp"] = _render_timestamps(stamps, style_codes, [""] + header["styles"])
+    shapes = [None] + [
+        [(key, values[key] if from_column else None) for key, from_column in shape]
+        for shape in header["shapes"]
+    ]
+
+    for row, shape_code in enumerate(shape_codes):
+        extra = iter(rest[row])
+        yield {
+            key: column[row] if column is not None else next(extra)
+            for key, column in shapes[shape_code]
+        }
+
+
+def _render_timestamps(stamps: array.array, style_codes: array.array, styles: list[str]) -> list[str]:
+    """Render a timestamp column; each whole-second prefix is formatted once."""
+    out: list[str] = []
+    prefixes: dict[tuple[int, int], str] = {}
+    for micros, code in zip(stamps, style_codes):
+        if micros == _ABSENT:
+            out.append("")  # row keeps its timestamp (if any) in "rest"
+            continue
+        seconds, fraction = divmod(micros, 1_000_000)
+        prefix = prefixes.get((seconds, code))
+        if prefix is None:
+            prefix = prefixes[(seconds, code)] = _render_seconds(seconds, styles[code])
+        out.append(prefix + _render_fraction(fraction, styles[code]))
+    return out
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# COMPACTION
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def archive_path_for(source: Path) -> Path:
+    """Default archive location for a JSONL file: same name, .gevc suffix."""
+    return Path(source).with_suffix(ARCHIVE_SUFFIX)
+
+
+def _jsonl_events(data: bytes) -> Iterator[dict[str, Any]]:
+    for line in data.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError:
+            # Same lossy retry as event_log._parse_line for invalid UTF-8
+            try:
+                raw = json.loads(line.decode("utf-8", errors="replace"))
+            except ValueError:
+                continue
+        if isinstance(raw, dict):
+            try:
+                yield normalize_event(raw)
+            except (AttributeError, TypeError):
+                yield raw
+
+
+def compact_jsonl(source: Path, dest: Optional[Union[str, Path]] = None) -> ArchiveStats:
+    """Convert the JSONL event file *source* into a columnar archive.
+
+    Malformed lines are dropped, as every reader of events.jsonl does. The
+    source file is left in place.
+    """
+    source = Path(source)
+    data = source.read_bytes()
+    stats = write_archive(_jsonl_events(data), Path(dest) if dest else archive_path_for(source))
+    stats.source_bytes = len(data)
+    return stats
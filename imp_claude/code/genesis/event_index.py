@@ -0,0 +1,145 @@
+# Implements: REQ-EVENT-002 (Projection Contract), REQ-EVENT-005 (Executor Attribution Fields)
+"""In-memory secondary indexes over the event stream.
+
+Lookups such as "every event for this review" or "the last event from this
+agent" are linear scans of events.jsonl. EventIndex keeps, for each indexed
+key, a map from value → positions in the stream, so each lookup touches only
+the matching events. It is append-only like the log it mirrors, and is
+updated incrementally as EventLog consumes new lines.
+
+Indexed keys:
+  feature, edge, event_type, review_id   — flat fields (after normalization)
+  agent_id                               — top level, or data.agent_id
+  correlation_id, causation_id           — flat fields, or the sdlc:universal
+                                           facet of an OL RunEvent
+
+Contract:
+  EventIndex(events)               → index over an already-loaded list
+  EventLog.shared(path).index()    → live index, extended on every refresh()
+  index.lookup(feature=..., ...)   → matching events in stream order (AND of criteria)
+
+Events are stored as given (raw or normalized) — lookup() returns the same
+dicts the caller indexed, so functions that accept either a list or an
+EventIndex can run their existing per-event logic over the candidates.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Iterator, Optional
+
+from .ol_event import normalize_event
+
+INDEXED_KEYS = (
+    "feature",
+    "edge",
+    "event_type",
+    "review_id",
+    "agent_id",
+    "correlation_id",
+    "causation_id",
+)
+
+
+def _dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _index_values(
+    event: dict[str, Any], raw: Optional[dict[str, Any]] = None
+) -> Iterator[tuple[str, str]]:
+    """Yield (key, value) pairs under which *event* is indexed.
+
+    When *raw* is given, *event* is already its normalized form.
+    """
+    if raw is None:
+        raw = event
+        try:
+            event = normalize_event(event)
+        except (AttributeError, TypeError):
+            pass  # malformed OL envelope: index the raw dict as-is
+    flat = event
+    data = _dict(flat.get("data"))
+    universal = _dict(_dict(_dict(raw.get("run")).get("facets")).get("sdlc:universal"))
+
+    for key in ("feature", "edge", "event_type", "review_id"):
+        value = flat.get(key)
+        if isinstance(value, str):
+            yield key, value
+
+    agent = flat.get("agent_id", data.get("agent_id"))
+    if isinstance(agent, str):
+        yield "agent_id", agent
+
+    for key in ("correlation_id", "causation_id"):
+        value = flat.get(key) or universal.get(key)
+        if isinstance(value, str):
+            yield key, value
+
+
+class EventIndex:
+    """Append-only secondary indexes keyed by INDEXED_KEYS.
+
+    Not thread-safe on its own; EventLog serialises appends under its lock.
+    """
+
+    def __init__(self, events: Optional[list[dict[str, Any]]] = None) -> None:
+        self._events: list[dict[str, Any]] = []
+        self._by: dict[str, dict[str, list[int]]] = {key: {} for key in INDEXED_KEYS}
+        for ev in events or ():
+            self.append(ev)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._events)
+
+    def append(self, event: dict[str, Any], raw: Optional[dict[str, Any]] = None) -> None:
+        """Index one event. *raw* is the event as written, when *event* is its normalized form."""
+        pos = len(self._events)
+        self._events.append(event)
+        for key, value in _index_values(event, raw):
+            self._by[key].setdefault(value, []).append(pos)
+
+    def values(self, key: str) -> list[str]:
+        """Distinct values seen for *key*."""
+        return list(self._by[key])
+
+    def positions(self, **criteria: str) -> list[int]:
+        """Stream positions of events matching every criterion, ascending."""
+        if not criteria:
+            return list(range(len(self._events)))
+        unknown = set(criteria) - set(INDEXED_KEYS)
+        if unknown:
+            raise ValueError(f"not an indexed key: {', '.join(sorted(unknown))}")
+        postings = sorted(
+            (self._by[key].get(value, []) for key, value in criteria.items()), key=len
+        )
+        first, rest = postings[0], postings[1:]
+        # Posting lists are ascending: walk the smallest and bisect the others,
+        # each from where its previous search stopped
+        lows = [0] * len(rest)
+        matches: list[int] = []
+        for pos in first:
+            for i, posting in enumerate(rest):
+                j = lows[i] = bisect_left(posting, pos, lows[i])
+                if j == len(posting):
+                    return matches
+                if posting[j] != pos:
+                    break
+            else:
+                matches.append(pos)
+        return matches
+
+    def lookup(self, **criteria: str) -> list[dict[str, Any]]:
+        """Events matching every criterion, in stream order."""
+        return [self._events[pos] for pos in self.positions(**criteria)]
+
+    def count(self, **criteria: str) -> int:
+        return len(self.positions(**criteria))
+
+    def last(self, **criteria: str) -> Optional[dict[str, Any]]:
+        """Most recent event matching every criterion, or None."""
+        positions = self.positions(**criteria)
+        return self._events[positions[-1]] if positions else None
@@ -0,0 +1,290 @@
+# Implements: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+# Implements: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Incremental, offset-checkpointed reader for events.jsonl.
+
+events.jsonl is append-only, so a reader that has already parsed the first
+N bytes never needs to parse them again. EventLog remembers the byte offset
+it has consumed and the events parsed so far; each refresh() parses only the
+bytes appended since the last call.
+
+Contract:
+  EventLog.shared(path) → EventLog   (one instance per path, per process)
+  log.events()          → list[dict] (normalized flat events, see ol_event.normalize_event)
+  log.raw_events()      → list[dict] (events exactly as written)
+  log.index()           → EventIndex (secondary indexes over events(), see event_index)
+
+Rewrite detection — the cache is discarded and the file re-parsed from byte 0
+when any of these hold:
+  - the file was replaced (device/inode changed) — rotation, migrate script
+  - the file shrank below the consumed offset — truncation
+  - the first or last consumed bytes no longer match — rewritten in place
+  - the size is unchanged but the mtime moved — same-length rewrite
+
+Segmented logs (see event_segments):
+  Sealed segments are read once, before the active events.jsonl; offsets
+  are tracked in the active file only. A seal truncates the active file,
+  which is detected as a rewrite and re-reads sealed + active.
+
+Unterminated final line:
+  A trailing fragment without a newline is consumed only if it parses as a
+  complete JSON object. Otherwise it is treated as a write still in progress
+  and left for the next refresh().
+
+Callers:
+  workspace_state.load_events()        fd_spawn.load_events()
+  human_audit.load_events()            workspace_integrity._load_events()
+  workspace_analysis._load_events()    intent_observer._read_events()
+  serialiser.process_inbox()           dispatch_loop._has_unresolved_fh_gates()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from .event_index import EventIndex
+from .event_segments import load_segments, read_logical, segments_dir
+from .ol_event import normalize_event
+
+# Bytes kept from the head of the file and from just before the consumed
+# offset — compared on every growth to detect in-place rewrites.
+_GUARD_BYTES = 64
+
+_SHARED: dict[str, "EventLog"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _parse_line(line: bytes) -> Optional[dict[str, Any]]:
+    """Parse one JSONL line. Returns None for blank, malformed or non-object lines."""
+    try:
+        value = json.loads(line)
+    except ValueError:
+        # UnicodeDecodeError is a ValueError — retry with lossy decoding
+        try:
+            value = json.loads(line.decode("utf-8", errors="replace"))
+        except ValueError:
+            return None
+    return value if isinstance(value, dict) else None
+
+
+def normalize_or_raw(raw: dict[str, Any]) -> dict[str, Any]:
+    """normalize_event(), keeping the raw dict for malformed OL envelopes.
+
+    Every reader that folds log events should normalize through this, so a
+    line the log accepts never crashes a consumer.
+    """
+    try:
+        return normalize_event(raw)
+    except (AttributeError, TypeError):
+        return raw
+
+
+def _split(data: bytes) -> tuple[list[dict[str, Any]], int, int]:
+    """Parse a byte span of JSONL. Returns (events, bytes_consumed, malformed_count).
+
+    Complete lines are always consumed. An unterminated fragment is consumed
+    only if it parses as a whole event; otherwise it is left for a later read.
+    """
+    events: list[dict[str, Any]] = []
+    malformed = 0
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].split(b"\n"):
+        if not line.strip():
+            continue
+        ev = _parse_line(line)
+        if ev is None:
+            malformed += 1
+        else:
+            events.append(ev)
+
+    fragment = data[end:]
+    if fragment.strip():
+        ev = _parse_line(fragment)
+        if ev is not None:
+            events.append(ev)
+            end = len(data)
+    return events, end, malformed
+
+
+def read_events_from(
+    path: Path, offset: int = 0, end: Optional[int] = None
+) -> tuple[list[dict[str, Any]], int]:
+    """Parse raw events from logical *offset* to *end* (default: end of log) without caching.
+
+    Offsets address the logical log — sealed segments then events.jsonl —
+    so they stay valid across a seal. Returns (events, end_offset). Used by
+    snapshot-backed projections that resume from a persisted offset instead
+    of holding the whole log, and by the dispatch monitor to examine only
+    the bytes appended since its last check.
+    """
+    if not os.path.exists(path):
+        return [], offset
+    data = read_logical(path, offset)
+    if end is not None:
+        data = data[: max(end - offset, 0)]
+    events, consumed, _malformed = _split(data)
+    return events, offset + consumed
+
+
+class EventLog:
+    """Offset-checkpointed view over one events.jsonl file.
+
+    Thread-safe. Returned lists are fresh copies; the event dicts inside them
+    are shared with the cache and must be treated as read-only.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._reset()
+        self._stat: Optional[tuple[int, int, int, int]] = None
+
+    @classmethod
+    def shared(cls, path: Path) -> "EventLog":
+        """Return the process-wide EventLog for *path*, creating it on first use."""
+        key = os.path.abspath(path)
+        with _SHARED_LOCK:
+            log = _SHARED.get(key)
+            if log is None:
+                log = cls(Path(key))
+                _SHARED[key] = log
+            return log
+
+    # ── State ─────────────────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._identity: Optional[tuple[int, int]] = None
+        self._head = b""
+        self._tail = b""
+        self._raw: list[dict[str, Any]] = []
+        self._flat: list[dict[str, Any]] = []
+        self._index: Optional[EventIndex] = None  # built on first index() call
+        self._sealed_loaded = False
+        self.malformed = 0
+        self.generation = getattr(self, "generation", -1) + 1
+
+    @property
+    def offset(self) -> int:
+        """Number of bytes of the file consumed so far."""
+        return self._offset
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._raw)
+
+    # ── Reading ───────────────────────────────────────────────────────────
+
+    def _continues(self, f, st: os.stat_result) -> bool:
+        """True if the file on disk is an append-only extension of what we consumed."""
+        if self._offset == 0:
+            return True
+        if self._identity != (st.st_dev, st.st_ino) or st.st_size < self._offset:
+            return False
+        if self._stat is not None and st.st_size == self._stat[2]:
+            return False  # mtime moved without growth — rewritten in place
+        f.seek(0)
+        if f.read(len(self._head)) != self._head:
+            return False
+        f.seek(self._offset - len(self._tail))
+        return f.read(len(self._tail)) == self._tail
+
+    def refresh(self) -> list[dict[str, Any]]:
+        """Parse bytes appended since the last call. Returns the new raw events.
+
+        After a detected rewrite the whole file is re-parsed and every event
+        is returned; compare ``generation`` before and after to tell the two
+        cases apart.
+        """
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                if self._offset or self._raw:
+                    self._reset()
+                self._stat = None
+                return []
+
+            sig = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            if sig == self._stat:
+                return []
+
+            try:
+                with open(self.path, "rb") as f:
+                    if not self._continues(f, st):
+                        self._reset()
+                    sealed = [] if self._sealed_loaded else self._read_sealed()
+                    f.seek(self._offset)
+                    data = f.read()
+            except OSError:
+                return []
+
+            self._stat = sig
+            self._identity = (st.st_dev, st.st_ino)
+            self._sealed_loaded = True
+            return self._extend(sealed) + self._consume(data)
+
+    def _read_sealed(self) -> list[dict[str, Any]]:
+        """Parse every sealed segment of a segmented log (empty if unsegmented)."""
+        seg_dir = segments_dir(self.path)
+        events: list[dict[str, Any]] = []
+        for seg in load_segments(self.path):
+            try:
+                data = (seg_dir / seg.file).read_bytes()
+            except OSError:
+                continue
+            new, _end, malformed = _split(data)
+            self.malformed += malformed
+            events.extend(new)
+        return events
+
+    def _consume(self, data: bytes) -> list[dict[str, Any]]:
+        new, end, malformed = _split(data)
+        self.malformed += malformed
+
+        chunk = data[:end]
+        if len(self._head) < _GUARD_BYTES:
+            self._head = (self._head + chunk)[:_GUARD_BYTES]
+        self._tail = (self._tail + chunk)[-_GUARD_BYTES:]
+        self._offset += end
+        return self._extend(new)
+
+    def _extend(self, new: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        start = len(self._flat)
+        self._raw.extend(new)
+        self._flat.extend(normalize_or_raw(ev) for ev in new)
+        if self._index is not None:
+            for raw, flat in zip(new, self._flat[start:]):
+                self._index.append(flat, raw)
+        return new
+
+    def raw_events(self) -> list[dict[str, Any]]:
+        """All events as written (OL RunEvents and flat events mixed)."""
+        with self._lock:
+            self.refresh()
+            return list(self._raw)
+
+    def events(self) -> list[dict[str, Any]]:
+        """All events normalized to flat {event_type, timestamp, project, ...} dicts."""
+        with self._lock:
+            self.refresh()
+            return list(self._flat)
+
+    def index(self) -> EventIndex:
+        """Secondary indexes over events(), extended incrementally on each refresh.
+
+        The returned index is live: later refreshes append to it. After a
+        detected rewrite a new index is built, so fetch it per query batch
+        rather than holding it across refreshes.
+        """
+        with self._lock:
+            self.refresh()
+            if self._index is None:
+                index = EventIndex()
+                for raw, flat in zip(self._raw, self._flat):
+                    index.append(flat, raw)
+                self._index = index
+            return self._index
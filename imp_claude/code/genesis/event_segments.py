@@ -0,0 +1,468 @@
+# Implements: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+# Implements: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Segmented event log — sealed history segments with sidecar indexes.
+
+events.jsonl stays the active segment: every writer keeps appending to it
+unchanged. Sealing moves its complete lines, byte for byte, into a numbered
+segment file and truncates the active file. The logical log is the sealed
+segments in manifest order followed by events.jsonl, so byte offsets into
+the logical log survive a seal (snapshots stay valid).
+
+Layout:
+    .ai-workspace/events/
+      events.jsonl                      active segment (appended to)
+      segments/
+        manifest.json                   {"version": 1, "segments": ["000001.jsonl", ...]}
+        000001.jsonl                    sealed segment (immutable)
+        000001.index.json               sidecar index, see SegmentIndex
+        000001.gevc                     columnar archive (optional, see compact_segments)
+
+Sidecar index: first/last timestamp, event counts by type and features
+touched. Readers use it to skip sealed segments that cannot match a query
+(select_segments / read_segmented_events); the active segment is always read.
+Readers that need the whole log go through read_logical or
+iter_logical_lines — never events.jsonl alone, which after a seal holds
+only the newest events. Projection folds read sealed history through
+read_sealed_normalized, which prefers a segment's columnar archive.
+
+Sealing is opt-in: maybe_seal_segment() seals when the active segment
+exceeds a size or age threshold, configured by argument or by
+GENESIS_EVENT_SEGMENT_BYTES / GENESIS_EVENT_SEGMENT_SECONDS. Without a
+threshold the log is never segmented and every reader behaves as before.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .event_archive import (
+    ArchiveError,
+    ArchiveStats,
+    archive_path_for,
+    compact_jsonl,
+    read_archive,
+)
+from .ol_event import normalize_event, view_event
+
+SEGMENTS_DIR = "segments"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class SegmentIndex:
+    """Sidecar index of one sealed segment."""
+
+    file: str
+    bytes: int = 0
+    events: int = 0
+    first_ts: str = ""
+    last_ts: str = ""
+    event_types: dict[str, int] = field(default_factory=dict)
+    features: list[str] = field(default_factory=list)
+    sealed_at: str = ""
+    sha256: str = ""
+
+    def may_match(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        feature: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> bool:
+        """False only if no event in the segment can satisfy the query.
+
+        Timestamps are compared as parsed datetimes; a segment without
+        timestamps always matches time bounds.
+        """
+        if feature is not None and feature not in self.features:
+            return False
+        if event_type is not None and event_type not in self.event_types:
+            return False
+        if until is not None and self.first_ts:
+            if parse_timestamp(self.first_ts) > parse_timestamp(until):
+                return False
+        if since is not None and self.last_ts:
+            if parse_timestamp(self.last_ts) < parse_timestamp(since):
+                return False
+        return True
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as UTC-aware; unparseable values sort first."""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def segments_dir(events_path: Path) -> Path:
+    return Path(events_path).parent / SEGMENTS_DIR
+
+
+def _index_path(seg_dir: Path, name: str) -> Path:
+    return seg_dir / (name.removesuffix(".jsonl") + ".index.json")
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# MANIFEST
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def load_segments(events_path: Path) -> list[SegmentIndex]:
+    """Sealed segments in log order. Empty if the log was never segmented."""
+    seg_dir = segments_dir(events_path)
+    try:
+        manifest = json.loads((seg_dir / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return []
+    segments: list[SegmentIndex] = []
+    for name in manifest.get("segments", []):
+        try:
+            data = json.loads(_index_path(seg_dir, name).read_text())
+            segments.append(SegmentIndex(**{**data, "file": name}))
+        except (OSError, ValueError, TypeError):
+            # Sidecar lost — rebuild it from the segment itself
+            segments.append(_build_index(name, _read_bytes(seg_dir / name)))
+    return segments
+
+
+def _write_json(path: Path, data: Any) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+def _index_fields(ev) -> tuple:
+    """(event_type, (feature, feature_id), timestamp) of one event or event view."""
+    return ev.get("event_type"), (ev.get("feature"), ev.get("feature_id")), ev.get("timestamp")
+
+
+def _build_index(name: str, data: bytes) -> SegmentIndex:
+    index = SegmentIndex(file=name, bytes=len(data), sha256=hashlib.sha256(data).hexdigest())
+    features: dict[str, None] = {}
+    for line in data.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(raw, dict):
+            continue
+        try:
+            # Only a few fields are read: a lazy view avoids copying each payload
+            et, found, ts = _index_fields(view_event(raw))
+        except (AttributeError, TypeError):
+            et, found, ts = _index_fields(raw)
+        index.events += 1
+        if isinstance(et, str):
+            index.event_types[et] = index.event_types.get(et, 0) + 1
+        for feature in found:
+            if isinstance(feature, str) and feature:
+                features[feature] = None
+        if isinstance(ts, str) and ts:
+            if not index.first_ts or parse_timestamp(ts) < parse_timestamp(index.first_ts):
+                index.first_ts = ts
+            if not index.last_ts or parse_timestamp(ts) > parse_timestamp(index.last_ts):
+                index.last_ts = ts
+    index.features = sorted(features)
+    return index
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LOGICAL LOG (sealed segments + active)
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def sealed_bytes(events_path: Path) -> int:
+    """Bytes of the logical log held in sealed segments."""
+    return sum(seg.bytes for seg in load_segments(events_path))
+
+
+def read_logical(events_path: Path, start: int = 0, end: Optional[int] = None) -> bytes:
+    """Bytes [start, end) of the logical log (sealed segments then events.jsonl)."""
+    events_path = Path(events_path)
+    seg_dir = segments_dir(events_path)
+    parts = [(seg_dir / seg.file, seg.bytes) for seg in load_segments(events_path)]
+    chunks: list[bytes] = []
+    base = 0
+    for path, size in parts:
+        if end is not None and base >= end:
+            break
+        if start < base + size:
+            data = _read_bytes(path)
+            chunks.append(data[max(0, start - base):(None if end is None else end - base)])
+        base += size
+    if end is None or end > base:
+        try:
+            with open(events_path, "rb") as f:
+                f.seek(max(0, start - base))
+                chunks.append(f.read() if end is None else f.read(end - max(start, base)))
+        except OSError:
+            pass
+    return b"".join(chunks)
+
+
+def iter_logical_lines(events_path: Path) -> Iterator[bytes]:
+    """Lines of the logical log in order, streamed one file at a time."""
+    events_path = Path(events_path)
+    seg_dir = segments_dir(events_path)
+    for path in [seg_dir / seg.file for seg in load_segments(events_path)] + [events_path]:
+        try:
+            with open(path, "rb") as f:
+                yield from f
+        except OSError:
+            continue
+
+
+def logical_size(events_path: Path) -> int:
+    """Size in bytes of the logical log, or -1 if the active segment is missing."""
+    try:
+        active = os.path.getsize(events_path)
+    except OSError:
+        return -1
+    return sealed_bytes(events_path) + active
+
+
+def select_segments(
+    events_path: Path,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    feature: Optional[str] = None,
+    event_type: Optional[str] = None,
+) -> list[SegmentIndex]:
+    """Sealed segments whose sidecar index says they may hold matching events."""
+    return [
+        seg for seg in load_segments(events_path)
+        if seg.may_match(since=since, until=until, feature=feature, event_type=event_type)
+    ]
+
+
+def read_segmented_events(
+    events_path: Path,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    feature: Optional[str] = None,
+    event_type: Optional[str] = None,
+    normalized: bool = False,
+) -> list[dict[str, Any]]:
+    """Events from the sealed segments that may match, then the active segment.
+
+    Raw events by default. With normalized=True, normalized events are
+    returned and sealed segments that have a columnar archive (see
+    compact_segments) are read from it instead of their JSONL.
+
+    Segment-level pruning only — callers still filter individual events.
+    """
+    from .event_log import _split
+
+    def parse(data: bytes) -> list[dict[str, Any]]:
+        raw = _split(data)[0]
+        return [normalize_event(ev) for ev in raw] if normalized else raw
+
+    seg_dir = segments_dir(events_path)
+    events: list[dict[str, Any]] = []
+    for seg in select_segments(events_path, since, until, feature, event_type):
+        archive = archive_path_for(seg_dir / seg.file)
+        if normalized and archive.exists():
+            try:
+                events.extend(read_archive(archive))
+                continue
+            except (OSError, ArchiveError):
+                pass  # fall back to the segment itself
+        events.extend(parse(_read_bytes(seg_dir / seg.file)))
+    events.extend(parse(_read_bytes(Path(events_path))))
+    return events
+
+
+def read_sealed_normalized(events_path: Path, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+    """Normalized events of the sealed segments from logical *offset* on.
+
+    A segment read whole is taken from its columnar archive when it has one
+    (see compact_segments); otherwise, or from mid-segment, its JSONL is
+    parsed. Returns (events, end_offset) — the caller continues from
+    end_offset into the active events.jsonl (event_log.read_events_from).
+    """
+    from .event_log import _split, normalize_or_raw
+
+    events_path = Path(events_path)
+    seg_dir = segments_dir(events_path)
+    events: list[dict[str, Any]] = []
+    base = 0
+    for seg in load_segments(events_path):
+        end = base + seg.bytes
+        if offset < end:
+            archived = None
+            archive = archive_path_for(seg_dir / seg.file)
+            if offset <= base and archive.exists():
+                try:
+                    archived = list(read_archive(archive))
+                except (OSError, ArchiveError):
+                    pass  # fall back to the segment itself
+            if archived is None:
+                data = _read_bytes(seg_dir / seg.file)[max(0, offset - base):]
+                archived = [normalize_or_raw(ev) for ev in _split(data)[0]]
+            events.extend(archived)
+            offset = end
+        base = end
+    return events, offset
+
+
+def compact_segments(events_path: Path) -> list[ArchiveStats]:
+    """Write a columnar archive next to every sealed segment that lacks one.
+
+    Sealed segments are immutable, so an existing archive is never stale.
+    The JSONL segments are kept: they back logical byte offsets.
+    """
+    seg_dir = segments_dir(events_path)
+    written: list[ArchiveStats] = []
+    for seg in load_segments(events_path):
+        if not archive_path_for(seg_dir / seg.file).exists():
+            written.append(compact_jsonl(seg_dir / seg.file))
+    return written
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SEALING
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _manifest_names(seg_dir: Path) -> list[str]:
+    try:
+        return list(json.loads((seg_dir / MANIFEST_FILE).read_text()).get("segments", []))
+    except (OSError, ValueError):
+        return []
+
+
+def _finish_interrupted_seal(f, events_path: Path) -> None:
+    """Drop a sealed prefix still present in the active segment. Caller holds the flock.
+
+    A crash after the manifest is written but before the active file is
+    truncated leaves the same bytes in both places.
+    """
+    segments = load_segments(events_path)
+    if not segments:
+        return
+    last = segments[-1]
+    f.seek(0)
+    prefix = f.read(last.bytes)
+    if len(prefix) == last.bytes and hashlib.sha256(prefix).hexdigest() == last.sha256:
+        rest = f.read()
+        f.seek(0)
+        f.truncate(0)
+        f.write(rest)
+        f.flush()
+
+
+def seal_segment(events_path: Path) -> Optional[SegmentIndex]:
+    """Seal the complete lines of events.jsonl into a new segment.
+
+    Runs under the writer flock, so no append can interleave. Returns the
+    new segment's index, or None if there was nothing to seal.
+    """
+    events_path = Path(events_path)
+    seg_dir = segments_dir(events_path)
+    try:
+        f = open(events_path, "r+b")
+    except OSError:
+        return None
+    with f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            _finish_interrupted_seal(f, events_path)
+            f.seek(0)
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end == 0:
+                return None
+
+            names = _manifest_names(seg_dir)
+            name = f"{len(names) + 1:06d}.jsonl"
+            seg_dir.mkdir(parents=True, exist_ok=True)
+            seg_path = seg_dir / name
+            with open(seg_path, "wb") as out:
+                out.write(data[:end])
+                out.flush()
+                os.fsync(out.fileno())
+
+            index = _build_index(name, data[:end])
+            index.sealed_at = datetime.now(timezone.utc).isoformat()
+            _write_json(_index_path(seg_dir, name), asdict(index))
+            _write_json(
+                seg_dir / MANIFEST_FILE,
+                {"version": MANIFEST_VERSION, "segments": names + [name]},
+            )
+
+            # Keep any unterminated tail in the active segment
+            f.seek(0)
+            f.truncate(0)
+            f.write(data[end:])
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+    return index
+
+
+def _env_int(name: str) -> Optional[int]:
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def maybe_seal_segment(
+    events_path: Path,
+    max_bytes: Optional[int] = None,
+    max_age_seconds: Optional[int] = None,
+) -> Optional[SegmentIndex]:
+    """Seal the active segment if it exceeds a size or age threshold.
+
+    Thresholds default to GENESIS_EVENT_SEGMENT_BYTES and
+    GENESIS_EVENT_SEGMENT_SECONDS; with neither set this never seals. Age is
+    measured from the first event in the active segment.
+    """
+    if max_bytes is None:
+        max_bytes = _env_int("GENESIS_EVENT_SEGMENT_BYTES")
+    if max_age_seconds is None:
+        max_age_seconds = _env_int("GENESIS_EVENT_SEGMENT_SECONDS")
+    if not max_bytes and not max_age_seconds:
+        return None
+    try:
+        size = os.path.getsize(events_path)
+    except OSError:
+        return None
+    if size == 0:
+        return None
+    if max_bytes and size >= max_bytes:
+        return seal_segment(events_path)
+    if max_age_seconds:
+        try:
+            with open(events_path, "rb") as f:
+                first = f.readline()
+            ts = view_event(json.loads(first)).get("timestamp", "")
+        except (OSError, ValueError, AttributeError, TypeError):
+            return None
+        if ts and (datetime.now(timezone.utc) - parse_timestamp(ts)).total_seconds() >= max_age_seconds:
+            return seal_segment(events_path)
+    return None
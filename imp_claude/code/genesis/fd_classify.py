@@ -162,6 +162,7 @@ def classify_signal_source(event: dict) -> str:
         "edge_claimed": "coordination",
         "claim_rejected": "coordination",
         "claim_expired": "coordination",
+        "inbox_item_rejected": "coordination",
         "edge_released": "coordination",
         "convergence_escalated": "escalation",
         # Escalation / encoding
@@ -15,12 +15,31 @@ Heartbeat:
   Every HEARTBEAT_INTERVAL seconds, prints to stderr:
     ⏱  [check_name] 42s elapsed  (last output 3s ago)
   Visible during long test runs; JSON result still goes to stdout.
+
+Concurrency (run_checks):
+  Independent checks run on a bounded thread pool (each thread supervises
+  one subprocess), so edge latency approaches the slowest check rather than
+  the sum. Checklist entries may declare:
+    group: <name>    checks sharing a group run one at a time, in declared order
+                     (e.g. two pytest invocations sharing .pytest_cache/.coverage)
+    exclusive: true  barrier — every earlier check finishes, this one runs alone
+  Results are always returned in declared order.
+  Pool size: workers argument, else $GENESIS_FD_WORKERS, else DEFAULT_WORKERS.
+  1 restores fully sequential execution.
+
+Result cache (run_checks(cache=...)):
+  Checks that declare ``inputs`` are looked up in a CheckCache first (see
+  check_cache); a hit returns the stored result with cached=True and runs
+  no subprocess.
 """
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+from .check_cache import CheckCache
 from .models import (
     CheckOutcome,
     CheckResult,
@@ -32,6 +51,7 @@ from .proc import run_bounded
 DEFAULT_TIMEOUT = 60  # stall timeout: kill if no output for N seconds
 HEARTBEAT_INTERVAL = 10  # seconds between heartbeat lines on stderr
 WALL_CEILING = 20  # wall_timeout = stall_timeout * WALL_CEILING
+DEFAULT_WORKERS = 4  # concurrent F_D subprocesses in run_checks()
 
 
 def run_check(
@@ -156,20 +176,92 @@ def run_check(
     )
 
 
+def fd_workers(workers: Optional[int] = None) -> int:
+    """Effective pool size: *workers*, else $GENESIS_FD_WORKERS, else DEFAULT_WORKERS."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("GENESIS_FD_WORKERS", DEFAULT_WORKERS))
+        except ValueError:
+            workers = DEFAULT_WORKERS
+    return max(1, workers)
+
+
+def run_checks(
+    checks: list[ResolvedCheck],
+    cwd: Path,
+    timeout: int = DEFAULT_TIMEOUT,
+    workers: Optional[int] = None,
+    cache: Optional[CheckCache] = None,
+) -> list[CheckResult]:
+    """Run checks concurrently, honouring group/exclusive. Results in declared order.
+
+    Checks are split into lanes: one lane per group (its checks in declared
+    order), one lane per ungrouped check. Lanes run concurrently on at most
+    fd_workers(workers) threads; with a single worker checks simply run in
+    declared order. An exclusive check waits for every lane before it to
+    finish and runs alone. With *cache*, cacheable checks are
+    answered from it when their inputs are unchanged.
+    """
+    results: list[Optional[CheckResult]] = [None] * len(checks)
+    pool_size = fd_workers(workers)
+
+    def run_lane(lane: list[int]) -> None:
+        for i in lane:
+            # Key is computed before the run: inputs changed mid-run → next run misses
+            key = cache.key(checks[i], cwd) if cache is not None else None
+            hit = cache.get(key, checks[i]) if key else None
+            if hit is not None:
+                results[i] = hit
+                continue
+            results[i] = run_check(checks[i], cwd, timeout=timeout)
+            if key:
+                cache.put(key, results[i])
+
+    def drain(lanes: list[list[int]]) -> None:
+        if pool_size == 1 or len(lanes) <= 1:
+            # Sequential: declared order, not lane order (groups don't jump ahead)
+            run_lane(sorted(i for lane in lanes for i in lane))
+            return
+        with ThreadPoolExecutor(max_workers=min(pool_size, len(lanes))) as pool:
+            for future in [pool.submit(run_lane, lane) for lane in lanes]:
+                future.result()  # re-raise in declared lane order
+
+    lanes: list[list[int]] = []
+    groups: dict[str, list[int]] = {}
+    for i, check in enumerate(checks):
+        if check.exclusive:
+            drain(lanes)
+            lanes, groups = [], {}
+            run_lane([i])
+        elif check.group:
+            if check.group not in groups:
+                groups[check.group] = []
+                lanes.append(groups[check.group])
+            groups[check.group].append(i)
+        else:
+            lanes.append([i])
+    drain(lanes)
+    if cache is not None:
+        cache.save()
+    return results  # type: ignore[return-value]
+
+
 def evaluate_checklist(
     checks: list[ResolvedCheck],
     cwd: Path,
     edge: str = "",
     timeout: int = DEFAULT_TIMEOUT,
+    workers: Optional[int] = None,
+    cache: Optional[CheckCache] = None,
 ) -> EvaluationResult:
-    """Evaluate all checks in a checklist. Returns aggregate result with delta."""
-    results = []
-    escalations = []
+    """Evaluate all checks in a checklist. Returns aggregate result with delta.
 
-    for check in checks:
-        cr = run_check(check, cwd, timeout=timeout)
-        results.append(cr)
+    Checks run concurrently via run_checks(); results keep declared order.
+    """
+    results = run_checks(checks, cwd, timeout=timeout, workers=workers, cache=cache)
+    escalations = []
 
+    for cr in results:
         # η detection: deterministic check fails → candidate for escalation to F_P
         if (
             cr.check_type == "deterministic"
@@ -13,6 +13,7 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .event_segments import iter_logical_lines, logical_size, read_logical
 from .models import SenseResult
 from .ol_event import normalize_event
 
@@ -80,20 +81,19 @@ def sense_feature_stall(
         )
 
     deltas = []
-    with open(events_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = normalize_event(json.loads(line))
-                if (
-                    event.get("event_type") == "iteration_completed"
-                    and event.get("feature") == feature_id
-                ):
-                    deltas.append(event.get("delta", -1))
-            except json.JSONDecodeError:
-                continue
+    for line in iter_logical_lines(events_path):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = normalize_event(json.loads(line))
+            if (
+                event.get("event_type") == "iteration_completed"
+                and event.get("feature") == feature_id
+            ):
+                deltas.append(event.get("delta", -1))
+        except json.JSONDecodeError:
+            continue
 
     if len(deltas) < threshold_iterations:
         return SenseResult(
@@ -209,19 +209,19 @@ def sense_event_log_integrity(events_path: Path) -> SenseResult:
     errors = []
     required_fields = {"event_type", "timestamp", "project"}
 
-    with open(events_path) as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            total += 1
-            try:
-                event = normalize_event(json.loads(line))
-                missing = required_fields - set(event.keys())
-                if missing:
-                    errors.append(f"Line {i}: missing fields {missing}")
-            except json.JSONDecodeError as e:
-                errors.append(f"Line {i}: invalid JSON: {e}")
+    # Line numbers count through the sealed segments into events.jsonl
+    for i, line in enumerate(iter_logical_lines(events_path), 1):
+        line = line.strip()
+        if not line:
+            continue
+        total += 1
+        try:
+            event = normalize_event(json.loads(line))
+            missing = required_fields - set(event.keys())
+            if missing:
+                errors.append(f"Line {i}: missing fields {missing}")
+        except json.JSONDecodeError as e:
+            errors.append(f"Line {i}: invalid JSON: {e}")
 
     if errors:
         return SenseResult(
@@ -407,15 +407,12 @@ def sense_convergence_evidence(
 
 
 def _last_line(path: Path) -> str:
-    """Read the last non-empty line of a file efficiently."""
-    with open(path, "rb") as f:
-        f.seek(0, 2)
-        size = f.tell()
-        if size == 0:
-            return ""
-        # Read last 4KB — enough for any single event line
-        read_size = min(4096, size)
-        f.seek(-read_size, 2)
-        chunk = f.read().decode("utf-8", errors="replace")
+    """Read the last non-empty line of the logical log efficiently."""
+    size = logical_size(path)
+    if size <= 0:
+        return ""
+    # Read last 4KB — enough for any single event line; a freshly sealed
+    # log keeps its tail in the newest segment, not in events.jsonl
+    chunk = read_logical(path, max(0, size - 4096)).decode("utf-8", errors="replace")
     lines = [line for line in chunk.splitlines() if line.strip()]
     return lines[-1] if lines else ""
@@ -7,7 +7,6 @@ links parent↔child, emits events, and handles fold-back.
 Actual child iteration happens via subsequent /gen-start invocations.
 """
 
-import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,7 +14,8 @@ from typing import Optional
 
 import yaml
 
-from .ol_event import emit_ol_event, make_ol_event, normalize_event
+from .event_log import EventLog
+from .ol_event import emit_ol_event, make_ol_event
 from .models import FoldBackResult, SpawnRequest, SpawnResult
 
 
@@ -437,11 +437,4 @@ def load_events(workspace: Path) -> list[dict]:
     events_path = workspace / ".ai-workspace" / "events" / "events.jsonl"
     if not events_path.exists():
         return []
-    events = []
-    for line in events_path.read_text().strip().split("\n"):
-        if line.strip():
-            try:
-                events.append(normalize_event(json.loads(line)))
-            except json.JSONDecodeError:
-                continue
-    return events
+    return EventLog.shared(events_path).events()
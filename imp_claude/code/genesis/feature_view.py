@@ -16,11 +16,21 @@ Tag formats scanned:
 
 The scan is intentionally broad — any file containing the REQ key in any
 context is surfaced. False positives are acceptable; false negatives are not.
+
+Lookups are answered from a ReqIndex: one pass over the tree records, per
+file, every REQ key with its line numbers and tag types. Files are re-read
+only when their (mtime_ns, size) changed; the index persists under
+.ai-workspace/cache/feature_view/ when the project has a workspace. Tracing
+K keys costs one tree walk (stat only, once warm) instead of K full reads.
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -182,8 +192,27 @@ def scan_for_req_key(
     """
     if project_root is None:
         project_root = search_root
+    if not _REQ_KEY_PATTERN.fullmatch(req_key):
+        # Not a key the index records — fall back to a literal scan
+        return _scan_direct(req_key, search_root, project_root)
+    return req_index(search_root).matches(req_key, project_root)
+
+
+def _artifact(fpath: Path, project_root: Path, lines: list[int], tags) -> ArtifactMatch:
+    try:
+        rel = str(fpath.relative_to(project_root))
+    except ValueError:
+        rel = str(fpath)
+    return ArtifactMatch(
+        path=fpath,
+        rel_path=rel,
+        line_numbers=lines,
+        tag_types=sorted(tags),
+        stage_hint=_infer_stage(fpath, project_root),
+    )
 
-    # Build a simple literal+word-boundary pattern for the specific key
+
+def _scan_direct(req_key: str, search_root: Path, project_root: Path) -> list[ArtifactMatch]:
     key_re = re.compile(r"\b" + re.escape(req_key) + r"\b")
     matches: list[ArtifactMatch] = []
 
@@ -207,23 +236,8 @@ def scan_for_req_key(
                 for t in _classify_line_tag(line):
                     tag_types_set.add(t)
 
-        if not line_numbers:
-            continue
-
-        try:
-            rel = str(fpath.relative_to(project_root))
-        except ValueError:
-            rel = str(fpath)
-
-        matches.append(
-            ArtifactMatch(
-                path=fpath,
-                rel_path=rel,
-                line_numbers=line_numbers,
-                tag_types=sorted(tag_types_set),
-                stage_hint=_infer_stage(fpath, project_root),
-            )
-        )
+        if line_numbers:
+            matches.append(_artifact(fpath, project_root, line_numbers, tag_types_set))
 
     return matches
 
@@ -243,6 +257,163 @@ def _iter_files(root: Path):
             yield item
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# REQ KEY INDEX
+# ═══════════════════════════════════════════════════════════════════════
+
+INDEX_VERSION = 1
+_RACY_NS = 2_000_000_000  # files modified this recently are re-read on every refresh
+
+
+def _keys_in_line(line: str) -> set[str]:
+    """Every REQ key a word-boundary search for that key would find in *line*.
+
+    A match may embed further keys (``REQ-F-REQ-AUTH-001`` contains
+    ``REQ-AUTH-001``), so each inner ``REQ-`` suffix is tried as well.
+    """
+    keys: set[str] = set()
+    for m in _REQ_KEY_PATTERN.finditer(line):
+        token = m.group()
+        keys.add(token)
+        i = token.find("REQ-", 1)
+        while i > 0:
+            inner = _REQ_KEY_PATTERN.match(token, i)
+            if inner is not None and inner.end() == len(token):
+                keys.add(inner.group())
+            i = token.find("REQ-", i + 1)
+    return keys
+
+
+def _index_text(text: str) -> dict[str, list[list]]:
+    """{key: [line_numbers, tag_types]} for one file's text."""
+    entry: dict[str, list[list]] = {}
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if "REQ-" not in line:
+            continue
+        keys = _keys_in_line(line)
+        if not keys:
+            continue
+        tags = _classify_line_tag(line)
+        for key in keys:
+            lines, seen = entry.setdefault(key, [[], []])
+            lines.append(lineno)
+            seen.extend(t for t in tags if t not in seen)
+    return entry
+
+
+class ReqIndex:
+    """Inverted index REQ key → files under *root*, with line numbers and tags.
+
+    refresh() walks the tree and re-reads only files whose (mtime_ns, size)
+    changed. With *cache_path* the per-file entries are persisted as JSON
+    and reused across processes.
+    """
+
+    def __init__(self, root: Path, cache_path: Optional[Path] = None) -> None:
+        self.root = Path(root)
+        self.cache_path = cache_path
+        self.reads = 0
+        # abspath → [mtime_ns, size, {key: [lines, tags]}, racy]
+        self._files: dict[str, list] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+        if cache_path is not None:
+            try:
+                doc = json.loads(cache_path.read_text())
+                if doc.get("version") == INDEX_VERSION and doc.get("root") == str(self.root):
+                    self._files = doc["files"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+
+    def refresh(self) -> "ReqIndex":
+        with self._lock:
+            now = time.time_ns()
+            files: dict[str, list] = {}
+            dirty = False
+            for fpath in _iter_files(self.root):
+                if fpath.suffix.lower() in _SKIP_EXTENSIONS:
+                    continue
+                key = str(fpath)
+                try:
+                    st = fpath.stat()
+                except OSError:
+                    continue
+                cached = self._files.get(key)
+                if (
+                    cached is not None
+                    and not cached[3]
+                    and cached[:2] == [st.st_mtime_ns, st.st_size]
+                ):
+                    files[key] = cached
+                    continue
+                try:
+                    text = fpath.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+                self.reads += 1
+                files[key] = [st.st_mtime_ns, st.st_size, _index_text(text), now - st.st_mtime_ns <= _RACY_NS]
+                dirty = True
+            dirty = dirty or files.keys() != self._files.keys()
+            self._files = files
+
+            postings: dict[str, list[str]] = {}
+            for path, entry in files.items():
+                for req_key in entry[2]:
+                    postings.setdefault(req_key, []).append(path)
+            self._postings = postings
+            if dirty:
+                self._save()
+        return self
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        doc = {"version": INDEX_VERSION, "root": str(self.root), "files": self._files}
+        tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, separators=(",", ":")))
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def keys(self) -> list[str]:
+        """Every REQ key found under the root."""
+        return sorted(self._postings)
+
+    def keys_in(self, path: Path) -> list[str]:
+        """REQ keys mentioned in the file at *path*, as of the last refresh."""
+        entry = self._files.get(str(path))
+        return sorted(entry[2]) if entry is not None else []
+
+    def matches(self, req_key: str, project_root: Optional[Path] = None) -> list[ArtifactMatch]:
+        """One ArtifactMatch per file mentioning *req_key*, in walk order."""
+        project_root = project_root or self.root
+        out: list[ArtifactMatch] = []
+        for path in self._postings.get(req_key, []):
+            lines, tags = self._files[path][2][req_key]
+            out.append(_artifact(Path(path), project_root, list(lines), tags))
+        return out
+
+
+_INDEXES: dict[str, ReqIndex] = {}
+
+
+def default_index_path(root: Path) -> Optional[Path]:
+    """Persisted index location for *root*, or None if it has no .ai-workspace."""
+    ws = Path(root) / ".ai-workspace"
+    return ws / "cache" / "feature_view" / "req_index.json" if ws.is_dir() else None
+
+
+def req_index(root: Path) -> ReqIndex:
+    """The process-wide ReqIndex of *root*, refreshed."""
+    key = os.path.abspath(root)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = ReqIndex(Path(root), default_index_path(Path(root)))
+    return index.refresh()
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # FEATURE VIEW BUILDER
 # ═══════════════════════════════════════════════════════════════════════
@@ -267,6 +438,12 @@ def build_feature_view(
         expected_stages = EXPECTED_STAGES
 
     all_matches = scan_for_req_key(req_key, project_root, project_root)
+    return _view_from_matches(req_key, all_matches, expected_stages)
+
+
+def _view_from_matches(
+    req_key: str, all_matches: list[ArtifactMatch], expected_stages: list[str]
+) -> FeatureView:
 
     # Group by stage
     by_stage: dict[str, list[ArtifactMatch]] = {}
@@ -305,9 +482,18 @@ def build_all_feature_views(
 
     Returns: {req_key: FeatureView}
     """
-    return {
-        key: build_feature_view(key, project_root, expected_stages) for key in req_keys
-    }
+    if expected_stages is None:
+        expected_stages = EXPECTED_STAGES
+    # One refresh serves every key; keys the index cannot hold are scanned directly
+    index = req_index(project_root)
+    views: dict[str, FeatureView] = {}
+    for key in req_keys:
+        if _REQ_KEY_PATTERN.fullmatch(key):
+            matches = index.matches(key, project_root)
+        else:
+            matches = _scan_direct(key, project_root, project_root)
+        views[key] = _view_from_matches(key, matches, expected_stages)
+    return views
 
 
 def coverage_report(views: dict[str, FeatureView]) -> list[dict[str, Any]]:
@@ -30,6 +30,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .event_log import EventLog
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # DECISION TYPES
@@ -131,6 +133,7 @@ def _append_event(events_path: Path, event: dict[str, Any]) -> None:
         fcntl.flock(f, fcntl.LOCK_EX)
         try:
             f.write(line)
+            f.flush()
         finally:
             fcntl.flock(f, fcntl.LOCK_UN)
 
@@ -267,16 +270,7 @@ def load_events(events_path: Path) -> list[dict[str, Any]]:
     """Load all events from events.jsonl, skipping malformed lines."""
     if not events_path.exists():
         return []
-    events: list[dict[str, Any]] = []
-    for line in events_path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return events
+    return EventLog.shared(events_path).raw_events()
 
 
 def get_human_gates(
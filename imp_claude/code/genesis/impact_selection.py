@@ -0,0 +1,229 @@
+# Implements: REQ-EVAL-002 (Evaluator Composition), REQ-FEAT-001 (Feature Vector Trajectories)
+"""Test impact selection — run the tests a feature's change can reach.
+
+The deterministic pytest checks run the whole suite on every iteration. A
+feature only touches the code and tests that carry its REQ keys, and the
+tree already says which: `# Implements:` / `# Validates:` tags, indexed by
+feature_view.ReqIndex.
+
+select() resolves the test files relevant to a feature from:
+  - its REQ keys — the feature id plus the keys listed under **Satisfies**
+    in specification/features/FEATURE_VECTORS.md — mapped to tagged tests
+  - the files changed since the feature last converged (a
+    WorkspaceFingerprint root hash recorded by record_converged()):
+    changed tests run directly; changed code pulls in the tests that
+    share one of its REQ keys
+
+The full suite runs instead (argument "") when there is no converged
+fingerprint yet, when test configuration changed (conftest.py,
+pyproject.toml, ...), when nothing could be selected, and on every
+`full_suite_every`-th selection so anything the tags miss is still caught.
+
+Checks opt in by referencing $selected_tests, e.g.
+  command: "$tools.test_runner.command $tools.test_runner.args $selected_tests"
+The period comes from tools.test_runner.full_suite_every (default 10).
+
+Layout (disposable):
+    .ai-workspace/cache/impact_selection/state.json   feature → {fingerprint, since_full}
+    .ai-workspace/cache/impact_selection/state.lock   flock held across each update,
+                                                      since features run in parallel
+
+Contract:
+  ImpactSelector(root).select(feature_id, req_keys=()) → Selection
+  ImpactSelector(root).record_converged(feature_id)     → fingerprint root hash
+  Selection.argument                                → value of $selected_tests
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from .feature_view import req_index
+from .workspace_fingerprint import WorkspaceFingerprint
+
+SELECTED_TESTS_VAR = "selected_tests"
+DEFAULT_FULL_SUITE_EVERY = 10
+
+# Changes to these files can affect any test
+_SUITE_CONFIG_FILES = frozenset({
+    "conftest.py", "pyproject.toml", "setup.cfg", "setup.py", "pytest.ini", "tox.ini",
+})
+
+_SATISFIES_PATTERN = re.compile(r"\*\*Satisfies\*\*:\s*(.+)")
+_REQ_KEY_PATTERN = re.compile(r"\bREQ-[A-Z]+(?:-[A-Z]+)*-\d+\b")
+
+
+@dataclass
+class Selection:
+    """Tests chosen for one check run; full=True means run the whole suite."""
+
+    tests: list[str] = field(default_factory=list)  # paths relative to the root
+    full: bool = True
+    reason: str = ""
+
+    @property
+    def argument(self) -> str:
+        """Space-separated test paths, or "" for the full suite."""
+        return "" if self.full else " ".join(self.tests)
+
+
+def is_test_path(rel_path: str) -> bool:
+    """True for pytest-style test modules (test_*.py / *_test.py)."""
+    name = rel_path.rsplit("/", 1)[-1]
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def spec_satisfies(spec_path: Path, feature_id: str) -> list[str]:
+    """REQ keys listed under **Satisfies** for *feature_id* in FEATURE_VECTORS.md."""
+    try:
+        text = spec_path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    keys: list[str] = []
+    in_section = False
+    for line in text.splitlines():
+        if line.startswith("### "):
+            in_section = line[4:].split(":", 1)[0].strip() == feature_id
+            continue
+        if in_section:
+            m = _SATISFIES_PATTERN.match(line)
+            if m:
+                keys.extend(_REQ_KEY_PATTERN.findall(m.group(1)))
+    return keys
+
+
+def full_suite_every(constraints: dict) -> int:
+    """tools.test_runner.full_suite_every from project constraints."""
+    runner = (constraints.get("tools") or {}).get("test_runner") or {}
+    try:
+        return max(1, int(runner.get("full_suite_every", DEFAULT_FULL_SUITE_EVERY)))
+    except (TypeError, ValueError):
+        return DEFAULT_FULL_SUITE_EVERY
+
+
+def references_selected_tests(edge_config: dict) -> bool:
+    """True if any checklist command uses $selected_tests."""
+    token = "$" + SELECTED_TESTS_VAR
+    return any(
+        token in str(entry.get("command") or "")
+        for entry in edge_config.get("checklist", [])
+        if isinstance(entry, dict)
+    )
+
+
+class ImpactSelector:
+    """Test selection state for the project at *root*."""
+
+    def __init__(
+        self,
+        root: Path,
+        full_every: int = DEFAULT_FULL_SUITE_EVERY,
+        spec_path: Optional[Path] = None,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.full_every = full_every
+        self.spec_path = spec_path or self.root / "specification" / "features" / "FEATURE_VECTORS.md"
+        self.state_path = self.root / ".ai-workspace" / "cache" / "impact_selection" / "state.json"
+
+    # ── State ─────────────────────────────────────────────────────────────
+
+    def _load(self) -> dict:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save(self, state: dict) -> None:
+        tmp = self.state_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(state, indent=1, sort_keys=True))
+            os.replace(tmp, self.state_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _update(self, feature_id: str, apply: Callable[[dict], None]) -> None:
+        """Apply *apply* to the feature's entry in a locked read-modify-write."""
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            lock = open(self.state_path.with_suffix(".lock"), "a")
+        except OSError:
+            return
+        with lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            state = self._load()
+            entry = state.get(feature_id)
+            if not isinstance(entry, dict):
+                entry = state[feature_id] = {}
+            apply(entry)
+            self._save(state)
+
+    def _fingerprint(self) -> WorkspaceFingerprint:
+        return WorkspaceFingerprint(self.root)
+
+    def record_converged(self, feature_id: str) -> str:
+        """Fingerprint the tree as the feature's last converged state."""
+        root_hash = self._fingerprint().snapshot()
+        self._update(feature_id, lambda entry: entry.update(fingerprint=root_hash))
+        return root_hash
+
+    # ── Selection ─────────────────────────────────────────────────────────
+
+    def select(self, feature_id: str, req_keys: Iterable[str] = ()) -> Selection:
+        """Tests to run for *feature_id*; counts towards the full-suite period."""
+        entry = self._load().get(feature_id)
+        # Select outside the lock; only the counter update is serialised
+        selection = self._select(feature_id, req_keys, entry if isinstance(entry, dict) else {})
+
+        def count(entry: dict) -> None:
+            entry["since_full"] = 0 if selection.full else entry.get("since_full", 0) + 1
+
+        self._update(feature_id, count)
+        return selection
+
+    def _select(self, feature_id: str, req_keys: Iterable[str], entry: dict) -> Selection:
+        old = entry.get("fingerprint")
+        if not old:
+            return Selection(reason="no converged fingerprint")
+        if entry.get("since_full", 0) + 1 >= self.full_every:
+            return Selection(reason=f"periodic full run (every {self.full_every})")
+        try:
+            changes = self._fingerprint().changed_since(old)
+        except KeyError:
+            return Selection(reason="converged fingerprint unavailable")
+
+        changed = [c.path for c in changes]
+        config = sorted(p for p in changed if p.rsplit("/", 1)[-1] in _SUITE_CONFIG_FILES)
+        if config:
+            return Selection(reason=f"test configuration changed: {config[0]}")
+
+        index = req_index(self.root)
+        keys = {feature_id, *req_keys, *spec_satisfies(self.spec_path, feature_id)}
+        tests: set[str] = set()
+        for c in changes:
+            if c.change == "removed":
+                continue
+            if is_test_path(c.path):
+                tests.add(c.path)
+            else:
+                keys.update(index.keys_in(self.root / c.path))
+        for key in keys:
+            for match in index.matches(key, self.root):
+                if is_test_path(match.rel_path):
+                    tests.add(match.rel_path)
+
+        tests = {t for t in tests if (self.root / t).is_file()}
+        if not tests:
+            return Selection(reason="no tagged tests for the change")
+        return Selection(
+            tests=sorted(tests),
+            full=False,
+            reason=f"{len(keys)} REQ keys, {len(changed)} changed files",
+        )
@@ -24,13 +24,12 @@ Design decisions:
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from . import yaml_cache
+from .event_log import EventLog
 from .outcome_types import IntentEvent
 
 
@@ -100,62 +99,8 @@ def _read_events(events_path: Path) -> list[dict[str, Any]]:
     if not events_path.exists():
         return []
 
-    events: list[dict[str, Any]] = []
-    for line in events_path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            raw = json.loads(line)
-            events.append(_normalize(raw))
-        except (json.JSONDecodeError, Exception):
-            continue
-    return events
-
-
-def _normalize(raw: dict[str, Any]) -> dict[str, Any]:
-    """Normalise an OL RunEvent or flat event to a uniform flat dict.
-
-    Flat events have 'event_type' at the top level.
-    OL events have eventType + run.facets.sdlc:event_type.
-    """
-    if "event_type" in raw:
-        return raw  # already flat
-
-    facets = raw.get("run", {}).get("facets", {})
-    type_facet = facets.get("sdlc:event_type", {})
-    if not type_facet:
-        return raw  # unknown format — pass through
-
-    import re as _re
-
-    semantic = type_facet.get("type", "")
-    event_type = _re.sub(r"(?<!^)(?=[A-Z])", "_", semantic).lower()
-
-    namespace = raw.get("job", {}).get("namespace", "")
-    project = namespace.removeprefix("aisdlc://")
-
-    payload = facets.get("sdlc:payload", {})
-    flat: dict[str, Any] = {
-        "event_type": event_type,
-        "timestamp": raw.get("eventTime", ""),
-        "project": project,
-    }
-    flat.update({k: v for k, v in payload.items() if not k.startswith("_")})
-
-    # Metadata preserved for legacy flat events wrapped in OL
-    if "_metadata" in raw and "original_data" in raw["_metadata"]:
-        orig = raw["_metadata"]["original_data"]
-        for k, v in orig.items():
-            if k not in flat:
-                flat[k] = v
-        # Flatten "data" sub-dict if present
-        if "data" in orig and isinstance(orig["data"], dict):
-            for k, v in orig["data"].items():
-                if k not in flat:
-                    flat[k] = v
-
-    return flat
+    # Normalised once per line by the shared log (ol_event.normalize_event)
+    return EventLog.shared(events_path).events()
 
 
 def _get_intent_id(event: dict[str, Any]) -> str | None:
@@ -247,7 +192,7 @@ def _load_feature_vector(workspace_root: Path, feature_id: str) -> dict[str, Any
     if not path.exists():
         return None
     try:
-        data = yaml.safe_load(path.read_text()) or {}
+        data = yaml_cache.load(path) or {}
         return data
     except Exception:
         return None
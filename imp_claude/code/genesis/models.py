@@ -57,6 +57,10 @@ class ResolvedCheck:
     command: Optional[str] = None
     pass_criterion: Optional[str] = None
     unresolved: list[str] = field(default_factory=list)
+    exclusive: bool = False  # run alone: no other check in flight
+    group: Optional[str] = None  # checks sharing a group run one at a time, in declared order
+    inputs: Optional[list[str]] = None  # globs the result depends on; None → never cached
+    input_env: list[str] = field(default_factory=list)  # env vars the result depends on
 
 
 @dataclass
@@ -73,6 +77,7 @@ class CheckResult:
     exit_code: Optional[int] = None
     stdout: str = ""
     stderr: str = ""
+    cached: bool = False  # reused from check_cache, subprocess not run
 
 
 @dataclass
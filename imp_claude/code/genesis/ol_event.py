@@ -20,8 +20,13 @@ Root events (no triggering parent) set causation_id = correlation_id = own runId
 """
 
 import argparse
+import atexit
 import fcntl
+import hashlib
 import json
+import os
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -101,6 +106,8 @@ _OL_EVENT_TYPE = {
     "ConsensusReached": "COMPLETE",    # quorum satisfied; all 5 checks passed
     "ConsensusFailed": "FAIL",         # typed failure with failure_reason + available_paths
     "RecoveryPathSelected": "OTHER",   # proposer selected re_open|narrow_scope|abandon
+    # Event log integrity (REQ-ROBUST-003)
+    "EventLogRepaired": "OTHER",       # torn final line terminated or truncated at startup
 }
 
 
@@ -196,28 +203,297 @@ def make_ol_event(
     }
 
 
+# fsync policies for one locked append: "none" leaves durability to the OS
+# page cache; "per-batch" fsyncs once after the write; "per-event" fsyncs
+# after every line. None defers to the process durability mode below.
+FSYNC_NONE = "none"
+FSYNC_PER_BATCH = "per-batch"
+FSYNC_PER_EVENT = "per-event"
+FSYNC_POLICIES = (FSYNC_NONE, FSYNC_PER_BATCH, FSYNC_PER_EVENT)
+
+# Process durability mode for appends without an explicit policy:
+#   none   — flush only (a crash of the machine can lose recent events)
+#   always — fsync after every append
+#   group  — fsync once every_events appends or every_ms milliseconds after
+#            the first unsynced append, whichever comes first; a background
+#            timer covers the interval when no further append arrives, and
+#            anything still pending is synced at exit
+# Set with configure_durability() or GENESIS_EVENT_DURABILITY, e.g.
+# "group" or "group:64:200" (mode:every_events:every_ms).
+DURABILITY_MODES = ("none", "always", "group")
+
+_durability = {"mode": "none", "every_events": 32, "every_ms": 100}
+_unsynced: dict[str, list] = {}  # abspath → [appends since last fsync, monotonic time of last fsync]
+_sync_lock = threading.Lock()
+_sync_timer: threading.Timer | None = None  # armed while group appends are pending
+
+
+def configure_durability(mode: str = "none", every_events: int = 32, every_ms: int = 100) -> None:
+    """Set the process-wide durability mode for event appends."""
+    if mode not in DURABILITY_MODES:
+        raise ValueError(f"durability mode must be one of {DURABILITY_MODES}, got {mode!r}")
+    sync_event_logs()
+    _durability.update(mode=mode, every_events=max(1, every_events), every_ms=max(0, every_ms))
+
+
+def _configure_from_env() -> None:
+    spec = os.environ.get("GENESIS_EVENT_DURABILITY", "")
+    if not spec:
+        return
+    mode, *rest = spec.split(":")
+    try:
+        configure_durability(mode, *(int(n) for n in rest[:2]))
+    except ValueError:
+        pass  # malformed setting — keep the default rather than fail every emit
+
+
+def _group_sync(f, key: str, appended: int) -> None:
+    """fsync *f* if the group thresholds for *key* are reached. Caller holds the flock."""
+    with _sync_lock:
+        state = _unsynced.setdefault(key, [0, time.monotonic()])
+        state[0] += appended
+        due = (
+            state[0] >= _durability["every_events"]
+            or (time.monotonic() - state[1]) * 1000 >= _durability["every_ms"]
+        )
+        if not due:
+            _arm_sync_timer()
+            return
+        os.fsync(f.fileno())
+        _unsynced[key] = [0, time.monotonic()]
+
+
+def _arm_sync_timer() -> None:
+    """Schedule a flush every_ms from now unless one is pending. Caller holds _sync_lock."""
+    global _sync_timer
+    if _sync_timer is not None:
+        return
+    _sync_timer = threading.Timer(_durability["every_ms"] / 1000, _sync_timer_fired)
+    _sync_timer.daemon = True
+    _sync_timer.start()
+
+
+def _sync_timer_fired() -> None:
+    global _sync_timer
+    with _sync_lock:
+        _sync_timer = None
+    sync_event_logs()
+
+
+def sync_event_logs() -> None:
+    """fsync every event log with appends not yet covered by a group fsync."""
+    global _sync_timer
+    with _sync_lock:
+        if _sync_timer is not None:
+            _sync_timer.cancel()
+            _sync_timer = None
+        pending = [key for key, (count, _t) in _unsynced.items() if count]
+        _unsynced.clear()
+    for key in pending:
+        try:
+            fd = os.open(key, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+atexit.register(sync_event_logs)
+_configure_from_env()
+
+
+def append_event_lines(events_path: Path, lines: list[str], fsync: str | None = None) -> None:
+    """Append serialised event lines to events.jsonl under one flock.
+
+    *fsync* is one of FSYNC_POLICIES, or None for the process durability mode.
+    """
+    events_path.parent.mkdir(parents=True, exist_ok=True)
+    if fsync is None and _durability["mode"] == "always":
+        fsync = FSYNC_PER_BATCH
+    with open(events_path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            if fsync == FSYNC_PER_EVENT:
+                for line in lines:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                f.write("".join(lines))
+                f.flush()
+                if fsync == FSYNC_PER_BATCH:
+                    os.fsync(f.fileno())
+                elif fsync is None and _durability["mode"] == "group":
+                    _group_sync(f, os.path.abspath(events_path), len(lines))
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
 def emit_ol_event(events_path: Path, event: dict) -> str:
     """
     Append an OL event dict to events.jsonl. Returns the runId.
 
     Uses fcntl.flock for advisory locking (single-machine safety).
     Creates parent directories if they don't exist.
+    Durability follows the process mode (see configure_durability).
     """
-    events_path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(event, separators=(",", ":")) + "\n"
+    append_event_lines(events_path, [json.dumps(event, separators=(",", ":")) + "\n"])
+    return event["run"]["runId"]
 
-    with open(events_path, "a") as f:
+
+def repair_event_log(events_path: Path) -> dict | None:
+    """Repair a torn final line left by a writer that died mid-append.
+
+    Writers append whole lines under the flock and flush before releasing
+    it: append_event_lines (and emit_ol_event), fd_emit, human_audit, the
+    plugin hooks' append_event and the installer's append_event. An
+    unterminated tail seen while holding the lock is therefore a crashed
+    write, provided no writer bypasses the lock. A tail that
+    still parses as a JSON object is kept and terminated; anything else is
+    truncated back to the last newline.
+
+    Returns None if the log ends cleanly, else a dict describing the repair:
+    {action: "terminated" | "truncated", offset, dropped_bytes, fragment_sha256}.
+    """
+    try:
+        f = open(events_path, "r+b")
+    except OSError:
+        return None
+    with f:
         fcntl.flock(f, fcntl.LOCK_EX)
         try:
-            f.write(line)
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return None
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return None
+            # Find the start of the unterminated fragment
+            pos = size
+            while pos > 0:
+                step = min(65536, pos)
+                f.seek(pos - step)
+                chunk = f.read(step)
+                nl = chunk.rfind(b"\n")
+                if nl >= 0:
+                    pos = pos - step + nl + 1
+                    break
+                pos -= step
+            f.seek(pos)
+            fragment = f.read()
+            try:
+                complete = isinstance(json.loads(fragment), dict)
+            except ValueError:
+                complete = False
+            if complete:
+                f.seek(size)
+                f.write(b"\n")
+            else:
+                f.truncate(pos)
             f.flush()
+            os.fsync(f.fileno())
         finally:
             fcntl.flock(f, fcntl.LOCK_UN)
+    return {
+        "action": "terminated" if complete else "truncated",
+        "offset": pos,
+        "dropped_bytes": 0 if complete else len(fragment),
+        "fragment_sha256": hashlib.sha256(fragment).hexdigest(),
+    }
 
-    return event["run"]["runId"]
+
+def recover_event_log(events_path: Path, project: str, actor: str = "genesis-cli") -> dict | None:
+    """Startup recovery: repair a torn final line and record it as event_log_repaired.
+
+    Returns the repair dict (see repair_event_log) or None if nothing was wrong.
+    """
+    repair = repair_event_log(events_path)
+    if repair is not None:
+        emit_ol_event(
+            events_path,
+            make_ol_event("EventLogRepaired", "event_log", project, project, actor, payload=repair),
+        )
+    return repair
+
+
+class EventBatch:
+    """Buffered emitter — collects events and appends them with one lock and one write.
+
+    Usage:
+        with EventBatch(events_path) as batch:
+            run_id = batch.emit(make_ol_event(...))
+            ...
+        # pending events are appended on exit, also when the block raises
+
+    emit() returns the runId immediately so causal chains can be threaded
+    before anything is written. flush() is an explicit flush point — call it
+    when another process must observe the events before the batch ends.
+    *fsync* overrides the process durability mode for this batch.
+    """
+
+    def __init__(self, events_path: Path, fsync: str | None = None) -> None:
+        if fsync is not None and fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.events_path = Path(events_path)
+        self.fsync = fsync
+        self._pending: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def emit(self, event: dict) -> str:
+        """Queue an OL event. Returns its runId."""
+        self._pending.append(json.dumps(event, separators=(",", ":")) + "\n")
+        return event["run"]["runId"]
+
+    def flush(self) -> int:
+        """Append all queued events. Returns the number written."""
+        if not self._pending:
+            return 0
+        lines, self._pending = self._pending, []
+        append_event_lines(self.events_path, lines, self.fsync)
+        return len(lines)
+
+    def __enter__(self) -> "EventBatch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
 
 
 import re as _re  # noqa: E402 — intentional late import (normalize_event helpers only)
+from collections.abc import Mapping as _Mapping  # noqa: E402
+from functools import lru_cache as _lru_cache  # noqa: E402
+
+_CAMEL_BOUNDARY = _re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@_lru_cache(maxsize=1024)
+def _camel_to_snake(name: str) -> str:
+    """CamelCase → snake_case: "IterationCompleted" → "iteration_completed"."""
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+# The closed set of semantic types is converted once at import; anything else
+# (new or foreign types) falls through to the memoized regex.
+_SNAKE_EVENT_TYPE = {name: _camel_to_snake(name) for name in _OL_EVENT_TYPE}
+
+
+def snake_event_type(semantic_type: str) -> str:
+    """Return the flat event_type for an OL semantic type name."""
+    return _SNAKE_EVENT_TYPE.get(semantic_type) or _camel_to_snake(semantic_type)
+
+
+def _original_data(raw: dict) -> dict:
+    """The v1 flat event preserved by migrate_events_v1_to_v2.py, or {}."""
+    meta = raw.get("_metadata")
+    if isinstance(meta, dict):
+        orig = meta.get("original_data")
+        if isinstance(orig, dict):
+            return orig
+    return {}
 
 
 def normalize_event(raw: dict) -> dict:
@@ -231,6 +507,8 @@ def normalize_event(raw: dict) -> dict:
       - timestamp from eventTime
       - project from job.namespace (strips "aisdlc://")
       - all payload fields from run.facets["sdlc:payload"]
+      - for migrated v1 events, any field of _metadata.original_data (and of
+        its "data" sub-dict) not already set by the above
 
     This function is the single read-side compatibility layer. Consumers that
     call load_events() receive flat dicts regardless of which writer produced them.
@@ -243,26 +521,94 @@ def normalize_event(raw: dict) -> dict:
     if not event_type_facet:
         return raw  # Unknown format — pass through unchanged
 
-    semantic_type = event_type_facet.get("type", "")
-    # CamelCase → snake_case: "IterationCompleted" → "iteration_completed"
-    event_type = _re.sub(r"(?<!^)(?=[A-Z])", "_", semantic_type).lower()
-
     # Project from job namespace: "aisdlc://my-project" → "my-project"
     namespace = raw.get("job", {}).get("namespace", "")
-    project = namespace.removeprefix("aisdlc://")
-
-    # Payload fields (skip internal _producer/_schemaURL keys)
-    payload_facet = facets.get("sdlc:payload", {})
 
     flat: dict = {
-        "event_type": event_type,
+        "event_type": snake_event_type(event_type_facet.get("type", "")),
         "timestamp": raw.get("eventTime", ""),
-        "project": project,
+        "project": namespace.removeprefix("aisdlc://"),
     }
-    flat.update({k: v for k, v in payload_facet.items() if not k.startswith("_")})
+    # Payload fields (skip internal _producer/_schemaURL keys)
+    for k, v in facets.get("sdlc:payload", {}).items():
+        if k[:1] != "_":
+            flat[k] = v
+
+    # Metadata preserved for legacy flat events wrapped in OL
+    orig = _original_data(raw)
+    if orig:
+        for k, v in orig.items():
+            flat.setdefault(k, v)
+        if isinstance(orig.get("data"), dict):
+            for k, v in orig["data"].items():
+                flat.setdefault(k, v)
     return flat
 
 
+class EventView(_Mapping):
+    """Read-only flat view of an OL RunEvent that reads facets on access.
+
+    Behaves like normalize_event(raw) for lookups (ev["feature"],
+    ev.get("edge"), "delta" in ev) without copying the payload. Use it on
+    hot paths that touch a few fields of many events; call dict(view) when
+    a real dict is needed.
+    """
+
+    __slots__ = ("_raw", "_facets")
+
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+        self._facets = raw.get("run", {}).get("facets", {})
+
+    def _builtin(self, key: str):
+        if key == "event_type":
+            return snake_event_type(self._facets.get("sdlc:event_type", {}).get("type", ""))
+        if key == "timestamp":
+            return self._raw.get("eventTime", "")
+        return self._raw.get("job", {}).get("namespace", "").removeprefix("aisdlc://")
+
+    def __getitem__(self, key: str):
+        # Same precedence as normalize_event(): payload over built-ins over v1 metadata
+        if key[:1] != "_":
+            payload = self._facets.get("sdlc:payload", {})
+            if key in payload:
+                return payload[key]
+        if key in ("event_type", "timestamp", "project"):
+            return self._builtin(key)
+        orig = _original_data(self._raw)
+        if key in orig:
+            return orig[key]
+        data = orig.get("data")
+        if isinstance(data, dict) and key in data:
+            return data[key]
+        raise KeyError(key)
+
+    def _keys(self) -> dict:
+        keys = dict.fromkeys(("event_type", "timestamp", "project"))
+        keys.update(dict.fromkeys(k for k in self._facets.get("sdlc:payload", {}) if k[:1] != "_"))
+        orig = _original_data(self._raw)
+        keys.update(dict.fromkeys(orig))
+        if isinstance(orig.get("data"), dict):
+            keys.update(dict.fromkeys(orig["data"]))
+        return keys
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"EventView({dict(self)!r})"
+
+
+def view_event(raw: dict):
+    """Like normalize_event(), but returns an EventView instead of a copy for OL events."""
+    if "event_type" in raw or not raw.get("run", {}).get("facets", {}).get("sdlc:event_type"):
+        return raw
+    return EventView(raw)
+
+
 # ---------------------------------------------------------------------------
 # Convenience constructors — one per ADR-S-012 event type
 # ---------------------------------------------------------------------------
@@ -0,0 +1,276 @@
+# Implements: REQ-EVENT-002 (Projection Contract), REQ-EVENT-001 (Event Log as Source of Truth)
+# Implements: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Resumable event-stream projections with persisted snapshots.
+
+Every workspace projection is a left fold over the normalized event stream.
+A Projection names the fold (initial state + per-event step) so it can be
+checkpointed: the folded state is persisted together with the byte offset it
+covers, and the next caller folds only the suffix appended since.
+
+Contract:
+  projection.fold(events)                  → state   (pure — no snapshot involved)
+  load_projection(events_path, projection) → state   (snapshot + suffix fold)
+  ProjectionSet(name, p1, p2, ...)         → Projection folding all members in one pass
+
+Snapshot layout:
+    .ai-workspace/events/snapshots/<projection.name>.json
+
+    {
+      "projection": name, "version": projection.version,
+      "offset": <bytes of events.jsonl covered>,
+      "last_run_id": <runId of the last folded event, or null>,
+      "head_sha": <sha256 of the first 64 bytes of the log>,
+      "tail_sha": <sha256 of the last line folded>,
+      "state": <projection.encode(state)>
+    }
+
+Offsets address the logical log (sealed segments then events.jsonl, see
+event_segments), so sealing a segment does not invalidate snapshots.
+
+Cold folds take sealed history from the segments' columnar archives when
+every fold step reads normalized events (see _reads_normalized), skipping
+json.loads and normalize_event for those segments.
+
+Invalidation — a snapshot is ignored (and the stream refolded from byte 0)
+when the log is shorter than its offset, when the head or last folded line
+no longer hash the same (the log was rewritten, e.g. by
+migrate_events_v1_to_v2.py), or when the projection version changed.
+Snapshots are a cache: deleting the directory is always safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .event_log import normalize_or_raw, read_events_from
+from .event_segments import logical_size, read_logical, read_sealed_normalized
+
+_HEAD_BYTES = 64
+_TAIL_WINDOW = 65536  # upper bound on a single event line when locating the last one
+
+
+class Projection:
+    """A named, resumable fold over normalized events.
+
+    Subclasses implement initial() and apply(). States that are not plain
+    JSON (tuple keys, sets) override encode()/decode(). Bump ``version`` when
+    the state shape changes so stale snapshots are discarded.
+    """
+
+    name: str = ""
+    version: int = 1
+    # False → apply() receives events exactly as written (no OL normalization)
+    normalized: bool = True
+
+    def initial(self) -> Any:
+        return {}
+
+    def apply(self, state: Any, event: dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    def encode(self, state: Any) -> Any:
+        return state
+
+    def decode(self, data: Any) -> Any:
+        return data
+
+    def fold(self, events: Iterable[dict[str, Any]], state: Any = None) -> Any:
+        """Fold *events* into *state* (or a fresh initial state)."""
+        if state is None:
+            state = self.initial()
+        for ev in events:
+            state = self.apply(state, ev)
+        return state
+
+
+class ProjectionSet(Projection):
+    """Several projections folded together in a single pass over the stream.
+
+    Consumers that need many derived views (status rendering needs converged
+    edges, deltas, iteration counts, Hamiltonians and stuck runs) register
+    them once and read the stream once, instead of one full scan per query.
+
+    The set is itself a Projection: its state is {member.name: member_state},
+    it snapshots as one file, and its version changes whenever a member is
+    added or a member's version changes. Each event is normalized at most
+    once and handed to members according to their ``normalized`` flag.
+    """
+
+    normalized = False
+
+    def __init__(self, name: str, *projections: Projection) -> None:
+        self.name = name
+        self.projections: dict[str, Projection] = {}
+        for projection in projections:
+            self.register(projection)
+
+    def register(self, projection: Projection) -> None:
+        if projection.name in self.projections:
+            raise ValueError(f"projection {projection.name!r} already registered in {self.name!r}")
+        self.projections[projection.name] = projection
+
+    @property
+    def version(self) -> str:  # type: ignore[override]
+        return ",".join(f"{name}:{p.version}" for name, p in self.projections.items())
+
+    def initial(self) -> dict[str, Any]:
+        return {name: p.initial() for name, p in self.projections.items()}
+
+    def apply(self, state: dict[str, Any], event: dict[str, Any]) -> dict[str, Any]:
+        flat = None
+        for name, p in self.projections.items():
+            if p.normalized:
+                if flat is None:
+                    flat = normalize_or_raw(event)
+                state[name] = p.apply(state[name], flat)
+            else:
+                state[name] = p.apply(state[name], event)
+        return state
+
+    def encode(self, state: dict[str, Any]) -> dict[str, Any]:
+        return {name: p.encode(state[name]) for name, p in self.projections.items()}
+
+    def decode(self, data: dict[str, Any]) -> dict[str, Any]:
+        return {name: p.decode(data[name]) for name, p in self.projections.items()}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SNAPSHOT STORE
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _run_id(raw: dict[str, Any]) -> Optional[str]:
+    run = raw.get("run")
+    return (run.get("runId") if isinstance(run, dict) else None) or raw.get("event_id") or None
+
+
+def _last_line(events_path: Path, offset: int) -> bytes:
+    """Return the last non-empty line of the logical log ending at or before *offset*."""
+    window = read_logical(events_path, max(0, offset - _TAIL_WINDOW), offset)
+    lines = [ln for ln in window.split(b"\n") if ln.strip()]
+    return lines[-1] if lines else b""
+
+
+class SnapshotStore:
+    """Reads and writes projection snapshots next to an events.jsonl file."""
+
+    def __init__(self, events_path: Path) -> None:
+        self.events_path = Path(events_path)
+        self.dir = self.events_path.parent / "snapshots"
+
+    def _path(self, projection: Projection) -> Path:
+        return self.dir / f"{projection.name}.json"
+
+    def _guards(self, offset: int) -> Optional[tuple[str, str]]:
+        """Return (head_sha, tail_sha) of the logical log up to *offset*, or None if unreadable."""
+        if logical_size(self.events_path) < offset:
+            return None
+        head = read_logical(self.events_path, 0, min(_HEAD_BYTES, offset))
+        return _sha(head), _sha(_last_line(self.events_path, offset))
+
+    def load(self, projection: Projection) -> Optional[tuple[Any, int]]:
+        """Return (state, offset) from a valid snapshot, or None."""
+        try:
+            snap = json.loads(self._path(projection).read_text())
+        except (OSError, ValueError):
+            return None
+        if snap.get("projection") != projection.name or snap.get("version") != projection.version:
+            return None
+        offset = snap.get("offset", 0)
+        if not isinstance(offset, int) or offset <= 0:
+            return None
+        if self._guards(offset) != (snap.get("head_sha"), snap.get("tail_sha")):
+            return None
+        return projection.decode(snap.get("state")), offset
+
+    def save(
+        self,
+        projection: Projection,
+        state: Any,
+        offset: int,
+        last_run_id: Optional[str] = None,
+    ) -> None:
+        """Persist *state* as covering the first *offset* bytes. Best-effort."""
+        guards = self._guards(offset)
+        if guards is None:
+            return
+        snap = {
+            "projection": projection.name,
+            "version": projection.version,
+            "offset": offset,
+            "last_run_id": last_run_id,
+            "head_sha": guards[0],
+            "tail_sha": guards[1],
+            "state": projection.encode(state),
+        }
+        path = self._path(projection)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(snap, separators=(",", ":")))
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def invalidate(self) -> None:
+        """Remove every snapshot — call after rewriting events.jsonl."""
+        if not self.dir.exists():
+            return
+        for path in self.dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SNAPSHOT-BACKED PROJECTION
+# ═══════════════════════════════════════════════════════════════════════
+
+
+def _reads_normalized(projection: Projection) -> bool:
+    """True if every fold step of *projection* takes normalized events.
+
+    Such a fold can be fed already-normalized (archived) events: a
+    ProjectionSet re-normalizes them, and normalize_event passes flat
+    events through unchanged.
+    """
+    if isinstance(projection, ProjectionSet):
+        return all(_reads_normalized(p) for p in projection.projections.values())
+    return projection.normalized
+
+
+def load_projection(events_path: Path, projection: Projection, snapshot: bool = True) -> Any:
+    """Fold *projection* over events.jsonl, resuming from its snapshot.
+
+    Loads the snapshot if it is still valid for the current log, folds only
+    the events appended after its offset, and writes a new snapshot when the
+    suffix was non-empty. With snapshot=False the whole log is folded and
+    nothing is persisted.
+    """
+    events_path = Path(events_path)
+    store = SnapshotStore(events_path)
+
+    state, offset = None, 0
+    if snapshot:
+        loaded = store.load(projection)
+        if loaded is not None:
+            state, offset = loaded
+
+    sealed: list[dict[str, Any]] = []
+    if _reads_normalized(projection):
+        sealed, offset = read_sealed_normalized(events_path, offset)
+        state = projection.fold(sealed, state)
+
+    raw, end = read_events_from(events_path, offset)
+    events = (normalize_or_raw(ev) for ev in raw) if projection.normalized else raw
+    state = projection.fold(events, state)
+
+    if snapshot and (raw or sealed):
+        store.save(projection, state, end, _run_id((raw or sealed)[-1]))
+    return state
@@ -28,7 +28,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+from . import yaml_cache
+from .ol_event import append_event_lines
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -70,8 +71,7 @@ def load_role_config(config_path: Optional[Path] = None) -> dict[str, Any]:
     path = config_path or _DEFAULT_CONFIG_PATH
     if not path.exists():
         raise FileNotFoundError(f"Role config not found: {path}")
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    return yaml_cache.load(path) or {}
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -153,7 +153,21 @@ def emit_convergence_escalated(
     action: str = "escalate",
 ) -> None:
     """Append a convergence_escalated event to events.jsonl (REQ-COORD-005)."""
-    event = {
+    event = convergence_escalated_event(project, agent_id, agent_role, feature, edge, reason, action)
+    append_event_lines(events_path, [json.dumps(event, separators=(",", ":")) + "\n"])
+
+
+def convergence_escalated_event(
+    project: str,
+    agent_id: str,
+    agent_role: str,
+    feature: str,
+    edge: str,
+    reason: str,
+    action: str = "escalate",
+) -> dict[str, Any]:
+    """Build (without writing) the convergence_escalated event for a denied edge."""
+    return {
         "event_type": "convergence_escalated",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "project": project,
@@ -167,9 +181,6 @@ def emit_convergence_escalated(
             "norm_edge": normalise_edge(edge),
         },
     }
-    events_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(events_path, "a") as f:
-        f.write(json.dumps(event, separators=(",", ":")) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════════
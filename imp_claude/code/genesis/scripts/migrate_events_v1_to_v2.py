@@ -11,11 +11,12 @@ Usage:
     python migrate_events_v1_to_v2.py .ai-workspace/events/events.jsonl
 
 Behaviour:
-    - Reads events.jsonl
+    - Reads events.jsonl, after any sealed segments (events/segments/)
     - Skips events already in v2 (eventType present)
     - Converts v1 events to OL RunEvent format
-    - Backs up original to events.v1.jsonl
-    - Writes migrated file to events.jsonl
+    - Backs up original to events.v1.jsonl (segments to segments.v1/)
+    - Writes the migrated history to events.jsonl and drops the segments
+    - Removes projection snapshots (events/snapshots/) built on the old log
     - Prints summary
 """
 
@@ -370,18 +371,38 @@ def convert_v1_to_v2(v1: dict, project_root: str = "") -> dict:
 # ── File migration ────────────────────────────────────────────────────────────
 
 
+def _sealed_segments(segments_dir: Path) -> list[Path]:
+    """Sealed segment files in log order, from the segment manifest."""
+    try:
+        manifest = json.loads((segments_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [segments_dir / name for name in manifest.get("segments", [])]
+
+
 def migrate_file(events_path: Path) -> None:
     if not events_path.exists():
         print(f"Error: {events_path} does not exist")
         sys.exit(1)
 
-    # Backup
+    # Backup — sealed segments (genesis.event_segments) hold the older history
     backup_path = events_path.parent / "events.v1.jsonl"
     shutil.copy2(events_path, backup_path)
     print(f"Backup written to: {backup_path}")
-
-    # Read all lines
-    lines = events_path.read_text(encoding="utf-8").strip().splitlines()
+    segments_dir = events_path.parent / "segments"
+    segment_paths = _sealed_segments(segments_dir)
+    if segment_paths:
+        segments_backup = events_path.parent / "segments.v1"
+        shutil.rmtree(segments_backup, ignore_errors=True)
+        shutil.copytree(segments_dir, segments_backup)
+        print(f"Segments backup written to: {segments_backup}")
+
+    # Read all lines: sealed segments in order, then the active file
+    lines = [
+        line
+        for path in [*segment_paths, events_path]
+        for line in path.read_text(encoding="utf-8").strip().splitlines()
+    ]
     print(f"Reading {len(lines)} events from {events_path}")
 
     # Infer project root from path (walk up to find .ai-workspace)
@@ -420,8 +441,16 @@ def migrate_file(events_path: Path) -> None:
             converted.append(json.dumps(v2, ensure_ascii=False))
             v1_count += 1
 
-    # Write migrated file
+    # Write migrated file — the whole history, so the log is no longer segmented
     events_path.write_text("\n".join(converted) + "\n", encoding="utf-8")
+    if segment_paths:
+        shutil.rmtree(segments_dir)
+
+    # Projection snapshots (genesis.projections) describe the old byte layout
+    snapshots_dir = events_path.parent / "snapshots"
+    if snapshots_dir.is_dir():
+        for snap in snapshots_dir.glob("*.json"):
+            snap.unlink(missing_ok=True)
 
     print("\nMigration complete:")
     print(f"  Converted v1→v2: {v1_count}")
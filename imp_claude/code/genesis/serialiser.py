@@ -11,26 +11,43 @@ no claim step. Both modes satisfy the invariant: events.jsonl has exactly
 one writer at a time.
 
 Inbox layout:
-    .ai-workspace/events/inbox/<agent_id>/<seq>.json
+    .ai-workspace/events/inbox/<agent_id>/queue.jsonl    append-only queue
+    .ai-workspace/events/inbox/<agent_id>/queue.offset   consumer offset (bytes)
+    .ai-workspace/events/inbox/<agent_id>/<seq>.json     legacy one-file-per-event
 
-Each inbox file is a single JSON event dict with event_type one of:
+Each queue line (or legacy file) is one JSON event dict with event_type one of:
     edge_claim   — agent proposes to work on feature+edge
     edge_released — agent voluntarily releases a claim
+
+Agents append to their own queue under a per-agent lock; the serialiser
+reads each queue from its offset, resolves the whole pass as one batch
+(a single append to events.jsonl) and only then advances the offsets. A
+queue that has been fully consumed is removed. Delivery is at-least-once:
+a crash between the append and the offset update re-resolves the batch,
+which re-grants a claim to its holder and is otherwise harmless.
+
+Claim arbitration does not replay the log: the active-claims map and each
+agent's last activity are a snapshot-backed projection (SERIALISER_STATE),
+so a pass folds only the events appended since the previous one.
 """
 
 from __future__ import annotations
 
 import fcntl
 import json
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .event_index import EventIndex
+from .ol_event import append_event_lines, recover_event_log
+from .projections import Projection, ProjectionSet, load_projection
 from .role_authority import (
     check_role_authority,
     convergence_action,
-    emit_convergence_escalated,
+    convergence_escalated_event,
     load_role_config,
 )
 
@@ -46,36 +63,36 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _append_event(events_path: Path, event: dict[str, Any]) -> None:
-    """Append a single event to events.jsonl (single-writer, fcntl-locked)."""
-    events_path.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(event, separators=(",", ":")) + "\n"
-    with open(events_path, "a") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
-        try:
-            f.write(line)
-            f.flush()
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+def _epoch(ts: Any) -> Optional[float]:
+    """Unix time of an ISO-8601 timestamp, or None if it does not parse."""
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except (ValueError, AttributeError):
+        return None
 
 
-def get_active_claims(events: list[dict[str, Any]]) -> dict[tuple[str, str], str]:
-    """Derive active claim map: (feature, edge) → agent_id.
+def _event_agent(ev: dict[str, Any]) -> Any:
+    return ev.get("agent_id", ev.get("data", {}).get("agent_id", ""))
 
-    Replays the event log to find feature+edge pairs that are claimed
-    (edge_started) but not yet released (edge_converged | edge_released).
 
-    Returns:
-        Dict mapping (feature, edge) → holding agent_id.
+class ActiveClaimsProjection(Projection):
+    """Fold state for get_active_claims(): {(feature, edge): agent_id}.
+
+    Folds events as written — only flat serialiser-protocol events take part
+    in claim arbitration.
     """
-    claimed: dict[tuple[str, str], str] = {}
 
-    for ev in events:
+    name = "active_claims"
+    normalized = False
+
+    def apply(self, claimed: dict, ev: dict[str, Any]) -> dict:
         et = ev.get("event_type", "")
         feature = ev.get("feature", "")
         edge = ev.get("edge", "")
         if not feature or not edge:
-            continue
+            return claimed
         key = (feature, edge)
 
         if et == "edge_started":
@@ -83,31 +100,71 @@ def get_active_claims(events: list[dict[str, Any]]) -> dict[tuple[str, str], str
             claimed[key] = agent_id
         elif et in ("edge_converged", "edge_released"):
             claimed.pop(key, None)
+        return claimed
+
+    def encode(self, claimed: dict) -> list:
+        return [[f, e, agent] for (f, e), agent in claimed.items()]
 
-    return claimed
+    def decode(self, data: list) -> dict:
+        return {(f, e): agent for f, e, agent in data}
 
 
-def get_last_event_time(events: list[dict[str, Any]], agent_id: str) -> Optional[float]:
+ACTIVE_CLAIMS = ActiveClaimsProjection()
+
+
+class AgentActivityProjection(Projection):
+    """Fold state for stale-claim detection: {agent_id: last event epoch}.
+
+    Reads events as written, like get_last_event_time().
+    """
+
+    name = "agent_activity"
+    normalized = False
+
+    def apply(self, last_seen: dict, ev: dict[str, Any]) -> dict:
+        agent_id = _event_agent(ev)
+        epoch = _epoch(ev.get("timestamp", "")) if agent_id else None
+        if epoch is not None and epoch > last_seen.get(agent_id, float("-inf")):
+            last_seen[agent_id] = epoch
+        return last_seen
+
+
+AGENT_ACTIVITY = AgentActivityProjection()
+
+# Everything process_inbox() needs from the log, folded in one pass
+SERIALISER_STATE = ProjectionSet("serialiser_state", ACTIVE_CLAIMS, AGENT_ACTIVITY)
+
+
+def get_active_claims(events: list[dict[str, Any]]) -> dict[tuple[str, str], str]:
+    """Derive active claim map: (feature, edge) → agent_id.
+
+    Replays the event log to find feature+edge pairs that are claimed
+    (edge_started) but not yet released (edge_converged | edge_released).
+
+    Returns:
+        Dict mapping (feature, edge) → holding agent_id.
+    """
+    return ACTIVE_CLAIMS.fold(events)
+
+
+def get_last_event_time(
+    events: list[dict[str, Any]] | EventIndex, agent_id: str
+) -> Optional[float]:
     """Return the unix timestamp of the most recent event from agent_id, or None."""
+    if isinstance(events, EventIndex):
+        events = events.lookup(agent_id=agent_id)
     last: Optional[float] = None
     for ev in events:
-        ev_agent = ev.get("agent_id", ev.get("data", {}).get("agent_id", ""))
-        if ev_agent != agent_id:
+        if _event_agent(ev) != agent_id:
             continue
-        ts = ev.get("timestamp", "")
-        if ts:
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                epoch = dt.timestamp()
-                if last is None or epoch > last:
-                    last = epoch
-            except (ValueError, AttributeError):
-                pass
+        epoch = _epoch(ev.get("timestamp", ""))
+        if epoch is not None and (last is None or epoch > last):
+            last = epoch
     return last
 
 
 def detect_stale_claims(
-    events: list[dict[str, Any]],
+    events: list[dict[str, Any]] | EventIndex,
     timeout_seconds: int = CLAIM_TIMEOUT_SECONDS,
     now: Optional[float] = None,
 ) -> list[dict[str, Any]]:
@@ -119,10 +176,21 @@ def detect_stale_claims(
         now = time.time()
 
     active = get_active_claims(events)
-    stale: list[dict[str, Any]] = []
+    # One index pass instead of a full scan per claim-holding agent
+    index = events if isinstance(events, EventIndex) else EventIndex(events)
+    last_seen = {agent: get_last_event_time(index, agent) for agent in set(active.values())}
+    return _stale_claims(active, last_seen, timeout_seconds, now)
 
+
+def _stale_claims(
+    active: dict[tuple[str, str], str],
+    last_seen: dict[str, Optional[float]],
+    timeout_seconds: int,
+    now: float,
+) -> list[dict[str, Any]]:
+    stale: list[dict[str, Any]] = []
     for (feature, edge), agent_id in active.items():
-        last_ts = get_last_event_time(events, agent_id)
+        last_ts = last_seen.get(agent_id)
         if last_ts is None:
             continue
         seconds_idle = now - last_ts
@@ -139,34 +207,182 @@ def detect_stale_claims(
     return stale
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# AGENT QUEUES
+# ═══════════════════════════════════════════════════════════════════════
+
+QUEUE_FILE = "queue.jsonl"
+OFFSET_FILE = "queue.offset"
+ATTEMPTS_FILE = "queue.attempts"
+REJECTED_FILE = "queue.rejected.jsonl"
+_LOCK_FILE = ".lock"
+
+# Passes a queue line may fail before it is dead-lettered
+MAX_INBOX_ATTEMPTS = 3
+# Raised by malformed items themselves: retrying cannot help
+_PERMANENT_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+class AgentQueue:
+    """Append-only JSONL inbox of one agent, with a persisted consumer offset.
+
+    Writers (agents) and the serialiser's removal of a drained queue take an
+    exclusive flock on inbox/<agent_id>/.lock; reading needs no lock because
+    only complete (newline-terminated) lines are consumed.
+    """
+
+    def __init__(self, agent_dir: Path) -> None:
+        self.dir = agent_dir
+        self.agent_id = agent_dir.name
+        self.path = agent_dir / QUEUE_FILE
+        self.offset_path = agent_dir / OFFSET_FILE
+        self.attempts_path = agent_dir / ATTEMPTS_FILE
+        self.rejected_path = agent_dir / REJECTED_FILE
+
+    def _locked(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        lock = open(self.dir / _LOCK_FILE, "a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def append(self, event: dict[str, Any]) -> Path:
+        """Append *event* as one line; returns the queue path."""
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode()
+        with self._locked():
+            with open(self.path, "ab") as f:
+                f.write(line)
+        return self.path
+
+    def offset(self) -> int:
+        try:
+            return int(self.offset_path.read_text())
+        except (OSError, ValueError):
+            return 0
+
+    def read(self) -> tuple[list[tuple[int, dict[str, Any]]], int]:
+        """(line offset, event) pairs after the consumer offset, and the offset just past them."""
+        start = self.offset()
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if start > size:  # offset outlived its queue
+                    start = 0
+                f.seek(start)
+                data = f.read(size - start)
+        except OSError:
+            return [], start
+        complete = data.rfind(b"\n") + 1
+        events: list[tuple[int, dict[str, Any]]] = []
+        pos = start
+        for raw in data[:complete].splitlines(keepends=True):
+            line_start, pos = pos, pos + len(raw)
+            try:
+                ev = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(ev, dict):
+                events.append((line_start, ev))
+        return events, start + complete
+
+    def record_failure(self, line_start: int) -> int:
+        """Count one more failed pass for the line at *line_start*; returns the total."""
+        try:
+            offset, attempts = map(int, self.attempts_path.read_text().split())
+        except (OSError, ValueError):
+            offset, attempts = line_start, 0
+        attempts = attempts + 1 if offset == line_start else 1
+        self.attempts_path.write_text(f"{line_start} {attempts}")
+        return attempts
+
+    def reject(self, line_start: int, event: dict[str, Any], error: str) -> None:
+        """Move the line at *line_start* to the dead-letter file."""
+        record = {"offset": line_start, "error": error, "rejected_at": _now_iso(), "event": event}
+        with self._locked():
+            with open(self.rejected_path, "a") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def commit(self, end: int) -> None:
+        """Record that everything before byte *end* has been resolved.
+
+        A queue consumed to its end is removed (offset first, so a crash in
+        between re-delivers rather than skips). Failure counts are kept only
+        for the line the queue is still held at.
+        """
+        try:
+            if end > int(self.attempts_path.read_text().split()[0]):
+                self.attempts_path.unlink(missing_ok=True)
+        except (OSError, ValueError, IndexError):
+            pass
+        with self._locked():
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if end >= size:
+                self.offset_path.unlink(missing_ok=True)
+                self.path.unlink(missing_ok=True)
+                return
+            tmp = self.offset_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(str(end))
+            os.replace(tmp, self.offset_path)
+
+
+def _inbox_dir(workspace: Path) -> Path:
+    ws_dir = (
+        workspace / ".ai-workspace"
+        if (workspace / ".ai-workspace").exists()
+        else workspace
+    )
+    return ws_dir / "events" / "inbox"
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # INBOX PROCESSING
 # ═══════════════════════════════════════════════════════════════════════
 
 
-def read_inbox_events(inbox_dir: Path) -> list[tuple[str, Path, dict[str, Any]]]:
-    """Read all pending events from inbox/<agent_id>/ subdirectories.
+def _collect_inbox(
+    inbox_dir: Path,
+) -> tuple[list[tuple[str, Path, dict[str, Any], Optional[int]]], list[tuple[AgentQueue, int]]]:
+    """Pending inbox items, plus each agent queue with the offset they reach.
 
-    Returns list of (agent_id, file_path, event_dict) tuples, sorted
-    deterministically: lexicographic agent_id order, then sequence number
-    within each agent's inbox.
+    Items are (agent_id, file, event, queue offset of the event's line —
+    None for a legacy per-event file).
     """
     if not inbox_dir.exists():
-        return []
+        return [], []
 
-    items: list[tuple[str, Path, dict[str, Any]]] = []
+    items: list[tuple[str, Path, dict[str, Any], Optional[int]]] = []
+    queues: list[tuple[AgentQueue, int]] = []
     for agent_dir in sorted(inbox_dir.iterdir()):
         if not agent_dir.is_dir():
             continue
         agent_id = agent_dir.name
+        # Legacy per-event files predate the queue, so they go first
         for event_file in sorted(agent_dir.glob("*.json")):
             try:
                 data = json.loads(event_file.read_text())
-                items.append((agent_id, event_file, data))
+                items.append((agent_id, event_file, data, None))
             except (json.JSONDecodeError, OSError):
                 pass
+        queue = AgentQueue(agent_dir)
+        if queue.path.exists():
+            events, end = queue.read()
+            items.extend((agent_id, queue.path, ev, line_start) for line_start, ev in events)
+            queues.append((queue, end))
 
-    return items
+    return items, queues
+
+
+def read_inbox_events(inbox_dir: Path) -> list[tuple[str, Path, dict[str, Any]]]:
+    """Read all pending events from inbox/<agent_id>/ subdirectories.
+
+    Returns list of (agent_id, file_path, event_dict) tuples, sorted
+    deterministically: lexicographic agent_id order, then legacy files in
+    sequence order, then queue lines in append order. For queued events
+    file_path is the agent's queue.jsonl.
+    """
+    return [item[:3] for item in _collect_inbox(inbox_dir)[0]]
 
 
 def process_inbox(
@@ -187,7 +403,14 @@ def process_inbox(
     - Other event types: forwarded verbatim to events.jsonl
 
     After processing claims, check for stale claims and emit claim_expired
-    for each one that has timed out.
+    for each one that has timed out. Everything the pass emits is written
+    with one append; inbox offsets advance only after it, and only past
+    items that resolved. An item that raises is counted in ``errors``. A
+    transient failure leaves it in the inbox, and the rest of its agent's
+    queue waits behind it so the agent's events are still resolved in order
+    on a later pass. A queue line that is malformed, or that has failed
+    MAX_INBOX_ATTEMPTS passes, is moved to the agent's queue.rejected.jsonl
+    (recorded as inbox_item_rejected) and the queue proceeds past it.
 
     Returns counts: {granted, rejected, forwarded, expired, errors, escalated}.
     """
@@ -197,27 +420,18 @@ def process_inbox(
         except FileNotFoundError:
             roles_config = {}
 
-    ws_dir = (
-        workspace / ".ai-workspace"
-        if (workspace / ".ai-workspace").exists()
-        else workspace
-    )
-    events_path = ws_dir / "events" / "events.jsonl"
-    inbox_dir = ws_dir / "events" / "inbox"
-
-    # Load current event log for claim resolution
-    existing_events: list[dict[str, Any]] = []
-    if events_path.exists():
-        for line in events_path.read_text().splitlines():
-            line = line.strip()
-            if line:
-                try:
-                    existing_events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
-
-    active_claims = get_active_claims(existing_events)
-    inbox_items = read_inbox_events(inbox_dir)
+    inbox_dir = _inbox_dir(workspace)
+    events_path = inbox_dir.parent / "events.jsonl"
+
+    # A serialiser crash mid-append leaves a torn line that would corrupt the
+    # next write — repair it before resolving claims
+    recover_event_log(events_path, project, actor=instance_id)
+
+    # Claim map and agent activity, folded only over events since the last pass
+    state = load_projection(events_path, SERIALISER_STATE)
+    active_claims = state[ACTIVE_CLAIMS.name]
+    last_seen = state[AGENT_ACTIVITY.name]
+    inbox_items, queues = _collect_inbox(inbox_dir)
 
     counts: dict[str, int] = {
         "granted": 0,
@@ -227,13 +441,23 @@ def process_inbox(
         "errors": 0,
         "escalated": 0,
     }
+    batch: list[dict[str, Any]] = []
+    consumed: list[Path] = []
+    held: dict[Path, int] = {}  # queue → offset of its first unresolved line
 
-    for agent_id, event_file, ev in inbox_items:
-        et = ev.get("event_type", "")
-        feature = ev.get("feature", "") or ev.get("data", {}).get("feature", "")
-        edge = ev.get("edge", "") or ev.get("data", {}).get("edge", "")
+    def emit(event: dict[str, Any]) -> None:
+        batch.append(event)
+        AGENT_ACTIVITY.apply(last_seen, event)
 
+    for agent_id, event_file, ev, line_start in inbox_items:
+        if event_file in held:
+            continue
+        mark = len(batch)
         try:
+            et = ev.get("event_type", "")
+            feature = ev.get("feature", "") or ev.get("data", {}).get("feature", "")
+            edge = ev.get("edge", "") or ev.get("data", {}).get("edge", "")
+
             if et == "edge_claim" and feature and edge:
                 key = (feature, edge)
                 held_by = active_claims.get(key)
@@ -241,10 +465,10 @@ def process_inbox(
                 if held_by is None or held_by == agent_id:
                     # Role authority check (REQ-COORD-005)
                     agent_role = ev.get("agent_role", "full_stack")
+                    action = None
                     if not check_role_authority(agent_role, edge, roles_config):
                         action = convergence_action(agent_role, edge, roles_config)
-                        emit_convergence_escalated(
-                            events_path=events_path,
+                        emit(convergence_escalated_event(
                             project=project,
                             agent_id=agent_id,
                             agent_role=agent_role,
@@ -252,31 +476,26 @@ def process_inbox(
                             edge=edge,
                             reason=f"role '{agent_role}' not authorised to converge '{edge}'",
                             action=action,
-                        )
+                        ))
                         counts["escalated"] += 1
-                        # "warn" still grants; "escalate"/"reject" block
-                        if action != "warn":
-                            event_file.unlink(missing_ok=True)
-                            continue
-
-                    # Grant: emit edge_started
-                    granted_event = {
-                        "event_type": "edge_started",
-                        "timestamp": _now_iso(),
-                        "project": project,
-                        "feature": feature,
-                        "edge": edge,
-                        "agent_id": agent_id,
-                        "instance_id": instance_id,
-                        "data": {"granted_to": agent_id, "source": "serialiser"},
-                    }
-                    _append_event(events_path, granted_event)
-                    active_claims[key] = agent_id
-                    existing_events.append(granted_event)
-                    counts["granted"] += 1
+
+                    # "warn" still grants; "escalate"/"reject" block
+                    if action in (None, "warn"):
+                        emit({
+                            "event_type": "edge_started",
+                            "timestamp": _now_iso(),
+                            "project": project,
+                            "feature": feature,
+                            "edge": edge,
+                            "agent_id": agent_id,
+                            "instance_id": instance_id,
+                            "data": {"granted_to": agent_id, "source": "serialiser"},
+                        })
+                        active_claims[key] = agent_id
+                        counts["granted"] += 1
                 else:
                     # Reject: emit claim_rejected
-                    rejected_event = {
+                    emit({
                         "event_type": "claim_rejected",
                         "timestamp": _now_iso(),
                         "project": project,
@@ -287,9 +506,7 @@ def process_inbox(
                             "reason": f"already claimed by {held_by}",
                             "held_by": held_by,
                         },
-                    }
-                    _append_event(events_path, rejected_event)
-                    existing_events.append(rejected_event)
+                    })
                     counts["rejected"] += 1
 
             elif et == "edge_released" and feature and edge:
@@ -297,9 +514,8 @@ def process_inbox(
                 forwarded["timestamp"] = _now_iso()
                 forwarded["project"] = project
                 forwarded["agent_id"] = agent_id
-                _append_event(events_path, forwarded)
+                emit(forwarded)
                 active_claims.pop((feature, edge), None)
-                existing_events.append(forwarded)
                 counts["forwarded"] += 1
 
             else:
@@ -309,20 +525,44 @@ def process_inbox(
                     forwarded["project"] = project
                 if "timestamp" not in forwarded:
                     forwarded["timestamp"] = _now_iso()
-                _append_event(events_path, forwarded)
-                existing_events.append(forwarded)
+                emit(forwarded)
                 counts["forwarded"] += 1
 
-            # Delete processed inbox file
-            event_file.unlink(missing_ok=True)
-
-        except Exception:
+        except Exception as exc:
+            # Leave the item in the inbox: drop what it emitted and hold its queue here
+            del batch[mark:]
             counts["errors"] += 1
+            if line_start is None:
+                continue
+            queue = AgentQueue(event_file.parent)
+            if (
+                not isinstance(exc, _PERMANENT_ERRORS)
+                and queue.record_failure(line_start) < MAX_INBOX_ATTEMPTS
+            ):
+                held[event_file] = line_start
+                continue
+            # Dead-letter it so the rest of the agent's queue can proceed
+            error = f"{type(exc).__name__}: {exc}"
+            queue.reject(line_start, ev, error)
+            batch.append({
+                "event_type": "inbox_item_rejected",
+                "timestamp": _now_iso(),
+                "project": project,
+                "agent_id": agent_id,
+                "data": {
+                    "queue_offset": line_start,
+                    "error": error,
+                    "dead_letter": str(queue.rejected_path),
+                    "source": "serialiser",
+                },
+            })
+            continue
+        if line_start is None:
+            consumed.append(event_file)
 
     # Check for stale claims
-    stale = detect_stale_claims(existing_events, timeout_seconds=timeout_seconds)
-    for s in stale:
-        expired_event = {
+    for s in _stale_claims(active_claims, last_seen, timeout_seconds, time.time()):
+        batch.append({
             "event_type": "claim_expired",
             "timestamp": _now_iso(),
             "project": project,
@@ -333,10 +573,20 @@ def process_inbox(
                 "seconds_idle": s["seconds_idle"],
                 "source": "serialiser",
             },
-        }
-        _append_event(events_path, expired_event)
+        })
         counts["expired"] += 1
 
+    if batch:
+        append_event_lines(
+            events_path, [json.dumps(ev, separators=(",", ":")) + "\n" for ev in batch]
+        )
+
+    # Consume the inbox only once the results are in the log
+    for event_file in consumed:
+        event_file.unlink(missing_ok=True)
+    for queue, end in queues:
+        queue.commit(held.get(queue.path, end))
+
     return counts
 
 
@@ -352,23 +602,11 @@ def stage_claim(
     edge: str,
     agent_role: str = "full_stack",
 ) -> Path:
-    """Write an edge_claim event to the agent's inbox directory.
+    """Append an edge_claim event to the agent's inbox queue.
 
-    Returns the path of the staged file. The serialiser reads and resolves
-    claims from inbox/ in lexicographic agent_id + sequence order.
+    Returns the path of the queue. The serialiser reads and resolves
+    claims from inbox/ in lexicographic agent_id + append order.
     """
-    ws_dir = (
-        workspace / ".ai-workspace"
-        if (workspace / ".ai-workspace").exists()
-        else workspace
-    )
-    inbox_agent_dir = ws_dir / "events" / "inbox" / agent_id
-    inbox_agent_dir.mkdir(parents=True, exist_ok=True)
-
-    # Use a timestamp-based sequence for lexicographic ordering
-    seq = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-    event_file = inbox_agent_dir / f"{seq}_edge_claim.json"
-
     claim_event = {
         "event_type": "edge_claim",
         "timestamp": _now_iso(),
@@ -377,8 +615,7 @@ def stage_claim(
         "agent_id": agent_id,
         "agent_role": agent_role,
     }
-    event_file.write_text(json.dumps(claim_event, separators=(",", ":")))
-    return event_file
+    return AgentQueue(_inbox_dir(workspace) / agent_id).append(claim_event)
 
 
 def stage_release(
@@ -388,18 +625,7 @@ def stage_release(
     edge: str,
     reason: str = "iteration_complete",
 ) -> Path:
-    """Write an edge_released event to the agent's inbox directory."""
-    ws_dir = (
-        workspace / ".ai-workspace"
-        if (workspace / ".ai-workspace").exists()
-        else workspace
-    )
-    inbox_agent_dir = ws_dir / "events" / "inbox" / agent_id
-    inbox_agent_dir.mkdir(parents=True, exist_ok=True)
-
-    seq = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-    event_file = inbox_agent_dir / f"{seq}_edge_released.json"
-
+    """Append an edge_released event to the agent's inbox queue."""
     release_event = {
         "event_type": "edge_released",
         "timestamp": _now_iso(),
@@ -408,5 +634,4 @@ def stage_release(
         "agent_id": agent_id,
         "reason": reason,
     }
-    event_file.write_text(json.dumps(release_event, separators=(",", ":")))
-    return event_file
+    return AgentQueue(_inbox_dir(workspace) / agent_id).append(release_event)
@@ -21,7 +21,6 @@ Both produce delta > 0 → intent_raised → homeostatic path. Same loop.
 
 from __future__ import annotations
 
-import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -30,6 +29,7 @@ from typing import Any, Optional
 
 import yaml
 
+from .event_log import EventLog
 from .workspace_gradient import (
     DeltaItem,
     WorkspaceGradient,
@@ -134,16 +134,7 @@ def _load_events(workspace: Path) -> list[dict[str, Any]]:
     events_path = ws_dir / "events" / "events.jsonl"
     if not events_path.exists():
         return []
-    events: list[dict[str, Any]] = []
-    for line in events_path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
-            pass
-    return events
+    return EventLog.shared(events_path).raw_events()
 
 
 def _features_with_no_events(
@@ -0,0 +1,309 @@
+# Implements: REQ-GRAPH-003 (Asset as Markov Object), REQ-TOOL-008 (Context Snapshot)
+"""Merkle-tree workspace fingerprints backed by a persisted stat cache.
+
+Change detection used to mean hashing every file every time (context
+manifests, F_P drift checks) or trusting a max-mtime over the top level
+(liveness). A fingerprint instead hashes each directory as the sha256 of its
+sorted ``name → (kind, hash)`` entries, so the root hash changes exactly when
+some file below it changed. Directories without files are left out, as in git.
+
+File hashes come from a StatCache — ``path → (size, mtime_ns, inode,
+sha256)`` persisted as JSON, digests as bare hex. A file is only read again
+when its stat changed. Files modified within the last two seconds are never
+cached (an edit in the same mtime tick as the hash would otherwise go
+unnoticed). Other engines working in the same workspace keep their own
+stat_cache.<engine>.json beside this file, so one engine's pruning or digest
+format never leaks into another's entries.
+
+Directory nodes are stored content-addressed under the cache directory, the
+same way git stores trees, so any earlier root hash can be diffed against a
+later one. changed_since() descends only into subtrees whose hashes differ:
+its cost is proportional to what changed, not to the size of the workspace.
+Taking a snapshot still costs one stat() per file.
+
+Layout (all disposable — deleting the directory is always safe):
+    .ai-workspace/cache/fingerprint/stat_cache.json
+    .ai-workspace/cache/fingerprint/trees/<h[:2]>/<h>.json
+
+Contract:
+  StatCache(path).sha256(file)             → hex digest (cached by stat)
+  WorkspaceFingerprint(root).snapshot()    → root hash
+  WorkspaceFingerprint(root).changed_since(old, new=None) → list[FileChange]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat as stat_mod
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+CACHE_VERSION = 2
+_RACY_NS = 2_000_000_000  # files younger than this are re-hashed every time
+
+# Directories never descended into
+SKIP_DIRS = frozenset({
+    ".git", ".hg", "__pycache__", "node_modules", ".venv", "venv",
+    ".tox", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+})
+
+_FILE, _DIR = "f", "d"
+
+
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def default_cache_dir(workspace: Path) -> Path:
+    """Fingerprint cache directory of a workspace root."""
+    return Path(workspace) / ".ai-workspace" / "cache" / "fingerprint"
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# STAT CACHE
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class StatCache:
+    """``path → (size, mtime_ns, inode, sha256)``, persisted at *path* if given.
+
+    ``hashed`` counts files actually read. Safe to share between threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self.hashed = 0
+        self._entries: dict[str, list[Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path is not None:
+            try:
+                doc = json.loads(self.path.read_text())
+                if doc.get("version") == CACHE_VERSION:
+                    self._entries = doc["entries"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+
+    def sha256(self, path: Union[str, Path], st: Optional[os.stat_result] = None) -> str:
+        """Content hash of *path*, re-read only if its stat changed."""
+        key = os.path.abspath(path)
+        st = st or os.stat(key)
+        sig = [st.st_size, st.st_mtime_ns, st.st_ino]
+        entry = self._entries.get(key)
+        if entry is not None and entry[:3] == sig:
+            return entry[3]
+        digest = sha256_file(Path(key))
+        with self._lock:
+            self.hashed += 1
+            if time.time_ns() - st.st_mtime_ns > _RACY_NS:
+                self._entries[key] = sig + [digest]
+                self._dirty = True
+            elif self._entries.pop(key, None) is not None:
+                self._dirty = True
+        return digest
+
+    def prune(self, prefix: str, keep: set[str]) -> None:
+        """Drop entries under *prefix* that are not in *keep* (deleted files)."""
+        with self._lock:
+            under = prefix.rstrip(os.sep) + os.sep
+            stale = [
+                k for k in self._entries
+                if (k == prefix or k.startswith(under)) and k not in keep
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Persist the cache if anything changed. Best-effort."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            doc = json.dumps({"version": CACHE_VERSION, "entries": self._entries})
+            self._dirty = False
+        _write_atomic(self.path, doc)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# MERKLE TREE
+# ═══════════════════════════════════════════════════════════════════════
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """One file that differs between two fingerprints."""
+
+    path: str    # relative to the fingerprint root, POSIX separators
+    change: str  # "added" | "removed" | "modified"
+
+
+class WorkspaceFingerprint:
+    """Merkle fingerprint of *root*, optionally limited to *include* subpaths.
+
+    *include* lists paths relative to *root* (files or directories); by
+    default the whole root is covered. The cache directory is always
+    excluded from the tree it fingerprints.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        include: Optional[Iterable[str]] = None,
+        cache_dir: Optional[Path] = None,
+        skip_dirs: frozenset[str] = SKIP_DIRS,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.include = sorted(include) if include is not None else None
+        self.cache_dir = Path(cache_dir).resolve() if cache_dir else default_cache_dir(self.root)
+        self.skip_dirs = skip_dirs
+        self.stat_cache = StatCache(self.cache_dir / "stat_cache.json")
+        self.files = 0
+        self._seen: set[str] = set()
+
+    # ── Snapshot ──────────────────────────────────────────────────────────
+
+    def snapshot(self) -> str:
+        """Fingerprint the workspace now; return the root hash.
+
+        Writes any new directory nodes and the stat cache to the cache dir.
+        """
+        self.files = 0
+        self._seen = set()
+        if self.include is None:
+            root_hash = self._hash_dir(self.root, root=True)
+            scanned = [str(self.root)]
+        else:
+            entries: dict[str, list[str]] = {}
+            scanned = []
+            for rel in self.include:
+                path = self.root / rel
+                scanned.append(str(path))
+                node = self._hash_entry(path)
+                if node is not None:
+                    entries[rel] = node
+            root_hash = self._store(entries)
+        for prefix in scanned:
+            self.stat_cache.prune(prefix, self._seen)
+        self.stat_cache.save()
+        return root_hash
+
+    def _hash_entry(self, path: Path) -> Optional[list[str]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if stat_mod.S_ISDIR(st.st_mode):
+            digest = self._hash_dir(path)
+            return [_DIR, digest] if digest is not None else None
+        if stat_mod.S_ISREG(st.st_mode):
+            digest = self._hash_file(path, st)
+            return [_FILE, digest] if digest is not None else None
+        return None
+
+    def _hash_file(self, path: Path, st: os.stat_result) -> Optional[str]:
+        try:
+            digest = self.stat_cache.sha256(path, st)
+        except OSError:
+            return None
+        self._seen.add(str(path))
+        self.files += 1
+        return digest
+
+    def _hash_dir(self, path: Path, root: bool = False) -> Optional[str]:
+        """Node hash of *path*; None for a directory with no files (as in git)."""
+        entries: dict[str, list[str]] = {}
+        try:
+            scan = list(os.scandir(path))
+        except OSError:
+            scan = []
+        for entry in scan:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in self.skip_dirs or entry.path == str(self.cache_dir):
+                        continue
+                    child = self._hash_dir(Path(entry.path))
+                    if child is not None:
+                        entries[entry.name] = [_DIR, child]
+                elif entry.is_file(follow_symlinks=False):
+                    digest = self._hash_file(Path(entry.path), entry.stat(follow_symlinks=False))
+                    if digest is not None:
+                        entries[entry.name] = [_FILE, digest]
+            except OSError:
+                continue
+        if not entries and not root:
+            return None
+        return self._store(entries)
+
+    def _store(self, entries: dict[str, list[str]]) -> str:
+        """Hash a directory node and persist it (content-addressed) if new."""
+        body = json.dumps(entries, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(body.encode()).hexdigest()
+        path = self._node_path(digest)
+        if not path.exists():
+            _write_atomic(path, body)
+        return digest
+
+    def _node_path(self, digest: str) -> Path:
+        return self.cache_dir / "trees" / digest[:2] / f"{digest}.json"
+
+    def _load(self, digest: str) -> dict[str, list[str]]:
+        try:
+            return json.loads(self._node_path(digest).read_text())
+        except (OSError, ValueError) as exc:
+            raise KeyError(f"unknown fingerprint node {digest}") from exc
+
+    # ── Diff ──────────────────────────────────────────────────────────────
+
+    def changed_since(self, old: str, new: Optional[str] = None) -> list[FileChange]:
+        """Files that differ between fingerprint *old* and *new* (default: now).
+
+        Raises KeyError if *old* was not produced with this cache directory.
+        """
+        new = new if new is not None else self.snapshot()
+        changes: list[FileChange] = []
+        self._diff(old, new, "", changes)
+        return changes
+
+    def _diff(self, old: str, new: str, prefix: str, out: list[FileChange]) -> None:
+        if old == new:
+            return
+        before, after = self._load(old), self._load(new)
+        for name in sorted(before.keys() | after.keys()):
+            a, b = before.get(name), after.get(name)
+            if a == b:
+                continue
+            rel = f"{prefix}{name}"
+            if a is not None and b is not None and a[0] == b[0] == _DIR:
+                self._diff(a[1], b[1], rel + "/", out)
+                continue
+            if a is not None:
+                self._walk(a, rel, "removed" if b is None or a[0] != b[0] else "modified", out)
+            if b is not None and (a is None or a[0] != b[0]):
+                self._walk(b, rel, "added", out)
+
+    def _walk(self, node: list[str], rel: str, change: str, out: list[FileChange]) -> None:
+        if node[0] == _FILE:
+            out.append(FileChange(rel, change))
+            return
+        for name, child in sorted(self._load(node[1]).items()):
+            self._walk(child, f"{rel}/{name}", change, out)
@@ -25,13 +25,14 @@ NOT terminal (lifecycle events — do not satisfy the check):
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator
 
 import yaml
 
+from .event_log import EventLog
+
 
 # ── Event types that constitute terminal convergence evidence ─────────────────
 TERMINAL_CONVERGENCE_EVENTS: frozenset[str] = frozenset(
@@ -139,16 +140,7 @@ def _load_events(events_path: Path) -> list[dict]:
     """Load events.jsonl — returns empty list on missing or corrupt file."""
     if not events_path.exists():
         return []
-    events = []
-    for line in events_path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return events
+    return EventLog.shared(events_path).raw_events()
 
 
 def _has_terminal_convergence_event(
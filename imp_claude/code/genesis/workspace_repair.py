@@ -26,6 +26,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .event_segments import iter_logical_lines
+from .ol_event import append_event_lines
 from .workspace_integrity import EvidenceGap
 
 
@@ -87,35 +89,38 @@ def repair_convergence_evidence(
     result = RepairResult()
     now = datetime.now(timezone.utc).isoformat()
 
-    with events_path.open("a", encoding="utf-8") as fh:
-        for gap in gaps:
-            gap_key = f"{gap.feature_id}/{gap.edge}"
-
-            if approved is not None and gap_key not in approved:
-                result.skipped.append(gap_key)
-                continue
-
-            event = {
-                "event_type": "edge_converged",
-                "timestamp": now,
-                "project": _read_project_name(events_path),
-                "feature": gap.feature_id,
-                "edge": gap.edge,
-                "executor": "human",
-                "emission": "retroactive",
-                "data": {
-                    "convergence_type": "retroactive_repair",
-                    "confirmed_by": provenance.confirmed_by,
-                    "confirmed_at": provenance.confirmed_at,
-                    "basis": provenance.basis,
-                    "monitor_id": provenance.monitor_id,
-                    "repaired_at": now,
-                },
-            }
-            fh.write(json.dumps(event) + "\n")
-            result.repaired.append(gap_key)
-            result.events_emitted.append(event)
-
+    project = _read_project_name(events_path)
+    lines: list[str] = []
+    for gap in gaps:
+        gap_key = f"{gap.feature_id}/{gap.edge}"
+
+        if approved is not None and gap_key not in approved:
+            result.skipped.append(gap_key)
+            continue
+
+        event = {
+            "event_type": "edge_converged",
+            "timestamp": now,
+            "project": project,
+            "feature": gap.feature_id,
+            "edge": gap.edge,
+            "executor": "human",
+            "emission": "retroactive",
+            "data": {
+                "convergence_type": "retroactive_repair",
+                "confirmed_by": provenance.confirmed_by,
+                "confirmed_at": provenance.confirmed_at,
+                "basis": provenance.basis,
+                "monitor_id": provenance.monitor_id,
+                "repaired_at": now,
+            },
+        }
+        lines.append(json.dumps(event) + "\n")
+        result.repaired.append(gap_key)
+        result.events_emitted.append(event)
+
+    if lines:
+        append_event_lines(events_path, lines)
     return result
 
 
@@ -149,14 +154,13 @@ def format_repair_prompt(gaps: list[EvidenceGap]) -> str:
 
 
 def _read_project_name(events_path: Path) -> str:
-    """Extract project name from the first event in the log."""
+    """Extract project name from the first event in the log (sealed segments first)."""
     try:
-        with events_path.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if line:
-                    event = json.loads(line)
-                    return event.get("project", "")
-    except (OSError, json.JSONDecodeError):
+        for line in iter_logical_lines(events_path):
+            line = line.strip()
+            if line:
+                event = json.loads(line)
+                return event.get("project", "")
+    except (OSError, ValueError):
         pass
     return ""
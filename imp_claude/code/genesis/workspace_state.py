@@ -25,7 +25,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -33,7 +35,12 @@ from typing import Any, Optional, Union
 
 import yaml
 
+from . import yaml_cache
 from .contracts import WorkspaceSchemaViolation
+from .event_index import EventIndex
+from .event_log import EventLog
+from .event_segments import iter_logical_lines, parse_timestamp, read_segmented_events
+from .projections import Projection, ProjectionSet, load_projection
 from .ol_event import normalize_event
 
 _REQ_F_PATTERN = re.compile(r"\bREQ-F-[A-Z]+-\d+\b")
@@ -58,7 +65,7 @@ def load_feature_vector(path: Path) -> dict[str, Any]:
     present — definition fields belong in specification/features/, not here.
     Implements: REQ-EVOL-001 (Workspace Vectors Are Trajectory-Only)
     """
-    data: dict[str, Any] = yaml.safe_load(path.read_text()) or {}
+    data: dict[str, Any] = yaml_cache.load(path) or {}
     for key in FORBIDDEN_WORKSPACE_KEYS:
         if key in data:
             raise WorkspaceSchemaViolation(str(path), key)
@@ -134,8 +141,7 @@ def compute_feature_view(workspace: Path, feature_id: str) -> dict[str, Any]:
     fv_path = ws_dir / "features" / "active" / f"{feature_id}.yml"
     if not fv_path.exists():
         return {"feature": feature_id, "status": "missing", "edges": {}}
-    with open(fv_path) as f:
-        data = yaml.safe_load(f) or {}
+    data = yaml_cache.load(fv_path) or {}
     return {
         "feature": data.get("feature", feature_id),
         "status": data.get("status", "pending"),
@@ -159,8 +165,7 @@ def compute_aggregated_view(workspace: Path) -> dict[str, Any]:
         return totals
 
     for path in sorted(features_dir.glob("*.yml")):
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = yaml_cache.load(path) or {}
         totals["total"] += 1
         status = data.get("status", "pending")
         if status in totals:
@@ -192,70 +197,159 @@ def classify_tolerance_breach(
 # ═══════════════════════════════════════════════════════════════════════
 
 
+def _events_file(workspace: Path) -> Path:
+    return _workspace_dir(workspace) / "events" / "events.jsonl"
+
+
 def load_events(workspace: Path) -> list[dict[str, Any]]:
     """Parse events.jsonl from a workspace, returning list of event dicts.
 
     Normalizes OL RunEvents to flat format so all consumers see a uniform
     {event_type, timestamp, project, ...payload} structure regardless of which
     writer produced them. See ol_event.normalize_event() for the conversion.
+
+    Backed by the shared EventLog — repeated calls only parse appended bytes.
     """
-    events_file = _workspace_dir(workspace) / "events" / "events.jsonl"
+    events_file = _events_file(workspace)
     if not events_file.exists():
         return []
+    return EventLog.shared(events_file).events()
+
+
+def load_feature_events(
+    workspace: Path,
+    feature: str,
+    until: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Normalized events for *feature* (optionally at or before *until*).
+
+    Cold read that skips sealed segments whose index shows they never touch
+    the feature or start after *until* — see event_segments.
+    """
+    events_file = _events_file(workspace)
+    if not events_file.exists():
+        return []
+    events = read_segmented_events(events_file, until=until, feature=feature, normalized=True)
+    limit = parse_timestamp(until) if until else None
+    return [
+        ev for ev in events
+        if ev.get("feature") == feature
+        and (limit is None or parse_timestamp(ev.get("timestamp") or "") <= limit)
+    ]
+
+
+class EdgeStatusProjection(Projection):
+    """Per-(feature, edge) edge status in one fold.
+
+    State: {feature: {edge: [iteration_count, current_delta | None, converged]}}
+    Iterations without an edge are not attributed to any edge.
+    """
+
+    name = "edge_status"
+    version = 2
+
+    def apply(self, state: dict, ev: dict[str, Any]) -> dict:
+        et = ev.get("event_type")
+        if et not in ("iteration_completed", "edge_converged"):
+            return state
+        feature = ev.get("feature")
+        if feature is None:
+            return state
+        edge = ev.get("edge", "") if et == "edge_converged" else ev.get("edge")
+        if edge is None:
+            return state
+        entry = state.setdefault(feature, {}).setdefault(edge, [0, None, False])
+        if et == "edge_converged":
+            entry[2] = True
+        else:
+            entry[0] += 1
+            d = ev.get("delta")
+            if d is not None:
+                entry[1] = int(d)
+        return state
+
+
+EDGE_STATUS = EdgeStatusProjection()
+
+
+@dataclass
+class WorkspaceStatus:
+    """O(1) lookups over the folded workspace_status projection set.
+
+    *states* maps member projection name → folded state (see WORKSPACE_STATUS).
+    Members missing from *states* read as empty.
+    """
+
+    states: dict[str, Any] = field(default_factory=dict)
+
+    def _edges(self, feature: str) -> dict[str, list]:
+        return self.states.get(EDGE_STATUS.name, {}).get(feature, {})
+
+    def converged_edges(self, feature: str) -> set[str]:
+        return {edge for edge, (_n, _d, conv) in self._edges(feature).items() if conv}
+
+    def current_delta(self, feature: str, edge: str) -> Union[int, None]:
+        entry = self._edges(feature).get(edge)
+        return entry[1] if entry else None
+
+    def iteration_count(self, feature: str, edge: str) -> int:
+        entry = self._edges(feature).get(edge)
+        return entry[0] if entry else 0
+
+    def hamiltonian(self, feature: str, edge: str | None = None) -> tuple[int, int, int]:
+        return HAMILTONIAN.result(self.states.get(HAMILTONIAN.name, {}), feature, edge)
+
+    def stuck_features(self, threshold: int = 3) -> list[dict[str, Any]]:
+        return DELTA_RUNS.result(self.states.get(DELTA_RUNS.name, {}), threshold)
 
-    events: list[dict[str, Any]] = []
-    for i, line in enumerate(events_file.read_text().splitlines(), 1):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            events.append(normalize_event(json.loads(line)))
-        except json.JSONDecodeError:
-            continue
-    return events
 
+def project_workspace_status(events: list[dict[str, Any]]) -> WorkspaceStatus:
+    """Fold every WORKSPACE_STATUS member over *events* in one pass."""
+    return WorkspaceStatus(WORKSPACE_STATUS.fold(events))
 
-def get_converged_edges(events: list[dict[str, Any]], feature: str) -> set[str]:
+
+def load_workspace_status(workspace: Path) -> WorkspaceStatus:
+    """Snapshot-backed project_workspace_status() over the workspace event log."""
+    return WorkspaceStatus(load_projection(_events_file(workspace), WORKSPACE_STATUS))
+
+
+def load_event_index(workspace: Path) -> EventIndex:
+    """Live secondary indexes over the workspace event log (see event_index)."""
+    return EventLog.shared(_events_file(workspace)).index()
+
+
+def _edge_status(events: list[dict[str, Any]] | EventIndex, **criteria: str) -> WorkspaceStatus:
+    # An EventIndex narrows the fold to the matching events only
+    if isinstance(events, EventIndex):
+        events = events.lookup(**criteria)
+    return WorkspaceStatus({EDGE_STATUS.name: EDGE_STATUS.fold(events)})
+
+
+def get_converged_edges(events: list[dict[str, Any]] | EventIndex, feature: str) -> set[str]:
     """Return set of edge names that have ``edge_converged`` events for *feature*."""
-    return {
-        ev.get("edge", "")
-        for ev in events
-        if ev.get("event_type") == "edge_converged" and ev.get("feature") == feature
-    }
+    return _edge_status(events, event_type="edge_converged", feature=feature).converged_edges(feature)
 
 
 def compute_current_delta(
-    events: list[dict[str, Any]],
+    events: list[dict[str, Any]] | EventIndex,
     feature: str,
     edge: str,
 ) -> Union[int, None]:
     """Return the most recent delta value for a feature/edge pair, or None."""
-    delta: Union[int, None] = None
-    for ev in events:
-        if (
-            ev.get("event_type") == "iteration_completed"
-            and ev.get("feature") == feature
-            and ev.get("edge") == edge
-        ):
-            d = ev.get("delta")
-            if d is not None:
-                delta = int(d)
-    return delta
+    return _edge_status(
+        events, event_type="iteration_completed", feature=feature, edge=edge
+    ).current_delta(feature, edge)
 
 
 def get_iteration_count(
-    events: list[dict[str, Any]],
+    events: list[dict[str, Any]] | EventIndex,
     feature: str,
     edge: str,
 ) -> int:
     """Count iteration_completed events for a feature/edge pair."""
-    return sum(
-        1
-        for ev in events
-        if ev.get("event_type") == "iteration_completed"
-        and ev.get("feature") == feature
-        and ev.get("edge") == edge
-    )
+    if isinstance(events, EventIndex):
+        return events.count(event_type="iteration_completed", feature=feature, edge=edge)
+    return _edge_status(events).iteration_count(feature, edge)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -263,6 +357,58 @@ def get_iteration_count(
 # ═══════════════════════════════════════════════════════════════════════
 
 
+class AbandonedIterationsProjection(Projection):
+    """Fold state for detect_abandoned_iterations().
+
+    State: {"started": {(feature, edge): timestamp}, "completed": set, "abandoned": set}
+    """
+
+    name = "abandoned_iterations"
+
+    def initial(self) -> dict[str, Any]:
+        return {"started": {}, "completed": set(), "abandoned": set()}
+
+    def apply(self, state: dict[str, Any], ev: dict[str, Any]) -> dict[str, Any]:
+        et = ev.get("event_type", "")
+        feature = ev.get("feature", "")
+        edge = ev.get("edge", "")
+        if not (feature and edge):
+            return state
+        key = (feature, edge)
+
+        if et == "edge_started":
+            state["started"][key] = ev.get("timestamp", "")
+        elif et in ("edge_converged", "iteration_completed"):
+            state["completed"].add(key)
+        elif et == "iteration_abandoned":
+            state["abandoned"].add(key)
+        return state
+
+    def encode(self, state: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "started": [[f, e, ts] for (f, e), ts in state["started"].items()],
+            "completed": sorted(state["completed"]),
+            "abandoned": sorted(state["abandoned"]),
+        }
+
+    def decode(self, data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "started": {(f, e): ts for f, e, ts in data["started"]},
+            "completed": {tuple(k) for k in data["completed"]},
+            "abandoned": {tuple(k) for k in data["abandoned"]},
+        }
+
+    def result(self, state: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            {"feature": key[0], "edge": key[1], "last_event_timestamp": timestamp}
+            for key, timestamp in state["started"].items()
+            if key not in state["completed"] and key not in state["abandoned"]
+        ]
+
+
+ABANDONED_ITERATIONS = AbandonedIterationsProjection()
+
+
 def detect_abandoned_iterations(
     events: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
@@ -275,35 +421,13 @@ def detect_abandoned_iterations(
 
     Returns a list of dicts: {feature, edge, last_event_timestamp}.
     """
-    started: dict[tuple[str, str], str] = {}  # (feature, edge) → timestamp
-    completed: set[tuple[str, str]] = set()
-    already_abandoned: set[tuple[str, str]] = set()
+    return ABANDONED_ITERATIONS.result(ABANDONED_ITERATIONS.fold(events))
 
-    for ev in events:
-        et = ev.get("event_type", "")
-        feature = ev.get("feature", "")
-        edge = ev.get("edge", "")
-        key = (feature, edge)
-
-        if et == "edge_started" and feature and edge:
-            started[key] = ev.get("timestamp", "")
-        elif et in ("edge_converged", "iteration_completed") and feature and edge:
-            completed.add(key)
-        elif et == "iteration_abandoned" and feature and edge:
-            already_abandoned.add(key)
-
-    abandoned = []
-    for key, timestamp in started.items():
-        if key not in completed and key not in already_abandoned:
-            abandoned.append(
-                {
-                    "feature": key[0],
-                    "edge": key[1],
-                    "last_event_timestamp": timestamp,
-                }
-            )
 
-    return abandoned
+def load_abandoned_iterations(workspace: Path) -> list[dict[str, Any]]:
+    """detect_abandoned_iterations() over the workspace log, resumed from its snapshot."""
+    state = load_projection(_events_file(workspace), ABANDONED_ITERATIONS)
+    return ABANDONED_ITERATIONS.result(state)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -311,19 +435,124 @@ def detect_abandoned_iterations(
 # ═══════════════════════════════════════════════════════════════════════
 
 
-def get_active_features(workspace: Path) -> list[dict[str, Any]]:
-    """Load all active feature vector YAML files."""
-    features_dir = _workspace_dir(workspace) / "features" / "active"
-    if not features_dir.exists():
-        return []
+FEATURE_BUCKETS = ("active", "completed")
+_RACY_NS = 2_000_000_000  # vectors written this recently are re-parsed on every refresh
 
-    features: list[dict[str, Any]] = []
-    for path in sorted(features_dir.glob("*.yml")):
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        if data:
-            features.append(data)
-    return features
+
+@dataclass
+class _FeatureFile:
+    mtime_ns: int
+    size: int
+    data: Any = None
+    error: Optional[Exception] = None
+    racy: bool = False
+
+
+class FeatureStore:
+    """Feature vectors in features/active and features/completed, indexed by id.
+
+    refresh() lists both directories and stats each file; only files whose
+    (mtime_ns, size) changed — or that were written too recently to trust
+    their mtime — are parsed again. Lookups between refreshes are O(1).
+
+    Returned documents are shared with the store: treat them as read-only
+    (get_active_features() hands out copies).
+    """
+
+    def __init__(self, workspace: Path) -> None:
+        self.ws_dir = _workspace_dir(workspace)
+        self.parses = 0
+        self._files: dict[str, dict[str, _FeatureFile]] = {b: {} for b in FEATURE_BUCKETS}
+        self._by_id: dict[str, dict[str, dict[str, Any]]] = {b: {} for b in FEATURE_BUCKETS}
+
+    def refresh(self) -> "FeatureStore":
+        now = time.time_ns()
+        for bucket, files in self._files.items():
+            seen: set[str] = set()
+            try:
+                entries = list(os.scandir(self.ws_dir / "features" / bucket))
+            except OSError:
+                entries = []
+            for entry in entries:
+                if not entry.name.endswith(".yml"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                seen.add(entry.path)
+                cached = files.get(entry.path)
+                if (
+                    cached is not None
+                    and not cached.racy
+                    and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size)
+                ):
+                    continue
+                record = _FeatureFile(st.st_mtime_ns, st.st_size, racy=now - st.st_mtime_ns <= _RACY_NS)
+                try:
+                    record.data = yaml_cache.load(entry.path)
+                except (yaml.YAMLError, OSError, UnicodeDecodeError) as exc:
+                    record.error = exc
+                self.parses += 1
+                files[entry.path] = record
+            for path in set(files) - seen:
+                del files[path]
+            self._files[bucket] = dict(sorted(files.items()))
+            index: dict[str, dict[str, Any]] = {}
+            for _path, data in self.documents(bucket, strict=False):
+                fid = data.get("feature") if isinstance(data, dict) else None
+                if fid:
+                    index.setdefault(fid, data)
+            self._by_id[bucket] = index
+        return self
+
+    def documents(self, bucket: str = "active", strict: bool = True) -> list[tuple[Path, Any]]:
+        """(path, document) for every non-empty file in *bucket*, in filename order.
+
+        strict re-raises the parse error of an unreadable file; otherwise it is skipped.
+        """
+        out: list[tuple[Path, Any]] = []
+        for path, record in self._files[bucket].items():
+            if record.error is not None:
+                if strict:
+                    raise record.error
+                continue
+            if record.data:
+                out.append((Path(path), record.data))
+        return out
+
+    def features(self, bucket: str = "active", strict: bool = True) -> list[dict[str, Any]]:
+        return [data for _path, data in self.documents(bucket, strict)]
+
+    def get(self, feature_id: str, bucket: str = "active") -> Optional[dict[str, Any]]:
+        """The vector in *bucket* whose ``feature`` is *feature_id*, or None."""
+        return self._by_id[bucket].get(feature_id)
+
+    def ids(self, bucket: str) -> set[str]:
+        """Feature ids (``feature`` or ``id`` key) of the readable files in *bucket*."""
+        ids: set[str] = set()
+        for _path, data in self.documents(bucket, strict=False):
+            fid = (data.get("feature") or data.get("id", "")) if isinstance(data, dict) else ""
+            if fid:
+                ids.add(fid)
+        return ids
+
+
+_FEATURE_STORES: dict[str, FeatureStore] = {}
+
+
+def feature_store(workspace: Path) -> FeatureStore:
+    """The process-wide FeatureStore of *workspace*, refreshed."""
+    key = os.path.abspath(_workspace_dir(workspace))
+    store = _FEATURE_STORES.get(key)
+    if store is None:
+        store = _FEATURE_STORES[key] = FeatureStore(workspace)
+    return store.refresh()
+
+
+def get_active_features(workspace: Path) -> list[dict[str, Any]]:
+    """Load all active feature vector YAML files (private copies)."""
+    return [yaml_cache.copy_document(fv) for fv in feature_store(workspace).features("active")]
 
 
 def extract_spec_feature_ids(spec_features_path: Path) -> list[str]:
@@ -370,24 +599,9 @@ def compute_spec_workspace_join(
     spec_ids: set[str] = set(extract_spec_feature_ids(spec_features_path))
 
     # Collect workspace feature IDs from active + completed directories
-    workspace_active: set[str] = set()
-    workspace_completed: set[str] = set()
-
-    for subdir, bucket in (
-        ("active", workspace_active),
-        ("completed", workspace_completed),
-    ):
-        features_dir = ws_dir / "features" / subdir
-        if features_dir.exists():
-            for path in features_dir.glob("*.yml"):
-                try:
-                    with open(path) as f:
-                        data = yaml.safe_load(f) or {}
-                    fid = data.get("feature") or data.get("id", "")
-                    if fid:
-                        bucket.add(fid)
-                except (yaml.YAMLError, OSError):
-                    pass
+    store = feature_store(workspace)
+    workspace_active = store.ids("active")
+    workspace_completed = store.ids("completed")
 
     workspace_ids = workspace_active | workspace_completed
 
@@ -409,80 +623,104 @@ def compute_spec_workspace_join(
     }
 
 
-def detect_stuck_features(
-    workspace: Path,
-    threshold: int = 3,
-) -> list[dict[str, Any]]:
-    """Detect features where delta has not decreased for *threshold*
-    consecutive iterations."""
-    events = load_events(workspace)
-    stuck: list[dict[str, Any]] = []
+class DeltaRunsProjection(Projection):
+    """Fold state for detect_stuck_features().
 
-    sequences: dict[tuple[str, str], list[int]] = {}
-    for ev in events:
+    Keeps, per (feature, edge), only what any threshold needs: the number of
+    iterations, the last delta, and how many consecutive iterations ended
+    on that same delta.
+
+    State: {(feature, edge): [iterations, last_delta, run_length]}
+    """
+
+    name = "delta_runs"
+
+    def apply(self, state: dict, ev: dict[str, Any]) -> dict:
         if ev.get("event_type") != "iteration_completed":
-            continue
+            return state
         feat = ev.get("feature", "")
         edge = ev.get("edge", "")
         delta = ev.get("delta")
-        if feat and edge and delta is not None:
-            sequences.setdefault((feat, edge), []).append(int(delta))
+        if not (feat and edge and delta is not None):
+            return state
+        delta = int(delta)
+        entry = state.get((feat, edge))
+        if entry is None:
+            state[(feat, edge)] = [1, delta, 1]
+        else:
+            entry[2] = entry[2] + 1 if entry[1] == delta else 1
+            entry[0] += 1
+            entry[1] = delta
+        return state
+
+    def encode(self, state: dict) -> list:
+        return [[f, e, *entry] for (f, e), entry in state.items()]
+
+    def decode(self, data: list) -> dict:
+        return {(f, e): [n, d, r] for f, e, n, d, r in data}
+
+    def result(self, state: dict, threshold: int = 3) -> list[dict[str, Any]]:
+        return [
+            {
+                "feature": feat,
+                "edge": edge,
+                "delta": last,
+                "iterations": count,
+                "reason": f"delta={last} unchanged for {threshold} iterations",
+            }
+            for (feat, edge), (count, last, run) in state.items()
+            if run >= threshold and last > 0
+        ]
 
-    for (feat, edge), deltas in sequences.items():
-        if len(deltas) < threshold:
-            continue
-        tail = deltas[-threshold:]
-        if len(set(tail)) == 1 and tail[0] > 0:
-            stuck.append(
-                {
-                    "feature": feat,
-                    "edge": edge,
-                    "delta": tail[0],
-                    "iterations": len(deltas),
-                    "reason": f"delta={tail[0]} unchanged for {threshold} iterations",
-                }
-            )
 
-    return stuck
+DELTA_RUNS = DeltaRunsProjection()
+
+
+def detect_stuck_features(
+    workspace: Path,
+    threshold: int = 3,
+) -> list[dict[str, Any]]:
+    """Detect features where delta has not decreased for *threshold*
+    consecutive iterations. Resumes from the delta_runs snapshot."""
+    return DELTA_RUNS.result(load_projection(_events_file(workspace), DELTA_RUNS), threshold)
 
 
 def _has_pending_human_review(
     workspace: Path,
     feature_id: str,
-    events: list[dict[str, Any]],
+    status: WorkspaceStatus,
+    store: Optional[FeatureStore] = None,
 ) -> bool:
     """Check if a feature has a pending human review."""
-    features = get_active_features(workspace)
-    for fv in features:
-        if fv.get("feature") != feature_id:
-            continue
-        traj = fv.get("trajectory", {})
-        for _edge_name, edge_data in traj.items():
-            if (
-                isinstance(edge_data, dict)
-                and edge_data.get("status") == "pending_review"
-            ):
-                return True
+    fv = (store or feature_store(workspace)).get(feature_id)
+    if fv is None:
+        return False
+    traj = fv.get("trajectory", {})
+    for _edge_name, edge_data in traj.items():
+        if (
+            isinstance(edge_data, dict)
+            and edge_data.get("status") == "pending_review"
+        ):
+            return True
     return False
 
 
 def _has_blocked_dependency(
     workspace: Path,
     feature_id: str,
-    events: list[dict[str, Any]],
+    status: WorkspaceStatus,
+    store: Optional[FeatureStore] = None,
 ) -> bool:
     """Check if a feature is blocked by an unconverged dependency (spawn)."""
-    features = get_active_features(workspace)
-    for fv in features:
-        if fv.get("feature") != feature_id:
-            continue
-        deps = fv.get("dependencies", [])
-        for dep in deps:
-            dep_id = dep if isinstance(dep, str) else dep.get("feature", "")
-            if dep_id:
-                dep_converged = get_converged_edges(events, dep_id)
-                if not dep_converged:
-                    return True
+    fv = (store or feature_store(workspace)).get(feature_id)
+    if fv is None:
+        return False
+    deps = fv.get("dependencies", [])
+    for dep in deps:
+        dep_id = dep if isinstance(dep, str) else dep.get("feature", "")
+        if dep_id:
+            if not status.converged_edges(dep_id):
+                return True
     return False
 
 
@@ -583,8 +821,7 @@ def verify_genesis_compliance(workspace: Path) -> dict[str, Any]:
     topology = None
     if topology_path.exists():
         try:
-            with open(topology_path) as f:
-                topology = yaml.safe_load(f)
+            topology = yaml_cache.load(topology_path)
             nodes = len(topology.get("asset_types", {}))
             edges = len(topology.get("transitions", []))
             if nodes > 0 and edges > 0:
@@ -643,8 +880,7 @@ def verify_genesis_compliance(workspace: Path) -> dict[str, Any]:
             if config_path.exists():
                 edge_configs_present += 1
                 try:
-                    with open(config_path) as f:
-                        cfg = yaml.safe_load(f)
+                    cfg = yaml_cache.load(config_path)
                     # Support both evaluators: and checklist: keys
                     evs = cfg.get("evaluators", cfg.get("checklist", []))
                     if isinstance(
@@ -715,8 +951,7 @@ def verify_genesis_compliance(workspace: Path) -> dict[str, Any]:
     )
     if constraints_path.exists():
         try:
-            with open(constraints_path) as f:
-                constraints = yaml.safe_load(f)
+            constraints = yaml_cache.load(constraints_path)
             dims = constraints.get("constraint_dimensions", {})
             wishes = []
             for name, val in dims.items():
@@ -774,20 +1009,14 @@ def verify_genesis_compliance(workspace: Path) -> dict[str, Any]:
     # 5. Workspace Vector Schema (REQ-EVOL-001)
     # Workspace YAMLs must NOT contain definition fields — module-level FORBIDDEN_WORKSPACE_KEYS
     violations: list[str] = []
-    _ws_dir = _workspace_dir(workspace)
-    for subdir in ("active", "completed"):
-        fv_dir = _ws_dir / "features" / subdir
-        if not fv_dir.exists():
-            continue
-        for path in sorted(fv_dir.glob("*.yml")):
-            try:
-                with open(path) as f:
-                    data = yaml.safe_load(f) or {}
-                for key in FORBIDDEN_WORKSPACE_KEYS:
-                    if key in data:
-                        violations.append(f"{path.name}: has forbidden key '{key}'")
-            except (yaml.YAMLError, OSError):
-                pass
+    store = feature_store(workspace)
+    for subdir in FEATURE_BUCKETS:
+        for path, data in store.documents(subdir, strict=False):
+            if not isinstance(data, dict):
+                continue
+            for key in FORBIDDEN_WORKSPACE_KEYS:
+                if key in data:
+                    violations.append(f"{path.name}: has forbidden key '{key}'")
 
     if violations:
         results.append(
@@ -872,25 +1101,21 @@ def verify_spec_hashes(
 
     # Collect most recent spec_modified event per file path
     last_spec_event: dict[str, dict] = {}
-    try:
-        with open(events_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                # Handle both flat and OL-wrapped formats
-                ev = normalize_event(event)
-                if ev.get("event_type") not in ("spec_modified", "SpecModified"):
-                    continue
-                file_path = ev.get("data", {}).get("file") or ev.get("file")
-                if file_path:
-                    last_spec_event[file_path] = ev
-    except OSError:
-        return []
+    for line in iter_logical_lines(events_file):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        # Handle both flat and OL-wrapped formats
+        ev = normalize_event(event)
+        if ev.get("event_type") not in ("spec_modified", "SpecModified"):
+            continue
+        file_path = ev.get("data", {}).get("file") or ev.get("file")
+        if file_path:
+            last_spec_event[file_path] = ev
 
     drift = []
     for file_path, event in last_spec_event.items():
@@ -942,8 +1167,8 @@ def detect_corrupted_events(workspace: Path) -> list[dict[str, Any]]:
         return []
 
     corruptions: list[dict[str, Any]] = []
-    for i, line in enumerate(events_file.read_text().splitlines(), 1):
-        stripped = line.strip()
+    for i, line in enumerate(iter_logical_lines(events_file), 1):
+        stripped = line.decode("utf-8", errors="replace").strip()
         if not stripped:
             continue
         try:
@@ -955,7 +1180,7 @@ def detect_corrupted_events(workspace: Path) -> list[dict[str, Any]]:
 
 def detect_orphaned_spawns(workspace: Path) -> list[dict[str, Any]]:
     """Find spawns whose parent feature doesn't exist."""
-    features = get_active_features(workspace)
+    features = feature_store(workspace).features("active")
     feature_ids = {fv.get("feature", "") for fv in features}
 
     orphans: list[dict[str, Any]] = []
@@ -1033,8 +1258,7 @@ def detect_workspace_state(workspace: Path) -> str:
         if cp.exists():
             # print(f"DEBUG: Found constraint file at {cp}")
             try:
-                with open(cp) as f:
-                    data = yaml.safe_load(f)
+                data = yaml_cache.load(cp)
                 if data and data.get("project"):
                     has_constraints = True
                     break
@@ -1045,8 +1269,7 @@ def detect_workspace_state(workspace: Path) -> str:
         for cp in constraints_candidates:
             if cp.exists():
                 try:
-                    with open(cp) as f:
-                        data = yaml.safe_load(f)
+                    data = yaml_cache.load(cp)
                     dims = data.get("constraint_dimensions", {})
                     mandatory_filled = 0
                     mandatory_total = 0
@@ -1087,11 +1310,14 @@ def detect_workspace_state(workspace: Path) -> str:
     if not has_intent:
         return "NEEDS_INTENT"
 
-    features = get_active_features(workspace)
+    store = feature_store(workspace)
+    features = store.features("active")
     if not features:
         return "NO_FEATURES"
 
-    events = load_events(workspace)
+    # One fold over the log answers every per-feature question below
+    ws_status = load_workspace_status(workspace)
+    stuck_ids = {s["feature"] for s in ws_status.stuck_features(threshold=3)}
 
     all_converged = True
     any_stuck = False
@@ -1106,14 +1332,13 @@ def detect_workspace_state(workspace: Path) -> str:
 
         all_converged = False
 
-        stuck_list = detect_stuck_features(workspace, threshold=3)
-        if any(s["feature"] == feat_id for s in stuck_list):
+        if feat_id in stuck_ids:
             any_stuck = True
             continue
 
         is_blocked = _has_blocked_dependency(
-            workspace, feat_id, events
-        ) or _has_pending_human_review(workspace, feat_id, events)
+            workspace, feat_id, ws_status, store
+        ) or _has_pending_human_review(workspace, feat_id, ws_status, store)
         if not is_blocked:
             all_blocked = False
 
@@ -1182,34 +1407,45 @@ class InstanceGraph:
     topology_version: str  # from graph_topology.yml graph_properties.version
 
 
-def project_instance_graph(
-    events: list[dict[str, Any]],
-    topology_version: str = "unknown",
-    active_profile_edges: list[str] | None = None,
-) -> InstanceGraph:
-    """Replay events to derive the current instance graph (ADR-022, Step 4).
+class InstanceGraphProjection(Projection):
+    """Fold state for project_instance_graph().
 
-    Mutation sequence:
-      feature_spawned / project_initialized  → node added
-      spawn_created                          → child node added immediately (T-COMPLY-003)
-      edge_started                           → node.current_edge = edge, status = in_progress
-      iteration_completed                    → node.delta = delta
-      edge_converged                         → node.converged_edges.add(edge)
-                                               if converged_edges ⊇ active_profile_edges → converged
-      feature_converged                      → (ignored — terminal status derived from coverage)
+    The fold is profile-independent so one snapshot serves every profile:
+    a node records its last progress kind ("pending" | "in_progress" |
+    "edge_converged") and whether a feature_converged event followed it.
+    result() resolves those into InstanceNode.status for a given profile.
 
-    Returns an InstanceGraph positioned at the watermark of the last event.
+    State: {"nodes": {feature_id: node_fields}, "last_timestamp": str | None}
     """
-    nodes: dict[str, InstanceNode] = {}  # feature_id → InstanceNode
-    last_timestamp: Optional[str] = None
 
-    for ev in events:
+    name = "instance_graph"
+
+    def initial(self) -> dict[str, Any]:
+        return {"nodes": {}, "last_timestamp": None}
+
+    @staticmethod
+    def _node(feature_id: str, zoom_level: int, parent_id: Optional[str]) -> dict[str, Any]:
+        return {
+            "feature_id": feature_id,
+            "zoom_level": zoom_level,
+            "current_edge": "",
+            "progress": "pending",
+            "feature_converged": False,
+            "delta": -1,
+            "parent_id": parent_id,
+            "converged_edges": [],
+            "hamiltonian_T": 0,
+            "hamiltonian_V": 0,
+        }
+
+    def apply(self, state: dict[str, Any], ev: dict[str, Any]) -> dict[str, Any]:
+        nodes = state["nodes"]
         et = ev.get("event_type", "")
         feature = ev.get("feature", "")
         edge = ev.get("edge", "")
         ts = ev.get("timestamp")
         if ts:
-            last_timestamp = ts
+            state["last_timestamp"] = ts
 
         # OL-wrapped events carry event_type in facets
         if not et:
@@ -1218,7 +1454,7 @@ def project_instance_graph(
 
         if et in ("project_initialized",) and not feature:
             # project-level event — no node to create
-            continue
+            return state
 
         # spawn_created: immediately add child node (T-COMPLY-003 bug fix)
         if et == "spawn_created":
@@ -1226,38 +1462,22 @@ def project_instance_graph(
             child_id = data.get("child_feature") or data.get("child_id")
             parent_id = data.get("parent_feature") or feature
             if child_id and child_id not in nodes:
-                nodes[child_id] = InstanceNode(
-                    feature_id=child_id,
-                    zoom_level=2,
-                    current_edge="",
-                    status="pending",
-                    delta=-1,
-                    parent_id=parent_id,
-                )
-            # Also ensure the parent node exists if feature is set
-            if not feature:
-                continue
+                nodes[child_id] = self._node(child_id, 2, parent_id)
 
         if not feature:
-            continue
+            return state
 
         # Ensure node exists
         if feature not in nodes:
             parent = ev.get("parent_id") or ev.get("data", {}).get("parent_id")
-            nodes[feature] = InstanceNode(
-                feature_id=feature,
-                zoom_level=2 if parent else 1,
-                current_edge="",
-                status="pending",
-                delta=-1,
-                parent_id=parent,
-            )
+            nodes[feature] = self._node(feature, 2 if parent else 1, parent)
 
         node = nodes[feature]
 
         if et == "edge_started":
-            node.current_edge = edge
-            node.status = "in_progress"
+            node["current_edge"] = edge
+            node["progress"] = "in_progress"
+            node["feature_converged"] = False
 
         elif et == "iteration_completed":
             raw_delta = ev.get("delta")
@@ -1265,47 +1485,177 @@ def project_instance_graph(
                 raw_delta = ev.get("data", {}).get("delta")
             if raw_delta is not None:
                 try:
-                    node.delta = int(raw_delta)
-                    node.hamiltonian_V = max(0, node.delta)
+                    node["delta"] = int(raw_delta)
+                    node["hamiltonian_V"] = max(0, node["delta"])
                 except (TypeError, ValueError):
                     pass
             # T increments by 1 for each iteration_completed event (ADR-S-020)
-            node.hamiltonian_T += 1
+            node["hamiltonian_T"] += 1
             if edge:
-                node.current_edge = edge
-            node.status = "in_progress"
+                node["current_edge"] = edge
+            node["progress"] = "in_progress"
+            node["feature_converged"] = False
 
         elif et == "edge_converged":
-            if edge and edge not in node.converged_edges:
-                node.converged_edges.append(edge)
-            node.current_edge = edge
+            if edge and edge not in node["converged_edges"]:
+                node["converged_edges"].append(edge)
+            node["current_edge"] = edge
             # V = 0 when edge converges (all evaluators pass)
-            node.hamiltonian_V = 0
-            # Derive terminal status from profile coverage (T-COMPLY-003 bug fix)
-            if active_profile_edges and set(active_profile_edges) <= set(node.converged_edges):
-                node.status = "converged"
-            else:
-                node.status = "in_progress"
+            node["hamiltonian_V"] = 0
+            node["progress"] = "edge_converged"
+            node["feature_converged"] = False
 
         elif et == "feature_converged":
             # Deprecated: terminal status is now derived from profile coverage.
-            # Accept old events gracefully — only archive if no profile to compare against.
-            if not active_profile_edges:
-                node.status = "archived"
-
-    # Infer converged status from trajectory files when events are sparse
-    # (handles workspace_state where feature.status = "converged" in yml)
-    as_of = (
-        datetime.fromisoformat(last_timestamp.replace("Z", "+00:00"))
-        if last_timestamp
-        else datetime.now(timezone.utc)
-    )
+            node["feature_converged"] = True
+
+        return state
+
+    def result(
+        self,
+        state: dict[str, Any],
+        topology_version: str = "unknown",
+        active_profile_edges: list[str] | None = None,
+    ) -> InstanceGraph:
+        result_nodes = []
+        for n in state["nodes"].values():
+            status = n["progress"]
+            if status == "edge_converged":
+                # Derive terminal status from profile coverage (T-COMPLY-003 bug fix)
+                covered = active_profile_edges and set(active_profile_edges) <= set(
+                    n["converged_edges"]
+                )
+                status = "converged" if covered else "in_progress"
+            if n["feature_converged"] and not active_profile_edges:
+                # Old feature_converged events archive only when there is no profile
+                status = "archived"
+            result_nodes.append(
+                InstanceNode(
+                    feature_id=n["feature_id"],
+                    zoom_level=n["zoom_level"],
+                    current_edge=n["current_edge"],
+                    status=status,
+                    delta=n["delta"],
+                    parent_id=n["parent_id"],
+                    converged_edges=list(n["converged_edges"]),
+                    hamiltonian_T=n["hamiltonian_T"],
+                    hamiltonian_V=n["hamiltonian_V"],
+                )
+            )
 
-    return InstanceGraph(
-        nodes=list(nodes.values()),
-        as_of=as_of,
-        topology_version=topology_version,
-    )
+        last_timestamp = state["last_timestamp"]
+        as_of = (
+            datetime.fromisoformat(last_timestamp.replace("Z", "+00:00"))
+            if last_timestamp
+            else datetime.now(timezone.utc)
+        )
+        return InstanceGraph(
+            nodes=result_nodes,
+            as_of=as_of,
+            topology_version=topology_version,
+        )
+
+
+INSTANCE_GRAPH = InstanceGraphProjection()
+
+
+def project_instance_graph(
+    events: list[dict[str, Any]],
+    topology_version: str = "unknown",
+    active_profile_edges: list[str] | None = None,
+) -> InstanceGraph:
+    """Replay events to derive the current instance graph (ADR-022, Step 4).
+
+    Mutation sequence:
+      feature_spawned / project_initialized  → node added
+      spawn_created                          → child node added immediately (T-COMPLY-003)
+      edge_started                           → node.current_edge = edge, status = in_progress
+      iteration_completed                    → node.delta = delta
+      edge_converged                         → node.converged_edges.add(edge)
+                                               if converged_edges ⊇ active_profile_edges → converged
+      feature_converged                      → (ignored — terminal status derived from coverage)
+
+    Returns an InstanceGraph positioned at the watermark of the last event.
+    """
+    state = INSTANCE_GRAPH.fold(events)
+    return INSTANCE_GRAPH.result(state, topology_version, active_profile_edges)
+
+
+def load_instance_graph(
+    workspace: Path,
+    topology_version: str = "unknown",
+    active_profile_edges: list[str] | None = None,
+) -> InstanceGraph:
+    """project_instance_graph() over the workspace log, resumed from its snapshot."""
+    state = load_projection(_events_file(workspace), INSTANCE_GRAPH)
+    return INSTANCE_GRAPH.result(state, topology_version, active_profile_edges)
+
+
+class HamiltonianProjection(Projection):
+    """Fold state for compute_hamiltonian() — every feature and edge at once.
+
+    Per feature:
+      all   — [T, V] across every edge (the edge=None query)
+      edges — {edge: [T, V, seq]} for events naming that edge
+      blank — [T, V, seq] for iteration_completed events with no edge, which
+              count towards every per-edge query
+    ``seq`` orders the last V update so a per-edge query can tell whether the
+    edge's own delta or a later edge-less delta is the current one.
+    """
+
+    name = "hamiltonian"
+
+    def apply(self, state: dict[str, Any], ev: dict[str, Any]) -> dict[str, Any]:
+        et = ev.get("event_type", "")
+        if et not in ("iteration_completed", "edge_converged"):
+            return state
+        edge = ev.get("edge", "")
+        f = state.setdefault(
+            ev.get("feature", ""),
+            {"seq": 0, "all": [0, 0], "blank": [0, 0, 0], "edges": {}},
+        )
+        f["seq"] += 1
+        slot = f["edges"].setdefault(edge, [0, 0, 0]) if edge else f["blank"]
+
+        if et == "iteration_completed":
+            f["all"][0] += 1
+            slot[0] += 1
+            raw = ev.get("delta")
+            if raw is not None:
+                try:
+                    v = max(0, int(raw))
+                except (TypeError, ValueError):
+                    return state
+                f["all"][1] = v
+                slot[1] = v
+                slot[2] = f["seq"]
+        else:  # edge_converged
+            f["all"][1] = 0
+            if edge:
+                slot[1] = 0
+                slot[2] = f["seq"]
+        return state
+
+    def result(
+        self, state: dict[str, Any], feature: str, edge: str | None = None
+    ) -> tuple[int, int, int]:
+        f = state.get(feature)
+        if f is None:
+            return 0, 0, 0
+        if not edge:
+            T, V = f["all"]
+        else:
+            own = f["edges"].get(edge, [0, 0, 0])
+            blank = f["blank"]
+            T = own[0] + blank[0]
+            V = own[1] if own[2] >= blank[2] else blank[1]
+        return T, V, T + V
+
+
+HAMILTONIAN = HamiltonianProjection()
+
+# Status rendering reads all of these together — fold them in one pass
+WORKSPACE_STATUS = ProjectionSet("workspace_status", EDGE_STATUS, DELTA_RUNS, HAMILTONIAN)
 
 
 def compute_hamiltonian(
@@ -1329,31 +1679,7 @@ def compute_hamiltonian(
         V: last delta value (0 if the edge has converged, -1 → treated as 0)
         H: T + V
     """
-    T = 0
-    V = 0
-    for ev in events:
-        et = ev.get("event_type", "")
-        ev_feature = ev.get("feature", "")
-        ev_edge = ev.get("edge", "")
-
-        if ev_feature != feature:
-            continue
-        if edge and ev_edge and ev_edge != edge:
-            continue
-
-        if et == "iteration_completed":
-            T += 1
-            raw = ev.get("delta")
-            if raw is not None:
-                try:
-                    V = max(0, int(raw))
-                except (TypeError, ValueError):
-                    pass
-        elif et == "edge_converged":
-            if not edge or ev_edge == edge:
-                V = 0
-
-    return T, V, T + V
+    return HAMILTONIAN.result(HAMILTONIAN.fold(events), feature, edge)
 
 
 def summarise_instance_graph(graph: InstanceGraph) -> dict[str, Any]:
@@ -0,0 +1,104 @@
+# Implements: REQ-CTX-001 (Context as Constraint Surface), REQ-GRAPH-001 (Asset Type Registry)
+"""Process-wide YAML parse cache keyed by file stat.
+
+Graph topology, profiles, edge_params and feature vectors are re-read many
+times per dispatch round, and the pure-Python SafeLoader dominates that cost.
+load() parses a file once per (path, mtime_ns, size) and serves later calls
+from memory. Parsing uses libyaml's CSafeLoader when PyYAML was built with
+it, else SafeLoader — both accept the same safe subset.
+
+Callers get a private copy of the cached document (dicts and lists are
+copied, scalars shared), so mutating a result never leaks into the cache or
+into another caller's result. Copying plain data is far cheaper than
+re-parsing it.
+
+A file modified in the last two seconds is parsed but not cached: a rewrite
+within the same mtime tick that keeps the size would otherwise be missed.
+Parse errors and missing files raise exactly as yaml.safe_load / open() do,
+and are never cached.
+
+Contract:
+  load(path)                      → document (first document of the stream)
+  load(path, all_documents=True)  → list of documents
+  YAML_CACHE.hits / .misses       → counters; YAML_CACHE.clear() empties it
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+MAX_ENTRIES = 1024
+_RACY_NS = 2_000_000_000  # files younger than this are parsed every time
+
+
+def parse(text: str, all_documents: bool = False) -> Any:
+    """Parse YAML *text* with the fastest safe loader available."""
+    if all_documents:
+        return list(yaml.load_all(text, Loader=Loader))
+    return yaml.load(text, Loader=Loader)
+
+
+def copy_document(value: Any) -> Any:
+    """Copy the containers of a parsed document; scalars are immutable."""
+    if isinstance(value, dict):
+        return {k: copy_document(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_document(v) for v in value]
+    return value
+
+
+class YamlCache:
+    """LRU of parsed documents keyed by (abspath, all_documents). Thread-safe."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, bool], tuple[int, int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Union[str, Path], all_documents: bool = False) -> Any:
+        """Parsed contents of *path* — a fresh copy on every call."""
+        key = (os.path.abspath(path), all_documents)
+        with open(key[0], encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy_document(entry[2])
+                self.misses += 1
+            doc = parse(f.read(), all_documents)
+
+        with self._lock:
+            if time.time_ns() - st.st_mtime_ns <= _RACY_NS:
+                self._entries.pop(key, None)
+                return doc
+            self._entries[key] = (st.st_mtime_ns, st.st_size, doc)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy_document(doc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+YAML_CACHE = YamlCache()
+
+
+def load(path: Union[str, Path], all_documents: bool = False) -> Any:
+    """Parse *path* through the process-wide YAML_CACHE."""
+    return YAML_CACHE.load(path, all_documents)
@@ -51,6 +51,7 @@ What gets created:
 
 import sys
 import os
+import fcntl
 import json
 import argparse
 import shutil
@@ -97,15 +98,17 @@ COMMANDS = [
 ]
 
 ENGINE_FILES = [
-    "__init__.py", "__main__.py", "config_loader.py", "consensus_engine.py",
+    "__init__.py", "__main__.py", "check_cache.py", "config_loader.py", "consensus_engine.py",
     "contracts.py", "dispatch.py", "dispatch_loop.py", "dispatch_monitor.py", "edge_runner.py",
-    "engine.py", "fd_classify.py", "fd_emit.py", "fd_evaluate.py",
-    "fd_route.py", "fd_sense.py", "fd_spawn.py", "feature_parallelism.py",
-    "feature_view.py", "fp_functor.py", "functor.py", "human_audit.py",
+    "engine.py", "event_archive.py", "event_index.py", "event_log.py", "event_segments.py",
+    "fd_classify.py", "fd_emit.py", "fd_evaluate.py", "fd_route.py", "fd_sense.py", "fd_spawn.py",
+    "feature_parallelism.py", "feature_view.py", "fp_functor.py", "functor.py", "human_audit.py",
+    "impact_selection.py",
     "intent_observer.py", "models.py", "ol_event.py", "outcome_types.py", "proc.py",
-    "role_authority.py", "schema_discovery.py", "serialiser.py",
+    "projections.py", "role_authority.py", "schema_discovery.py", "serialiser.py",
     "spec_boundary.py", "workspace_analysis.py", "workspace_gradient.py",
-    "workspace_integrity.py", "workspace_repair.py", "workspace_state.py",
+    "workspace_fingerprint.py", "workspace_integrity.py", "workspace_repair.py",
+    "workspace_state.py", "yaml_cache.py",
 ]
 
 ENGINE_SCRIPTS = [
@@ -430,6 +433,17 @@ def write_file(path: Path, content: str, dry_run: bool, force: bool = False) ->
     return True
 
 
+def append_event(events_file: Path, event: dict):
+    """Append one event line to events.jsonl under the flock the engine uses."""
+    with open(events_file, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write(json.dumps(event) + "\n")
+            f.flush()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
 def detect_project_name(target: Path) -> str:
     """Auto-detect project name from directory or config files."""
     # Try pyproject.toml
@@ -663,8 +677,7 @@ def setup_workspace(target: Path, project_name: str, dry_run: bool,
                     "lineage_levels": list(_lineage_levels),  # ADR-S-022 §2 provenance
                 },
             }
-            with open(events_file, "a") as f:
-                f.write(json.dumps(event) + "\n")
+            append_event(events_file, event)
             print_ok("Emitted project_initialized event")
     else:
         print_info("Would emit project_initialized event")
@@ -1167,8 +1180,7 @@ def emit_install_event(
         "project": project_name,
         "data": data,
     }
-    with open(events_file, "a") as f:
-        f.write(json.dumps(event) + "\n")
+    append_event(events_file, event)
 
 
 # =============================================================================
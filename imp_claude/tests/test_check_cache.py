@@ -0,0 +1,230 @@
+# Validates: REQ-EVAL-002 (Evaluator Composition), REQ-ITER-003 (Functor Encoding Tracking)
+"""Tests for the content-addressed deterministic check result cache."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import genesis.check_cache as check_cache
+from genesis.check_cache import CheckCache, hash_inputs
+from genesis.config_loader import resolve_checklist
+from genesis.engine import EngineConfig, iterate_edge
+from genesis.fd_evaluate import run_checks
+from genesis.models import CheckOutcome, ResolvedCheck
+from genesis.ol_event import normalize_event
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("x = 1\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "readme.md").write_text("hello\n")
+    return tmp_path
+
+
+def _check(project: Path, command: str = "true", **kw) -> ResolvedCheck:
+    """A check that records each real run in <project>/runs.log."""
+    kw.setdefault("inputs", ["**/*.py"])
+    return ResolvedCheck(
+        name="tests_pass", check_type="deterministic", functional_unit="evaluate",
+        criterion="ok", source="default", required=True,
+        command=f"echo run >> {project / 'runs.log'}; {command}",
+        pass_criterion="exit code 0", **kw,
+    )
+
+
+def _runs(project: Path) -> int:
+    log = project / "runs.log"
+    return len(log.read_text().split()) if log.exists() else 0
+
+
+# ── Input hashing ─────────────────────────────────────────────────────────────
+
+
+class TestHashInputs:
+    def test_stable_and_content_sensitive(self, project: Path) -> None:
+        before = hash_inputs(project, ["**/*.py"])
+        assert hash_inputs(project, ["**/*.py"]) == before
+        (project / "src" / "app.py").write_text("x = 2\n")
+        assert hash_inputs(project, ["**/*.py"]) != before
+
+    def test_unmatched_files_ignored(self, project: Path) -> None:
+        before = hash_inputs(project, ["**/*.py"])
+        (project / "docs" / "readme.md").write_text("changed\n")
+        assert hash_inputs(project, ["**/*.py"]) == before
+
+    def test_double_star_matches_top_level(self, project: Path) -> None:
+        before = hash_inputs(project, ["**/*.py"])
+        (project / "conftest.py").write_text("")
+        assert hash_inputs(project, ["**/*.py"]) != before
+
+    def test_workspace_and_vcs_dirs_skipped(self, project: Path) -> None:
+        before = hash_inputs(project, ["**/*.py"])
+        for skipped in (".git", ".ai-workspace", "__pycache__"):
+            (project / skipped).mkdir()
+            (project / skipped / "x.py").write_text("")
+        assert hash_inputs(project, ["**/*.py"]) == before
+
+
+    def test_keys_reread_only_changed_files(self, project: Path) -> None:
+        for n in range(5):
+            (project / "src" / f"m{n}.py").write_text(f"n = {n}\n")
+        for path in (project / "src").iterdir():
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        check = _check(project)
+        first = CheckCache(project)
+        before = first.key(check, project)
+        first.save()
+        assert first.stat_cache.hashed == 6
+
+        (project / "src" / "m0.py").write_text("n = -1\n")
+        second = CheckCache(project)  # a later iteration: fresh instance, persisted hashes
+        assert second.key(check, project) != before
+        assert second.stat_cache.hashed == 1
+
+# ── Cache semantics ───────────────────────────────────────────────────────────
+
+
+class TestCheckCache:
+    def test_hit_skips_subprocess(self, project: Path) -> None:
+        cache = CheckCache(project)
+        first = run_checks([_check(project)], project, cache=cache)[0]
+        second = run_checks([_check(project)], project, cache=cache)[0]
+        assert _runs(project) == 1
+        assert (first.cached, second.cached) == (False, True)
+        assert second.outcome == CheckOutcome.PASS
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_doc_change_still_hits(self, project: Path) -> None:
+        cache = CheckCache(project)
+        run_checks([_check(project)], project, cache=cache)
+        (project / "docs" / "readme.md").write_text("rewritten by F_P\n")
+        assert run_checks([_check(project)], project, cache=cache)[0].cached
+
+    def test_input_change_misses(self, project: Path) -> None:
+        cache = CheckCache(project)
+        run_checks([_check(project)], project, cache=cache)
+        (project / "src" / "app.py").write_text("x = 3\n")
+        assert not run_checks([_check(project)], project, cache=cache)[0].cached
+        assert _runs(project) == 2
+
+    def test_failure_cached_with_output_tail(self, project: Path) -> None:
+        cache = CheckCache(project)
+        run_checks([_check(project, "echo boom >&2; false")], project, cache=cache)
+        hit = run_checks([_check(project, "echo boom >&2; false")], project, cache=cache)[0]
+        assert hit.cached and hit.outcome == CheckOutcome.FAIL
+        assert "boom" in hit.stderr and hit.exit_code == 1
+
+    def test_error_not_cached(self, project: Path) -> None:
+        cache = CheckCache(project)
+        # Silent for longer than the stall timeout → ERROR (transient)
+        run_checks([_check(project, "sleep 5")], project, timeout=1, cache=cache)
+        assert not list(cache.dir.glob("*/*.json"))
+
+    def test_env_is_part_of_key(self, project: Path, monkeypatch) -> None:
+        cache = CheckCache(project)
+        monkeypatch.setenv("DB_URL", "a")
+        run_checks([_check(project, input_env=["DB_URL"])], project, cache=cache)
+        monkeypatch.setenv("DB_URL", "b")
+        assert not run_checks([_check(project, input_env=["DB_URL"])], project, cache=cache)[0].cached
+
+    def test_undeclared_inputs_never_cached(self, project: Path) -> None:
+        cache = CheckCache(project)
+        for _ in range(2):
+            run_checks([_check(project, inputs=None)], project, cache=cache)
+        assert _runs(project) == 2
+        assert cache.key(_check(project, inputs=None), project) is None
+
+    def test_command_is_part_of_key(self, project: Path) -> None:
+        cache = CheckCache(project)
+        assert cache.key(_check(project, "true"), project) != cache.key(_check(project, "false"), project)
+
+    def test_dependency_change_misses(self, project: Path, monkeypatch) -> None:
+        monkeypatch.setattr(check_cache, "dependency_fingerprint", lambda: "deps-a")
+        run_checks([_check(project)], project, cache=CheckCache(project))
+        monkeypatch.setattr(check_cache, "dependency_fingerprint", lambda: "deps-b")
+        assert not run_checks([_check(project)], project, cache=CheckCache(project))[0].cached
+
+    def test_coverage_output_is_not_an_input(self, project: Path) -> None:
+        cache = CheckCache(project)
+        before = cache.key(_check(project, inputs=["**"]), project)
+        (project / ".coverage").write_text("data")
+        (project / "htmlcov").mkdir()
+        (project / "htmlcov" / "index.html").write_text("<html/>")
+        assert cache.key(_check(project, inputs=["**"]), project) == before
+
+
+# ── Config resolution ─────────────────────────────────────────────────────────
+
+
+class TestInputsResolution:
+    def _resolve(self, inputs, constraints):
+        entry = {"name": "t", "type": "deterministic", "command": "true", "inputs": inputs}
+        return resolve_checklist({"checklist": [entry]}, constraints)[0]
+
+    def test_variable_expands_to_globs(self) -> None:
+        check = self._resolve("$tools.test_runner.inputs", {"tools": {"test_runner": {"inputs": "**/*.py setup.cfg"}}})
+        assert check.inputs == ["**/*.py", "setup.cfg"]
+
+    def test_unresolved_inputs_uncacheable_not_skipped(self) -> None:
+        check = self._resolve("$tools.test_runner.inputs", {})
+        assert check.inputs is None
+        assert check.unresolved == []
+
+    def test_template_inputs_cover_non_python_fixtures(self, project: Path, project_constraints_template) -> None:
+        fixture = project / "tests" / "fixtures" / "expected.json"
+        fixture.parent.mkdir(parents=True)
+        fixture.write_text('{"total": 1}')
+        check = self._resolve("$tools.test_runner.inputs", project_constraints_template)
+        cache = CheckCache(project)
+        run_checks([check], project, cache=cache)
+        assert run_checks([check], project, cache=cache)[0].cached
+        fixture.write_text('{"total": 2}')
+        assert not run_checks([check], project, cache=cache)[0].cached
+
+
+# ── Engine ────────────────────────────────────────────────────────────────────
+
+
+class TestEngineCache:
+    def _iterate(self, project: Path, **config) -> None:
+        checklist = [{
+            "name": "tests_pass", "type": "deterministic", "required": True,
+            "command": f"echo run >> {project / 'runs.log'}; false", "inputs": "**/*.py",
+        }]
+        iterate_edge(
+            edge="code↔unit_tests",
+            edge_config={"edge": "code↔unit_tests", "checklist": checklist},
+            config=EngineConfig(
+                project_name="test", workspace_path=project, edge_params_dir=project,
+                profiles_dir=project, constraints={}, graph_topology={},
+                deterministic_only=True, fd_timeout=5, **config,
+            ),
+            feature_id="REQ-F-A",
+            asset_content="x",
+        )
+
+    def _details(self, project: Path) -> list[dict]:
+        lines = (project / ".ai-workspace" / "events" / "events.jsonl").read_text().splitlines()
+        events = [normalize_event(json.loads(line)) for line in lines]
+        return [e for e in events if e["event_type"] == "evaluator_detail"]
+
+    def test_second_iteration_reuses_result(self, project: Path) -> None:
+        self._iterate(project)
+        self._iterate(project)
+        assert _runs(project) == 1
+        details = self._details(project)
+        assert "cached" not in details[0]
+        assert details[1]["cached"] is True
+        assert details[1]["outcome"] == "fail"
+
+    def test_cache_disabled(self, project: Path) -> None:
+        self._iterate(project, check_cache=False)
+        self._iterate(project, check_cache=False)
+        assert _runs(project) == 2
@@ -382,6 +382,19 @@ class TestResolveChecklist:
         checks = resolve_checklist({}, {})
         assert checks == []
 
+    def test_scheduling_keys(self):
+        checklist = {
+            "checklist": [
+                {"name": "a", "type": "deterministic", "command": "true", "group": "pytest"},
+                {"name": "b", "type": "deterministic", "command": "true", "exclusive": True},
+                {"name": "c", "type": "deterministic", "command": "true"},
+            ]
+        }
+        a, b, c = resolve_checklist(checklist, {})
+        assert (a.group, a.exclusive) == ("pytest", False)
+        assert (b.group, b.exclusive) == (None, True)
+        assert (c.group, c.exclusive) == (None, False)
+
 
 # ── load_yaml ────────────────────────────────────────────────────────────
 
@@ -334,3 +334,126 @@ class TestRunMonitor:
 
         assert len(callback_calls) >= 1
         assert callback_calls[0] == 2
+
+
+    def test_debounce_is_bounded(self, workspace, events_path):
+        """A steady stream of appends cannot postpone dispatch indefinitely."""
+        class Busy:
+            def wait(self, timeout):
+                time.sleep(0.01)
+                return True  # another append, every time
+
+            def close(self):
+                pass
+
+        calls = {"n": 0}
+
+        def fake_check(workspace_root, state, events_path, project_name, max_rounds):
+            calls["n"] += 1
+            return {"fired": calls["n"] > 1, "dispatched": 0, "converged": 0,
+                    "fh_required": 0, "fp_dispatched": 0, "quiescent": True}
+
+        with patch("genesis.dispatch_monitor._open_watcher", return_value=Busy()), \
+                patch("genesis.dispatch_monitor.check_and_dispatch", side_effect=fake_check):
+            started = time.monotonic()
+            run_monitor(workspace, events_path, max_total_fires=1, max_debounce_s=0.2)
+        assert calls["n"] == 2
+        assert time.monotonic() - started < 2.0
+
+
+# ── Appended range ────────────────────────────────────────────────────────────
+
+
+class TestAppendedRange:
+    def _no_full_scan(self, monkeypatch):
+        def fail(*_a, **_kw):
+            raise AssertionError("full log scanned")
+        monkeypatch.setattr("genesis.dispatch_loop.get_pending_dispatches", fail)
+
+    def test_non_trigger_append_skips_dispatch(self, workspace, events_path, monkeypatch):
+        state = MonitorState()
+        monkeypatch.setattr("genesis.dispatch_loop.get_pending_dispatches", lambda root: [])
+        check_and_dispatch(workspace, state, events_path)  # baseline
+
+        self._no_full_scan(monkeypatch)
+        _append_event(events_path, "iteration_completed")
+        result = check_and_dispatch(workspace, state, events_path)
+        assert result["fired"] is False
+        assert state.rounds_fired == 1
+
+    def test_trigger_append_fires(self, workspace, events_path, monkeypatch):
+        state = MonitorState()
+        monkeypatch.setattr("genesis.dispatch_loop.get_pending_dispatches", lambda root: [])
+        check_and_dispatch(workspace, state, events_path)
+        _append_event(events_path, "review_approved", feature="REQ-F-A-001")
+        assert check_and_dispatch(workspace, state, events_path)["fired"] is True
+        assert state.quiescent is True
+
+    def test_torn_trailing_line_examined_once_complete(self, workspace, events_path, monkeypatch):
+        state = MonitorState()
+        monkeypatch.setattr("genesis.dispatch_loop.get_pending_dispatches", lambda root: [])
+        check_and_dispatch(workspace, state, events_path)  # baseline
+        line = json.dumps({"event_type": "intent_raised", "timestamp": "2026-03-11T00:00:00Z"}) + "\n"
+        with open(events_path, "a") as f:
+            f.write(line[:20])  # writer caught mid-line
+        assert check_and_dispatch(workspace, state, events_path)["fired"] is False
+        with open(events_path, "a") as f:
+            f.write(line[20:])
+        assert check_and_dispatch(workspace, state, events_path)["fired"] is True
+
+    def test_only_range_examined(self, events_path):
+        from genesis.dispatch_loop import appended_triggers_dispatch
+        _append_event(events_path, "intent_raised")
+        start = events_path.stat().st_size
+        _append_event(events_path, "edge_started")
+        assert not appended_triggers_dispatch(events_path, (start, events_path.stat().st_size))
+        assert appended_triggers_dispatch(events_path, (0, events_path.stat().st_size))
+
+    def test_ol_events_normalized(self, events_path):
+        from genesis.dispatch_loop import appended_triggers_dispatch
+        from genesis.ol_event import make_ol_event
+        ev = make_ol_event("intent_raised", "design→code", "p", "REQ-F-A-001", "t", payload={"intent_id": "I"})
+        with open(events_path, "a") as f:
+            f.write(json.dumps(ev) + "\n")
+        assert appended_triggers_dispatch(events_path, (0, events_path.stat().st_size))
+
+
+# ── inotify watcher ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.skipif(not __import__("sys").platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyWatcher:
+    def test_wakes_on_append(self, events_path):
+        import threading
+        from genesis.dispatch_monitor import InotifyWatcher
+        watcher = InotifyWatcher(events_path)
+        try:
+            timer = threading.Timer(0.05, _append_event, (events_path, "intent_raised"))
+            timer.start()
+            started = time.monotonic()
+            assert watcher.wait(5.0) is True
+            assert time.monotonic() - started < 2.0
+            timer.join()
+        finally:
+            watcher.close()
+
+    def test_times_out_and_ignores_other_files(self, events_path):
+        from genesis.dispatch_monitor import InotifyWatcher
+        watcher = InotifyWatcher(events_path)
+        try:
+            (events_path.parent / "other.json").write_text("{}")
+            assert watcher.wait(0.1) is False
+        finally:
+            watcher.close()
+
+    def test_poll_mode_has_no_watcher(self, events_path):
+        from genesis.dispatch_monitor import _open_watcher
+        assert _open_watcher(events_path, "poll") is None
+
+    def test_monitor_fires_on_append_via_inotify(self, workspace, events_path, monkeypatch):
+        import threading
+        monkeypatch.setattr("genesis.dispatch_loop.get_pending_dispatches", lambda root: [])
+        threading.Timer(0.2, _append_event, (events_path, "intent_raised")).start()
+        started = time.monotonic()
+        run_monitor(workspace, events_path, max_total_fires=2, watch="inotify", heartbeat_s=10)
+        assert time.monotonic() - started < 5.0
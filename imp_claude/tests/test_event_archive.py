@@ -0,0 +1,176 @@
+# Validates: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+"""Tests for columnar event archives — exact round trip, compaction and the CLI."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import genesis.event_segments as event_segments
+from genesis.event_archive import (
+    ArchiveError,
+    archive_path_for,
+    compact_jsonl,
+    read_archive,
+    write_archive,
+)
+from genesis.event_segments import compact_segments, read_segmented_events, seal_segment
+from genesis.ol_event import make_ol_event, normalize_event
+from genesis.projections import load_projection
+from genesis.serialiser import SERIALISER_STATE
+from genesis.workspace_state import WORKSPACE_STATUS
+
+_GENESIS_CODE_DIR = str(Path(__file__).parent.parent / "code")
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+EDGE_CASES = [
+    {"event_type": "iteration_completed", "timestamp": "2026-01-01T00:00:00.123456+00:00",
+     "project": "p", "feature": "REQ-F-A", "edge": "design→code", "delta": 3, "data": {"k": [1, 2]}},
+    {"event_type": "edge_started", "timestamp": "2026-01-01T00:00:01.5Z", "feature": "REQ-F-A"},
+    {"timestamp": "2026-01-01T00:00:02Z", "event_type": "x", "delta": 2.5},
+    {"event_type": "x", "timestamp": "2026-01-01T09:30:00+05:30", "delta": True},
+    {"event_type": "x", "timestamp": "2026-01-01T00:00:00", "delta": -1},
+    {"event_type": "x", "timestamp": "yesterday", "feature": None, "edge": 7},
+    {"event_type": "x", "timestamp": "2026-01-01T00:00:00.1234567Z", "note": "ünïcode"},
+    {"event_type": "x", "delta": 2**62},
+    {"run": {"runId": "r"}, "eventType": "OTHER"},
+    {},
+]
+
+
+def _ol(n: int) -> dict:
+    return make_ol_event(
+        "IterationCompleted", "design→code", "proj", f"REQ-F-{n % 3}", "tester",
+        payload={"feature": f"REQ-F-{n % 3}", "edge": "design→code", "delta": n % 4, "iteration": n},
+    )
+
+
+def _write_jsonl(path: Path, events: list[dict]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(ev) + "\n" for ev in events))
+    return path
+
+
+# ── Round trip ────────────────────────────────────────────────────────────────
+
+
+class TestRoundTrip:
+    def test_edge_cases_exact(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.gevc"
+        stats = write_archive(EDGE_CASES, path)
+        assert stats.rows == len(EDGE_CASES)
+        back = list(read_archive(path))
+        assert back == EDGE_CASES
+        assert [list(ev) for ev in back] == [list(ev) for ev in EDGE_CASES]
+        assert type(back[3]["delta"]) is bool
+        assert type(back[2]["delta"]) is float
+
+    def test_empty_archive(self, tmp_path: Path) -> None:
+        write_archive([], tmp_path / "a.gevc")
+        assert list(read_archive(tmp_path / "a.gevc")) == []
+
+    def test_compact_jsonl_matches_normalized_source(self, tmp_path: Path) -> None:
+        raw = [_ol(n) for n in range(50)] + [{"event_type": "flat", "feature": "REQ-F-9"}]
+        source = _write_jsonl(tmp_path / "events.jsonl", raw)
+        with open(source, "a") as f:
+            f.write("not json\n")
+        stats = compact_jsonl(source)
+        assert stats.path == str(archive_path_for(source))
+        assert stats.rows == 51
+        assert stats.archive_bytes < stats.source_bytes / 5
+        assert list(read_archive(archive_path_for(source))) == [normalize_event(ev) for ev in raw]
+
+    @pytest.mark.parametrize("content", [b"", b"JSONL", b"GEVC\x01\x05\x00\x00\x00{bad}"])
+    def test_unreadable_archive_rejected(self, tmp_path: Path, content: bytes) -> None:
+        path = tmp_path / "a.gevc"
+        path.write_bytes(content)
+        with pytest.raises(ArchiveError):
+            list(read_archive(path))
+
+
+# ── Sealed segments ───────────────────────────────────────────────────────────
+
+
+class TestSegmentArchives:
+    @pytest.fixture
+    def events_path(self, tmp_path: Path) -> Path:
+        path = _write_jsonl(tmp_path / ".ai-workspace" / "events" / "events.jsonl", [_ol(n) for n in range(6)])
+        seal_segment(path)
+        _write_jsonl(path, [_ol(6)])
+        return path
+
+    def test_compact_segments_once(self, events_path: Path) -> None:
+        assert [s.rows for s in compact_segments(events_path)] == [6]
+        assert compact_segments(events_path) == []
+
+    def test_normalized_read_uses_archive(self, events_path: Path, monkeypatch) -> None:
+        expected = read_segmented_events(events_path, normalized=True)
+        compact_segments(events_path)
+        calls = []
+        real = event_segments.read_archive
+        monkeypatch.setattr(event_segments, "read_archive", lambda p: calls.append(p) or real(p))
+        assert read_segmented_events(events_path, normalized=True) == expected
+        assert len(calls) == 1
+        # Raw reads never touch archives
+        read_segmented_events(events_path)
+        assert len(calls) == 1
+
+    def test_corrupt_archive_falls_back_to_segment(self, events_path: Path) -> None:
+        expected = read_segmented_events(events_path, normalized=True)
+        compact_segments(events_path)
+        (events_path.parent / "segments" / "000001.gevc").write_bytes(b"junk")
+        assert read_segmented_events(events_path, normalized=True) == expected
+
+    def test_projection_cold_fold_uses_archive(self, events_path: Path, monkeypatch) -> None:
+        expected = load_projection(events_path, WORKSPACE_STATUS, snapshot=False)
+        compact_segments(events_path)
+        calls = []
+        real = event_segments.read_archive
+        monkeypatch.setattr(event_segments, "read_archive", lambda p: calls.append(p) or real(p))
+        assert load_projection(events_path, WORKSPACE_STATUS, snapshot=False) == expected
+        assert len(calls) == 1
+        # Folds that take raw events keep reading the JSONL segment
+        load_projection(events_path, SERIALISER_STATE, snapshot=False)
+        assert len(calls) == 1
+
+    def test_snapshot_inside_archived_segment(self, tmp_path: Path) -> None:
+        path = _write_jsonl(tmp_path / "events" / "events.jsonl", [_ol(n) for n in range(3)])
+        load_projection(path, WORKSPACE_STATUS)
+        with open(path, "a") as f:
+            f.writelines(json.dumps(_ol(n)) + "\n" for n in range(3, 6))
+        seal_segment(path)
+        compact_segments(path)
+        expected = load_projection(path, WORKSPACE_STATUS, snapshot=False)
+        assert load_projection(path, WORKSPACE_STATUS) == expected
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+
+
+class TestCompactEventsCli:
+    def _run(self, args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+        env = os.environ.copy()
+        env["PYTHONPATH"] = _GENESIS_CODE_DIR + os.pathsep + env.get("PYTHONPATH", "")
+        return subprocess.run(
+            [sys.executable, "-m", "genesis", "compact-events", *args],
+            capture_output=True, text=True, env=env, cwd=str(cwd),
+        )
+
+    def test_run_directory_compacted(self, tmp_path: Path) -> None:
+        run_dir = tmp_path / "e2e_run"
+        source = _write_jsonl(run_dir / ".ai-workspace" / "events" / "events.jsonl", [_ol(n) for n in range(3)])
+        result = self._run([str(run_dir)], tmp_path)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["rows"] == 3
+        assert archive_path_for(source).exists()
+
+    def test_missing_file_fails(self, tmp_path: Path) -> None:
+        result = self._run([str(tmp_path / "nope.jsonl")], tmp_path)
+        assert result.returncode == 1
+        assert "compaction failed" in result.stderr
@@ -0,0 +1,346 @@
+# Validates: REQ-EVENT-001 (Event Log as Source of Truth), REQ-ROBUST-007 (Failure Observability)
+# Validates: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Tests for event emission — EventBatch, durability modes and torn-write recovery."""
+
+import fcntl
+import importlib.util
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import genesis.ol_event as ol_event
+from genesis.engine import EngineConfig, iterate_edge
+from genesis.event_log import EventLog
+from genesis.ol_event import (
+    EventBatch,
+    configure_durability,
+    emit_ol_event,
+    make_ol_event,
+    normalize_event,
+    recover_event_log,
+    repair_event_log,
+    sync_event_logs,
+)
+from genesis.role_authority import emit_convergence_escalated
+from genesis.workspace_integrity import EvidenceGap
+from genesis.workspace_repair import RepairProvenance, repair_convergence_evidence
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def events_path(tmp_path: Path) -> Path:
+    return tmp_path / ".ai-workspace" / "events" / "events.jsonl"
+
+
+@pytest.fixture
+def lock_count(monkeypatch) -> list[int]:
+    """Count exclusive flock acquisitions made by the event writer."""
+    calls = [0]
+    real = ol_event.fcntl.flock
+
+    def counting(f, op):
+        if op == ol_event.fcntl.LOCK_EX:
+            calls[0] += 1
+        return real(f, op)
+
+    monkeypatch.setattr(ol_event.fcntl, "flock", counting)
+    return calls
+
+
+@pytest.fixture
+def fsync_count(monkeypatch) -> list[int]:
+    calls = [0]
+    real = ol_event.os.fsync
+
+    def counting(fd):
+        calls[0] += 1
+        return real(fd)
+
+    monkeypatch.setattr(ol_event.os, "fsync", counting)
+    return calls
+
+
+@pytest.fixture
+def durability():
+    yield configure_durability
+    configure_durability("none")
+
+
+def _event(n: int) -> dict:
+    return make_ol_event("EdgeStarted", "design→code", "proj", "REQ-F-A", "tester", payload={"seq": n})
+
+
+def _read(path: Path) -> list[dict]:
+    return [normalize_event(json.loads(line)) for line in path.read_text().splitlines()]
+
+
+def _installer_append(events_path: Path) -> None:
+    installer = Path(ol_event.__file__).parent.parent / "installers" / "gen-setup.py"
+    spec = importlib.util.spec_from_file_location("gen_setup", installer)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.append_event(events_path, _event(0))
+
+
+# ── EventBatch ────────────────────────────────────────────────────────────────
+
+
+class TestEventBatch:
+    def test_events_written_on_exit_in_order(self, events_path: Path) -> None:
+        with EventBatch(events_path) as batch:
+            for n in range(3):
+                batch.emit(_event(n))
+            assert not events_path.exists()
+        assert [e["seq"] for e in _read(events_path)] == [0, 1, 2]
+
+    def test_emit_returns_run_id(self, events_path: Path) -> None:
+        event = _event(0)
+        with EventBatch(events_path) as batch:
+            assert batch.emit(event) == event["run"]["runId"]
+
+    def test_single_lock_per_flush(self, events_path: Path, lock_count: list[int]) -> None:
+        with EventBatch(events_path) as batch:
+            for n in range(30):
+                batch.emit(_event(n))
+        assert lock_count[0] == 1
+
+    def test_explicit_flush_point(self, events_path: Path) -> None:
+        with EventBatch(events_path) as batch:
+            batch.emit(_event(0))
+            assert batch.flush() == 1
+            assert len(_read(events_path)) == 1
+            batch.emit(_event(1))
+            assert len(batch) == 1
+        assert len(_read(events_path)) == 2
+
+    def test_pending_events_flushed_when_block_raises(self, events_path: Path) -> None:
+        with pytest.raises(RuntimeError):
+            with EventBatch(events_path) as batch:
+                batch.emit(_event(0))
+                raise RuntimeError("boom")
+        assert len(_read(events_path)) == 1
+
+    def test_empty_batch_touches_nothing(self, events_path: Path, lock_count: list[int]) -> None:
+        with EventBatch(events_path):
+            pass
+        assert lock_count[0] == 0
+        assert not events_path.exists()
+
+    @pytest.mark.parametrize("policy,expected", [("none", 0), ("per-batch", 1), ("per-event", 3)])
+    def test_fsync_policy(self, events_path: Path, fsync_count: list[int], policy: str, expected: int) -> None:
+        with EventBatch(events_path, fsync=policy) as batch:
+            for n in range(3):
+                batch.emit(_event(n))
+        assert fsync_count[0] == expected
+        assert len(_read(events_path)) == 3
+
+    def test_unknown_policy_rejected(self, events_path: Path) -> None:
+        with pytest.raises(ValueError):
+            EventBatch(events_path, fsync="sometimes")
+
+    def test_interleaves_with_direct_emit(self, events_path: Path) -> None:
+        emit_ol_event(events_path, _event(0))
+        with EventBatch(events_path) as batch:
+            batch.emit(_event(1))
+        emit_ol_event(events_path, _event(2))
+        assert [e["seq"] for e in _read(events_path)] == [0, 1, 2]
+
+
+# ── Engine emission ───────────────────────────────────────────────────────────
+
+
+class TestIterateEdgeBatching:
+    def _config(self, tmp_path: Path) -> EngineConfig:
+        return EngineConfig(
+            project_name="test",
+            workspace_path=tmp_path,
+            edge_params_dir=tmp_path / "edge_params",
+            profiles_dir=tmp_path / "profiles",
+            constraints={},
+            graph_topology={},
+            deterministic_only=True,
+            fd_timeout=5,
+        )
+
+    def test_failing_checks_take_two_locks(self, tmp_path: Path, lock_count: list[int]) -> None:
+        checklist = [
+            {"name": f"check_{n}", "type": "deterministic", "command": "false", "required": True}
+            for n in range(5)
+        ]
+        record = iterate_edge(
+            edge="design→code",
+            edge_config={"edge": "design→code", "checklist": checklist},
+            config=self._config(tmp_path),
+            feature_id="REQ-F-A",
+            asset_content="x",
+        )
+        assert record.evaluation.delta == 5
+        # IterationStarted (crash marker) + one batch for everything after it
+        assert lock_count[0] == 2
+        types = [e["event_type"] for e in _read(tmp_path / ".ai-workspace" / "events" / "events.jsonl")]
+        assert types == ["iteration_started"] + ["evaluator_detail"] * 5 + ["iteration_completed"]
+
+    def test_concurrent_checks_emit_in_declared_order(self, tmp_path: Path) -> None:
+        # The first check finishes last; events still follow the checklist
+        checklist = [
+            {"name": f"check_{n}", "type": "deterministic", "command": f"sleep {0.3 - 0.1 * n}; false",
+             "required": True}
+            for n in range(3)
+        ]
+        checklist.insert(1, {"name": "agent", "type": "agent", "criterion": "x", "required": True})
+        record = iterate_edge(
+            edge="design→code",
+            edge_config={"edge": "design→code", "checklist": checklist},
+            config=self._config(tmp_path),
+            feature_id="REQ-F-A",
+            asset_content="x",
+        )
+        assert [cr.name for cr in record.evaluation.checks] == ["check_0", "agent", "check_1", "check_2"]
+        details = [
+            e["check_name"] for e in _read(tmp_path / ".ai-workspace" / "events" / "events.jsonl")
+            if e["event_type"] == "evaluator_detail"
+        ]
+        assert details == ["check_0", "check_1", "check_2"]
+
+
+# ── Durability modes ──────────────────────────────────────────────────────────
+
+
+class TestDurability:
+    def test_default_mode_never_fsyncs(self, events_path: Path, fsync_count: list[int]) -> None:
+        emit_ol_event(events_path, _event(0))
+        assert fsync_count[0] == 0
+
+    def test_always_fsyncs_each_append(self, events_path: Path, fsync_count: list[int], durability) -> None:
+        durability("always")
+        for n in range(3):
+            emit_ol_event(events_path, _event(n))
+        assert fsync_count[0] == 3
+
+    def test_group_fsyncs_every_n_events(self, events_path: Path, fsync_count: list[int], durability) -> None:
+        durability("group", every_events=4, every_ms=60_000)
+        for n in range(10):
+            emit_ol_event(events_path, _event(n))
+        assert fsync_count[0] == 2
+        sync_event_logs()
+        assert fsync_count[0] == 3  # the 2 trailing appends
+        assert len(_read(events_path)) == 10
+
+    def test_group_fsyncs_after_interval(self, events_path: Path, fsync_count: list[int], durability) -> None:
+        durability("group", every_events=1000, every_ms=0)
+        emit_ol_event(events_path, _event(0))
+        emit_ol_event(events_path, _event(1))
+        assert fsync_count[0] == 2
+
+    def test_group_timer_syncs_trailing_appends(self, events_path: Path, fsync_count: list[int], durability) -> None:
+        durability("group", every_events=1000, every_ms=20)
+        emit_ol_event(events_path, _event(0))
+        emit_ol_event(events_path, _event(1))
+        assert fsync_count[0] == 0
+        deadline = time.monotonic() + 5
+        while fsync_count[0] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert fsync_count[0] == 1  # no further append needed
+        assert not ol_event._unsynced
+
+    def test_explicit_batch_policy_overrides_mode(self, events_path: Path, fsync_count: list[int], durability) -> None:
+        durability("always")
+        with EventBatch(events_path, fsync="none") as batch:
+            batch.emit(_event(0))
+        assert fsync_count[0] == 0
+
+    def test_unknown_mode_rejected(self, durability) -> None:
+        with pytest.raises(ValueError):
+            durability("eventually")
+
+
+# ── Torn-write recovery ───────────────────────────────────────────────────────
+
+
+class TestRecovery:
+    def _torn(self, events_path: Path) -> str:
+        emit_ol_event(events_path, _event(0))
+        line = json.dumps(_event(1)) + "\n"
+        with open(events_path, "a") as f:
+            f.write(line[:25])
+        return line
+
+    def test_clean_log_untouched(self, events_path: Path) -> None:
+        emit_ol_event(events_path, _event(0))
+        before = events_path.read_bytes()
+        assert repair_event_log(events_path) is None
+        assert events_path.read_bytes() == before
+
+    def test_missing_log_is_not_an_error(self, events_path: Path) -> None:
+        assert repair_event_log(events_path) is None
+
+    def test_torn_line_truncated(self, events_path: Path) -> None:
+        self._torn(events_path)
+        size_before = events_path.stat().st_size
+        repair = repair_event_log(events_path)
+        assert repair["action"] == "truncated"
+        assert repair["dropped_bytes"] == 25
+        assert events_path.stat().st_size == size_before - 25
+        assert events_path.read_bytes().endswith(b"\n")
+
+    def test_plugin_hooks_append_under_flock(self) -> None:
+        hooks = Path(ol_event.__file__).parent.parent / ".claude-plugin" / "plugins" / "genesis" / "hooks"
+        for script in sorted(hooks.glob("*.sh")):
+            text = script.read_text()
+            assert not re.search(r'echo "\$\w*EVENT" >>', text), script.name
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda p: emit_convergence_escalated(p, "proj", "agent-1", "role", "REQ-F-A", "e", "denied"),
+            lambda p: repair_convergence_evidence(
+                [EvidenceGap("REQ-F-A", "e", Path("v.yml"))], RepairProvenance("human", "seen"), p
+            ),
+            _installer_append,
+        ],
+        ids=["role_authority", "workspace_repair", "gen_setup"],
+    )
+    def test_writers_wait_for_flock(self, events_path: Path, write) -> None:
+        events_path.parent.mkdir(parents=True)
+        events_path.touch()
+        with open(events_path, "a") as held:
+            fcntl.flock(held, fcntl.LOCK_EX)
+            writer = threading.Thread(target=write, args=(events_path,))
+            writer.start()
+            writer.join(0.3)
+            assert writer.is_alive()
+            assert events_path.stat().st_size == 0
+            fcntl.flock(held, fcntl.LOCK_UN)
+        writer.join(5)
+        assert len(_read(events_path)) == 1
+
+    def test_complete_unterminated_line_kept(self, events_path: Path) -> None:
+        events_path.parent.mkdir(parents=True)
+        events_path.write_text(json.dumps(_event(0)))
+        repair = repair_event_log(events_path)
+        assert repair["action"] == "terminated"
+        assert repair["dropped_bytes"] == 0
+        assert len(_read(events_path)) == 1
+
+    def test_recover_records_event_log_repaired(self, events_path: Path) -> None:
+        self._torn(events_path)
+        recover_event_log(events_path, "proj")
+        events = _read(events_path)
+        assert [e["event_type"] for e in events] == ["edge_started", "event_log_repaired"]
+        assert events[1]["action"] == "truncated"
+        assert recover_event_log(events_path, "proj") is None
+
+    def test_next_append_not_merged_with_torn_line(self, events_path: Path) -> None:
+        self._torn(events_path)
+        log = EventLog(events_path)
+        log.refresh()
+        recover_event_log(events_path, "proj")
+        emit_ol_event(events_path, _event(2))
+        assert log.malformed == 0
+        assert [e.get("seq") for e in log.events()] == [0, None, 2]
@@ -0,0 +1,173 @@
+# Validates: REQ-EVENT-002 (Projection Contract), REQ-EVENT-005 (Executor Attribution Fields)
+"""Tests for EventIndex — secondary indexes over the event stream."""
+
+import itertools
+import json
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from genesis.consensus_engine import project_review_state
+from genesis.event_index import EventIndex
+from genesis.event_log import EventLog
+from genesis.ol_event import make_ol_event
+from genesis.serialiser import detect_stale_claims, get_last_event_time
+from genesis.workspace_state import (
+    compute_current_delta,
+    get_converged_edges,
+    get_iteration_count,
+    load_event_index,
+)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+def _iter(feature: str, edge: str, delta: int, **kw) -> dict:
+    return {"event_type": "iteration_completed", "feature": feature, "edge": edge, "delta": delta, **kw}
+
+
+STREAM = [
+    {"event_type": "edge_started", "feature": "REQ-F-A", "edge": "design→code", "agent_id": "agent-1",
+     "timestamp": "2026-01-01T00:00:00+00:00"},
+    _iter("REQ-F-A", "design→code", 3, timestamp="2026-01-01T00:01:00+00:00", data={"agent_id": "agent-1"}),
+    _iter("REQ-F-A", "design→code", 1),
+    {"event_type": "edge_converged", "feature": "REQ-F-A", "edge": "design→code"},
+    _iter("REQ-F-B", "code↔unit_tests", 2, correlation_id="root-1", causation_id="root-1"),
+    {"event_type": "edge_claim", "feature": "REQ-F-B", "edge": "code↔unit_tests", "agent_id": "agent-2",
+     "timestamp": "2026-01-01T00:02:00+00:00"},
+    {"event_type": "edge_started", "feature": "REQ-F-B", "edge": "code↔unit_tests", "agent_id": "agent-2",
+     "timestamp": "2026-01-01T00:02:00+00:00"},
+    {"event_type": "vote_cast", "review_id": "R-1", "timestamp": "2026-01-01T00:03:00+00:00",
+     "data": {"participant": "alice", "verdict": "approve"}},
+]
+
+
+@pytest.fixture
+def index() -> EventIndex:
+    return EventIndex(STREAM)
+
+
+# ── Lookups ───────────────────────────────────────────────────────────────────
+
+
+class TestLookup:
+    def test_single_key(self, index: EventIndex) -> None:
+        assert index.lookup(feature="REQ-F-B") == STREAM[4:7]
+
+    def test_criteria_intersect_in_stream_order(self, index: EventIndex) -> None:
+        assert index.lookup(event_type="iteration_completed", feature="REQ-F-A") == STREAM[1:3]
+
+    def test_agent_id_from_data(self, index: EventIndex) -> None:
+        assert index.lookup(agent_id="agent-1") == STREAM[:2]
+
+    def test_no_criteria_returns_everything(self, index: EventIndex) -> None:
+        assert index.lookup() == STREAM
+
+    def test_missing_value_is_empty(self, index: EventIndex) -> None:
+        assert index.lookup(feature="REQ-F-Z") == []
+        assert index.last(feature="REQ-F-Z") is None
+
+    def test_unknown_key_rejected(self, index: EventIndex) -> None:
+        with pytest.raises(ValueError):
+            index.lookup(timestamp="x")
+
+    def test_last_and_count(self, index: EventIndex) -> None:
+        assert index.last(feature="REQ-F-A") is STREAM[3]
+        assert index.count(event_type="edge_started") == 2
+
+    def test_multi_key_intersection_matches_scan(self) -> None:
+        rng = random.Random(7)
+        events = [
+            {
+                "event_type": rng.choice(["a", "b", "c"]),
+                "feature": rng.choice(["F1", "F2"]),
+                "edge": rng.choice(["e1", "e2", "e3"]),
+            }
+            for _ in range(500)
+        ]
+        index = EventIndex(events)
+        for t, f, e in itertools.product("abcz", ["F1", "F2"], ["e1", "e2", "e3"]):
+            expected = [
+                i for i, ev in enumerate(events)
+                if (ev["event_type"], ev["feature"], ev["edge"]) == (t, f, e)
+            ]
+            assert index.positions(event_type=t, feature=f, edge=e) == expected
+
+    def test_ol_correlation_ids_read_from_facets(self) -> None:
+        ol = make_ol_event(
+            "IterationCompleted", "design→code", "proj", "i1", "tester",
+            payload={"feature": "REQ-F-A", "edge": "design→code", "delta": 2},
+            causation_id="parent-1", correlation_id="root-1",
+        )
+        index = EventIndex([ol])
+        assert index.lookup(correlation_id="root-1") == [ol]
+        assert index.lookup(causation_id="parent-1", feature="REQ-F-A") == [ol]
+
+
+# ── Incremental maintenance via EventLog ──────────────────────────────────────
+
+
+class TestEventLogIndex:
+    def test_index_extended_on_append(self, tmp_path: Path) -> None:
+        path = tmp_path / ".ai-workspace" / "events" / "events.jsonl"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(STREAM[0]) + "\n")
+        log = EventLog(path)
+        index = log.index()
+        assert index.count(feature="REQ-F-A") == 1
+        with open(path, "a") as f:
+            f.write(json.dumps(STREAM[1]) + "\n")
+        assert log.index() is index
+        assert index.count(feature="REQ-F-A") == 2
+
+    def test_rewrite_builds_new_index(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        path.write_text(json.dumps(STREAM[0]) + "\n")
+        log = EventLog(path)
+        log.index()
+        path.write_text(json.dumps(STREAM[4]) + "\n")
+        assert log.index().lookup(feature="REQ-F-A") == []
+
+    def test_load_event_index_for_workspace(self, tmp_path: Path) -> None:
+        path = tmp_path / ".ai-workspace" / "events" / "events.jsonl"
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(json.dumps(ev) + "\n" for ev in STREAM))
+        assert len(load_event_index(tmp_path)) == len(STREAM)
+
+    @pytest.mark.parametrize("run", [None, "x", {"facets": None}, {"facets": {"sdlc:universal": "x"}}])
+    def test_malformed_ol_line_indexed_raw(self, tmp_path: Path, run) -> None:
+        path = tmp_path / "events.jsonl"
+        bad = {"eventType": "OTHER", "eventTime": "2026-01-01T00:00:00Z", "run": run, "job": {"name": "x"}}
+        path.write_text(json.dumps(bad) + "\n" + json.dumps(STREAM[0]) + "\n")
+        index = EventLog(path).index()
+        assert len(index) == 2
+        assert index.count(feature="REQ-F-A") == 1
+        assert len(EventIndex([bad])) == 1
+
+
+# ── Indexed queries agree with linear scans ───────────────────────────────────
+
+
+class TestIndexedQueries:
+    @pytest.mark.parametrize(
+        "feature,edge", [("REQ-F-A", "design→code"), ("REQ-F-B", "code↔unit_tests"), ("REQ-F-Z", "x")]
+    )
+    def test_edge_queries(self, index: EventIndex, feature: str, edge: str) -> None:
+        assert get_iteration_count(index, feature, edge) == get_iteration_count(STREAM, feature, edge)
+        assert compute_current_delta(index, feature, edge) == compute_current_delta(STREAM, feature, edge)
+        assert get_converged_edges(index, feature) == get_converged_edges(STREAM, feature)
+
+    def test_last_event_time(self, index: EventIndex) -> None:
+        for agent in ("agent-1", "agent-2", "agent-9"):
+            assert get_last_event_time(index, agent) == get_last_event_time(STREAM, agent)
+
+    def test_stale_claims(self, index: EventIndex) -> None:
+        now = datetime(2026, 1, 1, 1, 0, tzinfo=timezone.utc).timestamp()
+        assert detect_stale_claims(index, 60, now) == detect_stale_claims(STREAM, 60, now)
+
+    def test_review_state(self, index: EventIndex) -> None:
+        closes = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        assert project_review_state(index, "R-1", closes) == project_review_state(STREAM, "R-1", closes)
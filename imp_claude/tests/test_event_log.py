@@ -0,0 +1,149 @@
+# Validates: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+# Validates: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Tests for EventLog — incremental, offset-checkpointed events.jsonl reader."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from genesis.event_log import EventLog
+from genesis.ol_event import make_ol_event
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def events_path(tmp_path: Path) -> Path:
+    path = tmp_path / ".ai-workspace" / "events" / "events.jsonl"
+    path.parent.mkdir(parents=True)
+    return path
+
+
+def _append(path: Path, *events: dict) -> None:
+    with open(path, "a") as f:
+        for ev in events:
+            f.write(json.dumps(ev) + "\n")
+
+
+def _ev(n: int) -> dict:
+    return {"event_type": "iteration_completed", "feature": "REQ-F-A", "seq": n}
+
+
+# ── Incremental reads ─────────────────────────────────────────────────────────
+
+
+class TestIncrementalRead:
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert EventLog(tmp_path / "nope.jsonl").events() == []
+
+    def test_reads_all_events(self, events_path: Path) -> None:
+        _append(events_path, _ev(1), _ev(2))
+        assert [e["seq"] for e in EventLog(events_path).events()] == [1, 2]
+
+    def test_refresh_returns_only_appended_events(self, events_path: Path) -> None:
+        log = EventLog(events_path)
+        _append(events_path, _ev(1))
+        assert [e["seq"] for e in log.refresh()] == [1]
+        _append(events_path, _ev(2), _ev(3))
+        assert [e["seq"] for e in log.refresh()] == [2, 3]
+        assert log.refresh() == []
+        assert [e["seq"] for e in log.events()] == [1, 2, 3]
+
+    def test_offset_tracks_consumed_bytes(self, events_path: Path) -> None:
+        _append(events_path, _ev(1))
+        log = EventLog(events_path)
+        log.refresh()
+        assert log.offset == events_path.stat().st_size
+
+    def test_returned_list_is_a_copy(self, events_path: Path) -> None:
+        _append(events_path, _ev(1))
+        log = EventLog(events_path)
+        log.events().append({"event_type": "bogus"})
+        assert len(log.events()) == 1
+
+    def test_malformed_lines_skipped_and_counted(self, events_path: Path) -> None:
+        _append(events_path, _ev(1))
+        with open(events_path, "a") as f:
+            f.write("{not json\n")
+        _append(events_path, _ev(2))
+        log = EventLog(events_path)
+        assert [e["seq"] for e in log.events()] == [1, 2]
+        assert log.malformed == 1
+
+    def test_ol_events_normalized_raw_preserved(self, events_path: Path) -> None:
+        ol = make_ol_event(
+            "IterationCompleted", "design→code", "proj", "i1", "tester",
+            payload={"feature": "REQ-F-A", "edge": "design→code", "delta": 2},
+        )
+        _append(events_path, ol)
+        log = EventLog(events_path)
+        assert log.events()[0]["event_type"] == "iteration_completed"
+        assert log.raw_events()[0]["eventType"] == "OTHER"
+
+    def test_shared_instance_per_path(self, events_path: Path) -> None:
+        assert EventLog.shared(events_path) is EventLog.shared(events_path)
+
+
+# ── Unterminated final line ───────────────────────────────────────────────────
+
+
+class TestUnterminatedTail:
+    def test_complete_json_without_newline_is_read(self, events_path: Path) -> None:
+        events_path.write_text(json.dumps(_ev(1)) + "\n" + json.dumps(_ev(2)))
+        assert [e["seq"] for e in EventLog(events_path).events()] == [1, 2]
+
+    def test_torn_tail_waits_for_completion(self, events_path: Path) -> None:
+        line = json.dumps(_ev(2)) + "\n"
+        _append(events_path, _ev(1))
+        with open(events_path, "a") as f:
+            f.write(line[:10])
+        log = EventLog(events_path)
+        assert [e["seq"] for e in log.events()] == [1]
+        with open(events_path, "a") as f:
+            f.write(line[10:])
+        assert [e["seq"] for e in log.refresh()] == [2]
+        assert log.malformed == 0
+
+
+# ── Rewrite / rotation detection ──────────────────────────────────────────────
+
+
+class TestRewriteDetection:
+    def test_truncation_triggers_reparse(self, events_path: Path) -> None:
+        _append(events_path, _ev(1), _ev(2))
+        log = EventLog(events_path)
+        log.refresh()
+        generation = log.generation
+        events_path.write_text(json.dumps(_ev(9)) + "\n")
+        assert [e["seq"] for e in log.events()] == [9]
+        assert log.generation == generation + 1
+
+    def test_replaced_file_triggers_reparse(self, events_path: Path) -> None:
+        _append(events_path, _ev(1))
+        log = EventLog(events_path)
+        log.refresh()
+        replacement = events_path.with_suffix(".new")
+        _append(replacement, _ev(7), _ev(8))
+        os.replace(replacement, events_path)
+        assert [e["seq"] for e in log.events()] == [7, 8]
+
+    def test_in_place_rewrite_with_growth_triggers_reparse(self, events_path: Path) -> None:
+        _append(events_path, {"event_type": "a", "seq": 1})
+        log = EventLog(events_path)
+        log.refresh()
+        events_path.write_text(
+            json.dumps({"event_type": "b", "seq": 5}) + "\n"
+            + json.dumps({"event_type": "b", "seq": 6}) + "\n"
+        )
+        assert [e["seq"] for e in log.events()] == [5, 6]
+
+    def test_deleted_file_resets(self, events_path: Path) -> None:
+        _append(events_path, _ev(1))
+        log = EventLog(events_path)
+        log.refresh()
+        events_path.unlink()
+        assert log.events() == []
+        assert log.offset == 0
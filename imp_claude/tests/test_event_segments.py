@@ -0,0 +1,259 @@
+# Validates: REQ-EVENT-001 (Event Log as Source of Truth), REQ-EVENT-002 (Projection Contract)
+# Validates: REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Tests for the segmented event log — sealing, logical reads and segment pruning."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from genesis.event_log import EventLog, read_events_from
+from genesis.event_segments import (
+    load_segments,
+    logical_size,
+    maybe_seal_segment,
+    read_logical,
+    read_segmented_events,
+    seal_segment,
+    segments_dir,
+    select_segments,
+)
+from genesis.projections import SnapshotStore, load_projection
+from genesis.workspace_state import EDGE_STATUS, load_feature_events
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / ".ai-workspace" / "events").mkdir(parents=True)
+    return tmp_path
+
+
+@pytest.fixture
+def events_path(workspace: Path) -> Path:
+    return workspace / ".ai-workspace" / "events" / "events.jsonl"
+
+
+def _ev(feature: str, day: int, event_type: str = "iteration_completed") -> dict:
+    return {
+        "event_type": event_type,
+        "feature": feature,
+        "edge": "design→code",
+        "delta": day,
+        "timestamp": f"2026-01-{day:02d}T00:00:00+00:00",
+    }
+
+
+def _append(path: Path, *events: dict) -> None:
+    with open(path, "a") as f:
+        for ev in events:
+            f.write(json.dumps(ev) + "\n")
+
+
+# ── Sealing ───────────────────────────────────────────────────────────────────
+
+
+class TestSeal:
+    def test_seal_moves_lines_and_keeps_logical_bytes(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1), _ev("REQ-F-B", 2))
+        before = events_path.read_bytes()
+        index = seal_segment(events_path)
+        assert index.events == 2
+        assert index.features == ["REQ-F-A", "REQ-F-B"]
+        assert index.first_ts.startswith("2026-01-01")
+        assert events_path.read_bytes() == b""
+        assert read_logical(events_path) == before
+        assert logical_size(events_path) == len(before)
+
+    def test_unterminated_tail_stays_active(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        with open(events_path, "a") as f:
+            f.write('{"event_type": "ite')
+        seal_segment(events_path)
+        assert events_path.read_text() == '{"event_type": "ite'
+
+    def test_empty_log_not_sealed(self, events_path: Path) -> None:
+        events_path.write_text("")
+        assert seal_segment(events_path) is None
+        assert load_segments(events_path) == []
+
+    def test_segments_numbered_in_order(self, events_path: Path) -> None:
+        for day in (1, 2):
+            _append(events_path, _ev("REQ-F-A", day))
+            seal_segment(events_path)
+        assert [s.file for s in load_segments(events_path)] == ["000001.jsonl", "000002.jsonl"]
+
+    def test_missing_sidecar_rebuilt(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        seal_segment(events_path)
+        (segments_dir(events_path) / "000001.index.json").unlink()
+        assert load_segments(events_path)[0].features == ["REQ-F-A"]
+
+    def test_interrupted_seal_finished_on_next_seal(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        sealed = events_path.read_bytes()
+        seal_segment(events_path)
+        # Crash between manifest write and truncation: sealed bytes still active
+        events_path.write_bytes(sealed)
+        _append(events_path, _ev("REQ-F-B", 2))
+        seal_segment(events_path)
+        assert [s.features for s in load_segments(events_path)] == [["REQ-F-A"], ["REQ-F-B"]]
+
+
+class TestMaybeSeal:
+    def test_no_threshold_never_seals(self, events_path: Path, monkeypatch) -> None:
+        monkeypatch.delenv("GENESIS_EVENT_SEGMENT_BYTES", raising=False)
+        monkeypatch.delenv("GENESIS_EVENT_SEGMENT_SECONDS", raising=False)
+        _append(events_path, _ev("REQ-F-A", 1))
+        assert maybe_seal_segment(events_path) is None
+
+    def test_size_threshold_from_env(self, events_path: Path, monkeypatch) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        monkeypatch.setenv("GENESIS_EVENT_SEGMENT_BYTES", "1000000")
+        assert maybe_seal_segment(events_path) is None
+        monkeypatch.setenv("GENESIS_EVENT_SEGMENT_BYTES", "10")
+        assert maybe_seal_segment(events_path) is not None
+
+    def test_age_threshold(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        assert maybe_seal_segment(events_path, max_age_seconds=60) is not None
+
+
+# ── Readers ───────────────────────────────────────────────────────────────────
+
+
+class TestSegmentedReaders:
+    def _log(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1), _ev("REQ-F-A", 2))
+        seal_segment(events_path)
+        _append(events_path, _ev("REQ-F-B", 5))
+        seal_segment(events_path)
+        _append(events_path, _ev("REQ-F-A", 9))
+
+    def test_event_log_reads_sealed_then_active(self, events_path: Path) -> None:
+        self._log(events_path)
+        assert [e["delta"] for e in EventLog(events_path).events()] == [1, 2, 5, 9]
+
+    def test_event_log_survives_seal_between_refreshes(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        log = EventLog(events_path)
+        log.refresh()
+        seal_segment(events_path)
+        _append(events_path, _ev("REQ-F-A", 2))
+        assert [e["delta"] for e in log.events()] == [1, 2]
+
+    def test_read_events_from_logical_offset(self, events_path: Path) -> None:
+        self._log(events_path)
+        events, end = read_events_from(events_path, 0)
+        assert len(events) == 4
+        assert end == logical_size(events_path)
+        assert read_events_from(events_path, end) == ([], end)
+
+    def test_select_segments_prunes_by_index(self, events_path: Path) -> None:
+        self._log(events_path)
+        assert [s.file for s in select_segments(events_path, feature="REQ-F-B")] == ["000002.jsonl"]
+        assert [s.file for s in select_segments(events_path, until="2026-01-03T00:00:00Z")] == ["000001.jsonl"]
+        assert select_segments(events_path, since="2026-01-06T00:00:00Z") == []
+        # Active segment is always read
+        assert [e["delta"] for e in read_segmented_events(events_path, feature="REQ-F-Z")] == [9]
+
+    def test_load_feature_events(self, workspace: Path, events_path: Path) -> None:
+        self._log(events_path)
+        assert [e["delta"] for e in load_feature_events(workspace, "REQ-F-A")] == [1, 2, 9]
+        until = "2026-01-04T00:00:00Z"
+        assert [e["delta"] for e in load_feature_events(workspace, "REQ-F-A", until=until)] == [1, 2]
+
+
+class TestReadersAfterFullSeal:
+    """Every reader sees the history once all of it lives in sealed segments."""
+
+    @pytest.fixture
+    def sealed(self, events_path: Path) -> Path:
+        events = [
+            {**_ev("REQ-F-A", day), "project": "demo", "delta": 2}
+            for day in (1, 2, 3)
+        ]
+        events.append({
+            "event_type": "spec_modified",
+            "project": "demo",
+            "file": "spec.md",
+            "data": {"file": "spec.md", "new_hash": "sha256:old"},
+            "timestamp": "2026-01-04T00:00:00+00:00",
+        })
+        events.append({**_ev("REQ-F-A", 5, "edge_converged"), "project": "demo"})
+        _append(events_path, *events)
+        with open(events_path, "a") as f:
+            f.write("not json\n")
+        seal_segment(events_path)
+        assert events_path.read_bytes() == b""
+        return events_path
+
+    def test_fd_sense(self, sealed: Path) -> None:
+        from genesis.fd_sense import (
+            sense_event_freshness,
+            sense_event_log_integrity,
+            sense_feature_stall,
+        )
+
+        assert sense_feature_stall(sealed, "REQ-F-A").breached
+        integrity = sense_event_log_integrity(sealed)
+        assert integrity.value == 6
+        assert "Line 6: invalid JSON" in integrity.detail
+        # The last event is the malformed line, not "events.jsonl is empty"
+        assert "Failed to parse last event" in sense_event_freshness(sealed).detail
+
+    def test_workspace_repair_project_name(self, sealed: Path) -> None:
+        from genesis.workspace_repair import _read_project_name
+
+        assert _read_project_name(sealed) == "demo"
+
+    def test_workspace_state(self, workspace: Path, sealed: Path) -> None:
+        from genesis.workspace_state import detect_corrupted_events, verify_spec_hashes
+
+        assert [c["line"] for c in detect_corrupted_events(workspace)] == [6]
+        (workspace / "specification").mkdir()
+        (workspace / "specification" / "spec.md").write_text("changed")
+        assert [d["file"] for d in verify_spec_hashes(workspace)] == ["spec.md"]
+
+    def test_dispatch_monitor(self, sealed: Path) -> None:
+        from genesis.dispatch_monitor import has_fh_resolution
+
+        assert has_fh_resolution(sealed, 0)
+        assert not has_fh_resolution(sealed, logical_size(sealed))
+
+    def test_cmd_context_recent_events(self, workspace: Path, sealed: Path, capsys) -> None:
+        import argparse
+
+        from genesis.__main__ import cmd_context
+
+        assert cmd_context(argparse.Namespace(workspace=str(workspace))) == 0
+        assert "spec_modified, edge_converged" in capsys.readouterr().out
+
+    def test_migrate_v1_to_v2(self, sealed: Path) -> None:
+        from genesis.scripts.migrate_events_v1_to_v2 import migrate_file
+
+        migrate_file(sealed)
+        migrated = [json.loads(line) for line in sealed.read_text().splitlines()]
+        assert len(migrated) == 5
+        assert not segments_dir(sealed).exists()
+        assert (sealed.parent / "segments.v1" / "000001.jsonl").exists()
+        assert load_segments(sealed) == []
+
+
+# ── Snapshots across a seal ───────────────────────────────────────────────────
+
+
+class TestSnapshotsAcrossSeal:
+    def test_snapshot_stays_valid_after_seal(self, events_path: Path) -> None:
+        _append(events_path, _ev("REQ-F-A", 1))
+        load_projection(events_path, EDGE_STATUS)
+        _state, offset = SnapshotStore(events_path).load(EDGE_STATUS)
+
+        seal_segment(events_path)
+        _append(events_path, _ev("REQ-F-A", 2))
+        assert SnapshotStore(events_path).load(EDGE_STATUS)[1] == offset
+        state = load_projection(events_path, EDGE_STATUS)
+        assert state == load_projection(events_path, EDGE_STATUS, snapshot=False)
+        assert state["REQ-F-A"]["design→code"][0] == 2
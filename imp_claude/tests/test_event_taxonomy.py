@@ -12,6 +12,7 @@ Covers:
   - Transition gate events: TransitionAuthorized, TransitionDenied
   - Saga compensation: CompensationTriggered, CompensationCompleted
   - IterationStarted emission in engine.iterate_edge()
+  - normalize_event: memoized type names, migrated-event metadata, lazy EventView
 """
 
 import json
@@ -20,7 +21,7 @@ import pathlib
 import pytest
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "code"))
-from genesis.ol_event import normalize_event
+from genesis.ol_event import EventView, make_ol_event, normalize_event, snake_event_type, view_event
 
 
 # ── Event type registry completeness ─────────────────────────────────
@@ -539,3 +540,81 @@ class TestExecutorAttributionFields:
         # Per REQ-EVENT-005 AC-1: tooling MUST infer executor=engine when eventType is present
         inferred_executor = "engine" if "eventType" in event else "claude"
         assert inferred_executor == "engine"
+
+
+# ── Read-side normalization ───────────────────────────────────────────
+
+
+def _ol(**payload):
+    return make_ol_event(
+        "IterationCompleted", "design→code", "proj", "inst-1", "engine",
+        payload={"feature": "REQ-F-A", "edge": "design→code", "delta": 2, **payload},
+    )
+
+
+class TestNormalizeEvent:
+    """REQ-EVENT-001: one shared read-side normalizer for OL and flat events."""
+
+    def test_registered_types_use_precomputed_names(self):
+        from genesis.ol_event import _OL_EVENT_TYPE, _SNAKE_EVENT_TYPE
+        assert set(_SNAKE_EVENT_TYPE) == set(_OL_EVENT_TYPE)
+        assert _SNAKE_EVENT_TYPE["IterationCompleted"] == "iteration_completed"
+        assert _SNAKE_EVENT_TYPE["FpFailure"] == "fp_failure"
+
+    def test_unregistered_type_still_converted(self):
+        assert snake_event_type("SomethingNewHappened") == "something_new_happened"
+
+    def test_payload_flattened(self):
+        flat = normalize_event(_ol())
+        assert flat["event_type"] == "iteration_completed"
+        assert flat["project"] == "proj"
+        assert flat["delta"] == 2
+        assert not any(k.startswith("_") for k in flat)
+
+    def test_migrated_original_data_fills_missing_fields(self):
+        raw = _ol()
+        raw["_metadata"] = {
+            "original_data": {"event_type": "iteration_completed", "delta": 9, "evaluators": {"passed": 3},
+                              "data": {"agent_id": "agent-1", "feature": "REQ-F-OTHER"}},
+        }
+        flat = normalize_event(raw)
+        assert flat["delta"] == 2  # payload wins
+        assert flat["feature"] == "REQ-F-A"
+        assert flat["evaluators"] == {"passed": 3}
+        assert flat["agent_id"] == "agent-1"
+
+    def test_flat_events_pass_through(self):
+        ev = {"event_type": "edge_started", "feature": "REQ-F-A"}
+        assert normalize_event(ev) is ev
+        assert view_event(ev) is ev
+
+
+class TestEventView:
+    """Lazy view reads facets on access and matches normalize_event()."""
+
+    def test_view_equals_normalized_copy(self):
+        raw = _ol(agent_id="agent-1")
+        raw["_metadata"] = {"original_data": {"legacy": True, "data": {"extra": 1}}}
+        view = view_event(raw)
+        assert isinstance(view, EventView)
+        assert dict(view) == normalize_event(raw)
+
+    def test_lookups(self):
+        view = EventView(_ol())
+        assert view["event_type"] == "iteration_completed"
+        assert view.get("edge") == "design→code"
+        assert view.get("missing") is None
+        assert "delta" in view
+        with pytest.raises(KeyError):
+            view["_producer"]
+
+    def test_unknown_envelope_passes_through(self):
+        raw = {"eventType": "START", "run": {"facets": {}}}
+        assert view_event(raw) is raw
+
+    def test_payload_overrides_builtins(self):
+        raw = _ol(project="override", timestamp="2026-01-01T00:00:00Z")
+        view = view_event(raw)
+        assert view["project"] == normalize_event(raw)["project"] == "override"
+        assert view["timestamp"] == "2026-01-01T00:00:00Z"
+        assert dict(view) == normalize_event(raw)
@@ -0,0 +1,122 @@
+# Validates: REQ-FEAT-002 (Feature Dependencies), REQ-EVOL-002 (Feature Display Tools Must JOIN Spec and Workspace)
+"""Tests for the shared, stat-invalidated feature vector store."""
+
+import itertools
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from genesis.workspace_state import (
+    FeatureStore,
+    _has_blocked_dependency,
+    _has_pending_human_review,
+    feature_store,
+    get_active_features,
+)
+
+_AGE = itertools.count(600, -1)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / ".ai-workspace" / "features" / "active").mkdir(parents=True)
+    (tmp_path / ".ai-workspace" / "features" / "completed").mkdir(parents=True)
+    return tmp_path
+
+
+def _write(workspace: Path, fid: str, subdir: str = "active", fresh: bool = False, **fields) -> Path:
+    """Write a feature vector; unless *fresh*, backdate it (distinct mtime per call)."""
+    path = workspace / ".ai-workspace" / "features" / subdir / f"{fid}.yml"
+    path.write_text(yaml.dump({"feature": fid, "status": "pending", **fields}))
+    if not fresh:
+        old = time.time() - next(_AGE)
+        os.utime(path, (old, old))
+    return path
+
+
+class _Status:
+    """WorkspaceStatus stand-in: only converged_edges() is consulted."""
+
+    def __init__(self, converged: dict[str, set] | None = None) -> None:
+        self.converged = converged or {}
+
+    def converged_edges(self, feature_id: str) -> set:
+        return self.converged.get(feature_id, set())
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+
+
+class TestFeatureStore:
+    def test_indexes_active_and_completed(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A")
+        _write(workspace, "REQ-F-B", "completed", status="converged")
+        store = FeatureStore(workspace).refresh()
+        assert store.get("REQ-F-A")["status"] == "pending"
+        assert store.get("REQ-F-B") is None
+        assert store.get("REQ-F-B", "completed")["status"] == "converged"
+        assert (store.ids("active"), store.ids("completed")) == ({"REQ-F-A"}, {"REQ-F-B"})
+
+    def test_unchanged_files_not_reparsed(self, workspace: Path) -> None:
+        for fid in ("REQ-F-A", "REQ-F-B", "REQ-F-C"):
+            _write(workspace, fid)
+        store = FeatureStore(workspace).refresh()
+        assert store.parses == 3
+        _write(workspace, "REQ-F-B", status="in_progress")
+        store.refresh()
+        assert store.parses == 4
+        assert store.get("REQ-F-B")["status"] == "in_progress"
+
+    def test_removed_file_dropped(self, workspace: Path) -> None:
+        path = _write(workspace, "REQ-F-A")
+        store = FeatureStore(workspace).refresh()
+        path.unlink()
+        assert store.refresh().get("REQ-F-A") is None
+
+    def test_recent_file_reparsed_each_refresh(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A", fresh=True)
+        store = FeatureStore(workspace).refresh()
+        store.refresh()
+        assert store.parses == 2
+
+    def test_unreadable_vector_raises_only_when_strict(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A")
+        (workspace / ".ai-workspace" / "features" / "active" / "bad.yml").write_text("a: [unclosed\n")
+        store = FeatureStore(workspace).refresh()
+        assert store.ids("active") == {"REQ-F-A"}
+        with pytest.raises(yaml.YAMLError):
+            store.features("active")
+        with pytest.raises(yaml.YAMLError):
+            get_active_features(workspace)
+
+    def test_shared_per_workspace(self, workspace: Path) -> None:
+        assert feature_store(workspace) is feature_store(workspace / ".ai-workspace")
+
+    def test_get_active_features_returns_copies(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A")
+        get_active_features(workspace)[0]["status"] = "mutated"
+        assert feature_store(workspace).get("REQ-F-A")["status"] == "pending"
+
+
+# ── Queries ───────────────────────────────────────────────────────────────────
+
+
+class TestFeatureQueries:
+    def test_pending_human_review(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A", trajectory={"design": {"status": "pending_review"}})
+        _write(workspace, "REQ-F-B", trajectory={"design": {"status": "iterating"}})
+        store = feature_store(workspace)
+        assert _has_pending_human_review(workspace, "REQ-F-A", _Status(), store)
+        assert not _has_pending_human_review(workspace, "REQ-F-B", _Status(), store)
+        assert not _has_pending_human_review(workspace, "REQ-F-MISSING", _Status())
+
+    def test_blocked_dependency(self, workspace: Path) -> None:
+        _write(workspace, "REQ-F-A", dependencies=["REQ-F-B"])
+        assert _has_blocked_dependency(workspace, "REQ-F-A", _Status())
+        assert not _has_blocked_dependency(workspace, "REQ-F-A", _Status({"REQ-F-B": {"code"}}))
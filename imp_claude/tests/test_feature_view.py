@@ -1,6 +1,9 @@
 # Validates: REQ-TOOL-009 (Feature Views)
 """Tests for feature_view.py — cross-artifact REQ key tracer."""
 
+import itertools
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -8,12 +11,14 @@ import pytest
 from genesis.feature_view import (
     ArtifactMatch,
     FeatureView,
+    ReqIndex,
     build_all_feature_views,
     build_feature_view,
     coverage_report,
     scan_for_req_key,
     _classify_line_tag,
     _infer_stage,
+    _scan_direct,
     EXPECTED_STAGES,
 )
 
@@ -225,3 +230,71 @@ class TestCoverageReport:
         assert "stages_present" in row
         assert "missing_stages" in row
         assert "summary" in row
+
+
+# ── ReqIndex ──────────────────────────────────────────────────────────────────
+
+_AGE = itertools.count(600, -1)
+
+
+def aged(path: Path, content: str) -> Path:
+    """write() and backdate past the racy window (distinct mtime per call)."""
+    write(path, content)
+    old = time.time() - next(_AGE)
+    os.utime(path, (old, old))
+    return path
+
+
+class TestReqIndex:
+    def _tree(self, root: Path) -> None:
+        aged(root / "src" / "auth.py", "# Implements: REQ-F-AUTH-001\n# see REQ-F-REQ-NFR-002\n")
+        aged(root / "tests" / "test_auth.py", "# Validates: REQ-F-AUTH-001\nx = 'REQ-F-AUTH-001-002'\n")
+        aged(root / "docs" / "spec.md", "REQ-F-AUTH-001 and REQ-NFR-002\n")
+
+    def test_matches_direct_scan(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        index = ReqIndex(tmp_path).refresh()
+        for key in ("REQ-F-AUTH-001", "REQ-NFR-002", "REQ-F-REQ-NFR-002", "REQ-F-MISSING-001"):
+            indexed = {(m.rel_path, tuple(m.line_numbers), tuple(m.tag_types)) for m in index.matches(key)}
+            direct = {(m.rel_path, tuple(m.line_numbers), tuple(m.tag_types)) for m in _scan_direct(key, tmp_path, tmp_path)}
+            assert indexed == direct, key
+
+    def test_nested_key_found(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        paths = {m.rel_path for m in ReqIndex(tmp_path).refresh().matches("REQ-NFR-002")}
+        assert paths == {str(Path("src") / "auth.py"), str(Path("docs") / "spec.md")}
+
+    def test_unchanged_files_not_reread(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        index = ReqIndex(tmp_path).refresh()
+        assert index.reads == 3
+        aged(tmp_path / "src" / "auth.py", "# Implements: REQ-F-AUTH-009\n")
+        index.refresh()
+        assert index.reads == 4
+        assert index.matches("REQ-F-AUTH-009")[0].line_numbers == [1]
+        assert all(m.path.parent.name != "src" for m in index.matches("REQ-F-AUTH-001"))
+
+    def test_persisted_across_instances(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        cache = tmp_path / "cache" / "req_index.json"
+        ReqIndex(tmp_path / "src", cache).refresh()
+        warm = ReqIndex(tmp_path / "src", cache).refresh()
+        assert warm.reads == 0
+        assert warm.keys() == ["REQ-F-AUTH-001", "REQ-F-REQ-NFR-002", "REQ-NFR-002"]
+
+    def test_deleted_file_dropped(self, tmp_path: Path) -> None:
+        self._tree(tmp_path)
+        index = ReqIndex(tmp_path).refresh()
+        (tmp_path / "docs" / "spec.md").unlink()
+        assert all("spec.md" not in m.rel_path for m in index.refresh().matches("REQ-F-AUTH-001"))
+
+    def test_workspace_project_persists_index(self, tmp_path: Path) -> None:
+        (tmp_path / ".ai-workspace").mkdir()
+        self._tree(tmp_path)
+        views = build_all_feature_views(["REQ-F-AUTH-001", "REQ-NFR-002"], tmp_path)
+        assert views["REQ-F-AUTH-001"].coverage >= 2
+        assert (tmp_path / ".ai-workspace" / "cache" / "feature_view" / "req_index.json").exists()
+
+    def test_non_key_query_falls_back_to_scan(self, tmp_path: Path) -> None:
+        aged(tmp_path / "notes.md", "see REQ-F-AUTH-001a\n")
+        assert len(scan_for_req_key("REQ-F-AUTH-001a", tmp_path)) == 1
@@ -19,7 +19,7 @@ from genesis.models import (
     FunctionalUnit,
     ResolvedCheck,
 )
-from genesis.fd_evaluate import evaluate_checklist, run_check
+from genesis.fd_evaluate import evaluate_checklist, run_check, run_checks
 from genesis.fd_emit import emit_event, make_event
 from genesis.ol_event import emit_ol_event
 from genesis.fd_classify import (
@@ -194,6 +194,89 @@ class TestEvaluateChecklist:
         assert result.delta == 0
 
 
+class TestRunChecks:
+    """Concurrent F_D execution — declared order, group lanes, exclusive barriers."""
+
+    def _check(self, name, log, sleep=0.3, **kw):
+        # Appends "<name>+" on start and "<name>-" on finish to a shared log
+        return ResolvedCheck(
+            name=name, check_type="deterministic", functional_unit="evaluate",
+            criterion="ok", source="default", required=True,
+            command=f"echo {name}+ >> {log}; sleep {sleep}; echo {name}- >> {log}",
+            pass_criterion="exit code 0", **kw,
+        )
+
+    def _log(self, log):
+        return log.read_text().split()
+
+    def test_results_in_declared_order(self, tmp_path):
+        log = tmp_path / "log"
+        checks = [self._check(n, log, sleep=s) for n, s in (("slow", 0.5), ("mid", 0.2), ("fast", 0.0))]
+        results = run_checks(checks, tmp_path, workers=3)
+        assert [r.name for r in results] == ["slow", "mid", "fast"]
+        assert all(r.outcome == CheckOutcome.PASS for r in results)
+        # All started before the slow one finished → ran concurrently
+        assert self._log(log).index("slow-") > max(self._log(log).index(f"{n}+") for n in ("mid", "fast"))
+
+    def test_single_worker_is_sequential(self, tmp_path):
+        log = tmp_path / "log"
+        run_checks([self._check(n, log, sleep=0.05) for n in "abc"], tmp_path, workers=1)
+        assert self._log(log) == ["a+", "a-", "b+", "b-", "c+", "c-"]
+
+    def test_single_worker_keeps_declared_order_across_groups(self, tmp_path):
+        log = tmp_path / "log"
+        checks = [
+            self._check("a", log, sleep=0.0, group="pytest"),
+            self._check("b", log, sleep=0.0),
+            self._check("c", log, sleep=0.0, group="pytest"),
+        ]
+        run_checks(checks, tmp_path, workers=1)
+        assert self._log(log) == ["a+", "a-", "b+", "b-", "c+", "c-"]
+
+    def test_workers_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GENESIS_FD_WORKERS", "1")
+        log = tmp_path / "log"
+        run_checks([self._check(n, log, sleep=0.05) for n in "ab"], tmp_path)
+        assert self._log(log) == ["a+", "a-", "b+", "b-"]
+
+    def test_group_runs_serially_in_order(self, tmp_path):
+        log = tmp_path / "log"
+        checks = [
+            self._check("g1", log, group="pytest"),
+            self._check("free", log, sleep=0.5),
+            self._check("g2", log, group="pytest"),
+        ]
+        run_checks(checks, tmp_path, workers=4)
+        entries = self._log(log)
+        assert entries.index("g1-") < entries.index("g2+")
+        assert entries.index("free+") < entries.index("g1-")  # other lanes overlap the group
+
+    def test_exclusive_is_a_barrier(self, tmp_path):
+        log = tmp_path / "log"
+        checks = [
+            self._check("a", log, sleep=0.2),
+            self._check("b", log, sleep=0.2),
+            self._check("x", log, sleep=0.1, exclusive=True),
+            self._check("c", log, sleep=0.0),
+        ]
+        results = run_checks(checks, tmp_path, workers=4)
+        entries = self._log(log)
+        x_start, x_end = entries.index("x+"), entries.index("x-")
+        assert x_end == x_start + 1  # nothing else ran while x was in flight
+        assert {"a-", "b-"} <= set(entries[:x_start])
+        assert entries[x_end + 1:] == ["c+", "c-"]
+        assert [r.name for r in results] == ["a", "b", "x", "c"]
+
+    def test_evaluate_checklist_aggregates_in_order(self, tmp_path):
+        log = tmp_path / "log"
+        checks = [self._check("p", log, sleep=0.2), self._check("f", log, sleep=0.0)]
+        checks[1].command = "false"
+        result = evaluate_checklist(checks, tmp_path, workers=2)
+        assert [c.name for c in result.checks] == ["p", "f"]
+        assert result.delta == 1
+        assert result.escalations == ["η_D→P: f — deterministic failure"]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # F_D EMIT
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,167 @@
+# Validates: REQ-EVAL-002 (Evaluator Composition), REQ-FEAT-001 (Feature Vector Trajectories)
+"""Tests for REQ-tag-driven test impact selection ($selected_tests)."""
+
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from genesis.config_loader import resolve_checklist
+from genesis.impact_selection import (
+    SELECTED_TESTS_VAR,
+    ImpactSelector,
+    Selection,
+    full_suite_every,
+    is_test_path,
+    references_selected_tests,
+    spec_satisfies,
+)
+
+_AGE = itertools.count(600, -1)
+
+SPEC = """\
+## Feature Vectors
+
+### REQ-F-AUTH-001: Authentication
+
+**Satisfies**: REQ-AUTH-001, REQ-AUTH-002
+
+### REQ-F-BILL-001: Billing
+
+**Satisfies**: REQ-BILL-001
+"""
+
+
+def _write(root: Path, rel: str, text: str) -> Path:
+    """Write *text*, backdated past the racy window (distinct mtime per call)."""
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    old = time.time() - next(_AGE)
+    os.utime(path, (old, old))
+    return path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".ai-workspace").mkdir()
+    _write(tmp_path, "specification/features/FEATURE_VECTORS.md", SPEC)
+    _write(tmp_path, "src/auth.py", "# Implements: REQ-AUTH-001\n")
+    _write(tmp_path, "src/bill.py", "# Implements: REQ-BILL-001\n")
+    _write(tmp_path, "src/util.py", "def helper(): pass\n")
+    _write(tmp_path, "tests/test_auth.py", "# Validates: REQ-AUTH-002\n")
+    _write(tmp_path, "tests/test_bill.py", "# Validates: REQ-BILL-001\n")
+    _write(tmp_path, "tests/test_util.py", "def test_helper(): pass\n")
+    return tmp_path
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+
+class TestHelpers:
+    def test_spec_satisfies(self, project: Path) -> None:
+        spec = project / "specification" / "features" / "FEATURE_VECTORS.md"
+        assert spec_satisfies(spec, "REQ-F-AUTH-001") == ["REQ-AUTH-001", "REQ-AUTH-002"]
+        assert spec_satisfies(spec, "REQ-F-NONE-001") == []
+        assert spec_satisfies(project / "missing.md", "REQ-F-AUTH-001") == []
+
+    def test_is_test_path(self) -> None:
+        assert is_test_path("tests/test_auth.py")
+        assert is_test_path("pkg/auth_test.py")
+        assert not is_test_path("src/auth.py")
+        assert not is_test_path("tests/conftest.py")
+
+    def test_full_suite_every(self) -> None:
+        assert full_suite_every({}) == 10
+        assert full_suite_every({"tools": {"test_runner": {"full_suite_every": 3}}}) == 3
+        assert full_suite_every({"tools": {"test_runner": {"full_suite_every": "x"}}}) == 10
+
+    def test_references_selected_tests(self) -> None:
+        assert references_selected_tests({"checklist": [{"command": "pytest $selected_tests"}]})
+        assert not references_selected_tests({"checklist": [{"command": "pytest"}]})
+
+    def test_argument(self) -> None:
+        assert Selection().argument == ""
+        assert Selection(tests=["a.py", "b.py"], full=False).argument == "a.py b.py"
+
+    def test_resolve_checklist_substitutes_variable(self) -> None:
+        edge = {"checklist": [{"name": "t", "type": "deterministic", "command": "pytest $selected_tests"}]}
+        [check] = resolve_checklist(edge, {SELECTED_TESTS_VAR: "tests/test_a.py"})
+        assert check.command == "pytest tests/test_a.py"
+        assert check.unresolved == []
+
+
+# ── Selection ─────────────────────────────────────────────────────────────────
+
+
+class TestImpactSelector:
+    def test_full_suite_without_converged_fingerprint(self, project: Path) -> None:
+        selection = ImpactSelector(project).select("REQ-F-AUTH-001")
+        assert selection.full
+        assert selection.reason == "no converged fingerprint"
+
+    def test_selects_tests_tagged_with_feature_keys(self, project: Path) -> None:
+        selector = ImpactSelector(project)
+        selector.record_converged("REQ-F-AUTH-001")
+        selection = selector.select("REQ-F-AUTH-001")
+        assert not selection.full
+        assert selection.tests == ["tests/test_auth.py"]
+
+    def test_changed_code_pulls_in_tests_sharing_its_keys(self, project: Path) -> None:
+        selector = ImpactSelector(project)
+        selector.record_converged("REQ-F-AUTH-001")
+        _write(project, "src/bill.py", "# Implements: REQ-BILL-001\nX = 1\n")
+        assert selector.select("REQ-F-AUTH-001").tests == ["tests/test_auth.py", "tests/test_bill.py"]
+
+    def test_changed_test_runs_directly(self, project: Path) -> None:
+        selector = ImpactSelector(project)
+        selector.record_converged("REQ-F-AUTH-001")
+        _write(project, "tests/test_util.py", "def test_helper(): assert True\n")
+        assert "tests/test_util.py" in selector.select("REQ-F-AUTH-001").tests
+
+    def test_config_change_runs_full_suite(self, project: Path) -> None:
+        selector = ImpactSelector(project)
+        selector.record_converged("REQ-F-AUTH-001")
+        _write(project, "tests/conftest.py", "import pytest\n")
+        selection = selector.select("REQ-F-AUTH-001")
+        assert selection.full
+        assert "conftest.py" in selection.reason
+
+    def test_periodic_full_suite(self, project: Path) -> None:
+        selector = ImpactSelector(project, full_every=3)
+        selector.record_converged("REQ-F-AUTH-001")
+        runs = [selector.select("REQ-F-AUTH-001").full for _ in range(6)]
+        assert runs == [False, False, True, False, False, True]
+
+    def test_nothing_tagged_runs_full_suite(self, project: Path) -> None:
+        selector = ImpactSelector(project)
+        selector.record_converged("REQ-F-NONE-001")
+        assert selector.select("REQ-F-NONE-001").full
+
+    def test_state_persists_across_instances(self, project: Path) -> None:
+        ImpactSelector(project).record_converged("REQ-F-BILL-001")
+        assert ImpactSelector(project).select("REQ-F-BILL-001").tests == ["tests/test_bill.py"]
+
+    def test_concurrent_updates_are_not_lost(self, project: Path, monkeypatch) -> None:
+        real_load = ImpactSelector._load
+
+        def slow_load(self) -> dict:
+            state = real_load(self)
+            time.sleep(0.05)  # widen the read-modify-write window
+            return state
+
+        monkeypatch.setattr(ImpactSelector, "_load", slow_load)
+        features = [f"REQ-F-P{i}-001" for i in range(6)]
+        ctx = multiprocessing.get_context("fork")
+        workers = [ctx.Process(target=ImpactSelector(project).record_converged, args=(f,)) for f in features]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join(30)
+
+        state = json.loads(ImpactSelector(project).state_path.read_text())
+        assert sorted(state) == features
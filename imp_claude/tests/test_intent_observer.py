@@ -23,7 +23,6 @@ from genesis.intent_observer import (
     DispatchTarget,
     _get_affected_features,
     _get_intent_id,
-    _normalize,
     _select_edge,
     find_unhandled_intents,
     get_pending_dispatches,
@@ -0,0 +1,230 @@
+# Validates: REQ-EVENT-002 (Projection Contract), REQ-ROBUST-003 (Crash Recovery via Event Log Gap Detection)
+"""Tests for snapshot-backed projections — resume from a persisted fold + suffix."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from genesis.projections import ProjectionSet, SnapshotStore, load_projection
+from genesis.serialiser import ACTIVE_CLAIMS, get_active_claims
+from genesis.workspace_state import (
+    ABANDONED_ITERATIONS,
+    DELTA_RUNS,
+    EDGE_STATUS,
+    HAMILTONIAN,
+    INSTANCE_GRAPH,
+    WORKSPACE_STATUS,
+    compute_current_delta,
+    compute_hamiltonian,
+    detect_abandoned_iterations,
+    detect_stuck_features,
+    get_converged_edges,
+    get_iteration_count,
+    load_instance_graph,
+    load_workspace_status,
+    project_instance_graph,
+    project_workspace_status,
+)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / ".ai-workspace" / "events").mkdir(parents=True)
+    return tmp_path
+
+
+def _events_path(workspace: Path) -> Path:
+    return workspace / ".ai-workspace" / "events" / "events.jsonl"
+
+
+def _append(workspace: Path, *events: dict) -> None:
+    with open(_events_path(workspace), "a") as f:
+        for ev in events:
+            f.write(json.dumps(ev) + "\n")
+
+
+def _iter(feature: str, edge: str, delta: int) -> dict:
+    return {"event_type": "iteration_completed", "feature": feature, "edge": edge, "delta": delta}
+
+
+STREAM = [
+    {"event_type": "edge_started", "feature": "REQ-F-A", "edge": "design→code", "timestamp": "2026-01-01T00:00:00+00:00"},
+    _iter("REQ-F-A", "design→code", 3),
+    _iter("REQ-F-A", "design→code", 3),
+    {"event_type": "edge_converged", "feature": "REQ-F-A", "edge": "design→code"},
+    {"event_type": "edge_started", "feature": "REQ-F-B", "edge": "code↔unit_tests", "agent_id": "agent-1"},
+    _iter("REQ-F-B", "code↔unit_tests", 2),
+    _iter("REQ-F-B", "", 1),
+    {"event_type": "spawn_created", "feature": "REQ-F-B", "data": {"child_feature": "REQ-F-B-1"}},
+    {"event_type": "feature_converged", "feature": "REQ-F-C"},
+]
+
+
+# ── Snapshot resume ───────────────────────────────────────────────────────────
+
+
+class TestSnapshotResume:
+    def test_snapshot_written_after_first_projection(self, workspace: Path) -> None:
+        _append(workspace, *STREAM)
+        load_projection(_events_path(workspace), DELTA_RUNS)
+        snap = workspace / ".ai-workspace" / "events" / "snapshots" / "delta_runs.json"
+        data = json.loads(snap.read_text())
+        assert data["offset"] == _events_path(workspace).stat().st_size
+        assert data["projection"] == "delta_runs"
+
+    def test_resume_folds_only_suffix(self, workspace: Path) -> None:
+        _append(workspace, _iter("REQ-F-A", "design→code", 4))
+        load_projection(_events_path(workspace), DELTA_RUNS)
+        # Poison the snapshot state: a resumed fold must start from it, not byte 0
+        snap_path = SnapshotStore(_events_path(workspace))._path(DELTA_RUNS)
+        snap = json.loads(snap_path.read_text())
+        snap["state"] = [["REQ-F-Z", "design→code", 9, 4, 9]]
+        snap_path.write_text(json.dumps(snap))
+        _append(workspace, _iter("REQ-F-A", "design→code", 4))
+        state = load_projection(_events_path(workspace), DELTA_RUNS)
+        assert ("REQ-F-Z", "design→code") in state
+        assert state[("REQ-F-A", "design→code")] == [1, 4, 1]
+
+    def test_resumed_result_matches_full_fold(self, workspace: Path) -> None:
+        _append(workspace, *STREAM[:4])
+        load_instance_graph(workspace)
+        _append(workspace, *STREAM[4:])
+        resumed = load_instance_graph(workspace, active_profile_edges=["design→code"])
+        full = project_instance_graph(STREAM, active_profile_edges=["design→code"])
+        assert resumed.nodes == full.nodes
+        assert resumed.as_of == full.as_of
+
+    def test_rewritten_log_invalidates_snapshot(self, workspace: Path) -> None:
+        _append(workspace, *[_iter("REQ-F-A", "design→code", 5)] * 3)
+        assert detect_stuck_features(workspace)
+        # Rewrite with different (longer) content — snapshot must not be trusted
+        _events_path(workspace).write_text(
+            "\n".join(json.dumps(_iter("REQ-F-A", "design→code", d)) for d in (5, 4, 3, 2)) + "\n"
+        )
+        assert detect_stuck_features(workspace) == []
+
+    def test_truncated_log_invalidates_snapshot(self, workspace: Path) -> None:
+        _append(workspace, *STREAM)
+        load_projection(_events_path(workspace), ABANDONED_ITERATIONS)
+        _events_path(workspace).write_text(json.dumps(STREAM[0]) + "\n")
+        state = load_projection(_events_path(workspace), ABANDONED_ITERATIONS)
+        assert ABANDONED_ITERATIONS.result(state) == detect_abandoned_iterations(STREAM[:1])
+
+    def test_version_change_discards_snapshot(self, workspace: Path) -> None:
+        _append(workspace, *STREAM)
+        store = SnapshotStore(_events_path(workspace))
+        load_projection(_events_path(workspace), HAMILTONIAN)
+        snap = json.loads(store._path(HAMILTONIAN).read_text())
+        snap["version"] = 0
+        store._path(HAMILTONIAN).write_text(json.dumps(snap))
+        assert store.load(HAMILTONIAN) is None
+
+    def test_invalidate_removes_snapshots(self, workspace: Path) -> None:
+        _append(workspace, *STREAM)
+        load_projection(_events_path(workspace), HAMILTONIAN)
+        store = SnapshotStore(_events_path(workspace))
+        store.invalidate()
+        assert store.load(HAMILTONIAN) is None
+
+    def test_snapshot_false_writes_nothing(self, workspace: Path) -> None:
+        _append(workspace, *STREAM)
+        load_projection(_events_path(workspace), HAMILTONIAN, snapshot=False)
+        assert not (workspace / ".ai-workspace" / "events" / "snapshots").exists()
+
+
+# ── Encode/decode round trips ─────────────────────────────────────────────────
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize(
+        "projection",
+        [ABANDONED_ITERATIONS, DELTA_RUNS, EDGE_STATUS, HAMILTONIAN, INSTANCE_GRAPH, ACTIVE_CLAIMS, WORKSPACE_STATUS],
+    )
+    def test_encode_decode_preserves_state(self, projection) -> None:
+        state = projection.fold(STREAM)
+        data = json.loads(json.dumps(projection.encode(state)))
+        assert projection.decode(data) == state
+
+
+# ── Fold equivalence with the pure functions ──────────────────────────────────
+
+
+class TestFoldSemantics:
+    def test_hamiltonian_per_edge_includes_edgeless_iterations(self) -> None:
+        assert compute_hamiltonian(STREAM, "REQ-F-B", "code↔unit_tests") == (2, 1, 3)
+
+    def test_hamiltonian_edge_converged_resets_v(self) -> None:
+        assert compute_hamiltonian(STREAM, "REQ-F-A", "design→code") == (2, 0, 2)
+        assert compute_hamiltonian(STREAM, "REQ-F-A") == (2, 0, 2)
+
+    def test_feature_converged_archives_without_profile(self) -> None:
+        graph = project_instance_graph(STREAM)
+        status = {n.feature_id: n.status for n in graph.nodes}
+        assert status["REQ-F-C"] == "archived"
+        assert status["REQ-F-B-1"] == "pending"
+
+    def test_active_claims_ignore_ol_wrapped_events(self, workspace: Path) -> None:
+        _append(workspace, STREAM[4], {"eventType": "START", "run": {"facets": {}}})
+        assert load_projection(_events_path(workspace), ACTIVE_CLAIMS) == get_active_claims([STREAM[4]])
+
+
+# ── Projection sets ───────────────────────────────────────────────────────────
+
+
+class TestProjectionSet:
+    def test_members_match_individual_folds(self) -> None:
+        state = WORKSPACE_STATUS.fold(STREAM)
+        assert state["delta_runs"] == DELTA_RUNS.fold(STREAM)
+        assert state["hamiltonian"] == HAMILTONIAN.fold(STREAM)
+        assert state["edge_status"] == EDGE_STATUS.fold(STREAM)
+
+    def test_raw_and_normalized_members_share_one_pass(self) -> None:
+        ol = {"eventType": "START", "run": {"facets": {}}}
+        pset = ProjectionSet("mixed", ACTIVE_CLAIMS, HAMILTONIAN)
+        state = pset.fold([STREAM[4], ol])
+        assert state["active_claims"] == get_active_claims([STREAM[4]])
+        assert state["hamiltonian"] == HAMILTONIAN.fold([STREAM[4], ol])
+
+    def test_malformed_ol_envelope_skipped(self, workspace: Path) -> None:
+        bad = {"eventType": "START", "run": "not-a-dict"}
+        pset = ProjectionSet("mixed", ACTIVE_CLAIMS, HAMILTONIAN)
+        assert pset.fold([STREAM[4], bad]) == pset.fold([STREAM[4]])
+        _append(workspace, *STREAM, bad)
+        assert load_workspace_status(workspace) == project_workspace_status(STREAM)
+
+    def test_duplicate_member_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ProjectionSet("dup", HAMILTONIAN, HAMILTONIAN)
+
+    def test_version_tracks_members(self) -> None:
+        pset = ProjectionSet("grow", HAMILTONIAN)
+        before = pset.version
+        pset.register(DELTA_RUNS)
+        assert pset.version != before
+
+    def test_snapshot_resume(self, workspace: Path) -> None:
+        _append(workspace, *STREAM[:4])
+        load_workspace_status(workspace)
+        _append(workspace, *STREAM[4:])
+        assert load_workspace_status(workspace) == project_workspace_status(STREAM)
+        assert (workspace / ".ai-workspace" / "events" / "snapshots" / "workspace_status.json").exists()
+
+
+class TestWorkspaceStatus:
+    @pytest.mark.parametrize(
+        "feature,edge", [("REQ-F-A", "design→code"), ("REQ-F-B", "code↔unit_tests"), ("REQ-F-B", ""), ("REQ-F-X", "e")]
+    )
+    def test_lookups_match_scan_functions(self, feature: str, edge: str) -> None:
+        status = project_workspace_status(STREAM)
+        assert status.converged_edges(feature) == get_converged_edges(STREAM, feature)
+        assert status.current_delta(feature, edge) == compute_current_delta(STREAM, feature, edge)
+        assert status.iteration_count(feature, edge) == get_iteration_count(STREAM, feature, edge)
+        assert status.hamiltonian(feature, edge or None) == compute_hamiltonian(STREAM, feature, edge or None)
+
+    def test_stuck_features_from_view(self, workspace: Path) -> None:
+        _append(workspace, *[_iter("REQ-F-A", "design→code", 5)] * 3)
+        assert load_workspace_status(workspace).stuck_features() == detect_stuck_features(workspace)
@@ -7,7 +7,11 @@ from pathlib import Path
 
 import pytest
 
+import genesis.serialiser as serialiser
 from genesis.serialiser import (
+    MAX_INBOX_ATTEMPTS,
+    OFFSET_FILE,
+    REJECTED_FILE,
     detect_stale_claims,
     get_active_claims,
     process_inbox,
@@ -259,6 +263,171 @@ class TestProcessInbox:
         assert counts["rejected"] == 0
 
 
+# ── Agent queues and batching ─────────────────────────────────────────────────
+
+
+def _inbox(workspace: Path) -> Path:
+    return workspace / ".ai-workspace" / "events" / "inbox"
+
+
+class TestAgentQueue:
+    def test_one_append_only_queue_per_agent(self, workspace: Path) -> None:
+        first = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        second = stage_release(workspace, "agent-1", "REQ-F-A", "design→code")
+        assert first == second
+        lines = first.read_text().splitlines()
+        assert [json.loads(line)["event_type"] for line in lines] == ["edge_claim", "edge_released"]
+
+    def test_torn_line_left_for_next_pass(self, workspace: Path) -> None:
+        queue = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        complete = queue.stat().st_size
+        line = json.dumps({"event_type": "edge_claim", "feature": "REQ-F-B", "edge": "design→code"})
+        with open(queue, "a") as f:
+            f.write(line[:10])
+
+        assert process_inbox(workspace, project="test-proj")["granted"] == 1
+        assert int((queue.parent / OFFSET_FILE).read_text()) == complete
+
+        with open(queue, "a") as f:
+            f.write(line[10:] + "\n")
+        assert process_inbox(workspace, project="test-proj")["granted"] == 1
+        assert not queue.exists()
+        assert not (queue.parent / OFFSET_FILE).exists()
+
+    def test_legacy_inbox_files_still_processed(self, workspace: Path) -> None:
+        agent_dir = _inbox(workspace) / "agent-1"
+        agent_dir.mkdir()
+        legacy = agent_dir / "20250101T000000000000_edge_claim.json"
+        legacy.write_text(json.dumps({"event_type": "edge_claim", "feature": "REQ-F-A", "edge": "design→code"}))
+        stage_release(workspace, "agent-1", "REQ-F-A", "design→code")
+
+        counts = process_inbox(workspace, project="test-proj")
+
+        assert (counts["granted"], counts["forwarded"]) == (1, 1)
+        assert not legacy.exists()
+        types = [e["event_type"] for e in _read_events(workspace)]
+        assert types == ["edge_started", "edge_released"]
+
+    def test_pass_is_one_log_append(self, workspace: Path, monkeypatch) -> None:
+        _write_events(workspace, [
+            {"event_type": "edge_started", "feature": "REQ-F-X", "edge": "design→code",
+             "agent_id": "stale-agent", "timestamp": "2020-01-01T00:00:00Z"},
+        ])
+        for n in range(8):
+            stage_claim(workspace, f"agent-{n}", f"REQ-F-{n}", "design→code")
+        calls = []
+        real = serialiser.append_event_lines
+        monkeypatch.setattr(serialiser, "append_event_lines", lambda p, lines: (calls.append(len(lines)), real(p, lines)))
+
+        counts = process_inbox(workspace, project="test-proj", timeout_seconds=60)
+
+        assert (counts["granted"], counts["expired"]) == (8, 1)
+        assert calls == [9]
+
+    def test_failed_append_leaves_inbox_untouched(self, workspace: Path, monkeypatch) -> None:
+        queue = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+
+        def broken(path, lines):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(serialiser, "append_event_lines", broken)
+        with pytest.raises(OSError):
+            process_inbox(workspace, project="test-proj")
+        assert queue.exists()
+
+        monkeypatch.undo()
+        assert process_inbox(workspace, project="test-proj")["granted"] == 1
+
+    def test_failed_item_retried_and_holds_its_queue(self, workspace: Path, monkeypatch) -> None:
+        queue = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        held_at = queue.stat().st_size
+        stage_claim(workspace, "agent-1", "REQ-F-B", "design→code")
+        stage_claim(workspace, "agent-1", "REQ-F-C", "design→code")
+        real = serialiser.check_role_authority
+        calls = {"n": 0}
+
+        def second_fails(role, edge, config):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("transient")
+            return real(role, edge, config)
+
+        monkeypatch.setattr(serialiser, "check_role_authority", second_fails)
+        counts = process_inbox(workspace, project="test-proj")
+        assert (counts["granted"], counts["errors"]) == (1, 1)
+        assert int((queue.parent / OFFSET_FILE).read_text()) == held_at
+
+        counts = process_inbox(workspace, project="test-proj")
+        assert (counts["granted"], counts["errors"]) == (2, 0)
+        assert not queue.exists()
+        granted = [e["feature"] for e in _read_events(workspace) if e["event_type"] == "edge_started"]
+        assert granted == ["REQ-F-A", "REQ-F-B", "REQ-F-C"]
+
+    def test_malformed_line_dead_lettered(self, workspace: Path) -> None:
+        queue = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        with open(queue, "a") as f:
+            f.write(json.dumps({"event_type": "edge_claim", "data": "x"}) + "\n")
+        stage_claim(workspace, "agent-1", "REQ-F-B", "design→code")
+
+        counts = process_inbox(workspace, project="test-proj")
+        assert (counts["granted"], counts["errors"]) == (2, 1)
+        assert not queue.exists()
+        [rejected] = [json.loads(line) for line in (queue.parent / REJECTED_FILE).read_text().splitlines()]
+        assert rejected["event"]["data"] == "x"
+        assert rejected["error"].startswith("AttributeError")
+        events = _read_events(workspace)
+        assert [e["event_type"] for e in events].count("inbox_item_rejected") == 1
+
+    def test_persistent_failure_dead_lettered_after_max_attempts(self, workspace: Path, monkeypatch) -> None:
+        queue = stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        stage_claim(workspace, "agent-1", "REQ-F-B", "design→code")
+        real = serialiser.check_role_authority
+
+        def a_always_fails(role, edge, config):
+            if calls.pop(0) == "REQ-F-A":
+                raise RuntimeError("still down")
+            return real(role, edge, config)
+
+        monkeypatch.setattr(serialiser, "check_role_authority", a_always_fails)
+        for attempt in range(1, MAX_INBOX_ATTEMPTS):
+            calls = ["REQ-F-A"]
+            assert process_inbox(workspace, project="test-proj")["errors"] == 1
+            assert int((queue.parent / OFFSET_FILE).read_text()) == 0
+            assert not (queue.parent / REJECTED_FILE).exists()
+
+        calls = ["REQ-F-A", "REQ-F-B"]
+        counts = process_inbox(workspace, project="test-proj")
+        assert (counts["granted"], counts["errors"]) == (1, 1)
+        assert not queue.exists()
+        assert (queue.parent / REJECTED_FILE).exists()
+        granted = [e["feature"] for e in _read_events(workspace) if e["event_type"] == "edge_started"]
+        assert granted == ["REQ-F-B"]
+
+    def test_failed_legacy_file_kept(self, workspace: Path) -> None:
+        agent_dir = _inbox(workspace) / "agent-1"
+        agent_dir.mkdir()
+        legacy = agent_dir / "20250101T000000000000_edge_claim.json"
+        legacy.write_text(json.dumps({"event_type": "edge_claim", "data": "not-a-mapping"}))
+
+        assert process_inbox(workspace, project="test-proj")["errors"] == 1
+        assert legacy.exists()
+
+    def test_claim_state_is_snapshotted(self, workspace: Path) -> None:
+        log = workspace / ".ai-workspace" / "events" / "events.jsonl"
+        snapshot = workspace / ".ai-workspace" / "events" / "snapshots" / "serialiser_state.json"
+        stage_claim(workspace, "agent-1", "REQ-F-A", "design→code")
+        process_inbox(workspace, project="test-proj")
+        after_first = log.stat().st_size
+
+        stage_claim(workspace, "agent-2", "REQ-F-A", "design→code")
+        assert process_inbox(workspace, project="test-proj")["rejected"] == 1
+
+        # The second pass folded only the first pass's output and checkpointed it
+        doc = json.loads(snapshot.read_text())
+        assert doc["offset"] == after_first
+        assert doc["state"]["active_claims"] == [["REQ-F-A", "design→code", "agent-1"]]
+
+
 # ── Role Authority Integration (REQ-COORD-005) ────────────────────────────────
 
 _ROLES_CONFIG = {
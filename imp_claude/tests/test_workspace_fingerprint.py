@@ -0,0 +1,178 @@
+# Validates: REQ-GRAPH-003 (Asset as Markov Object), REQ-TOOL-008 (Context Snapshot)
+"""Tests for Merkle workspace fingerprints and the persisted stat cache."""
+
+import itertools
+import os
+from pathlib import Path
+
+import pytest
+
+from genesis.config_loader import generate_context_manifest
+from genesis.workspace_fingerprint import (
+    FileChange,
+    StatCache,
+    WorkspaceFingerprint,
+    default_cache_dir,
+)
+
+# Distinct mtimes in 1970 — well outside the racy window
+_OLD_NS = itertools.count(1_000_000_000, 1_000)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+def _write(path: Path, content: str, old: bool = True) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if old:
+        ns = next(_OLD_NS)
+        os.utime(path, ns=(ns, ns))
+    return path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    _write(tmp_path / "code" / "pkg" / "a.py", "a = 1\n")
+    _write(tmp_path / "code" / "pkg" / "b.py", "b = 1\n")
+    _write(tmp_path / "specification" / "REQ.md", "# REQ\n")
+    _write(tmp_path / "README.md", "hi\n")
+    return tmp_path
+
+
+# ── Stat cache ────────────────────────────────────────────────────────────────
+
+
+class TestStatCache:
+    def test_unchanged_file_not_reread(self, project: Path) -> None:
+        cache = StatCache()
+        first = cache.sha256(project / "README.md")
+        assert cache.sha256(project / "README.md") == first
+        assert cache.hashed == 1
+
+    def test_persisted_across_instances(self, project: Path) -> None:
+        path = project / "stat_cache.json"
+        cache = StatCache(path)
+        cache.sha256(project / "README.md")
+        cache.save()
+        reloaded = StatCache(path)
+        reloaded.sha256(project / "README.md")
+        assert reloaded.hashed == 0
+
+    def test_stat_change_rehashes(self, project: Path) -> None:
+        cache = StatCache()
+        before = cache.sha256(project / "README.md")
+        _write(project / "README.md", "bye\n")
+        assert cache.sha256(project / "README.md") != before
+
+    def test_racy_files_never_cached(self, project: Path) -> None:
+        cache = StatCache()
+        fresh = _write(project / "fresh.txt", "x", old=False)
+        cache.sha256(fresh)
+        cache.sha256(fresh)
+        assert cache.hashed == 2
+
+    def test_corrupt_cache_file_ignored(self, project: Path) -> None:
+        path = project / "stat_cache.json"
+        path.write_text("{not json")
+        assert StatCache(path).sha256(project / "README.md")
+
+
+# ── Snapshots ─────────────────────────────────────────────────────────────────
+
+
+class TestSnapshot:
+    def test_stable_root_and_incremental_hashing(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        root = fp.snapshot()
+        assert fp.files == 4
+        again = WorkspaceFingerprint(project)
+        assert again.snapshot() == root
+        assert again.stat_cache.hashed == 0
+
+    def test_nested_change_changes_root(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        root = fp.snapshot()
+        _write(project / "code" / "pkg" / "a.py", "a = 2\n")
+        assert fp.snapshot() != root
+        assert fp.stat_cache.hashed == 5
+
+    def test_cache_dir_and_skip_dirs_excluded(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        root = fp.snapshot()
+        assert default_cache_dir(project).is_dir()
+        _write(project / "code" / "__pycache__" / "a.pyc", "junk")
+        assert fp.snapshot() == root
+
+    def test_include_limits_scope(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project, include=["code", "specification", "missing"])
+        root = fp.snapshot()
+        assert fp.files == 3
+        _write(project / "README.md", "outside\n")
+        assert fp.snapshot() == root
+
+    def test_deleted_files_pruned_from_stat_cache(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        fp.snapshot()
+        (project / "README.md").unlink()
+        fp.snapshot()
+        assert str(project / "README.md") not in StatCache(fp.stat_cache.path)._entries
+
+
+# ── Diff ──────────────────────────────────────────────────────────────────────
+
+
+class TestChangedSince:
+    def test_reports_each_kind_of_change(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        old = fp.snapshot()
+        _write(project / "code" / "pkg" / "a.py", "a = 2\n")
+        (project / "specification" / "REQ.md").unlink()
+        _write(project / "tests" / "test_a.py", "")
+        assert fp.changed_since(old) == [
+            FileChange("code/pkg/a.py", "modified"),
+            FileChange("specification/REQ.md", "removed"),
+            FileChange("tests/test_a.py", "added"),
+        ]
+
+    def test_no_change_is_empty(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        assert fp.changed_since(fp.snapshot()) == []
+
+    def test_unchanged_subtrees_not_loaded(self, project: Path, monkeypatch) -> None:
+        fp = WorkspaceFingerprint(project)
+        old = fp.snapshot()
+        _write(project / "README.md", "changed\n")
+        new = fp.snapshot()
+        loaded = []
+        real = fp._load
+        monkeypatch.setattr(fp, "_load", lambda h: loaded.append(h) or real(h))
+        assert fp.changed_since(old, new) == [FileChange("README.md", "modified")]
+        assert len(loaded) == 2  # the two roots only
+
+    def test_file_replaced_by_directory(self, project: Path) -> None:
+        fp = WorkspaceFingerprint(project)
+        old = fp.snapshot()
+        (project / "README.md").unlink()
+        _write(project / "README.md" / "index.md", "")
+        assert fp.changed_since(old) == [
+            FileChange("README.md", "removed"),
+            FileChange("README.md/index.md", "added"),
+        ]
+
+    def test_unknown_fingerprint_raises(self, project: Path) -> None:
+        with pytest.raises(KeyError):
+            WorkspaceFingerprint(project).changed_since("0" * 64)
+
+
+# ── Context manifest ──────────────────────────────────────────────────────────
+
+
+class TestContextManifestCache:
+    def test_persisted_cache_skips_unchanged_files(self, project: Path) -> None:
+        files = [project / "README.md", project / "specification" / "REQ.md"]
+        cache_path = default_cache_dir(project) / "stat_cache.json"
+        first = generate_context_manifest(files, StatCache(cache_path))
+        cache = StatCache(cache_path)
+        assert generate_context_manifest(files, cache) == first
+        assert cache.hashed == 0
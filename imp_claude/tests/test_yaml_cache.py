@@ -0,0 +1,104 @@
+# Validates: REQ-CTX-001 (Context as Constraint Surface), REQ-GRAPH-001 (Asset Type Registry)
+"""Tests for the stat-keyed YAML parse cache."""
+
+import itertools
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from genesis import yaml_cache
+from genesis.config_loader import load_yaml
+from genesis.workspace_state import get_active_features
+
+_AGE = itertools.count(600, -1)
+
+
+def _write(path: Path, text: str, fresh: bool = False) -> Path:
+    """Write *text*; unless *fresh*, backdate it past the racy window (distinct mtime per call)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if not fresh:
+        old = time.time() - next(_AGE)
+        os.utime(path, (old, old))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    yaml_cache.YAML_CACHE.clear()
+    yield
+    yaml_cache.YAML_CACHE.clear()
+
+
+# ── Cache semantics ───────────────────────────────────────────────────────────
+
+
+class TestYamlCache:
+    def test_unchanged_file_parsed_once(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.yml", "edges: [a, b]\n")
+        assert yaml_cache.load(path) == {"edges": ["a", "b"]}
+        assert yaml_cache.load(path) == {"edges": ["a", "b"]}
+        assert (yaml_cache.YAML_CACHE.hits, yaml_cache.YAML_CACHE.misses) == (1, 1)
+
+    def test_results_are_private_copies(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.yml", "trajectory:\n  design: {status: pending}\n")
+        first = yaml_cache.load(path)
+        first["trajectory"]["design"]["status"] = "converged"
+        assert yaml_cache.load(path)["trajectory"]["design"]["status"] == "pending"
+
+    def test_rewrite_same_size_invalidates(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.yml", "status: aaa\n")
+        yaml_cache.load(path)
+        _write(path, "status: bbb\n")
+        assert yaml_cache.load(path) == {"status": "bbb"}
+
+    def test_recent_file_not_cached(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.yml", "status: aaa\n", fresh=True)
+        yaml_cache.load(path)
+        yaml_cache.load(path)
+        assert (yaml_cache.YAML_CACHE.hits, yaml_cache.YAML_CACHE.misses) == (0, 2)
+
+    def test_single_and_multi_document_cached_separately(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.yml", "a: 1\n---\nb: 2\n")
+        assert yaml_cache.load(path, all_documents=True) == [{"a": 1}, {"b": 2}]
+        with pytest.raises(yaml.YAMLError):
+            yaml_cache.load(path)
+
+    def test_errors_propagate_and_are_not_cached(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "bad.yml", "a: [unclosed\n")
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                yaml_cache.load(path)
+        assert yaml_cache.YAML_CACHE.misses == 2
+        with pytest.raises(FileNotFoundError):
+            yaml_cache.load(tmp_path / "missing.yml")
+
+    def test_lru_bound(self, tmp_path: Path) -> None:
+        cache = yaml_cache.YamlCache(max_entries=2)
+        paths = [_write(tmp_path / f"{n}.yml", f"n: {n}\n") for n in range(3)]
+        for path in paths:
+            cache.load(path)
+        cache.load(paths[0])
+        assert (cache.hits, cache.misses) == (0, 4)
+
+
+# ── Callers ───────────────────────────────────────────────────────────────────
+
+
+class TestCallers:
+    def test_load_yaml_merges_documents_through_cache(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "edge.yml", "a: 1\n---\nb: 2\n")
+        assert load_yaml(path) == {"a": 1, "b": 2}
+        load_yaml(path)["a"] = 99
+        assert load_yaml(path) == {"a": 1, "b": 2}
+        assert yaml_cache.YAML_CACHE.hits == 2
+
+    def test_get_active_features_sees_updates(self, tmp_path: Path) -> None:
+        fv = tmp_path / ".ai-workspace" / "features" / "active" / "REQ-F-A.yml"
+        _write(fv, "feature: REQ-F-A\nstatus: pending\n")
+        assert get_active_features(tmp_path)[0]["status"] == "pending"
+        _write(fv, "feature: REQ-F-A\nstatus: converged\n")
+        assert get_active_features(tmp_path)[0]["status"] == "converged"
@@ -0,0 +1,84 @@
+# Implements: REQ-F-ENGINE-001, REQ-F-LIFE-001
+"""Stat-cached content hashing for drift detection.
+
+Pending F_P manifests pin artifact hashes; every supervisor scan used to
+re-read each pinned file. StatCache keeps ``path -> (size, mtime_ns, inode,
+sha256)`` on disk and only re-reads a file when its stat changed. Files
+modified within the last two seconds are never cached, so an edit landing in
+the same mtime tick as the hash is still detected next time.
+
+Entries hold bare hex digests, the format every engine's stat cache uses;
+the ``sha256:`` prefix of manifest pins is added on the way out. The cache
+file is this runtime's own (``stat_cache.codex.json``) so it never shares
+entries with another engine working in the same workspace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+
+CACHE_VERSION = 2
+RACY_NS = 2_000_000_000
+
+
+def _sha256_hex(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    return f"sha256:{_sha256_hex(path)}"
+
+
+class StatCache:
+    """Persisted ``path -> [size, mtime_ns, inode, sha256]`` map."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.hashed = 0
+        self._entries: dict[str, list[Any]] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                document = json.loads(path.read_text())
+                if document.get("version") == CACHE_VERSION:
+                    self._entries = dict(document["entries"])
+            except (OSError, ValueError, KeyError, TypeError):
+                self._entries = {}
+
+    def sha256(self, path: Path) -> str:
+        """Return ``sha256:<hex>`` for *path*, re-reading it only if its stat changed."""
+
+        key = str(path.resolve())
+        stat = os.stat(key)
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = self._entries.get(key)
+        if entry is not None and entry[:3] == signature:
+            return f"sha256:{entry[3]}"
+        value = _sha256_hex(Path(key))
+        self.hashed += 1
+        if time.time_ns() - stat.st_mtime_ns > RACY_NS:
+            self._entries[key] = [*signature, value]
+            self._dirty = True
+        return f"sha256:{value}"
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self._entries}))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            tmp.unlink(missing_ok=True)
@@ -5,13 +5,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import hashlib
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 import uuid
 
 from .events import append_run_event
+from .fingerprint import StatCache
 from .intents import resolve_named_intent_payload
 from .paths import RuntimePaths
 from .projections import load_feature, load_yaml
@@ -55,12 +55,6 @@ def _ts(now: str | datetime | None = None) -> str:
     return _now(now).isoformat().replace("+00:00", "Z")
 
 
-def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return f"sha256:{digest.hexdigest()}"
-
-
 def _workspace_rel(paths: RuntimePaths, path: Path) -> str:
     try:
         return str(path.resolve().relative_to(paths.project_root.resolve()))
@@ -106,6 +100,7 @@ def input_manifest_for_target(
 
     entries: list[dict[str, Any]] = []
     seen: set[str] = set()
+    cache = StatCache(paths.stat_cache_path)
 
     if iterate_result is not None:
         feature_path = str(iterate_result.get("feature_path", "")).strip()
@@ -117,7 +112,7 @@ def input_manifest_for_target(
                 entries.append(
                     {
                         "path": _workspace_rel(paths, resolved),
-                        "sha256": _sha256_file(resolved),
+                        "sha256": cache.sha256(resolved),
                         "bytes": resolved.stat().st_size,
                     }
                 )
@@ -132,7 +127,7 @@ def input_manifest_for_target(
             entries.append(
                 {
                     "path": _workspace_rel(paths, resolved),
-                    "sha256": _sha256_file(resolved),
+                    "sha256": cache.sha256(resolved),
                     "bytes": resolved.stat().st_size,
                 }
             )
@@ -144,10 +139,11 @@ def input_manifest_for_target(
             entries.append(
                 {
                     "path": _workspace_rel(paths, resolved),
-                    "sha256": _sha256_file(resolved),
+                    "sha256": cache.sha256(resolved),
                     "bytes": resolved.stat().st_size,
                 }
             )
+    cache.save()
     return entries
 
 
@@ -237,7 +233,14 @@ def classify_missing_result_failure(manifest: dict[str, Any], *, now: str | date
     return None
 
 
-def detect_manifest_drift(paths: RuntimePaths, manifest: dict[str, Any]) -> list[dict[str, Any]]:
+def detect_manifest_drift(
+    paths: RuntimePaths,
+    manifest: dict[str, Any],
+    stat_cache: StatCache | None = None,
+) -> list[dict[str, Any]]:
+    """Compare pinned input hashes with disk; unchanged files are not re-read."""
+
+    cache = stat_cache or StatCache(paths.stat_cache_path)
     changed: list[dict[str, Any]] = []
     for entry in manifest.get("input_manifest", []):
         raw_path = str(entry.get("path", "")).strip()
@@ -247,7 +250,7 @@ def detect_manifest_drift(paths: RuntimePaths, manifest: dict[str, Any]) -> list
         if not candidate.exists() or not candidate.is_file():
             changed.append({"path": raw_path, "reason": "missing"})
             continue
-        current_hash = _sha256_file(candidate)
+        current_hash = cache.sha256(candidate)
         if current_hash != entry.get("sha256"):
             changed.append(
                 {
@@ -256,6 +259,8 @@ def detect_manifest_drift(paths: RuntimePaths, manifest: dict[str, Any]) -> list
                     "actual_sha256": current_hash,
                 }
             )
+    if stat_cache is None:
+        cache.save()
     return changed
 
 
@@ -265,10 +270,11 @@ def emit_gap_detected(
     *,
     actor: str,
     now: str | datetime | None = None,
+    stat_cache: StatCache | None = None,
 ) -> dict | None:
     """Emit one gap_detected event when a pending F_P run drifted on disk."""
 
-    changed = detect_manifest_drift(paths, manifest)
+    changed = detect_manifest_drift(paths, manifest, stat_cache)
     if not changed:
         return None
     if manifest.get("gap_run_id"):
@@ -477,6 +483,7 @@ def scan_pending_fp_runs(
     gap_events = 0
     manifests_summary: list[dict[str, Any]] = []
     timestamp = _ts(now)
+    stat_cache = StatCache(paths.stat_cache_path)
 
     for manifest_path in sorted(_agents_dir(project_root).glob("fp_intent_*.json")):
         manifest = load_fp_manifest(manifest_path)
@@ -498,7 +505,7 @@ def scan_pending_fp_runs(
             )
             continue
 
-        gap_event = emit_gap_detected(paths, manifest, actor=actor, now=timestamp)
+        gap_event = emit_gap_detected(paths, manifest, actor=actor, now=timestamp, stat_cache=stat_cache)
         if gap_event is not None:
             gap_events += 1
 
@@ -572,6 +579,7 @@ def scan_pending_fp_runs(
             }
         )
 
+    stat_cache.save()
     return FpSupervisorScanResult(
         scanned=scanned,
         retries_scheduled=retries_scheduled,
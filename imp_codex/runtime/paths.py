@@ -83,6 +83,10 @@ class RuntimePaths:
     def events_file(self) -> Path:
         return self.workspace_root / "events" / "events.jsonl"
 
+    @property
+    def stat_cache_path(self) -> Path:
+        return self.workspace_root / "cache" / "fingerprint" / "stat_cache.codex.json"
+
     @property
     def status_file(self) -> Path:
         return self.workspace_root / "STATUS.md"
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import yaml
@@ -28,7 +29,8 @@ from imp_codex.runtime import (
     gen_trace,
 )
 from imp_codex.runtime.events import load_events
-from imp_codex.runtime.fp_supervisor import load_fp_manifest, save_fp_manifest
+from imp_codex.runtime.fingerprint import StatCache, sha256_file
+from imp_codex.runtime.fp_supervisor import detect_manifest_drift, load_fp_manifest, save_fp_manifest
 from imp_codex.runtime.paths import detect_workspace_scope
 
 
@@ -509,6 +511,45 @@ def test_gen_start_emits_gap_detected_and_escalates_stale_fp_manifest(tmp_path,
     assert "intent_raised" in semantic_types
 
 
+def test_manifest_drift_rehashes_only_changed_inputs(tmp_path):
+    paths = RuntimePaths(tmp_path)
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text(f"{name}\n")
+        os.utime(tmp_path / name, ns=(1_000_000_000, 1_000_000_000))
+    manifest = {
+        "input_manifest": [
+            {"path": name, "sha256": sha256_file(tmp_path / name)} for name in ("a.py", "b.py")
+        ]
+    }
+
+    assert detect_manifest_drift(paths, manifest) == []
+    assert paths.stat_cache_path.exists()
+
+    (tmp_path / "b.py").write_text("changed\n")
+    cache = StatCache(paths.stat_cache_path)
+    changed = detect_manifest_drift(paths, manifest, cache)
+
+    assert [entry["path"] for entry in changed] == ["b.py"]
+    assert cache.hashed == 1
+
+
+def test_stat_cache_is_private_and_stores_bare_hex(tmp_path):
+    paths = RuntimePaths(tmp_path)
+    (tmp_path / "a.py").write_text("a\n")
+    os.utime(tmp_path / "a.py", ns=(1_000_000_000, 1_000_000_000))
+    manifest = {"input_manifest": [{"path": "a.py", "sha256": sha256_file(tmp_path / "a.py")}]}
+    # Another engine's cache in the shared fingerprint directory is never read
+    shared = paths.stat_cache_path.with_name("stat_cache.json")
+    shared.parent.mkdir(parents=True)
+    shared.write_text(json.dumps({"version": 2, "entries": {str((tmp_path / "a.py").resolve()): [0, 0, 0, "x"]}}))
+
+    assert detect_manifest_drift(paths, manifest) == []
+    entries = json.loads(paths.stat_cache_path.read_text())["entries"]
+    assert paths.stat_cache_path != shared
+    assert all(":" not in entry[3] for entry in entries.values())
+    assert detect_manifest_drift(paths, manifest) == []  # cached hit re-adds the prefix
+
+
 def test_gen_review_records_human_decision_and_persists_feature(tmp_path):
     project_root = tmp_path / "demo"
     _write_intent(project_root)
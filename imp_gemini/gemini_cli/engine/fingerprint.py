@@ -0,0 +1,128 @@
+# Implements: REQ-ITER-002, REQ-ROBUST-002
+"""Merkle-tree project fingerprint with a persisted stat cache.
+
+Each directory hashes to sha256 of its sorted (name, kind, hash) entries, so
+the root hash changes exactly when any file below a sentinel path changes —
+not just the top level. File hashes are cached by (size, mtime_ns, inode)
+in .ai-workspace/cache/fingerprint/stat_cache.gemini.json (this engine's
+own file — other engines keep theirs beside it); only files whose stat
+changed are re-read. Files modified in the last two seconds are never cached.
+"""
+import hashlib
+import json
+import os
+import stat as stat_mod
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+CACHE_VERSION = 2
+RACY_NS = 2_000_000_000
+SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", ".pytest_cache", ".mypy_cache"}
+
+
+class StatCache:
+    """path -> [size, mtime_ns, inode, sha256], persisted as JSON."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.hashed = 0
+        self.entries: Dict[str, List[Any]] = {}
+        self.dirty = False
+        if path and path.exists():
+            try:
+                doc = json.loads(path.read_text())
+                if doc.get("version") == CACHE_VERSION:
+                    self.entries = doc["entries"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def sha256(self, path: str, st: os.stat_result) -> str:
+        sig = [st.st_size, st.st_mtime_ns, st.st_ino]
+        entry = self.entries.get(path)
+        if entry and entry[:3] == sig:
+            return entry[3]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(65536):
+                h.update(chunk)
+        self.hashed += 1
+        if time.time_ns() - st.st_mtime_ns > RACY_NS:
+            self.entries[path] = sig + [h.hexdigest()]
+            self.dirty = True
+        return h.hexdigest()
+
+    def prune(self, prefix: str, keep: set):
+        """Drop entries under *prefix* that are not in *keep* (deleted files)."""
+        under = prefix.rstrip(os.sep) + os.sep
+        stale = [k for k in self.entries if (k == prefix or k.startswith(under)) and k not in keep]
+        for key in stale:
+            del self.entries[key]
+        self.dirty = self.dirty or bool(stale)
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": self.entries}))
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+class ProjectFingerprint:
+    """Merkle root over a fixed set of sentinel paths under project_root."""
+
+    def __init__(self, project_root: Path, sentinels: Iterable[str]):
+        self.project_root = project_root
+        self.sentinels = sorted(sentinels)
+        self.cache = StatCache(project_root / ".ai-workspace" / "cache" / "fingerprint" / "stat_cache.gemini.json")
+        self.file_count = 0
+        self._seen: set = set()
+
+    def compute(self) -> str:
+        """Return the root hash now, re-hashing only files whose stat changed."""
+        self.file_count = 0
+        self._seen = set()
+        entries = []
+        for rel in self.sentinels:
+            path = self.project_root / rel
+            if path.is_dir():
+                entries.append((rel, "d", self._hash_dir(str(path))))
+            elif path.is_file():
+                entries.append((rel, "f", self._hash_file(str(path), path.stat())))
+        for rel in self.sentinels:
+            self.cache.prune(str(self.project_root / rel), self._seen)
+        self.cache.save()
+        return _node_hash(entries)
+
+    def _hash_file(self, path: str, st: os.stat_result) -> str:
+        self._seen.add(path)
+        self.file_count += 1
+        return self.cache.sha256(path, st)
+
+    def _hash_dir(self, path: str) -> str:
+        entries = []
+        try:
+            scan = list(os.scandir(path))
+        except OSError:
+            return _node_hash(entries)
+        for entry in scan:
+            try:
+                st = entry.stat(follow_symlinks=False)
+                if stat_mod.S_ISDIR(st.st_mode):
+                    if entry.name not in SKIP_DIRS:
+                        entries.append((entry.name, "d", self._hash_dir(entry.path)))
+                elif stat_mod.S_ISREG(st.st_mode):
+                    entries.append((entry.name, "f", self._hash_file(entry.path, st)))
+            except OSError:
+                continue
+        return _node_hash(entries)
+
+
+def _node_hash(entries: List[tuple]) -> str:
+    body = "\n".join(f"{name}\0{kind}\0{digest}" for name, kind, digest in sorted(entries))
+    return hashlib.sha256(body.encode()).hexdigest()
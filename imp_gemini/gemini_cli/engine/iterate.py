@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 
 from .models import IterationRecord, IterationReport, FunctorResult, Outcome, ConstructResult, IntentVector, WorkOrder, PlanResult
 from .state import EventStore
+from .fingerprint import ProjectFingerprint
 
 from .stateless import run_iteration
 
@@ -47,43 +48,29 @@ class IterateEngine:
             self.constraints = constraints
             
         self.store = EventStore(self.workspace_root)
+        self._fingerprint: Optional[ProjectFingerprint] = None
 
-    def _get_project_fingerprint(self) -> tuple[float, int]:
-        """Return (latest_mtime, total_file_count) for key project locations.
-        Implementation of the Markov Blanket boundary check.
+    def _get_project_fingerprint(self) -> str:
+        """Return the Merkle root hash of key project locations.
+        Implementation of the Markov Blanket boundary check: any file change
+        below a sentinel path changes the hash; unchanged files are not re-read.
         """
-        latest = 0.0
-        count = 0
-        sentinel_dirs = [
-            self.project_root / "code",
-            self.project_root / "tests",
-            self.project_root / "specification",
-            self.project_root / ".ai-workspace" / "events",
-            self.project_root / ".ai-workspace" / "features",
-            self.project_root / ".ai-workspace" / "vectors",
-        ]
-        for d in sentinel_dirs:
-            if not d.exists(): continue
-            try:
-                mt = d.stat().st_mtime
-                if mt > latest: latest = mt
-                for child in d.iterdir():
-                    count += 1
-                    try:
-                        mt = child.stat().st_mtime
-                        if mt > latest: latest = mt
-                    except OSError: continue
-            except OSError: continue
-        return latest, count
+        if self._fingerprint is None:
+            self._fingerprint = ProjectFingerprint(self.project_root, [
+                "code", "tests", "specification",
+                ".ai-workspace/events", ".ai-workspace/features", ".ai-workspace/vectors",
+            ])
+        return self._fingerprint.compute()
 
-    def get_liveness_signal(self, transport: str = "filesystem") -> tuple[float, int]:
+    def get_liveness_signal(self, transport: str = "filesystem") -> str:
         """Pluggable liveness signal (Finding #4). 
         Defaults to filesystem fingerprint but can be extended for cloud heartbeats.
+        A changed signal means activity.
         """
         if transport == "filesystem":
             return self._get_project_fingerprint()
         # Fallback to local time for unknown transports
-        return time.time(), 0
+        return str(time.time())
 
     def _archive_iteration(self, feature_id: str, edge: str, iteration: int, failed: bool = False):
         """Archive the project state for this iteration to ensure audit reproducibility."""
@@ -283,7 +270,7 @@ class IterateEngine:
         
         records = []
         start_time = time.time()
-        last_mtime, last_count = self.get_liveness_signal()
+        last_signal = self.get_liveness_signal()
         last_activity = time.time()
         
         for i in range(1, max_iterations + 1):
@@ -353,9 +340,9 @@ class IterateEngine:
                 break
 
             if time.time() - start_time > wall_timeout: break
-            cur_mtime, cur_count = self.get_liveness_signal()
-            if cur_mtime > last_mtime or cur_count != last_count:
-                last_mtime, last_count = cur_mtime, cur_count
+            cur_signal = self.get_liveness_signal()
+            if cur_signal != last_signal:
+                last_signal = cur_signal
                 last_activity = time.time()
             elif time.time() - last_activity > stall_timeout: break
                 
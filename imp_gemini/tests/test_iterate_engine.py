@@ -1,6 +1,7 @@
 # Validates: REQ-ITER-001, REQ-ITER-002, REQ-EVENT-001, REQ-FEAT-001, REQ-LIFE-008
 # Validates: REQ-ROBUST-001, REQ-ROBUST-002, REQ-ROBUST-003, REQ-ROBUST-007, REQ-ROBUST-008, REQ-F-ROBUST-001
 # Validates: REQ-FEAT-002 (Dependencies), REQ-ITER-003 (Metadata)
+import os
 import pytest
 import json
 import yaml
@@ -91,3 +92,28 @@ def test_verify_protocol_failure(engine):
     # Assert
     assert len(gaps) > 0
     assert any("No event emitted" in g for g in gaps)
+
+def test_project_fingerprint_sees_nested_changes(engine):
+    nested = engine.project_root / "code" / "pkg" / "mod.py"
+    nested.parent.mkdir(parents=True)
+    nested.write_text("x = 1\n")
+    os.utime(nested, ns=(1_000_000_000, 1_000_000_000))
+    before = engine.get_liveness_signal()
+    assert engine.get_liveness_signal() == before
+    assert engine._fingerprint.cache.hashed == 1  # unchanged file not re-read
+
+    nested.write_text("x = 2\n")
+    assert engine.get_liveness_signal() != before
+
+def test_fingerprint_prunes_only_scanned_sentinels(tmp_path):
+    from gemini_cli.engine.fingerprint import ProjectFingerprint
+    for rel in ("code/a.py", "specs/b.md"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(rel)
+        os.utime(tmp_path / rel, ns=(1_000_000_000, 1_000_000_000))
+    ProjectFingerprint(tmp_path, ["code", "specs"]).compute()
+    ProjectFingerprint(tmp_path, ["code"]).compute()
+    fp = ProjectFingerprint(tmp_path, ["specs"])
+    fp.compute()
+    assert fp.cache.hashed == 0  # specs/ entry survived the code-only scan
+    assert fp.cache.path.name == "stat_cache.gemini.json"
@@ -15,11 +15,34 @@ The OL event stream is a distributed trace:
 from __future__ import annotations
 
 import hashlib
-from collections import defaultdict
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
 from datetime import datetime, date
+from itertools import count
 
 from genesis_monitor.models.events import Event
-from genesis_monitor.projections.edge_runs import EdgeRun, build_edge_runs
+from genesis_monitor.projections.edge_runs import EdgeRun, EdgeRunBuilder
+
+
+def _started_at(run: EdgeRun) -> datetime:
+    return run.started_at
+
+
+def _locate(bucket: list[EdgeRun], run: EdgeRun) -> int:
+    """Index of *run* in a bucket ordered by started_at."""
+    # Runs usually close soon after they open, near the tail
+    for i in range(len(bucket) - 1, max(len(bucket) - 8, -1), -1):
+        if bucket[i] is run:
+            return i
+    i = bisect_left(bucket, run.started_at, key=_started_at)
+    while bucket[i] is not run:
+        i += 1
+    return i
+
+
+def _remove(bucket: list[EdgeRun], run: EdgeRun) -> None:
+    """Remove *run* from a bucket ordered by started_at."""
+    del bucket[_locate(bucket, run)]
 
 
 class EventIndex:
@@ -30,6 +53,12 @@ class EventIndex:
     """
 
     def __init__(self) -> None:
+        self._reset()
+
+        # Metadata
+        self.built_at: datetime = datetime.now()
+
+    def _reset(self) -> None:
         # Ordered chronologically — for range queries (scrubber / replay)
         self._runs: list[EdgeRun] = []
 
@@ -40,9 +69,20 @@ class EventIndex:
         self._by_day: dict[date, list[EdgeRun]] = defaultdict(list)
         self._by_status: dict[str, list[EdgeRun]] = defaultdict(list)
 
-        # Metadata
+        # Incremental state: the open-run map ((feature, edge) → open EdgeRuns)
+        # lives in the builder; every event is kept (by reference) for the
+        # rare out-of-order append that needs a replay
+        self._builder = EdgeRunBuilder(on_open=self._index_run, on_close=self._reindex_closed)
+        self._events: list[Event] = []
+
+        # Tie-break among runs with equal started_at, matching build_edge_runs():
+        # closed runs in close order, then open runs in open-run map order
+        # ((feature, edge) key first seen, then open order) — id(run) → rank
+        self._rank: dict[int, tuple] = {}
+        self._seq = count()
+        self._starts: Counter[datetime] = Counter()
+        self._last_ts: datetime | None = None
         self.event_count: int = 0
-        self.built_at: datetime = datetime.now()
 
     # ── Build ───────────────────────────────────────────────────────────────
 
@@ -50,45 +90,93 @@ class EventIndex:
     def build(cls, events: list[Event]) -> "EventIndex":
         """Build the index from the full event list. O(n) one-time cost."""
         idx = cls()
-        idx.event_count = len(events)
-        runs = build_edge_runs(events)
-        for run in runs:
-            idx._index_run(run)
+        idx.append(events)
         idx.built_at = datetime.now()
         return idx
 
-    def _index_run(self, run: EdgeRun) -> None:
-        """Add one EdgeRun to all secondary indices."""
-        self._runs.append(run)
-        self._by_run_id[run.run_id] = run
+    def _order(self, run: EdgeRun) -> tuple:
+        return (run.started_at, self._rank[id(run)])
+
+    def _buckets(self, run: EdgeRun) -> list[list[EdgeRun]]:
+        """Every ordered list *run* belongs to, except its status bucket."""
+        buckets = [self._runs, self._by_day[run.started_at.date()]]
         if run.feature:
-            self._by_feature[run.feature].append(run)
+            buckets.append(self._by_feature[run.feature])
         if run.edge:
-            self._by_edge[run.edge].append(run)
-        day = run.started_at.date()
-        self._by_day[day].append(run)
-        self._by_status[run.status].append(run)
+            buckets.append(self._by_edge[run.edge])
+        return buckets
+
+    def _insert(self, bucket: list[EdgeRun], run: EdgeRun) -> None:
+        # Runs mostly arrive in order: appending is the common case
+        if not bucket or bucket[-1].started_at < run.started_at:
+            bucket.append(run)
+        elif bucket[-1].started_at == run.started_at and self._order(bucket[-1]) <= self._order(run):
+            bucket.append(run)
+        else:
+            insort(bucket, run, key=self._order)
+
+    def _reposition(self, bucket: list[EdgeRun], run: EdgeRun) -> None:
+        """Re-sort *run* among the runs sharing its started_at, in place."""
+        lo = hi = _locate(bucket, run)
+        while lo > 0 and bucket[lo - 1].started_at == run.started_at:
+            lo -= 1
+        while hi + 1 < len(bucket) and bucket[hi + 1].started_at == run.started_at:
+            hi += 1
+        hi += 1
+        if hi - lo > 1:
+            group = [r for r in bucket[lo:hi] if r is not run]
+            insort(group, run, key=self._order)
+            bucket[lo:hi] = group
+
+    def _index_run(self, run: EdgeRun) -> None:
+        """Add one newly opened EdgeRun to all secondary indices."""
+        siblings = self._builder.open_runs[(run.feature, run.edge)]
+        key_seq = self._rank[id(siblings[0])][1] if len(siblings) > 1 else next(self._seq)
+        self._rank[id(run)] = (1, key_seq, next(self._seq))
+        self._by_run_id[run.run_id] = run
+        self._starts[run.started_at] += 1
+        for bucket in self._buckets(run) + [self._by_status[run.status]]:
+            self._insert(bucket, run)
+
+    def _reindex_closed(self, run: EdgeRun) -> None:
+        """Re-rank a run that left in_progress and move it to its status bucket.
+
+        Every list stays ordered as a full build leaves it: by started_at,
+        ties broken by self._rank.  The new rank can only move the run
+        past runs sharing its started_at, so it is re-sorted within that
+        group without shifting the rest of the list, and only when such a
+        group exists.
+        """
+        _remove(self._by_status["in_progress"], run)
+        self._rank[id(run)] = (0, next(self._seq))
+        if self._starts[run.started_at] > 1:
+            for bucket in self._buckets(run):
+                self._reposition(bucket, run)
+        self._insert(self._by_status[run.status], run)
 
     def append(self, new_events: list[Event]) -> None:
         """Incrementally update the index with newly appended events.
 
-        Re-runs build_edge_runs over ALL events (including existing) so that
-        open runs can be completed by the new events. Efficient enough at
-        current dogfood scale; replace with partial-rebuild at >100k events.
+        New events are routed through the open-run map: they continue an open
+        run, open a new one, or close one (moving it between status buckets).
+        Cost is proportional to the new events, not the whole stream.  If the
+        batch starts before the newest event already indexed, the stream is
+        replayed.  Either way the result equals a full build over all events,
+        including the order of runs that share a started_at.
         """
-        # Clear and rebuild from scratch — Phase 2 will do true incremental
-        all_events = []
-        for run in self._runs:
-            all_events.extend(run.raw_events)
-        all_events.extend(new_events)
-        rebuilt = EventIndex.build(all_events)
-        self._runs = rebuilt._runs
-        self._by_run_id = rebuilt._by_run_id
-        self._by_feature = rebuilt._by_feature
-        self._by_edge = rebuilt._by_edge
-        self._by_day = rebuilt._by_day
-        self._by_status = rebuilt._by_status
-        self.event_count = rebuilt.event_count
+        if not new_events:
+            return
+        batch = sorted(new_events, key=lambda e: e.timestamp)
+        if self._last_ts is not None and batch[0].timestamp < self._last_ts:
+            events = self._events + list(new_events)
+            self._reset()
+            self.append(events)
+            return
+        for ev in batch:
+            self._builder.feed(ev)
+        self._events.extend(new_events)
+        self._last_ts = batch[-1].timestamp
+        self.event_count += len(new_events)
 
     # ── Query API ───────────────────────────────────────────────────────────
 
@@ -6,6 +6,7 @@ from pathlib import Path
 import yaml
 
 from genesis_monitor.models import ProjectConstraints
+from genesis_monitor.parsers.yaml_cache import load_yaml
 
 
 def parse_constraints(workspace: Path) -> ProjectConstraints | None:
@@ -19,8 +20,7 @@ def parse_constraints(workspace: Path) -> ProjectConstraints | None:
         return None
 
     try:
-        with open(constraints_path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(constraints_path)
     except (OSError, yaml.YAMLError):
         return None
 
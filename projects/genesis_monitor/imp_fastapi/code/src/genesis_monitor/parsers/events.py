@@ -16,7 +16,9 @@ from genesis_monitor.models.events import (
 logger = logging.getLogger(__name__)
 
 
-def parse_events(workspace: Path, max_events: int = 100000) -> list[Event]:
+def parse_events(
+    workspace: Path, max_events: int = 100000, until: datetime | None = None
+) -> list[Event]:
     """Parse the append-only event log.
 
     Handles two formats:
@@ -24,14 +26,22 @@ def parse_events(workspace: Path, max_events: int = 100000) -> list[Event]:
     - Flat-format: has ``event_type`` key (emitted by methodology commands)
 
     Both are accepted; flat-format events are parsed via ``_parse_flat()``.
+
+    Segmented logs are read in order: sealed ``events/segments/*.jsonl``
+    (per ``manifest.json``) then the active ``events.jsonl``. With *until*
+    (time travel), sealed segments whose sidecar index starts after it are
+    skipped unread and only events at or before *until* are returned.
     """
     events_path = workspace / "events" / "events.jsonl"
     if not events_path.exists():
         return []
 
     events: list[Event] = []
-    try:
-        lines = events_path.read_text(encoding="utf-8").strip().splitlines()
+    for path in _segment_files(workspace, until) + [events_path]:
+        try:
+            lines = path.read_text(encoding="utf-8").strip().splitlines()
+        except OSError:
+            continue
         for line in lines:
             line = line.strip()
             if not line:
@@ -44,12 +54,40 @@ def parse_events(workspace: Path, max_events: int = 100000) -> list[Event]:
                     events.append(_parse_flat(data))
             except json.JSONDecodeError:
                 continue
-    except OSError:
-        return []
 
+    if until is not None:
+        limit = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
+        events = [e for e in events if e.timestamp <= limit]
     return events
 
 
+def _segment_files(workspace: Path, until: datetime | None = None) -> list[Path]:
+    """Sealed segment files in log order, minus those that start after *until*.
+
+    Reads the manifest and sidecar indexes written by the engine's
+    event_segments module. Unsegmented logs have no manifest → [].
+    """
+    seg_dir = workspace / "events" / "segments"
+    try:
+        names = json.loads((seg_dir / "manifest.json").read_text()).get("segments", [])
+    except (OSError, ValueError):
+        return []
+    files: list[Path] = []
+    for name in names:
+        if until is not None:
+            try:
+                index = json.loads((seg_dir / (name.removesuffix(".jsonl") + ".index.json")).read_text())
+                first_ts = index.get("first_ts", "")
+            except (OSError, ValueError):
+                first_ts = ""
+            if first_ts and _parse_timestamp(first_ts) > (
+                until if until.tzinfo else until.replace(tzinfo=timezone.utc)
+            ):
+                continue
+        files.append(seg_dir / name)
+    return files
+
+
 def _parse_one(data: dict) -> Event:
     """Dispatch to typed event using ADR-S-011 OpenLineage facets."""
 
@@ -10,6 +10,7 @@ import yaml
 
 from genesis_monitor.models.core import EdgeTrajectory, FeatureVector
 from genesis_monitor.models.features import TimeBox
+from genesis_monitor.parsers.yaml_cache import load_yaml
 
 
 def parse_feature_vectors(workspace: Path, project_path: Path = None) -> list[FeatureVector]:
@@ -75,8 +76,7 @@ def parse_feature_vectors(workspace: Path, project_path: Path = None) -> list[Fe
 def _parse_one(path: Path) -> FeatureVector | None:
     """Parse a single feature vector YAML file."""
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(path)
     except (OSError, yaml.YAMLError):
         return None
 
@@ -16,6 +16,7 @@ import yaml
 
 from genesis_monitor.models.core import AssetType, GraphTopology, Transition
 from genesis_monitor.models.features import ConstraintDimension, ProjectionProfile
+from genesis_monitor.parsers.yaml_cache import load_yaml
 
 
 def _find_plugin_config(project_root: Path) -> Path | None:
@@ -54,8 +55,7 @@ def parse_graph_topology(
         return None
 
     try:
-        with open(topo_path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(topo_path)
     except (OSError, yaml.YAMLError):
         return None
 
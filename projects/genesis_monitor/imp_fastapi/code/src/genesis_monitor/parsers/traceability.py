@@ -3,6 +3,7 @@
 
 import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -93,13 +94,16 @@ def _should_skip_dir(dirname: str) -> bool:
     return dirname in _SKIP_DIRS or dirname.startswith(".")
 
 
-def _extract_req_tags(file_path: Path, project_root: Path) -> list[ReqTagEntry]:
-    """Extract all REQ tags from a single file."""
+def _extract_req_tags(
+    file_path: Path, project_root: Path, text: str | None = None,
+) -> list[ReqTagEntry]:
+    """Extract all REQ tags from a single file (*text*: its contents, if already read)."""
     entries = []
-    try:
-        text = file_path.read_text(encoding="utf-8", errors="ignore")
-    except (OSError, UnicodeDecodeError):
-        return entries
+    if text is None:
+        try:
+            text = file_path.read_text(encoding="utf-8", errors="ignore")
+        except (OSError, UnicodeDecodeError):
+            return entries
 
     rel_path = str(file_path.relative_to(project_root))
 
@@ -188,60 +192,230 @@ def parse_traceability(project_root: Path) -> TraceabilityReport:
     `# Implements: REQ-*` tags and test files with `# Validates: REQ-*` tags.
     Returns a cross-referenced report.
     """
-    report = TraceabilityReport()
-    code_files = 0
-    test_files = 0
+    return TraceabilityIndex(project_root).report()
 
-    for dirpath_str, dirnames, filenames in os.walk(project_root):
-        # Prune directories in-place
-        dirnames[:] = [d for d in dirnames if not _should_skip_dir(d)]
 
-        dirpath = Path(dirpath_str)
-        for filename in filenames:
-            file_path = dirpath / filename
-            if file_path.suffix not in _CODE_EXTENSIONS:
-                continue
+# ── Incremental index ────────────────────────────────────────────
 
-            rel_path = str(file_path.relative_to(project_root))
-            is_test = _is_test_file(rel_path)
-            if is_test:
-                test_files += 1
+
+_SPEC_CANDIDATES = (
+    Path(".ai-workspace") / "spec" / "REQUIREMENTS.md",
+    Path("specification") / "REQUIREMENTS.md",
+)
+
+
+@dataclass
+class _FileScan:
+    """What one source file contributes to the report."""
+
+    mtime_ns: int
+    size: int
+    is_test: bool
+    tags: list[ReqTagEntry]
+    telemetry: set[str]
+
+
+class TraceabilityIndex:
+    """Per-file traceability state of one project, updated from changed paths.
+
+    The constructor walks the tree once. update(paths) rescans only the given
+    files — for a directory, only the files below it whose (mtime_ns, size)
+    changed — and applies the difference to the coverage maps. Orphan and
+    uncovered membership is re-decided only for the REQ keys those files
+    touched; the whole set only when REQUIREMENTS.md changes.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.root = Path(project_root)
+        self.lock = threading.Lock()  # held by callers around update() + report()
+        self.files_read = 0
+        self._files: dict[str, _FileScan] = {}
+        # REQ key → files, as insertion-ordered sets
+        self._code: dict[str, dict[str, None]] = {}
+        self._test: dict[str, dict[str, None]] = {}
+        self._telemetry: dict[str, dict[str, None]] = {}
+        self._spec: set[str] = set()
+        self._orphan: set[str] = set()
+        self._uncovered: set[str] = set()
+        self.rebuild()
+
+    # ── Scanning ──────────────────────────────────────────────────
+
+    def rebuild(self) -> None:
+        """Forget everything and rescan the whole project."""
+        self._files.clear()
+        self._code.clear()
+        self._test.clear()
+        self._telemetry.clear()
+        for rel in self._walk(self.root):
+            self._rescan(rel)
+        self._spec = spec_inventory(self.root)
+        self._classify(None)
+
+    def _walk(self, top: Path):
+        """Relative paths of the scannable files under *top*."""
+        for dirpath_str, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not _should_skip_dir(d)]
+            dirpath = Path(dirpath_str)
+            for filename in filenames:
+                if Path(filename).suffix in _CODE_EXTENSIONS:
+                    yield str((dirpath / filename).relative_to(self.root))
+
+    def _scan(self, rel: str) -> _FileScan | None:
+        file_path = self.root / rel
+        telemetry: set[str] = set()
+        try:
+            st = file_path.stat()
+            text = file_path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return None
+        self.files_read += 1
+        if rel.endswith(".py"):
+            for line in text.splitlines():
+                telemetry.update(m.group(1) for m in _TELEMETRY_RE.finditer(line))
+        return _FileScan(
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            is_test=_is_test_file(rel),
+            tags=_extract_req_tags(file_path, self.root, text),
+            telemetry=telemetry,
+        )
+
+    def _rescan(self, rel: str) -> set[str]:
+        """Replace *rel*'s contribution; return the REQ keys it touched."""
+        touched: set[str] = set()
+        old = self._files.pop(rel, None)
+        if old is not None:
+            touched |= self._apply(rel, old, remove=True)
+        new = self._scan(rel)
+        if new is not None:
+            self._files[rel] = new
+            touched |= self._apply(rel, new, remove=False)
+        return touched
+
+    def _apply(self, rel: str, scan: _FileScan, remove: bool) -> set[str]:
+        touched: set[str] = set()
+        for tag in scan.tags:
+            is_test = tag.tag_type == "validates" or (tag.tag_type == "implements" and scan.is_test)
+            touched.add(tag.req_key)
+            _toggle(self._test if is_test else self._code, tag.req_key, rel, remove)
+        for req_key in scan.telemetry:
+            touched.add(req_key)
+            _toggle(self._telemetry, req_key, rel, remove)
+        return touched
+
+    # ── Incremental update ────────────────────────────────────────
+
+    def update(self, paths) -> None:
+        """Apply changes to *paths* (files or directories, absolute)."""
+        touched: set[str] = set()
+        spec_changed = False
+        for path in paths:
+            path = Path(path)
+            try:
+                rel_path = path.relative_to(self.root)
+            except ValueError:
+                continue
+            if not rel_path.parts:
+                self.rebuild()
+                return
+            if any(c == rel_path or rel_path in c.parents for c in _SPEC_CANDIDATES):
+                spec_changed = True
+            if any(_should_skip_dir(part) for part in rel_path.parts[:-1]):
+                continue
+            rel = str(rel_path)
+            if path.is_dir():
+                if not _should_skip_dir(path.name):
+                    touched |= self._update_dir(rel)
+            elif path.exists():
+                if path.suffix in _CODE_EXTENSIONS:
+                    touched |= self._rescan(rel)
             else:
-                code_files += 1
+                # Deleted: a file, or a directory with everything below it
+                prefix = rel + os.sep
+                for gone in [f for f in self._files if f == rel or f.startswith(prefix)]:
+                    touched |= self._rescan(gone)
+
+        if spec_changed:
+            self._spec = spec_inventory(self.root)
+            self._classify(None)
+        else:
+            self._classify(touched)
+
+    def _update_dir(self, rel: str) -> set[str]:
+        touched: set[str] = set()
+        prefix = rel + os.sep
+        present = set()
+        for found in self._walk(self.root / rel):
+            present.add(found)
+            known = self._files.get(found)
+            if known is not None:
+                try:
+                    st = (self.root / found).stat()
+                except OSError:
+                    continue
+                if (known.mtime_ns, known.size) == (st.st_mtime_ns, st.st_size):
+                    continue
+            touched |= self._rescan(found)
+        for gone in [f for f in self._files if f.startswith(prefix) and f not in present]:
+            touched |= self._rescan(gone)
+        return touched
+
+    def _classify(self, keys: set[str] | None) -> None:
+        """Re-decide orphan/uncovered membership for *keys* (None → all)."""
+        if not self._spec:
+            self._orphan, self._uncovered = set(), set()
+            return
+        if keys is None:
+            downstream = set(self._code) | set(self._test) | set(self._telemetry)
+            self._orphan = downstream - self._spec
+            self._uncovered = self._spec - downstream
+            return
+        for key in keys:
+            covered = key in self._code or key in self._test or key in self._telemetry
+            if covered and key not in self._spec:
+                self._orphan.add(key)
+            else:
+                self._orphan.discard(key)
+            if key in self._spec and not covered:
+                self._uncovered.add(key)
+            else:
+                self._uncovered.discard(key)
 
-            tags = _extract_req_tags(file_path, project_root)
-            for tag in tags:
-                report.all_req_keys.add(tag.req_key)
-                if tag.tag_type == "validates" or (tag.tag_type == "implements" and is_test):
+    # ── Report ────────────────────────────────────────────────────
+
+    def report(self) -> TraceabilityReport:
+        """A TraceabilityReport snapshot of the current state."""
+        report = TraceabilityReport()
+        for rel, scan in self._files.items():
+            if scan.is_test:
+                report.test_files_scanned += 1
+            else:
+                report.code_files_scanned += 1
+            for tag in scan.tags:
+                if tag.tag_type == "validates" or (tag.tag_type == "implements" and scan.is_test):
                     report.test_tags.append(tag)
-                    report.test_coverage.setdefault(tag.req_key, [])
-                    if tag.file_path not in report.test_coverage[tag.req_key]:
-                        report.test_coverage[tag.req_key].append(tag.file_path)
                 else:
                     report.code_tags.append(tag)
-                    report.code_coverage.setdefault(tag.req_key, [])
-                    if tag.file_path not in report.code_coverage[tag.req_key]:
-                        report.code_coverage[tag.req_key].append(tag.file_path)
-
-    report.code_files_scanned = code_files
-    report.test_files_scanned = test_files
-
-    # Telemetry and spec inventory
-    report.telemetry_coverage = telemetry_scanner(project_root)
-    report.spec_defined_keys = spec_inventory(project_root)
-    report.telemetry_files_scanned = len(
-        {f for files in report.telemetry_coverage.values() for f in files}
-    )
-
-    # Orphan and uncovered key detection
-    # Only meaningful when a spec inventory exists (backward compat — LINEAGE-001 AC-5)
-    if report.spec_defined_keys:
-        downstream = (
-            set(report.code_coverage)
-            | set(report.test_coverage)
-            | set(report.telemetry_coverage)
+        report.code_coverage = {k: list(files) for k, files in self._code.items()}
+        report.test_coverage = {k: list(files) for k, files in self._test.items()}
+        report.all_req_keys = set(self._code) | set(self._test)
+        report.telemetry_coverage = {k: sorted(files) for k, files in self._telemetry.items()}
+        report.telemetry_files_scanned = len(
+            {f for files in self._telemetry.values() for f in files}
         )
-        report.orphan_keys = downstream - report.spec_defined_keys
-        report.uncovered_keys = report.spec_defined_keys - downstream
-
-    return report
+        report.spec_defined_keys = set(self._spec)
+        report.orphan_keys = set(self._orphan)
+        report.uncovered_keys = set(self._uncovered)
+        return report
+
+
+def _toggle(coverage: dict[str, dict[str, None]], req_key: str, rel: str, remove: bool) -> None:
+    if not remove:
+        coverage.setdefault(req_key, {})[rel] = None
+        return
+    files = coverage.get(req_key)
+    if files is not None:
+        files.pop(rel, None)
+        if not files:
+            del coverage[req_key]
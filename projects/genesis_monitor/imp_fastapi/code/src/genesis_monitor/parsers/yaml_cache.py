@@ -0,0 +1,61 @@
+# Implements: REQ-F-PARSE-001, REQ-F-PARSE-002, REQ-F-PARSE-006
+"""Parse YAML files once per (path, mtime_ns, size).
+
+Every watcher-triggered refresh re-parses the same feature vectors, topology
+and constraints files; only the ones whose stat changed are parsed again.
+Uses libyaml's CSafeLoader when available. Results are copied out of the
+cache, so callers may mutate them. Files modified in the last two seconds
+are not cached (a same-size rewrite within one mtime tick would be missed).
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_MAX_ENTRIES = 2048
+_RACY_NS = 2_000_000_000
+
+_entries: dict[str, tuple[int, int, object]] = {}
+_lock = threading.Lock()
+stats = {"hits": 0, "misses": 0}
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def load_yaml(path: Path):
+    """Parsed contents of *path*. Raises OSError / yaml.YAMLError like yaml.safe_load."""
+    key = os.path.abspath(path)
+    with open(key, encoding="utf-8") as f:
+        st = os.fstat(f.fileno())
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                stats["hits"] += 1
+                return _copy(entry[2])
+            stats["misses"] += 1
+        data = yaml.load(f.read(), Loader=Loader)
+
+    if time.time_ns() - st.st_mtime_ns <= _RACY_NS:
+        return data
+    with _lock:
+        if len(_entries) >= _MAX_ENTRIES:
+            _entries.clear()
+        _entries[key] = (st.st_mtime_ns, st.st_size, data)
+    return _copy(data)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+        stats["hits"] = stats["misses"] = 0
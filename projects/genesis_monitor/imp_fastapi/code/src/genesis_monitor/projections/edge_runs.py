@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable
 
 from genesis_monitor.models.events import Event
 
@@ -70,73 +71,80 @@ class EdgeRun:
         return len(self.iterations)
 
 
-def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
-    """Group events into EdgeRun objects, sorted by started_at ascending.
-
-    Algorithm:
-    1. First pass: collect edge_started events → open a run bucket per (feature, edge).
-    2. Second pass: route iteration_completed / evaluator_detail / edge_converged /
-       command_error / transaction_aborted events into open buckets.
-    3. Close buckets on terminal events.
-    4. Any leftover iteration events not preceded by edge_started get a synthesised run.
+def _get_feature_edge(ev: Event) -> tuple[str, str]:
+    d = ev.data
+    feature = (
+        ev.data.get("feature")
+        or d.get("run", {}).get("facets", {}).get("sdlc:req_keys", {}).get("feature_id", "")
+        or d.get("run", {}).get("facets", {}).get("sdlc_req_keys", {}).get("feature_id", "")
+        or ""
+    )
+    edge = (
+        ev.data.get("edge")
+        or d.get("run", {}).get("facets", {}).get("sdlc:req_keys", {}).get("edge", "")
+        or d.get("job", {}).get("name", "")
+        or ""
+    )
+    # Fallback: nested data dict (flat format)
+    if not feature:
+        feature = d.get("data", {}).get("feature", "") if isinstance(d.get("data"), dict) else ""
+    if not edge:
+        edge = d.get("data", {}).get("edge", "") if isinstance(d.get("data"), dict) else ""
+    return feature, edge
+
+
+def _get_run_id(ev: Event) -> str:
+    return (
+        ev.data.get("run", {}).get("runId", "")
+        or ev.data.get("run_id", "")
+        or ""
+    )
+
+
+def _extract_artifacts(ev: Event) -> list[str]:
+    """Pull file paths from OL outputs[] and _metadata.original_data.file_path."""
+    paths: list[str] = []
+    outputs = ev.data.get("outputs", [])
+    for out in outputs:
+        if isinstance(out, dict):
+            name = out.get("name", "")
+            if name.startswith("file://"):
+                paths.append(name[7:])  # strip file://
+            elif name:
+                paths.append(name)
+    fp = (
+        ev.data.get("_metadata", {}).get("original_data", {}).get("file_path", "")
+        or ev.data.get("asset", "")
+    )
+    if fp and fp not in paths:
+        paths.append(fp)
+    return paths
+
+
+class EdgeRunBuilder:
+    """Streaming form of build_edge_runs(): feed events in chronological order.
+
+    Keeps the open-run map as state, so events appended later are routed into
+    the runs they continue.  ``on_open`` is called with each new EdgeRun and
+    ``on_close`` with each run as it leaves ``in_progress``.
     """
-    # Key: (feature, edge) → list of open EdgeRun (may have multiple sequential runs on same edge)
-    open_runs: dict[tuple[str, str], list[EdgeRun]] = {}
-    completed: list[EdgeRun] = []
-
-    def _get_feature_edge(ev: Event) -> tuple[str, str]:
-        d = ev.data
-        feature = (
-            ev.data.get("feature")
-            or d.get("run", {}).get("facets", {}).get("sdlc:req_keys", {}).get("feature_id", "")
-            or d.get("run", {}).get("facets", {}).get("sdlc_req_keys", {}).get("feature_id", "")
-            or ""
-        )
-        edge = (
-            ev.data.get("edge")
-            or d.get("run", {}).get("facets", {}).get("sdlc:req_keys", {}).get("edge", "")
-            or d.get("job", {}).get("name", "")
-            or ""
-        )
-        # Fallback: nested data dict (flat format)
-        if not feature:
-            feature = d.get("data", {}).get("feature", "") if isinstance(d.get("data"), dict) else ""
-        if not edge:
-            edge = d.get("data", {}).get("edge", "") if isinstance(d.get("data"), dict) else ""
-        return feature, edge
-
-    def _get_run_id(ev: Event) -> str:
-        return (
-            ev.data.get("run", {}).get("runId", "")
-            or ev.data.get("run_id", "")
-            or ""
-        )
-
-    def _extract_artifacts(ev: Event) -> list[str]:
-        """Pull file paths from OL outputs[] and _metadata.original_data.file_path."""
-        paths: list[str] = []
-        outputs = ev.data.get("outputs", [])
-        for out in outputs:
-            if isinstance(out, dict):
-                name = out.get("name", "")
-                if name.startswith("file://"):
-                    paths.append(name[7:])  # strip file://
-                elif name:
-                    paths.append(name)
-        fp = (
-            ev.data.get("_metadata", {}).get("original_data", {}).get("file_path", "")
-            or ev.data.get("asset", "")
-        )
-        if fp and fp not in paths:
-            paths.append(fp)
-        return paths
 
-    def _active_run(key: tuple[str, str]) -> EdgeRun | None:
+    def __init__(
+        self,
+        on_open: Callable[[EdgeRun], None] | None = None,
+        on_close: Callable[[EdgeRun], None] | None = None,
+    ) -> None:
+        # Key: (feature, edge) → list of open EdgeRun (may have multiple sequential runs on same edge)
+        self.open_runs: dict[tuple[str, str], list[EdgeRun]] = {}
+        self._on_open = on_open
+        self._on_close = on_close
+
+    def _active_run(self, key: tuple[str, str]) -> EdgeRun | None:
         """Return the most recently opened (still open) run for this (feature, edge) key."""
-        runs = open_runs.get(key, [])
+        runs = self.open_runs.get(key, [])
         return runs[-1] if runs else None
 
-    def _open_run(key: tuple[str, str], ev: Event, run_id: str) -> EdgeRun:
+    def _open_run(self, key: tuple[str, str], ev: Event, run_id: str) -> EdgeRun:
         run = EdgeRun(
             run_id=run_id or f"{key[0]}:{key[1]}:{ev.timestamp.isoformat()}",
             feature=key[0],
@@ -147,11 +155,13 @@ def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
             status="in_progress",
             convergence_type="",
         )
-        open_runs.setdefault(key, []).append(run)
+        self.open_runs.setdefault(key, []).append(run)
+        if self._on_open is not None:
+            self._on_open(run)
         return run
 
-    def _close_run(key: tuple[str, str], ev: Event, status: str, conv_type: str = "") -> None:
-        run = _active_run(key)
+    def _close_run(self, key: tuple[str, str], ev: Event, status: str, conv_type: str = "") -> None:
+        run = self._active_run(key)
         if run is None:
             return
         run.raw_events.append(ev)
@@ -169,15 +179,14 @@ def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
                     run.executor = past.executor
                     run.emission = past.emission
                     break
-        open_runs[key].pop()
-        if not open_runs[key]:
-            del open_runs[key]
-        completed.append(run)
-
-    # Sort events chronologically before processing
-    sorted_events = sorted(events, key=lambda e: e.timestamp)
-
-    for ev in sorted_events:
+        self.open_runs[key].pop()
+        if not self.open_runs[key]:
+            del self.open_runs[key]
+        if self._on_close is not None:
+            self._on_close(run)
+
+    def feed(self, ev: Event) -> None:
+        """Route one event into an open run, a new run, or nowhere."""
         et = ev.event_type
         feature, edge = _get_feature_edge(ev)
         key = (feature, edge)
@@ -185,15 +194,15 @@ def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
 
         if et == "edge_started":
             if not feature and not edge:
-                continue
-            run = _open_run(key, ev, run_id)
+                return
+            run = self._open_run(key, ev, run_id)
             run.raw_events.append(ev)
 
         elif et in ("iteration_completed", "iteration_started", "iteration_failed"):
-            run = _active_run(key)
+            run = self._active_run(key)
             if run is None and (feature or edge):
                 # iteration without edge_started — synthesise a run
-                run = _open_run(key, ev, run_id)
+                run = self._open_run(key, ev, run_id)
 
             if run is not None:
                 run.raw_events.append(ev)
@@ -231,10 +240,10 @@ def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
                     # Auto-close converged runs (some flows emit converged status on iteration event)
                     if status_str == "converged":
                         conv_type = d.get("convergence_type", "standard")
-                        _close_run(key, ev, "converged", conv_type)
+                        self._close_run(key, ev, "converged", conv_type)
 
         elif et == "evaluator_detail":
-            run = _active_run(key)
+            run = self._active_run(key)
             if run is not None:
                 detail = {
                     "check_name": ev.data.get("data", {}).get("check_name", "") if isinstance(ev.data.get("data"), dict) else "",
@@ -256,16 +265,34 @@ def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
                 conv_type = d["data"].get("convergence_type", "standard")
             elif "convergence_type" in d:
                 conv_type = d.get("convergence_type", "standard")
-            _close_run(key, ev, "converged", conv_type or "standard")
+            self._close_run(key, ev, "converged", conv_type or "standard")
 
         elif et in ("command_error", "iteration_failed"):
-            _close_run(key, ev, "failed")
+            self._close_run(key, ev, "failed")
 
         elif et == "transaction_aborted":
-            _close_run(key, ev, "aborted")
+            self._close_run(key, ev, "aborted")
+
+
+def build_edge_runs(events: list[Event]) -> list[EdgeRun]:
+    """Group events into EdgeRun objects, sorted by started_at ascending.
+
+    Algorithm:
+    1. First pass: collect edge_started events → open a run bucket per (feature, edge).
+    2. Second pass: route iteration_completed / evaluator_detail / edge_converged /
+       command_error / transaction_aborted events into open buckets.
+    3. Close buckets on terminal events.
+    4. Any leftover iteration events not preceded by edge_started get a synthesised run.
+    """
+    completed: list[EdgeRun] = []
+    builder = EdgeRunBuilder(on_close=completed.append)
+
+    # Sort events chronologically before processing
+    for ev in sorted(events, key=lambda e: e.timestamp):
+        builder.feed(ev)
 
     # Collect still-open runs as in_progress
-    for runs in open_runs.values():
+    for runs in builder.open_runs.values():
         completed.extend(runs)
 
     # Sort chronologically
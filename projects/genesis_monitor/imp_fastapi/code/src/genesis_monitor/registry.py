@@ -19,7 +19,7 @@ from genesis_monitor.parsers import (
     parse_status,
     parse_tasks,
 )
-from genesis_monitor.parsers.traceability import parse_traceability
+from genesis_monitor.parsers.traceability import TraceabilityIndex
 from genesis_monitor.index import EventIndex
 
 
@@ -37,9 +37,16 @@ class ProjectRegistry:
     def __init__(self) -> None:
         self._projects: dict[str, Project] = {}
         self._lock = threading.Lock()
+        # Per-project traceability state, updated from watcher-reported paths
+        self._traceability: dict[str, TraceabilityIndex] = {}
+        self._changed_paths: dict[str, set[Path]] = {}
 
-    def add_project(self, path: Path) -> Project:
-        """Add a project by its filesystem path. Parses all workspace data."""
+    def add_project(self, path: Path, changed_paths: set[Path] | None = None) -> Project:
+        """Add a project by its filesystem path. Parses all workspace data.
+
+        With *changed_paths*, the traceability report is updated from the
+        project's existing index by rescanning only those paths.
+        """
         project_id = _slugify(path.name)
         workspace = path / ".ai-workspace"
 
@@ -61,7 +68,7 @@ class ProjectRegistry:
             constraints=parse_constraints(workspace),
             has_bootloader=detect_bootloader(path),
             last_updated=datetime.now(),
-            traceability=parse_traceability(path),
+            traceability=self._traceability_report(project_id, path, changed_paths),
             index=EventIndex.build(events),  # ADR-004: O(n) once at load
             adrs=parse_adrs(path),
             reviews=parse_reviews(workspace),
@@ -72,11 +79,25 @@ class ProjectRegistry:
 
         return project
 
+    def _traceability_report(self, project_id: str, path: Path, changed_paths: set[Path] | None):
+        with self._lock:
+            index = self._traceability.get(project_id)
+        if index is None or index.root != path or changed_paths is None:
+            index = TraceabilityIndex(path)
+            with self._lock:
+                self._traceability[project_id] = index
+            return index.report()
+        with index.lock:
+            index.update(changed_paths)
+            return index.report()
+
     def remove_project(self, path: Path) -> None:
         """Remove a project by path."""
         project_id = _slugify(path.name)
         with self._lock:
             self._projects.pop(project_id, None)
+            self._traceability.pop(project_id, None)
+            self._changed_paths.pop(project_id, None)
 
     def get_project(self, project_id: str) -> Project | None:
         """Get a project by its slug ID."""
@@ -88,15 +109,25 @@ class ProjectRegistry:
         with self._lock:
             return sorted(self._projects.values(), key=lambda p: p.name.lower())
 
+    def note_changed_paths(self, project_id: str, paths) -> None:
+        """Record paths changed under a project, consumed by the next refresh."""
+        with self._lock:
+            self._changed_paths.setdefault(project_id, set()).update(Path(p) for p in paths)
+
     def refresh_project(self, project_id: str) -> Project | None:
-        """Re-parse all data for an existing project."""
+        """Re-parse all data for an existing project.
+
+        If the changed paths were noted since the last refresh, only those
+        are rescanned for traceability tags; otherwise the tree is rewalked.
+        """
         with self._lock:
             existing = self._projects.get(project_id)
+            changed = self._changed_paths.pop(project_id, None)
 
         if not existing:
             return None
 
-        return self.add_project(existing.path)
+        return self.add_project(existing.path, changed)
 
     def project_id_for_path(self, path: Path) -> str | None:
         """Find the project_id that contains the given path."""
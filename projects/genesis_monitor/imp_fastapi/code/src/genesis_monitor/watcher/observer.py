@@ -62,6 +62,12 @@ class _RootHandler(FileSystemEventHandler):
         project_id = self._find_project(affected_path)
         if project_id is None:
             return
+        # Changed paths let the refresh rescan only what moved (traceability)
+        changed = [affected_path]
+        dest_path = getattr(event, "dest_path", None)
+        if isinstance(dest_path, str) and dest_path:
+            changed.append(Path(dest_path))
+        self._registry.note_changed_paths(project_id, changed)
         with self._lock:
             existing = self._timers.get(project_id)
             if existing:
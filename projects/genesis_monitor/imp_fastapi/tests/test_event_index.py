@@ -11,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import json
+import random
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -454,6 +455,113 @@ class TestEventIndexAppend:
         assert idx.event_count == 2
 
 
+    @staticmethod
+    def _stream() -> list[Event]:
+        """Interleaved runs covering every status transition."""
+        return [
+            _event("edge_started",   "2026-03-01T10:00:00Z", feature="REQ-F-001"),
+            _event("edge_started",   "2026-03-01T10:01:00Z", feature="REQ-F-002"),
+            _iter_event("2026-03-01T10:02:00Z", 1, 3, feature="REQ-F-001"),
+            _event("edge_started",   "2026-03-01T10:03:00Z", feature="REQ-F-003"),
+            _event("command_error",  "2026-03-01T10:04:00Z", feature="REQ-F-002"),
+            _iter_event("2026-03-01T10:05:00Z", 2, 0, status="converged", feature="REQ-F-001"),
+            _iter_event("2026-03-01T10:06:00Z", 1, 2, feature="REQ-F-004"),
+            _event("transaction_aborted", "2026-03-01T10:07:00Z", feature="REQ-F-003"),
+            _event("edge_started",   "2026-03-02T09:00:00Z", feature="REQ-F-001"),
+            _event("edge_converged", "2026-03-02T09:30:00Z", feature="REQ-F-001"),
+        ]
+
+    @staticmethod
+    def _shape(idx: EventIndex) -> dict:
+        def ids(runs):
+            return [(r.run_id, r.status, len(r.raw_events), r.iteration_count) for r in runs]
+
+        return {
+            "runs": ids(idx.timeline()),
+            "status": {k: ids(v) for k, v in idx._by_status.items() if v},
+            "feature": {k: ids(v) for k, v in idx._by_feature.items()},
+            "day": {k: ids(v) for k, v in idx._by_day.items()},
+            "events": idx.event_count,
+        }
+
+    def test_incremental_matches_full_build(self):
+        """Appending in any number of batches equals one build over all events."""
+        events = self._stream()
+        full = EventIndex.build(events)
+        assert [(r.run_id, r.status) for r in full.timeline()] == [
+            (r.run_id, r.status) for r in build_edge_runs(events)
+        ]
+        for split in range(len(events) + 1):
+            idx = EventIndex.build(events[:split])
+            for ev in events[split:]:
+                idx.append([ev])
+            assert self._shape(idx) == self._shape(full)
+
+    def test_append_routes_into_existing_open_run(self):
+        """An appended iteration extends the open EdgeRun object in place."""
+        idx = EventIndex.build([_event("edge_started", "2026-03-01T10:00:00Z")])
+        [run] = idx.timeline()
+        idx.append([_iter_event("2026-03-01T10:01:00Z", 1, 4)])
+        assert idx.timeline() == [run]
+        assert run.iteration_count == 1
+        idx.append([_iter_event("2026-03-01T10:02:00Z", 2, 0, status="converged")])
+        assert run.status == "converged"
+        assert idx.timeline(status="converged") == [run]
+        assert idx.in_progress_count == 0
+
+    def test_out_of_order_append_replays(self):
+        """A batch older than the indexed stream still yields the full-build result."""
+        events = self._stream()
+        idx = EventIndex.build(events[5:])
+        idx.append(events[:5])
+        assert self._shape(idx) == self._shape(EventIndex.build(events[5:] + events[:5]))
+
+
+    def test_tied_start_times_match_full_build(self):
+        """Runs sharing a started_at keep build_edge_runs() order (closed, then open)."""
+        rng = random.Random(7)
+        stamps = ["2026-03-01T23:59:00Z", "2026-03-02T00:00:00Z", "2026-03-02T00:01:00Z"]
+        for _ in range(60):
+            events = []
+            for ts in stamps:
+                for _ in range(rng.randint(3, 12)):
+                    kind = rng.choice(["edge_started", "edge_started", "iter", "done",
+                                       "edge_converged", "command_error", "transaction_aborted"])
+                    where = {"feature": rng.choice(["REQ-F-001", "REQ-F-002", "REQ-F-003"]),
+                             "edge": rng.choice(["design→code", "code↔unit_tests"])}
+                    if kind == "iter":
+                        events.append(_iter_event(ts, 1, 2, **where))
+                    elif kind == "done":
+                        events.append(_iter_event(ts, 2, 0, status="converged", **where))
+                    else:
+                        events.append(_event(kind, ts, **where))
+            position = {id(ev): n for n, ev in enumerate(events)}
+
+            def ids(runs):
+                return [(position[id(r.raw_events[0])], r.status, len(r.raw_events)) for r in runs]
+
+            want = build_edge_runs(events)
+            expected = {"runs": ids(want), "status": {}, "feature": {}, "edge": {}, "day": {}}
+            for run in want:
+                for name, key in (("status", run.status), ("feature", run.feature),
+                                  ("edge", run.edge), ("day", run.started_at.date())):
+                    expected[name].setdefault(key, []).extend(ids([run]))
+
+            idx = EventIndex()
+            start = 0
+            while start < len(events):
+                stop = start + rng.randint(1, 6)
+                idx.append(events[start:stop])
+                start = stop
+            got = {
+                "runs": ids(idx._runs),
+                "status": {k: ids(v) for k, v in idx._by_status.items() if v},
+                "feature": {k: ids(v) for k, v in idx._by_feature.items()},
+                "edge": {k: ids(v) for k, v in idx._by_edge.items()},
+                "day": {k: ids(v) for k, v in idx._by_day.items()},
+            }
+            assert got == expected
+
 # ── _parse_flat ──────────────────────────────────────────────────────────────
 
 class TestParseFlatEvents:
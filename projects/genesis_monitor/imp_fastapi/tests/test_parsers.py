@@ -149,6 +149,38 @@ class TestParseEvents:
         result = parse_events(tmp_path)
         assert len(result) == 2
 
+    def _segmented(self, tmp_path: Path) -> Path:
+        """Sealed segment (Feb 1) + active events.jsonl (Feb 3), engine layout."""
+        seg_dir = tmp_path / "events" / "segments"
+        seg_dir.mkdir(parents=True)
+        sealed = json.dumps(make_ol2_event("edge_started", timestamp="2026-02-01T00:00:00Z"))
+        (seg_dir / "000001.jsonl").write_text(sealed + "\n")
+        (seg_dir / "000001.index.json").write_text(json.dumps({"first_ts": "2026-02-01T00:00:00Z"}))
+        (seg_dir / "manifest.json").write_text(json.dumps({"version": 1, "segments": ["000001.jsonl"]}))
+        active = json.dumps(make_ol2_event("edge_converged", timestamp="2026-02-03T00:00:00Z"))
+        (tmp_path / "events" / "events.jsonl").write_text(active + "\n")
+        return tmp_path
+
+    def test_parse_segmented_log_in_order(self, tmp_path: Path):
+        result = parse_events(self._segmented(tmp_path))
+        assert [e.event_type for e in result] == ["edge_started", "edge_converged"]
+
+    def test_parse_until_filters_events(self, tmp_path: Path):
+        from datetime import datetime, timezone
+
+        result = parse_events(self._segmented(tmp_path), until=datetime(2026, 2, 2, tzinfo=timezone.utc))
+        assert [e.event_type for e in result] == ["edge_started"]
+
+    def test_parse_until_skips_later_segments(self, tmp_path: Path):
+        from datetime import datetime, timezone
+
+        workspace = self._segmented(tmp_path)
+        # Sidecar claims the segment starts after *until* → it is never read
+        index = workspace / "events" / "segments" / "000001.index.json"
+        index.write_text(json.dumps({"first_ts": "2026-03-01T00:00:00Z"}))
+        result = parse_events(workspace, until=datetime(2026, 2, 2, tzinfo=timezone.utc))
+        assert result == []
+
 
 # ── Tasks parser ─────────────────────────────────────────────────
 
@@ -212,3 +244,35 @@ class TestParseConstraints:
     def test_parse_missing_file(self, tmp_path: Path):
         result = parse_constraints(tmp_path)
         assert result is None
+
+
+# ── YAML parse cache ─────────────────────────────────────────────
+
+
+class TestYamlCache:
+    def _aged(self, path: Path, text: str) -> Path:
+        import os
+        import time
+
+        path.write_text(text)
+        old = time.time() - 60
+        os.utime(path, (old, old))
+        return path
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path):
+        from genesis_monitor.parsers import yaml_cache
+
+        yaml_cache.clear()
+        path = self._aged(tmp_path / "a.yml", "status: pending\n")
+        first = yaml_cache.load_yaml(path)
+        first["status"] = "mutated"
+        assert yaml_cache.load_yaml(path) == {"status": "pending"}
+        assert yaml_cache.stats == {"hits": 1, "misses": 1}
+
+    def test_rewrite_invalidates(self, tmp_path: Path):
+        from genesis_monitor.parsers import yaml_cache
+
+        path = self._aged(tmp_path / "a.yml", "status: pending\n")
+        yaml_cache.load_yaml(path)
+        self._aged(path, "status: converged\n")
+        assert yaml_cache.load_yaml(path) == {"status": "converged"}
@@ -44,6 +44,15 @@ class TestProjectRegistry:
         assert refreshed is not None
         assert refreshed.project_id == "test-project"
 
+    def test_refresh_applies_noted_paths_to_traceability(self, tmp_workspace: Path):
+        reg = ProjectRegistry()
+        reg.add_project(tmp_workspace)
+        code = tmp_workspace / "noted.py"
+        code.write_text("# Implements: REQ-F-NOTED-001\n")
+        reg.note_changed_paths("test-project", [code])
+        refreshed = reg.refresh_project("test-project")
+        assert refreshed.traceability.code_coverage["REQ-F-NOTED-001"] == ["noted.py"]
+
     def test_refresh_nonexistent(self):
         reg = ProjectRegistry()
         assert reg.refresh_project("nonexistent") is None
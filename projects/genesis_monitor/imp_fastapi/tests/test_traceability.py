@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from genesis_monitor.parsers.traceability import (
+    TraceabilityIndex,
     TraceabilityReport,
     parse_traceability,
     spec_inventory,
@@ -282,6 +283,104 @@ class TestParseTraceabilityIntegration:
         assert report.uncovered_keys == set()
 
 
+# ── TraceabilityIndex incremental updates ────────────────────────
+
+
+def _same(index: TraceabilityIndex, root: Path) -> None:
+    """The incrementally maintained report equals a fresh full scan."""
+    got, want = index.report(), parse_traceability(root)
+    assert {k: sorted(v) for k, v in got.code_coverage.items()} == {
+        k: sorted(v) for k, v in want.code_coverage.items()
+    }
+    assert {k: sorted(v) for k, v in got.test_coverage.items()} == {
+        k: sorted(v) for k, v in want.test_coverage.items()
+    }
+    assert got.telemetry_coverage == want.telemetry_coverage
+    assert got.all_req_keys == want.all_req_keys
+    assert (got.code_files_scanned, got.test_files_scanned) == (
+        want.code_files_scanned, want.test_files_scanned,
+    )
+    assert got.telemetry_files_scanned == want.telemetry_files_scanned
+    assert got.spec_defined_keys == want.spec_defined_keys
+    assert got.orphan_keys == want.orphan_keys
+    assert got.uncovered_keys == want.uncovered_keys
+
+
+class TestTraceabilityIndex:
+    def test_initial_report_matches_full_scan(self, full_project: Path):
+        _same(TraceabilityIndex(full_project), full_project)
+
+    def test_changed_file_only_rescanned(self, full_project: Path):
+        index = TraceabilityIndex(full_project)
+        before = index.files_read
+        code = full_project / "src" / "auth.py"
+        code.write_text("# Implements: REQ-F-AUTH-002\n")
+        index.update([code])
+        assert index.files_read == before + 1
+        _same(index, full_project)
+        assert "REQ-F-AUTH-002" not in index.report().uncovered_keys
+
+    def test_each_file_read_once_per_scan(self, full_project: Path, monkeypatch):
+        reads: list[str] = []
+        real = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(str(self))
+            return real(self, *args, **kwargs)
+
+        index = TraceabilityIndex(full_project)
+        code = full_project / "src" / "auth.py"
+        monkeypatch.setattr(Path, "read_text", counting)
+        index.update([code])
+        assert reads == [str(code)]
+
+    def test_new_and_deleted_files(self, full_project: Path):
+        index = TraceabilityIndex(full_project)
+        extra = full_project / "src" / "extra.py"
+        extra.write_text("# Implements: REQ-F-NEW-001\n")
+        index.update([extra])
+        assert "REQ-F-NEW-001" in index.report().orphan_keys
+        extra.unlink()
+        index.update([extra])
+        assert "REQ-F-NEW-001" not in index.report().all_req_keys
+        _same(index, full_project)
+
+    def test_deleted_and_created_directories(self, full_project: Path):
+        index = TraceabilityIndex(full_project)
+        pkg = full_project / "pkg"
+        (pkg / "sub").mkdir(parents=True)
+        (pkg / "sub" / "mod.py").write_text('log(req="REQ-F-AUTH-002")\n')
+        index.update([pkg])
+        assert index.report().telemetry_coverage["REQ-F-AUTH-002"] == ["pkg/sub/mod.py"]
+        (pkg / "sub" / "mod.py").unlink()
+        (pkg / "sub").rmdir()
+        pkg.rmdir()
+        index.update([pkg])
+        _same(index, full_project)
+
+    def test_directory_update_skips_unchanged_files(self, full_project: Path):
+        index = TraceabilityIndex(full_project)
+        before = index.files_read
+        index.update([full_project / "src"])
+        assert index.files_read == before
+
+    def test_spec_change_reclassifies(self, full_project: Path):
+        index = TraceabilityIndex(full_project)
+        spec = full_project / ".ai-workspace" / "spec" / "REQUIREMENTS.md"
+        spec.write_text(spec.read_text() + "\n### REQ-F-ORPHAN-CODE-001\n")
+        index.update([spec])
+        assert "REQ-F-ORPHAN-CODE-001" not in index.report().orphan_keys
+        _same(index, full_project)
+
+    def test_skipped_and_foreign_paths_ignored(self, full_project: Path, tmp_path: Path):
+        index = TraceabilityIndex(full_project)
+        cache = full_project / "__pycache__"
+        cache.mkdir(exist_ok=True)
+        (cache / "x.py").write_text("# Implements: REQ-F-CACHE-001\n")
+        index.update([cache / "x.py", tmp_path.parent / "elsewhere.py"])
+        assert "REQ-F-CACHE-001" not in index.report().all_req_keys
+
+
 # ── build_traceability_view() ─────────────────────────────────────
 
 
@@ -1,7 +1,8 @@
 """Gap Analysis Engine — traceability layer scanner for Genesis projects.
 
 Computes three-layer gap coverage between spec REQ keys and their annotations
-in code, tests, and telemetry.  All operations are pure read-only
+in code, tests, and telemetry.  The project tree is walked once and each text
+file read once for all three tag layers.  All operations are pure read-only
 (REQ-NFR-ARCH-002).
 """
 
@@ -10,12 +11,15 @@ in code, tests, and telemetry.  All operations are pure read-only
 # Implements: REQ-F-GAP-003
 # Implements: REQ-F-GAP-004
 # Implements: REQ-F-API-003
+# Implements: REQ-NFR-PERF-002
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,28 +31,34 @@ _REQ_KEY_RE = re.compile(r"REQ-[A-Z][A-Z-]*[A-Z]-\d+")
 _CODE_TAG_RE = re.compile(r"#\s*Implements:\s*(REQ-[A-Z][A-Z-]*[A-Z]-\d+)")
 _TEST_TAG_RE = re.compile(r"#\s*Validates:\s*(REQ-[A-Z][A-Z-]*[A-Z]-\d+)")
 _TELEM_TAG_RE = re.compile(r'req=["\'](REQ-[A-Z][A-Z-]*[A-Z]-\d+)')
+# All three tag forms in one pass: group 1 = Implements key, 2 = Validates
+# key, 3 = telemetry key.  The forms cannot overlap, so one scan finds
+# exactly the matches of the three separate patterns.
+_ANY_TAG_RE = re.compile(
+    r"#\s*(?:Implements:\s*(REQ-[A-Z][A-Z-]*[A-Z]-\d+)|Validates:\s*(REQ-[A-Z][A-Z-]*[A-Z]-\d+))"
+    r'|req=["\'](REQ-[A-Z][A-Z-]*[A-Z]-\d+)'
+)
 
 # ---------------------------------------------------------------------------
 # Directory pruning constants
 # ---------------------------------------------------------------------------
 
 _PRUNE: frozenset[str] = frozenset({".git", "node_modules", "__pycache__", ".venv"})
-_EXCLUDE_CODE: frozenset[str] = _PRUNE | frozenset({"tests", "test"})
 _TEXT_SUFFIXES: frozenset[str] = frozenset(
     {".py", ".md", ".yml", ".yaml", ".txt", ".js", ".ts", ".jsx", ".tsx", ".json"}
 )
 _TEST_DIR_NAMES: frozenset[str] = frozenset({"tests", "test"})
 
+# Trees with at least this many text files are read on a thread pool
+_PARALLEL_MIN_FILES = 512
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _is_text_file(path: Path) -> bool:
-    return path.suffix in _TEXT_SUFFIXES
-
-
 def _read_text(path: Path) -> str:
     try:
         return path.read_text(errors="replace")
@@ -56,17 +66,144 @@ def _read_text(path: Path) -> str:
         return ""
 
 
-def _walk_files(root: Path, prune: frozenset[str]) -> list[Path]:
-    """Walk *root* recursively, pruning *prune* directories, returning all files."""
-    results: list[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in prune]
-        current = Path(dirpath)
-        for fname in filenames:
-            results.append(current / fname)
+@dataclass
+class SourceFile:
+    """A text file the gap analysis reads and the layers it counts towards.
+
+    Attributes:
+        path: Absolute path of the file.
+        rel: Path relative to the project root.
+        is_code: True if no directory between the root and the file is a test directory.
+        is_test: True if the file lives under a test directory or is named like a test module.
+    """
+
+    path: Path
+    rel: str
+    is_code: bool
+    is_test: bool
+
+
+@dataclass
+class TagScan:
+    """REQ tags found by one walk of a project tree.
+
+    Each attribute maps a REQ key to the relative paths of the files carrying
+    that tag, in walk order and without duplicates.
+
+    Attributes:
+        code: ``# Implements: REQ-*`` tags outside test directories.
+        test: ``# Validates: REQ-*`` tags in test files.
+        telemetry: ``req="REQ-*"`` tags in any text file.
+    """
+
+    code: dict[str, list[str]] = field(default_factory=dict)
+    test: dict[str, list[str]] = field(default_factory=dict)
+    telemetry: dict[str, list[str]] = field(default_factory=dict)
+
+
+def source_files(project_path: Path) -> list[SourceFile]:
+    """Walk *project_path* once, returning every text file in walk order.
+
+    A file is code if no directory between *project_path* and the file is a
+    test directory, and a test file if any component of its path is a test
+    directory or its name looks like a test module.
+    """
+    root_in_test_dir = bool(set(project_path.parts) & _TEST_DIR_NAMES)
+    results: list[SourceFile] = []
+    # Stack of (directory, inside a tests/ or test/ directory below the root)
+    stack: list[tuple[str, bool]] = [(str(project_path), False)]
+    while stack:
+        dirpath, below_test_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: list[tuple[str, bool]] = []
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk: symlinked directories are not descended into
+                if entry.name not in _PRUNE and not entry.is_symlink():
+                    subdirs.append((entry.path, below_test_dir or entry.name in _TEST_DIR_NAMES))
+                continue
+            name = entry.name
+            if os.path.splitext(name)[1] not in _TEXT_SUFFIXES:
+                continue
+            path = Path(entry.path)
+            results.append(
+                SourceFile(
+                    path=path,
+                    rel=str(path.relative_to(project_path)),
+                    is_code=not below_test_dir,
+                    is_test=(
+                        below_test_dir
+                        or root_in_test_dir
+                        or name.startswith("test_")
+                        or name.endswith("_test.py")
+                    ),
+                )
+            )
+        # Depth-first in directory order, as os.walk(topdown=True) visits them
+        stack.extend(reversed(subdirs))
     return results
 
 
+def _scan_file(candidate: SourceFile) -> tuple[list[str], list[str], list[str]]:
+    """Read one file and return its (code, test, telemetry) keys, de-duplicated."""
+    text = _read_text(candidate.path)
+    if "REQ-" not in text:
+        return [], [], []
+    code: dict[str, None] = {}
+    test: dict[str, None] = {}
+    telemetry: dict[str, None] = {}
+    for impl, valid, telem in _ANY_TAG_RE.findall(text):
+        if impl:
+            code[impl] = None
+        elif valid:
+            test[valid] = None
+        else:
+            telemetry[telem] = None
+    return (
+        list(code) if candidate.is_code else [],
+        list(test) if candidate.is_test else [],
+        list(telemetry),
+    )
+
+
+def scan_req_tags(project_path: Path, max_workers: int | None = None) -> TagScan:
+    """Collect code, test and telemetry REQ tags in a single pass over the tree.
+
+    Every text file is read once and all three tag patterns are applied in
+    the same scan.  Large trees are read on a thread pool; results are merged
+    in walk order, so the output does not depend on scheduling.
+
+    Args:
+        project_path: Root of the Genesis project.
+        max_workers: Thread pool size; ``1`` forces a sequential scan.
+            Defaults to ``min(8, cpu_count)`` for trees of at least
+            ``_PARALLEL_MIN_FILES`` text files.
+
+    Returns:
+        A :class:`TagScan` with one REQ key → files mapping per layer.
+    """
+    candidates = source_files(project_path)
+    workers = _MAX_WORKERS if max_workers is None else max_workers
+    if workers > 1 and len(candidates) >= _PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            per_file = list(pool.map(_scan_file, candidates, chunksize=32))
+    else:
+        per_file = [_scan_file(c) for c in candidates]
+
+    scan = TagScan()
+    for candidate, layers in zip(candidates, per_file):
+        for result, keys in zip((scan.code, scan.test, scan.telemetry), layers):
+            # Keys are unique per file and each file is visited once, so the
+            # path lists need no membership checks
+            for key in keys:
+                result.setdefault(key, []).append(candidate.rel)
+    return scan
+
+
 # ---------------------------------------------------------------------------
 # Public extraction functions
 # ---------------------------------------------------------------------------
@@ -101,18 +238,7 @@ def extract_code_req_keys(project_path: Path) -> dict[str, list[str]]:
     Returns:
         Dict mapping each found REQ key to a list of relative file paths.
     """
-    result: dict[str, list[str]] = {}
-    for fpath in _walk_files(project_path, _EXCLUDE_CODE):
-        if not _is_text_file(fpath):
-            continue
-        text = _read_text(fpath)
-        for match in _CODE_TAG_RE.finditer(text):
-            key = match.group(1)
-            rel = str(fpath.relative_to(project_path))
-            result.setdefault(key, [])
-            if rel not in result[key]:
-                result[key].append(rel)
-    return result
+    return scan_req_tags(project_path).code
 
 
 def extract_test_req_keys(project_path: Path) -> dict[str, list[str]]:
@@ -127,25 +253,7 @@ def extract_test_req_keys(project_path: Path) -> dict[str, list[str]]:
     Returns:
         Dict mapping each found REQ key to a list of relative file paths.
     """
-    result: dict[str, list[str]] = {}
-    for fpath in _walk_files(project_path, _PRUNE):
-        if not _is_text_file(fpath):
-            continue
-        # Determine whether this looks like a test file
-        parts = set(fpath.parts)
-        in_test_dir = bool(parts & _TEST_DIR_NAMES)
-        name = fpath.name
-        is_test_file = in_test_dir or name.startswith("test_") or name.endswith("_test.py")
-        if not is_test_file:
-            continue
-        text = _read_text(fpath)
-        for match in _TEST_TAG_RE.finditer(text):
-            key = match.group(1)
-            rel = str(fpath.relative_to(project_path))
-            result.setdefault(key, [])
-            if rel not in result[key]:
-                result[key].append(rel)
-    return result
+    return scan_req_tags(project_path).test
 
 
 def extract_telemetry_req_keys(project_path: Path) -> dict[str, list[str]]:
@@ -159,18 +267,7 @@ def extract_telemetry_req_keys(project_path: Path) -> dict[str, list[str]]:
     Returns:
         Dict mapping each found REQ key to a list of relative file paths.
     """
-    result: dict[str, list[str]] = {}
-    for fpath in _walk_files(project_path, _PRUNE):
-        if not _is_text_file(fpath):
-            continue
-        text = _read_text(fpath)
-        for match in _TELEM_TAG_RE.finditer(text):
-            key = match.group(1)
-            rel = str(fpath.relative_to(project_path))
-            result.setdefault(key, [])
-            if rel not in result[key]:
-                result[key].append(rel)
-    return result
+    return scan_req_tags(project_path).telemetry
 
 
 # ---------------------------------------------------------------------------
@@ -242,13 +339,11 @@ def analyze_gaps(project_path: Path) -> dict:
         Dict conforming to the :class:`~genesis_nav.models.schemas.GapReport` schema.
     """
     spec_keys = extract_spec_req_keys(project_path)
-    code_keys = extract_code_req_keys(project_path)
-    test_keys = extract_test_req_keys(project_path)
-    telem_keys = extract_telemetry_req_keys(project_path)
+    tags = scan_req_tags(project_path)
 
-    layer1 = compute_gap_layer(spec_keys, code_keys, "CODE_GAP")
-    layer2 = compute_gap_layer(spec_keys, test_keys, "TEST_GAP")
-    layer3 = compute_gap_layer(spec_keys, telem_keys, "TELEMETRY_GAP")
+    layer1 = compute_gap_layer(spec_keys, tags.code, "CODE_GAP")
+    layer2 = compute_gap_layer(spec_keys, tags.test, "TEST_GAP")
+    layer3 = compute_gap_layer(spec_keys, tags.telemetry, "TELEMETRY_GAP")
 
     return {
         "project_id": project_path.name,
@@ -0,0 +1,213 @@
+"""Per-project cache of derived state, with strong ETags for conditional GETs.
+
+The detail, gap and queue endpoints rebuild everything they return on every
+GET — re-reading all events and feature vectors and re-walking the source
+tree — while the dashboard polls every project every few seconds.  Each
+derived value is a pure function of a few inputs, so it is cached under a
+key built from cheap stat() fingerprints of those inputs:
+
+``events``
+    ``events.jsonl`` (mtime_ns, size) and the sealed-segment manifest.
+``features``
+    (name, mtime_ns, size) of every feature vector in ``features/active``
+    and ``features/completed``.
+``source``
+    (path, mtime_ns, size) of every file the gap analyzer reads.
+
+The key doubles as a strong ETag.  A request whose ``If-None-Match`` matches
+gets a 304 without anything being recomputed.  If any input was modified in
+the last two seconds, no key is issued and the value is recomputed: a second
+write in the same mtime tick that kept the size would otherwise be missed.
+
+Only the newest value per (project, kind) is kept.  The cache never writes
+to a workspace (REQ-NFR-ARCH-002).
+"""
+
+# Implements: REQ-NFR-PERF-002
+# Implements: REQ-NFR-ARCH-002
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from genesis_nav.analyzers.gap_analyzer import source_files
+
+# Bump when a cached value's shape changes
+CACHE_VERSION = 1
+# Inputs modified this recently make a value uncacheable
+_RACY_NS = 2_000_000_000
+# (project, kind) slots kept before the least recently used is dropped
+_MAX_SLOTS = 512
+
+_AI_WORKSPACE = ".ai-workspace"
+_EVENTS_REL = f"{_AI_WORKSPACE}/events/events.jsonl"
+_MANIFEST_REL = f"{_AI_WORKSPACE}/events/segments/manifest.json"
+_FEATURE_DIRS = (f"{_AI_WORKSPACE}/features/active", f"{_AI_WORKSPACE}/features/completed")
+
+
+# ---------------------------------------------------------------------------
+# Input fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _stat_entry(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _events_entries(project_path: Path) -> list:
+    return [
+        ("events", _stat_entry(str(project_path / _EVENTS_REL))),
+        ("manifest", _stat_entry(str(project_path / _MANIFEST_REL))),
+    ]
+
+
+def _features_entries(project_path: Path) -> list:
+    entries: list = []
+    for rel in _FEATURE_DIRS:
+        try:
+            with os.scandir(project_path / rel) as it:
+                names = sorted(
+                    e.name for e in it if e.is_file() and e.name.endswith((".yml", ".yaml"))
+                )
+        except OSError:
+            continue
+        entries.extend((f"{rel}/{name}", _stat_entry(str(project_path / rel / name))) for name in names)
+    return entries
+
+
+def _source_entries(project_path: Path) -> list:
+    """Every file the gap analyzer reads, with its stat."""
+    return sorted((c.rel, _stat_entry(str(c.path))) for c in source_files(project_path))
+
+
+_INPUTS: dict[str, Callable[[Path], list]] = {
+    "events": _events_entries,
+    "features": _features_entries,
+    "source": _source_entries,
+}
+
+
+def derived_etag(
+    project_path: Path,
+    kind: str,
+    inputs: Iterable[str],
+    depends: Iterable[Optional[str]] = (),
+) -> Optional[str]:
+    """Return the strong ETag of *kind* for *project_path*, or ``None``.
+
+    Args:
+        project_path: Root of the Genesis project.
+        kind: Name of the derived value (e.g. ``"detail"``).
+        inputs: Names of the input fingerprints it depends on
+            (``"events"``, ``"features"``, ``"source"``).
+        depends: ETags of other derived values this one is built from.
+
+    Returns:
+        A quoted ETag string, or ``None`` if an input was modified within
+        the last two seconds or a dependency has no ETag (the value must
+        then be recomputed).
+    """
+    digest = hashlib.sha256(f"{CACHE_VERSION}\0{project_path}\0{kind}".encode())
+    for upstream in depends:
+        if upstream is None:
+            return None
+        digest.update(upstream.encode())
+    now = time.time_ns()
+    for name in inputs:
+        for entry in _INPUTS[name](project_path):
+            stat = entry[1]
+            if stat is not None and now - stat[0] <= _RACY_NS:
+                return None
+            digest.update(repr(entry).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Return True if an ``If-None-Match`` header value matches *etag*.
+
+    Args:
+        if_none_match: Raw header value (a list of entity tags or ``*``).
+        etag: The current ETag, or ``None`` if there is none.
+
+    Returns:
+        ``True`` when the client's copy is current and a 304 may be sent.
+    """
+    if not if_none_match or etag is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class DerivedStateCache:
+    """Newest derived value per (project, kind), keyed by its ETag.  Thread-safe.
+
+    Args:
+        max_slots: Number of (project, kind) slots kept (LRU).
+    """
+
+    def __init__(self, max_slots: int = _MAX_SLOTS) -> None:
+        self.max_slots = max_slots
+        self.hits = 0
+        self.misses = 0
+        self._slots: OrderedDict[tuple[str, str], tuple[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, project_path: Path, kind: str, etag: Optional[str], compute: Callable[[], Any]
+    ) -> Any:
+        """Return the cached value for *etag*, computing and storing it on a miss.
+
+        Args:
+            project_path: Root of the Genesis project.
+            kind: Name of the derived value.
+            etag: Key from :func:`derived_etag`; ``None`` always recomputes.
+            compute: Zero-argument function producing the value.
+
+        Returns:
+            The derived value.  Callers must not mutate it.
+        """
+        slot = (str(project_path), kind)
+        if etag is not None:
+            with self._lock:
+                cached = self._slots.get(slot)
+                if cached is not None and cached[0] == etag:
+                    self._slots.move_to_end(slot)
+                    self.hits += 1
+                    return cached[1]
+        with self._lock:
+            self.misses += 1
+        value = compute()
+        if etag is not None:
+            with self._lock:
+                self._slots[slot] = (etag, value)
+                self._slots.move_to_end(slot)
+                while len(self._slots) > self.max_slots:
+                    self._slots.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value and reset the counters."""
+        with self._lock:
+            self._slots.clear()
+            self.hits = self.misses = 0
+
+
+DERIVED_CACHE = DerivedStateCache()
@@ -11,6 +11,9 @@ environment-variable coupling and keeps the config explicit.
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -20,6 +23,7 @@ from genesis_nav.routers import gaps as gaps_router
 from genesis_nav.routers import history as history_router
 from genesis_nav.routers import projects as projects_router
 from genesis_nav.routers import queue as queue_router
+from genesis_nav.scanner.catalog import catalog_for
 
 # ---------------------------------------------------------------------------
 # Module-level config — set by cli.py before uvicorn starts
@@ -43,11 +47,27 @@ def get_root_dir() -> str:
 # ---------------------------------------------------------------------------
 
 
+@asynccontextmanager
+async def _lifespan(application: FastAPI):
+    """Keep the project catalog for the configured root warm while serving.
+
+    Args:
+        application: The application being started (unused).
+    """
+    catalog = catalog_for(Path(get_root_dir()))
+    catalog.start()
+    try:
+        yield
+    finally:
+        catalog.stop()
+
+
 def create_app() -> FastAPI:
     """Construct and configure the FastAPI application.
 
     Sets up CORS to allow the Vite dev server (port 5173) and any other
-    localhost origin, mounts all routers, and registers the /health endpoint.
+    localhost origin, mounts all routers, registers the /health endpoint and
+    runs the project catalog's background rescan for the app's lifetime.
 
     Returns:
         A fully configured :class:`fastapi.FastAPI` instance.
@@ -59,6 +79,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=_lifespan,
     )
 
     application.add_middleware(
@@ -6,7 +6,12 @@ All readers are pure read operations — no writes, no side effects (REQ-NFR-ARC
 # Implements: REQ-F-STAT-001, REQ-F-STAT-002, REQ-F-STAT-003, REQ-F-STAT-004
 # Implements: REQ-NFR-ARCH-002
 
-from genesis_nav.readers.event_reader import last_event_timestamp, read_events
+from genesis_nav.readers.event_reader import (
+    iter_events_reversed,
+    last_event_timestamp,
+    read_events,
+    read_tail_events,
+)
 from genesis_nav.readers.feature_reader import read_features
 from genesis_nav.readers.state_computer import (
     build_feature_detail,
@@ -16,6 +21,8 @@ from genesis_nav.readers.state_computer import (
 
 __all__ = [
     "read_events",
+    "read_tail_events",
+    "iter_events_reversed",
     "last_event_timestamp",
     "read_features",
     "compute_project_state",
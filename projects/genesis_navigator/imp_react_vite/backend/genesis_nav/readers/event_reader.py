@@ -1,30 +1,53 @@
 """Reader for Genesis workspace event streams.
 
 Reads ``events.jsonl`` from a workspace, skipping malformed lines silently.
-All operations are read-only (REQ-NFR-ARCH-002).
+A segmented log is read whole: the sealed segments the engine moved out of
+``events.jsonl`` come first, then the active file.  Callers that only need
+the newest events read the log backwards in chunks
+(:func:`iter_events_reversed`, :func:`read_tail_events`) instead of parsing
+all of it.  All operations are read-only (REQ-NFR-ARCH-002).
 """
 
 # Implements: REQ-F-STAT-002
 # Implements: REQ-F-STAT-004
+# Implements: REQ-NFR-PERF-001
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
 import json
+import os
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
 
 _AI_WORKSPACE = ".ai-workspace"
 _EVENTS_REL = f"{_AI_WORKSPACE}/events/events.jsonl"
+_SEGMENTS_DIR = "segments"
+# Bytes read per backward step when tailing a log
+_TAIL_CHUNK_BYTES = 65_536
 
 
-def read_events(workspace_path: Path) -> list[dict]:
+def read_events(
+    workspace_path: Path,
+    feature: str | None = None,
+    until: str | None = None,
+) -> list[dict]:
     """Read all events from the workspace event log.
 
     Reads ``.ai-workspace/events/events.jsonl`` and returns every valid JSON
     object as a dict.  Malformed lines are silently skipped.
 
+    Segmented logs are read in order: the sealed segments listed in
+    ``events/segments/manifest.json``, then the active ``events.jsonl``.
+    ``feature`` and ``until`` prune whole sealed segments using their
+    sidecar index; they do not filter individual events.
+
     Args:
         workspace_path: Absolute path to the Genesis project root.
+        feature: Skip sealed segments that never touch this feature.
+        until: ISO 8601 timestamp — skip sealed segments that start after it.
 
     Returns:
         List of parsed event dicts in file order.  Empty list if the file
@@ -35,24 +58,158 @@ def read_events(workspace_path: Path) -> list[dict]:
         return []
 
     events: list[dict] = []
+    for path in sealed_segments(events_file, feature, until):
+        events.extend(_read_jsonl(path))
     try:
-        with events_file.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        events.append(obj)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        events.extend(_read_jsonl(events_file, strict=True))
     except OSError:
         return []
 
     return events
 
 
+def _read_jsonl(path: Path, strict: bool = False) -> list[dict]:
+    """Parse one JSONL file.  OSError propagates only when *strict*."""
+    events: list[dict] = []
+    try:
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                event = _parse_line(line)
+                if event is not None:
+                    events.append(event)
+    except OSError:
+        if strict:
+            raise
+    return events
+
+
+def _parse_line(line: bytes | str) -> dict | None:
+    """Parse one JSONL line; ``None`` for blank, malformed or non-object lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        obj = json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def iter_events_reversed(
+    events_path: Path, chunk_size: int = _TAIL_CHUNK_BYTES
+) -> Iterator[dict]:
+    """Yield the events of a JSONL event log newest-first.
+
+    The file is read backwards in *chunk_size* blocks, so taking the first
+    few events costs one or two reads however long the log is.  Once it is
+    exhausted, the sealed segments next to it follow, newest first, so a
+    freshly sealed log still has its history.  Malformed lines are skipped;
+    a missing or unreadable file yields nothing.
+
+    Args:
+        events_path: Path to a JSONL event log.
+        chunk_size: Bytes read per backward step.
+
+    Yields:
+        Parsed event dicts, last line first.
+    """
+    yield from _iter_file_reversed(events_path, chunk_size)
+    for segment in reversed(sealed_segments(events_path)):
+        yield from _iter_file_reversed(segment, chunk_size)
+
+
+def _iter_file_reversed(events_path: Path, chunk_size: int) -> Iterator[dict]:
+    """Yield the events of one JSONL file newest-first."""
+    try:
+        fh = events_path.open("rb")
+    except OSError:
+        return
+    with fh:
+        try:
+            pos = fh.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0:
+                step = min(chunk_size, pos)
+                pos -= step
+                fh.seek(pos)
+                lines = (fh.read(step) + carry).split(b"\n")
+                # The first piece may continue in the previous chunk
+                carry = lines[0]
+                for line in reversed(lines[1:]):
+                    event = _parse_line(line)
+                    if event is not None:
+                        yield event
+        except OSError:
+            return
+        event = _parse_line(carry)
+        if event is not None:
+            yield event
+
+
+def read_tail_events(events_path: Path, n: int) -> list[dict]:
+    """Return the last *n* valid events of an event log, in log order.
+
+    Args:
+        events_path: Path to a JSONL event log.
+        n: Maximum number of events to return.
+
+    Returns:
+        Up to *n* parsed event dicts.  Empty list if the file is missing.
+    """
+    tail = list(islice(iter_events_reversed(events_path), n))
+    tail.reverse()
+    return tail
+
+
+def _parse_ts(value: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def sealed_segments(
+    events_path: Path, feature: str | None = None, until: str | None = None
+) -> list[Path]:
+    """Sealed segment files of *events_path*, in log order, whose sidecar index may match.
+
+    Segments and sidecars are written by the engine (``genesis.event_segments``)
+    to a ``segments/`` directory next to the active file.  A missing or
+    unreadable sidecar never prunes its segment.
+
+    Args:
+        events_path: Path to the active ``events.jsonl``.
+        feature: Skip segments that never touch this feature.
+        until: ISO 8601 timestamp — skip segments that start after it.
+
+    Returns:
+        Segment paths, oldest first.  Empty if the log was never sealed.
+    """
+    seg_dir = events_path.parent / _SEGMENTS_DIR
+    try:
+        manifest = json.loads((seg_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    limit = _parse_ts(until) if until else None
+
+    paths: list[Path] = []
+    for name in manifest.get("segments", []):
+        try:
+            index = json.loads(
+                (seg_dir / (name.removesuffix(".jsonl") + ".index.json")).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            index = {}
+        if feature is not None and "features" in index and feature not in index["features"]:
+            continue
+        first = _parse_ts(index.get("first_ts", "")) if index.get("first_ts") else None
+        if limit is not None and first is not None and first > limit:
+            continue
+        paths.append(seg_dir / name)
+    return paths
+
+
 def last_event_timestamp(events: list[dict]) -> str | None:
     """Return the ISO 8601 timestamp of the last event that carries one.
 
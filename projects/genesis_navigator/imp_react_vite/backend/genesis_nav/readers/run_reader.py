@@ -4,6 +4,14 @@ A "run" is a distinct events.jsonl snapshot — either the live workspace
 (run_id='current') or an archived e2e run directory discovered under
 ``tests/e2e/runs/e2e_*/``.
 
+Run summaries (the ``/runs`` listing) are kept in a process-wide cache keyed
+by the events file's (inode, mtime_ns, size).  An unchanged archived run is
+answered from a stat(); a log that only grew is parsed from where the cached
+summary stopped, after checking that the bytes just before that point are
+unchanged.  A file modified within the last two seconds is re-checked on
+every call.  A segmented log's sealed segments are cached the same way and
+summed with the active file.
+
 All operations are read-only (REQ-NFR-ARCH-002).
 """
 
@@ -11,47 +19,117 @@ All operations are read-only (REQ-NFR-ARCH-002).
 # Implements: REQ-F-HIST-002
 # Implements: REQ-F-HIST-003
 # Implements: REQ-F-API-005
+# Implements: REQ-NFR-PERF-001
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
-import json
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from genesis_nav.readers.event_reader import _parse_line, _read_jsonl, sealed_segments
+
 _WORKSPACE_EVENTS = ".ai-workspace/events/events.jsonl"
 _E2E_RUNS_GLOB = "tests/e2e/runs/e2e_*"
+# Files modified this recently are never answered from the summary cache
+_RACY_NS = 2_000_000_000
+# Run summaries kept before the least recently used is dropped
+_MAX_CACHED_RUNS = 1024
+# Bytes before the resume offset compared to detect a rewritten log
+_ANCHOR_BYTES = 256
 
 
 def _read_events_file(events_path: Path) -> list[dict]:
-    """Read and parse a JSONL events file, skipping malformed lines.
+    """Read and parse a JSONL events log, skipping malformed lines.
+
+    Sealed segments next to the file are read first, in log order.
 
     Args:
         events_path: Path to the events.jsonl file.
 
     Returns:
-        List of parsed event dicts in file order. Empty list if missing.
+        List of parsed event dicts in log order. Empty list if missing.
     """
     if not events_path.is_file():
         return []
     events: list[dict] = []
+    for path in sealed_segments(events_path):
+        events.extend(_read_jsonl(path))
     try:
-        with events_path.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        events.append(obj)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        events.extend(_read_jsonl(events_path, strict=True))
     except OSError:
         return []
     return events
 
 
+@dataclass
+class _RunStats:
+    """Running totals behind a run summary, fed one event at a time."""
+
+    timestamp: Optional[str] = None
+    event_count: int = 0
+    converged_pairs: set[tuple[str, str]] = field(default_factory=set)
+    converged_features: set[str] = field(default_factory=set)
+    iterating_features: set[str] = field(default_factory=set)
+
+    def merge(self, other: _RunStats) -> None:
+        """Fold in the totals of events that came after these."""
+        self.event_count += other.event_count
+        if self.timestamp is None:
+            self.timestamp = other.timestamp
+        self.converged_pairs |= other.converged_pairs
+        self.converged_features |= other.converged_features
+        self.iterating_features |= other.iterating_features
+
+    def add(self, e: dict) -> None:
+        """Fold one parsed event into the totals."""
+        self.event_count += 1
+        # First timestamp from any event (SDLC or OpenLineage)
+        if self.timestamp is None:
+            ts = e.get("timestamp") or e.get("eventTime")
+            if ts and isinstance(ts, str):
+                self.timestamp = ts
+        if "event_type" not in e:
+            return
+        etype = e.get("event_type", "")
+        if etype == "edge_converged":
+            # Count unique feature+edge pairs from edge_converged events
+            self.converged_pairs.add((e.get("feature", ""), e.get("edge", "")))
+        feat = e.get("feature")
+        if not feat:
+            return
+        if etype == "edge_converged":
+            self.converged_features.add(feat)
+        elif etype in ("edge_started", "iteration_completed"):
+            self.iterating_features.add(feat)
+
+    def summary(self, run_id: str, *, is_current: bool) -> dict:
+        """Return the RunSummary dict for the events added so far."""
+        # Determine final state from event stream
+        still_iterating = self.iterating_features - self.converged_features
+        if still_iterating:
+            final_state = "ITERATING"
+        elif self.converged_features:
+            final_state = "CONVERGED"
+        else:
+            final_state = "UNINITIALIZED"
+
+        return {
+            "run_id": run_id,
+            "timestamp": self.timestamp,
+            "event_count": self.event_count,
+            "edges_traversed": len(self.converged_pairs),
+            "final_state": final_state,
+            "is_current": is_current,
+        }
+
+
 def _compute_run_summary(events: list[dict], run_id: str, *, is_current: bool) -> dict:
     """Compute a run summary dict from a list of parsed events.
 
@@ -63,52 +141,134 @@ def _compute_run_summary(events: list[dict], run_id: str, *, is_current: bool) -
     Returns:
         Dict matching the RunSummary schema.
     """
-    # First timestamp from any event (SDLC or OpenLineage)
-    timestamp: Optional[str] = None
+    stats = _RunStats()
     for e in events:
-        ts = e.get("timestamp") or e.get("eventTime")
-        if ts and isinstance(ts, str):
-            timestamp = ts
-            break
-
-    # Count unique feature+edge pairs from edge_converged events
-    sdlc = [e for e in events if "event_type" in e]
-    converged_pairs: set[tuple[str, str]] = {
-        (e.get("feature", ""), e.get("edge", ""))
-        for e in sdlc
-        if e.get("event_type") == "edge_converged"
-    }
-    edges_traversed = len(converged_pairs)
+        stats.add(e)
+    return stats.summary(run_id, is_current=is_current)
 
-    # Determine final state from event stream
-    converged_features: set[str] = set()
-    iterating_features: set[str] = set()
-    for e in sdlc:
-        feat = e.get("feature")
-        if not feat:
-            continue
-        etype = e.get("event_type", "")
-        if etype == "edge_converged":
-            converged_features.add(feat)
-        elif etype in ("edge_started", "iteration_completed"):
-            iterating_features.add(feat)
 
-    still_iterating = iterating_features - converged_features
-    if still_iterating:
-        final_state = "ITERATING"
-    elif converged_features:
-        final_state = "CONVERGED"
-    else:
-        final_state = "UNINITIALIZED"
+@dataclass
+class _CachedRun:
+    """Totals for the complete lines of an events file, and its stat."""
+
+    stats: _RunStats
+    offset: int  # bytes consumed, always at a line boundary
+    anchor: bytes  # the last bytes consumed, to detect rewrites
+    ino: int
+    mtime_ns: int
+    size: int
+    tail: Optional[dict]  # a final line without newline that parsed, if any
 
-    return {
-        "run_id": run_id,
-        "timestamp": timestamp,
-        "event_count": len(events),
-        "edges_traversed": edges_traversed,
-        "final_state": final_state,
-        "is_current": is_current,
-    }
+
+class RunSummaryCache:
+    """Per-file run summary totals, validated by stat().  Thread-safe.
+
+    Args:
+        max_runs: Number of events files kept (LRU).
+    """
+
+    def __init__(self, max_runs: int = _MAX_CACHED_RUNS) -> None:
+        self.max_runs = max_runs
+        self.bytes_parsed = 0  # for tests/diagnostics
+        self._runs: OrderedDict[str, _CachedRun] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def summary(self, events_path: Path, run_id: str, *, is_current: bool) -> dict:
+        """Return the run summary for *events_path*, parsing only new bytes.
+
+        A segmented log is summarised across its sealed segments and the
+        active file; each file is cached on its own, and sealed segments
+        never change.
+
+        Args:
+            events_path: Path to the run's events file.
+            run_id: Identifier for this run.
+            is_current: Whether this is the live workspace run.
+
+        Returns:
+            Dict matching the RunSummary schema (empty totals if the file
+            is missing or unreadable).
+        """
+        active = self._file_run(events_path)
+        if active is None:
+            return _RunStats().summary(run_id, is_current=is_current)
+        stats = _RunStats()
+        for segment in sealed_segments(events_path):
+            cached = self._file_run(segment)
+            if cached is not None:
+                stats.merge(cached.stats)
+        stats.merge(active.stats)
+        if active.tail is not None:
+            stats.add(active.tail)
+        return stats.summary(run_id, is_current=is_current)
+
+    def _file_run(self, events_path: Path) -> Optional[_CachedRun]:
+        """Up-to-date totals for one file, or None if it cannot be read."""
+        key = str(events_path)
+        try:
+            st = os.stat(events_path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._runs.get(key)
+            if cached is not None:
+                self._runs.move_to_end(key)
+
+        unchanged = cached is not None and (cached.ino, cached.mtime_ns, cached.size) == (
+            st.st_ino,
+            st.st_mtime_ns,
+            st.st_size,
+        )
+        if not (unchanged and time.time_ns() - st.st_mtime_ns > _RACY_NS):
+            appended = cached is not None and cached.ino == st.st_ino and st.st_size >= cached.size
+            cached = self._scan(events_path, st, cached if appended else None)
+            if cached is None:
+                return None
+            with self._lock:
+                self._runs[key] = cached
+                self._runs.move_to_end(key)
+                while len(self._runs) > self.max_runs:
+                    self._runs.popitem(last=False)
+        return cached
+
+    def _scan(
+        self, events_path: Path, st: os.stat_result, base: Optional[_CachedRun]
+    ) -> Optional[_CachedRun]:
+        """Parse *events_path* from *base*'s offset (or the start) to the end."""
+        tail: Optional[dict] = None
+        try:
+            with events_path.open("rb") as fh:
+                if base is not None and base.anchor:
+                    fh.seek(base.offset - len(base.anchor))
+                    if fh.read(len(base.anchor)) != base.anchor:
+                        base = None  # rewritten, not appended to
+                stats = copy.deepcopy(base.stats) if base is not None else _RunStats()
+                offset = base.offset if base is not None else 0
+                anchor = base.anchor if base is not None else b""
+                fh.seek(offset)
+                for line in fh:
+                    self.bytes_parsed += len(line)
+                    if not line.endswith(b"\n"):
+                        # Possibly still being written: count it, but resume before it
+                        tail = _parse_line(line)
+                        break
+                    offset += len(line)
+                    anchor = (anchor + line)[-_ANCHOR_BYTES:]
+                    event = _parse_line(line)
+                    if event is not None:
+                        stats.add(event)
+        except OSError:
+            return None
+        return _CachedRun(stats, offset, anchor, st.st_ino, st.st_mtime_ns, st.st_size, tail)
+
+    def clear(self) -> None:
+        """Drop every cached summary."""
+        with self._lock:
+            self._runs.clear()
+            self.bytes_parsed = 0
+
+
+RUN_SUMMARY_CACHE = RunSummaryCache()
 
 
 def read_current_run(project_path: Path) -> dict:
@@ -121,8 +281,7 @@ def read_current_run(project_path: Path) -> dict:
         Dict matching RunSummary schema with run_id='current'.
     """
     events_path = project_path / _WORKSPACE_EVENTS
-    events = _read_events_file(events_path)
-    return _compute_run_summary(events, "current", is_current=True)
+    return RUN_SUMMARY_CACHE.summary(events_path, "current", is_current=True)
 
 
 def list_archived_runs(project_path: Path) -> list[dict]:
@@ -146,8 +305,7 @@ def list_archived_runs(project_path: Path) -> list[dict]:
             events_path = run_dir / ".ai-workspace" / "events" / "events.jsonl"
         if not events_path.is_file():
             continue
-        events = _read_events_file(events_path)
-        runs.append(_compute_run_summary(events, run_dir.name, is_current=False))
+        runs.append(RUN_SUMMARY_CACHE.summary(events_path, run_dir.name, is_current=False))
     return runs
 
 
@@ -1,8 +1,10 @@
 """Detail endpoint: GET /api/projects/{project_id}.
 
 Returns full feature-level data for a single Genesis project identified by
-``project_id``.  All data is derived by reading the workspace on-demand —
-no caching, no writes (REQ-NFR-ARCH-002).
+``project_id``.  The detail is derived from the workspace's events and
+feature vectors and cached until either changes; the response carries a
+strong ETag and a matching ``If-None-Match`` gets a 304.  No writes
+(REQ-NFR-ARCH-002).
 """
 
 # Implements: REQ-F-API-002
@@ -10,41 +12,47 @@ no caching, no writes (REQ-NFR-ARCH-002).
 # Implements: REQ-F-STAT-002
 # Implements: REQ-F-STAT-003
 # Implements: REQ-F-STAT-004
+# Implements: REQ-NFR-PERF-002
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 
 router = APIRouter()
 
 
 @router.get("/api/projects/{project_id}", tags=["projects"])
-def get_project_detail(project_id: str):
+def get_project_detail(
+    project_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
     """Return full detail for a single Genesis project.
 
-    Locates the project by scanning the configured workspace root, then reads
-    all feature vectors and events to build a
-    :class:`~genesis_nav.models.schemas.ProjectDetail` response.
+    Locates the project through the project catalog, then reads all feature
+    vectors and events to build a
+    :class:`~genesis_nav.models.schemas.ProjectDetail` response — unless the
+    cached detail for the same events and feature files can be reused.
 
     Args:
         project_id: The unique project identifier (as returned by
             ``GET /api/projects``).
+        response: Outgoing response, used to set the ``ETag`` header.
+        if_none_match: ``If-None-Match`` request header.
 
     Returns:
-        A :class:`~genesis_nav.models.schemas.ProjectDetail` dict.
+        A :class:`~genesis_nav.models.schemas.ProjectDetail` dict, or an
+        empty 304 response if the client's ETag is current.
 
     Raises:
         HTTPException: 404 if no project with ``project_id`` is found.
     """
     # Late imports to avoid circular dependency with main.py
     from genesis_nav import main as _main
-    from genesis_nav.models.schemas import EdgeTrajectory, FeatureDetail, ProjectDetail
-    from genesis_nav.readers.event_reader import read_events
-    from genesis_nav.readers.feature_reader import read_features
-    from genesis_nav.readers.state_computer import build_feature_detail, compute_project_state
+    from genesis_nav.derived_cache import DERIVED_CACHE, derived_etag, etag_matches
     from genesis_nav.scanner.workspace_scanner import get_project_path
 
     root = Path(_main.get_root_dir())
@@ -53,6 +61,35 @@ def get_project_detail(project_id: str):
     if project_path is None:
         raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found.")
 
+    etag = derived_etag(project_path, f"detail:{project_id}", ("events", "features"))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+    return DERIVED_CACHE.get(
+        project_path,
+        f"detail:{project_id}",
+        etag,
+        lambda: _build_project_detail(project_path, project_id),
+    )
+
+
+def _build_project_detail(project_path: Path, project_id: str):
+    """Read events and feature vectors and build the project's ProjectDetail.
+
+    Args:
+        project_path: Root of the Genesis project.
+        project_id: The project identifier to report.
+
+    Returns:
+        A :class:`~genesis_nav.models.schemas.ProjectDetail` instance.
+    """
+    from genesis_nav.models.schemas import EdgeTrajectory, FeatureDetail, ProjectDetail
+    from genesis_nav.readers.event_reader import read_events
+    from genesis_nav.readers.feature_reader import read_features
+    from genesis_nav.readers.state_computer import build_feature_detail, compute_project_state
+
     events = read_events(project_path)
     raw_features = read_features(project_path)
     state = compute_project_state(raw_features)
@@ -58,7 +58,8 @@ def get_feature_detail(project_id: str, feature_id: str):
     if project_path is None:
         raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found.")
 
-    events = read_events(project_path)
+    # Only segments touching this feature are read (build_feature_detail filters events)
+    events = read_events(project_path, feature=feature_id)
     raw_features = read_features(project_path)
 
     feature_dict = next(
@@ -1,23 +1,30 @@
 """Gap Analysis endpoint: GET /api/projects/{project_id}/gaps.
 
 Returns a three-layer traceability gap report for a single Genesis project.
-All data is derived on-demand — no caching, no writes (REQ-NFR-ARCH-002).
+The analysis is cached until a file it reads changes; the response carries a
+strong ETag and a matching ``If-None-Match`` gets a 304.  No writes
+(REQ-NFR-ARCH-002).
 """
 
 # Implements: REQ-F-API-003
+# Implements: REQ-NFR-PERF-002
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 
 router = APIRouter()
 
 
 @router.get("/api/projects/{project_id}/gaps", tags=["gaps"])
-def get_project_gaps(project_id: str):
+def get_project_gaps(
+    project_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
     """Return the three-layer gap analysis report for a Genesis project.
 
     Scans the project for ``specification/requirements/REQUIREMENTS.md`` to
@@ -28,15 +35,19 @@ def get_project_gaps(project_id: str):
     Args:
         project_id: The unique project identifier (as returned by
             ``GET /api/projects``).
+        response: Outgoing response, used to set the ``ETag`` header.
+        if_none_match: ``If-None-Match`` request header.
 
     Returns:
-        A :class:`~genesis_nav.models.schemas.GapReport` dict.
+        A :class:`~genesis_nav.models.schemas.GapReport` dict, or an empty
+        304 response if the client's ETag is current.
 
     Raises:
         HTTPException: 404 if no project with ``project_id`` is found.
     """
     from genesis_nav import main as _main
     from genesis_nav.analyzers.gap_analyzer import analyze_gaps
+    from genesis_nav.derived_cache import DERIVED_CACHE, derived_etag, etag_matches
     from genesis_nav.models.schemas import GapItem, GapLayer, GapReport
     from genesis_nav.scanner.workspace_scanner import get_project_path
 
@@ -46,8 +57,15 @@ def get_project_gaps(project_id: str):
     if project_path is None:
         raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found.")
 
-    raw = analyze_gaps(project_path)
-    raw["project_id"] = project_id
+    gaps_etag = derived_etag(project_path, "gaps", ("source",))
+    etag = derived_etag(project_path, f"gaps:{project_id}", (), depends=(gaps_etag,))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+    # Shared with the decision queue; the cached dict must not be mutated
+    raw = DERIVED_CACHE.get(project_path, "gaps", gaps_etag, lambda: analyze_gaps(project_path))
 
     def _make_layer(layer_dict: dict) -> GapLayer:
         return GapLayer(
@@ -57,7 +75,7 @@ def get_project_gaps(project_id: str):
         )
 
     return GapReport(
-        project_id=raw["project_id"],
+        project_id=project_id,
         computed_at=raw["computed_at"],
         health_signal=raw["health_signal"],
         layer_1=_make_layer(raw["layer_1"]),
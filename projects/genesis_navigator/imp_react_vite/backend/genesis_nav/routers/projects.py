@@ -1,6 +1,6 @@
 """FastAPI router for the /api/projects endpoint.
 
-Returns a list of ProjectSummary objects by delegating to the workspace scanner.
+Returns a list of ProjectSummary objects from the long-lived project catalog.
 """
 
 # Implements: REQ-F-API-001
@@ -13,7 +13,7 @@ from pathlib import Path
 from fastapi import APIRouter
 
 from genesis_nav.models.schemas import ProjectSummary
-from genesis_nav.scanner.workspace_scanner import scan_workspace
+from genesis_nav.scanner.catalog import catalog_for
 
 router = APIRouter(prefix="/api", tags=["projects"])
 
@@ -22,9 +22,10 @@ router = APIRouter(prefix="/api", tags=["projects"])
 def list_projects() -> list[ProjectSummary]:
     """Return all Genesis projects discovered under the configured root directory.
 
-    Scans the root directory set at startup via :mod:`genesis_nav.main`
-    ``_config["root_dir"]``. The scan is synchronous and runs in the request
-    thread; at ≤200 projects it completes well within the 2-second budget
+    Served from the project catalog for the root directory set at startup via
+    :mod:`genesis_nav.main` ``_config["root_dir"]``.  The root is re-walked
+    only when its directory structure changed, and a project's summary is
+    rebuilt only when its events or feature directories changed
     (REQ-NFR-PERF-001).
 
     Returns:
@@ -33,4 +34,4 @@ def list_projects() -> list[ProjectSummary]:
     import genesis_nav.main as _main  # late import avoids circular dependency
 
     root = Path(_main.get_root_dir())
-    return scan_workspace(root)
+    return catalog_for(root).summaries()
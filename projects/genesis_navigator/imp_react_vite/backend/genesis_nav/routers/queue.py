@@ -2,23 +2,30 @@
 
 Returns a ranked list of actionable items for a Genesis project, ordered by
 urgency (STUCK > BLOCKED > GAP_CLUSTER > IN_PROGRESS).
-All data is derived on-demand — no caching, no writes (REQ-NFR-ARCH-002).
+The queue is cached until the events, feature vectors or any file the gap
+analysis reads change; the response carries a strong ETag and a matching
+``If-None-Match`` gets a 304.  No writes (REQ-NFR-ARCH-002).
 """
 
 # Implements: REQ-F-API-004
+# Implements: REQ-NFR-PERF-002
 # Implements: REQ-NFR-ARCH-002
 
 from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
 
 router = APIRouter()
 
 
 @router.get("/api/projects/{project_id}/queue", tags=["queue"])
-def get_project_queue(project_id: str):
+def get_project_queue(
+    project_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
     """Return the ranked decision queue for a Genesis project.
 
     Combines feature vector status, event history, and gap analysis to surface
@@ -27,20 +34,20 @@ def get_project_queue(project_id: str):
     Args:
         project_id: The unique project identifier (as returned by
             ``GET /api/projects``).
+        response: Outgoing response, used to set the ``ETag`` header.
+        if_none_match: ``If-None-Match`` request header.
 
     Returns:
         List of :class:`~genesis_nav.models.schemas.QueueItem` dicts, sorted
-        by urgency.  Returns a single "healthy" item when no issues are found.
+        by urgency.  Returns a single "healthy" item when no issues are found,
+        or an empty 304 response if the client's ETag is current.
 
     Raises:
         HTTPException: 404 if no project with ``project_id`` is found.
     """
     from genesis_nav import main as _main
     from genesis_nav.analyzers.gap_analyzer import analyze_gaps
-    from genesis_nav.analyzers.queue_builder import build_queue_items
-    from genesis_nav.models.schemas import QueueItem, QueueItemDetail
-    from genesis_nav.readers.event_reader import read_events
-    from genesis_nav.readers.feature_reader import read_features
+    from genesis_nav.derived_cache import DERIVED_CACHE, derived_etag, etag_matches
     from genesis_nav.scanner.workspace_scanner import get_project_path
 
     root = Path(_main.get_root_dir())
@@ -49,9 +56,39 @@ def get_project_queue(project_id: str):
     if project_path is None:
         raise HTTPException(status_code=404, detail=f"Project '{project_id}' not found.")
 
+    gaps_etag = derived_etag(project_path, "gaps", ("source",))
+    etag = derived_etag(project_path, "queue", ("events", "features"), depends=(gaps_etag,))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+    def _build():
+        gaps = DERIVED_CACHE.get(
+            project_path, "gaps", gaps_etag, lambda: analyze_gaps(project_path)
+        )
+        return _build_queue(project_path, gaps)
+
+    return DERIVED_CACHE.get(project_path, "queue", etag, _build)
+
+
+def _build_queue(project_path: Path, gaps: dict):
+    """Read features and events and rank the project's decision queue.
+
+    Args:
+        project_path: Root of the Genesis project.
+        gaps: Gap analysis for the project (from ``analyze_gaps``).
+
+    Returns:
+        List of :class:`~genesis_nav.models.schemas.QueueItem` instances.
+    """
+    from genesis_nav.analyzers.queue_builder import build_queue_items
+    from genesis_nav.models.schemas import QueueItem, QueueItemDetail
+    from genesis_nav.readers.event_reader import read_events
+    from genesis_nav.readers.feature_reader import read_features
+
     features = read_features(project_path)
     events = read_events(project_path)
-    gaps = analyze_gaps(project_path)
 
     raw_items = build_queue_items(features, events, gaps)
 
@@ -1,6 +1,7 @@
 # Implements: REQ-F-NAV-001
 # Implements: REQ-NFR-ARCH-002
 
+from genesis_nav.scanner.catalog import ProjectCatalog, catalog_for
 from genesis_nav.scanner.workspace_scanner import scan_workspace
 
-__all__ = ["scan_workspace"]
+__all__ = ["ProjectCatalog", "catalog_for", "scan_workspace"]
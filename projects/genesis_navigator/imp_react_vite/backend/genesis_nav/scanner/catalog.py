@@ -0,0 +1,295 @@
+"""Long-lived project catalog: ``project_id → path`` map plus cached summaries.
+
+Every project endpoint used to resolve its ``project_id`` by running a full
+:func:`~genesis_nav.scanner.workspace_scanner.scan_workspace` — walking the
+scan root and building every project's summary (events tail, feature counts)
+— once per HTTP request.  The catalog keeps the result of one walk in memory:
+
+- :meth:`ProjectCatalog.get_path` answers from a dict.  Only an unknown id,
+  or a cached path whose ``.ai-workspace/`` has disappeared, triggers a
+  validation of the directory structure.
+- The structure is validated by re-stat'ing the directories the last walk
+  visited (the scan root, every non-project directory below it and every
+  project directory).  A changed mtime means a project may have been added,
+  removed or renamed, and the root is walked again.  Directories modified
+  within the last two seconds are treated as changed — a second change in
+  the same mtime tick would otherwise go unnoticed.
+- :meth:`ProjectCatalog.summaries` rebuilds a project's summary only when its
+  ``events.jsonl`` (mtime, size) or feature directories changed.
+- :meth:`ProjectCatalog.start` runs the validation on a background thread
+  every ``rescan_interval_s`` seconds, so new projects appear without a
+  request having to pay for the walk.
+
+Project ids are assigned in walk order exactly as :func:`scan_workspace`
+assigns them.  The catalog never writes to any workspace (REQ-NFR-ARCH-002).
+"""
+
+# Implements: REQ-F-NAV-001
+# Implements: REQ-NFR-PERF-001
+# Implements: REQ-NFR-ARCH-002
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from genesis_nav.models.schemas import ProjectSummary
+from genesis_nav.scanner.project_identity import derive_project_id
+from genesis_nav.scanner.workspace_scanner import (
+    _ACTIVE_FEATURES_REL,
+    _AI_WORKSPACE,
+    _COMPLETED_FEATURES_REL,
+    _EVENTS_REL,
+    _PRUNE_DIRS,
+    _build_summary,
+)
+
+# Seconds between background structure validations
+RESCAN_INTERVAL_S = 30.0
+# Directories modified this recently are re-checked on every validation
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class _CachedSummary:
+    """A built summary and the stat signature it was built from."""
+
+    summary: ProjectSummary
+    signature: tuple
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _signature(project_path: Path) -> tuple:
+    """Stat signature of everything a project's summary is derived from.
+
+    Args:
+        project_path: Project root directory.
+
+    Returns:
+        Tuple of ``events.jsonl`` (mtime_ns, size) and the mtimes of the
+        active/completed feature directories; ``None`` for missing entries.
+    """
+    try:
+        st = os.stat(project_path / _EVENTS_REL)
+        events = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        events = None
+    return (
+        events,
+        _mtime_ns(str(project_path / _ACTIVE_FEATURES_REL)),
+        _mtime_ns(str(project_path / _COMPLETED_FEATURES_REL)),
+    )
+
+
+def _discover(current: Path, projects: list[Path], dirs: dict[str, Optional[int]]) -> None:
+    """Walk *current* in :func:`scan_workspace` order, collecting project paths.
+
+    Args:
+        current: Directory being scanned in this call.
+        projects: Accumulator for discovered project directories.
+        dirs: Accumulator mapping every visited directory to its mtime_ns.
+    """
+    dirs[str(current)] = _mtime_ns(str(current))
+    try:
+        entries = list(os.scandir(current))
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return
+
+    has_ai_workspace = False
+    subdirs: list[Path] = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name in _PRUNE_DIRS:
+                continue
+            if entry.name == _AI_WORKSPACE:
+                has_ai_workspace = True
+            else:
+                subdirs.append(Path(entry.path))
+
+    if has_ai_workspace:
+        projects.append(current)
+        return
+
+    for subdir in subdirs:
+        _discover(subdir, projects, dirs)
+
+
+class ProjectCatalog:
+    """In-memory catalog of the Genesis projects under one scan root.
+
+    Thread-safe: request handlers and the background rescan thread share one
+    instance per root (see :func:`catalog_for`).
+
+    Args:
+        root: Directory to scan for Genesis projects.
+        rescan_interval_s: Seconds between background validations.
+    """
+
+    def __init__(self, root: Path, rescan_interval_s: float = RESCAN_INTERVAL_S) -> None:
+        self.root = Path(root).resolve()
+        self.rescan_interval_s = rescan_interval_s
+        self.walks = 0  # full structure walks performed (for tests/diagnostics)
+        self._lock = threading.RLock()
+        self._walked_at_ns: Optional[int] = None
+        self._dirs: dict[str, Optional[int]] = {}
+        self._order: list[tuple[str, Path]] = []
+        self._paths: dict[str, Path] = {}
+        self._summaries: dict[Path, _CachedSummary] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+
+    def _structure_changed(self) -> bool:
+        """Return True if any directory the last walk visited has changed."""
+        if self._walked_at_ns is None:
+            return True
+        for path, mtime in self._dirs.items():
+            if mtime is None or self._walked_at_ns - mtime <= _RACY_NS:
+                return True
+            if _mtime_ns(path) != mtime:
+                return True
+        return False
+
+    def refresh(self, force: bool = False) -> "ProjectCatalog":
+        """Re-walk the scan root if its directory structure changed.
+
+        Args:
+            force: Walk even if no directory mtime changed.
+
+        Returns:
+            ``self``, for chaining.
+        """
+        with self._lock:
+            if not force and not self._structure_changed():
+                return self
+            walked_at = time.time_ns()
+            projects: list[Path] = []
+            dirs: dict[str, Optional[int]] = {}
+            _discover(self.root, projects, dirs)
+
+            seen_names: set[str] = set()
+            self._order = [
+                (derive_project_id(path, self.root, seen_names), path) for path in projects
+            ]
+            self._paths = {}
+            for project_id, path in self._order:
+                # First match wins, as in a linear search of scan_workspace()
+                self._paths.setdefault(project_id, path)
+            live = set(projects)
+            self._summaries = {p: s for p, s in self._summaries.items() if p in live}
+            self._dirs = dirs
+            self._walked_at_ns = walked_at
+            self.walks += 1
+        return self
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_path(self, project_id: str) -> Path | None:
+        """Return the project root for *project_id*, or ``None``.
+
+        A cached path is returned without touching the rest of the tree.
+
+        Args:
+            project_id: The project identifier (as returned by
+                ``GET /api/projects``).
+
+        Returns:
+            :class:`~pathlib.Path` to the project root, or ``None``.
+        """
+        with self._lock:
+            path = self._paths.get(project_id)
+            if path is not None and (path / _AI_WORKSPACE).is_dir():
+                return path
+            self.refresh(force=path is not None)
+            return self._paths.get(project_id)
+
+    def summaries(self) -> list[ProjectSummary]:
+        """Return one summary per project, in scan order.
+
+        Only summaries whose inputs changed since they were built are rebuilt.
+
+        Returns:
+            List of :class:`~genesis_nav.models.schemas.ProjectSummary` objects.
+        """
+        with self._lock:
+            self.refresh()
+            results: list[ProjectSummary] = []
+            for project_id, path in self._order:
+                signature = _signature(path)
+                cached = self._summaries.get(path)
+                if cached is None or cached.signature != signature:
+                    t0 = time.perf_counter()
+                    summary = _build_summary(path, self.root, set())
+                    elapsed_ms = (time.perf_counter() - t0) * 1000.0
+                    summary = summary.model_copy(update={"scan_duration_ms": elapsed_ms})
+                    cached = self._summaries[path] = _CachedSummary(summary, signature)
+                if cached.summary.project_id != project_id:
+                    cached.summary = cached.summary.model_copy(update={"project_id": project_id})
+                results.append(cached.summary)
+            return results
+
+    # ------------------------------------------------------------------
+    # Background rescan
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background validation thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="genesis-nav-catalog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background validation thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.summaries()
+            except Exception:  # keep the thread alive; requests fall back to refresh()
+                pass
+            if self._stop.wait(self.rescan_interval_s):
+                return
+
+
+_CATALOGS: dict[str, ProjectCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def catalog_for(root: Path) -> ProjectCatalog:
+    """Return the process-wide :class:`ProjectCatalog` for *root*.
+
+    Args:
+        root: Scan root directory (relative paths are resolved).
+
+    Returns:
+        The shared catalog instance for the resolved root.
+    """
+    key = str(Path(root).resolve())
+    with _CATALOGS_LOCK:
+        catalog = _CATALOGS.get(key)
+        if catalog is None:
+            catalog = _CATALOGS[key] = ProjectCatalog(Path(key))
+        return catalog
@@ -16,13 +16,13 @@ Pruned directories (never descended into): ``.git``, ``node_modules``,
 
 from __future__ import annotations
 
-import json
 import os
 import time
 from pathlib import Path
 from typing import Optional
 
 from genesis_nav.models.schemas import ProjectState, ProjectSummary
+from genesis_nav.readers.event_reader import read_tail_events
 from genesis_nav.scanner.project_identity import derive_project_id
 
 _PRUNE_DIRS: frozenset[str] = frozenset({".git", "node_modules", "__pycache__", ".venv"})
@@ -34,15 +34,15 @@ _COMPLETED_FEATURES_REL = os.path.join(_AI_WORKSPACE, "features", "completed")
 
 # Number of tail events to inspect for state computation
 _STATE_WINDOW = 50
-# Approximate max bytes to read from the tail of events.jsonl for state window
-_TAIL_READ_BYTES = 32_768  # 32 KiB — plenty for 50 JSON lines
 
 
 def get_project_path(root: Path, project_id: str) -> Path | None:
     """Find the filesystem path for a project given its project_id.
 
-    Performs a full workspace scan and returns the path of the project whose
-    ``project_id`` matches.  Returns ``None`` if no match is found.
+    Resolves through the long-lived :class:`~genesis_nav.scanner.catalog.ProjectCatalog`
+    for *root*: a known id is answered from memory, and the root is only
+    re-walked when its directory structure changed.  Returns ``None`` if no
+    match is found.
 
     Args:
         root: Absolute path to the directory to scan.
@@ -52,11 +52,9 @@ def get_project_path(root: Path, project_id: str) -> Path | None:
     Returns:
         :class:`~pathlib.Path` to the project root, or ``None``.
     """
-    summaries = scan_workspace(root)
-    for summary in summaries:
-        if summary.project_id == project_id:
-            return Path(summary.path)
-    return None
+    from genesis_nav.scanner.catalog import catalog_for  # catalog imports this module
+
+    return catalog_for(root).get_path(project_id)
 
 
 def scan_workspace(root: Path) -> list[ProjectSummary]:
@@ -170,8 +168,10 @@ def _build_summary(project_path: Path, root: Path, seen_names: set[str]) -> Proj
 def _read_tail_events(events_jsonl: Path, n: int) -> list[dict]:
     """Read up to the last *n* valid JSON lines from *events_jsonl*.
 
-    Reads from the tail of the file for performance (REQ-NFR-PERF-001).
-    Malformed lines are silently skipped.
+    Reads backwards from the end of the file for performance
+    (REQ-NFR-PERF-001), however long the lines are, continuing into sealed
+    segments when the active file holds fewer than *n* events (right after
+    a seal it holds none).  Malformed lines are silently skipped.
 
     Args:
         events_jsonl: Path to ``events.jsonl``.
@@ -180,37 +180,7 @@ def _read_tail_events(events_jsonl: Path, n: int) -> list[dict]:
     Returns:
         List of parsed event dicts, up to *n* entries, in file order.
     """
-    try:
-        size = events_jsonl.stat().st_size
-    except OSError:
-        return []
-
-    read_offset = max(0, size - _TAIL_READ_BYTES)
-    try:
-        with events_jsonl.open("rb") as fh:
-            fh.seek(read_offset)
-            raw = fh.read()
-    except OSError:
-        return []
-
-    lines = raw.splitlines()
-    # If we sought mid-file the first partial line should be discarded
-    if read_offset > 0 and lines:
-        lines = lines[1:]
-
-    events: list[dict] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-            if isinstance(obj, dict):
-                events.append(obj)
-        except (json.JSONDecodeError, ValueError):
-            continue
-
-    return events[-n:]
+    return read_tail_events(events_jsonl, n)
 
 
 def _compute_state(events: list[dict]) -> ProjectState:
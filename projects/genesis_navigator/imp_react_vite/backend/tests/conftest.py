@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import builtins
 import json
+import os
+import time
 from pathlib import Path
 from typing import Callable
 
@@ -118,3 +120,21 @@ def assert_no_writes(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(builtins, "open", _patched_open)
     yield writes
     assert writes == [], f"Unexpected filesystem writes detected: {writes}"
+
+
+@pytest.fixture
+def backdate() -> Callable[..., None]:
+    """Fixture returning ``backdate(root, seconds=60.0)``.
+
+    Sets the mtime of every file and directory under *root* to *seconds* ago,
+    moving them out of the two-second racy window of the navigator's caches.
+    """
+
+    def _backdate(root: Path, seconds: float = 60.0) -> None:
+        old = time.time() - seconds
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                os.utime(os.path.join(dirpath, name), (old, old))
+            os.utime(dirpath, (old, old))
+
+    return _backdate
@@ -9,6 +9,7 @@ and the GET /api/projects/{project_id}/gaps endpoint.
 # Validates: REQ-F-GAP-003
 # Validates: REQ-F-GAP-004
 # Validates: REQ-F-API-003
+# Validates: REQ-NFR-PERF-002
 
 from __future__ import annotations
 
@@ -18,6 +19,7 @@ from typing import Callable
 import pytest
 from fastapi.testclient import TestClient
 
+import genesis_nav.analyzers.gap_analyzer as _gap_analyzer
 import genesis_nav.main as _main
 from genesis_nav.analyzers.gap_analyzer import (
     analyze_gaps,
@@ -27,6 +29,7 @@ from genesis_nav.analyzers.gap_analyzer import (
     extract_spec_req_keys,
     extract_telemetry_req_keys,
     extract_test_req_keys,
+    scan_req_tags,
 )
 from genesis_nav.main import create_app
 
@@ -283,6 +286,52 @@ class TestGapAnalyzer:
         assert result["health_signal"] == "RED"
 
 
+    # ---- scan_req_tags ----
+
+    def test_scan_reads_each_file_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """One pass collects all three layers, reading every text file once."""
+        project = _make_project(tmp_path)
+        _write(project / "src" / "auth.py", '# Implements: REQ-F-AUTH-001\nlog(req="REQ-F-AUTH-001")\n')
+        _write(project / "tests" / "test_auth.py", "# Validates: REQ-F-AUTH-001\n")
+        _write(project / "docs" / "notes.md", "nothing tagged\n")
+        reads: list[Path] = []
+        real_read = _gap_analyzer._read_text
+        monkeypatch.setattr(
+            _gap_analyzer, "_read_text", lambda path: reads.append(path) or real_read(path)
+        )
+        analyze_gaps(project)
+        assert sorted(p.name for p in reads) == ["auth.py", "notes.md", "test_auth.py"]
+
+    def test_scan_matches_separate_extractors(self, tmp_path: Path) -> None:
+        """Layers match the per-layer extractors, with each file listed once."""
+        project = _make_project(tmp_path)
+        _write(project / "src" / "a.py", "# Implements: REQ-F-A-001\n# Implements: REQ-F-A-001\n")
+        _write(project / "src" / "b.py", '# Implements: REQ-F-A-001\nemit(req=\'REQ-F-A-001\')\n')
+        _write(project / "tests" / "test_a.py", "# Implements: REQ-F-B-001\n# Validates: REQ-F-A-001\n")
+        _write(project / "pkg" / "a_test.py", "# Validates: REQ-F-A-001\n")
+        _write(project / "pkg" / "helper.py", "# Validates: REQ-F-C-001\n")
+        scan = scan_req_tags(project)
+        assert scan.code == extract_code_req_keys(project)
+        assert sorted(scan.code["REQ-F-A-001"]) == ["src/a.py", "src/b.py"]
+        assert "REQ-F-B-001" not in scan.code
+        assert sorted(scan.test["REQ-F-A-001"]) == ["pkg/a_test.py", "tests/test_a.py"]
+        assert "REQ-F-C-001" not in scan.test
+        assert scan.telemetry == {"REQ-F-A-001": ["src/b.py"]}
+
+    def test_parallel_scan_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The thread-pool scan returns the same layers in the same order."""
+        project = _make_project(tmp_path)
+        for i in range(40):
+            _write(project / "src" / f"m{i:02d}.py", f"# Implements: REQ-F-M-{i % 7:03d}\n")
+            _write(project / "tests" / f"test_m{i:02d}.py", f"# Validates: REQ-F-M-{i % 5:03d}\n")
+        monkeypatch.setattr(_gap_analyzer, "_PARALLEL_MIN_FILES", 1)
+        assert scan_req_tags(project, max_workers=4) == scan_req_tags(project, max_workers=1)
+
+
 # ---------------------------------------------------------------------------
 # TestGapsEndpoint — HTTP tests for GET /api/projects/{id}/gaps
 # ---------------------------------------------------------------------------
@@ -385,3 +434,32 @@ class TestGapsEndpoint:
         gap_keys = {g["req_key"] for g in data["layer_1"]["gaps"]}
         assert "REQ-F-AUTH-001" not in gap_keys
         assert "REQ-F-AUTH-002" in gap_keys
+
+    def test_etag_and_304(self, tmp_workspace: tuple[Path, Callable], backdate) -> None:
+        """An unchanged source tree answers If-None-Match with 304."""
+        root, make_project = tmp_workspace
+        make_project("zeta")
+        backdate(root)
+        self._set_root(root)
+        etag = self._client.get("/api/projects/zeta/gaps").headers["etag"]
+        resp = self._client.get("/api/projects/zeta/gaps", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_source_change_invalidates_gaps(
+        self, tmp_workspace: tuple[Path, Callable], backdate
+    ) -> None:
+        """Tagging a key in source drops it from the cached gap list."""
+        root, make_project = tmp_workspace
+        project = make_project("eta")
+        _write(project / "specification" / "requirements" / "REQUIREMENTS.md", "REQ-F-AUTH-001\n")
+        backdate(root, 120.0)
+        self._set_root(root)
+        resp = self._client.get("/api/projects/eta/gaps")
+        etag = resp.headers["etag"]
+        assert resp.json()["layer_1"]["gap_count"] == 1
+
+        _write(project / "src" / "auth.py", "# Implements: REQ-F-AUTH-001\n")
+        backdate(root)
+        resp = self._client.get("/api/projects/eta/gaps", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["layer_1"]["gap_count"] == 0
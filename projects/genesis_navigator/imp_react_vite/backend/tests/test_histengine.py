@@ -4,6 +4,7 @@ Validates: REQ-F-HIST-001
 Validates: REQ-F-HIST-002
 Validates: REQ-F-HIST-003
 Validates: REQ-F-API-005
+Validates: REQ-NFR-PERF-001
 Validates: REQ-NFR-ARCH-002
 """
 
@@ -11,6 +12,7 @@ Validates: REQ-NFR-ARCH-002
 # Validates: REQ-F-HIST-002
 # Validates: REQ-F-HIST-003
 # Validates: REQ-F-API-005
+# Validates: REQ-NFR-PERF-001
 # Validates: REQ-NFR-ARCH-002
 
 from __future__ import annotations
@@ -202,6 +204,71 @@ class TestListAllRuns:
         assert runs[1]["run_id"] == "e2e_001"
 
 
+class TestRunSummaryCache:
+    """Tests for the stat-validated run summary cache."""
+
+    def _log(self, path: Path, events: list[dict]) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(json.dumps(e) + "\n" for e in events))
+        return path
+
+    def test_unchanged_run_not_reparsed(self, tmp_path, backdate):
+        """REQ-NFR-PERF-001: a second listing only stats archived runs."""
+        from genesis_nav.readers.run_reader import RunSummaryCache
+        path = self._log(tmp_path / "events.jsonl", [_EDGE_STARTED, _EDGE_CONVERGED])
+        backdate(tmp_path)
+        cache = RunSummaryCache()
+        first = cache.summary(path, "e2e_001", is_current=False)
+        parsed = cache.bytes_parsed
+        assert cache.summary(path, "e2e_001", is_current=False) == first
+        assert cache.bytes_parsed == parsed
+        assert first["event_count"] == 2
+        assert first["final_state"] == "CONVERGED"
+
+    def test_appended_events_parsed_incrementally(self, tmp_path, backdate):
+        """Only bytes appended since the last summary are parsed."""
+        from genesis_nav.readers.run_reader import RunSummaryCache, _compute_run_summary
+        path = self._log(tmp_path / "events.jsonl", [_EDGE_STARTED])
+        backdate(tmp_path, 120.0)
+        cache = RunSummaryCache()
+        cache.summary(path, "current", is_current=True)
+        parsed = cache.bytes_parsed
+        extra = "".join(json.dumps(e) + "\n" for e in (_ITER_COMPLETED, _EDGE_CONVERGED))
+        with path.open("a") as fh:
+            fh.write(extra)
+        backdate(tmp_path)
+        summary = cache.summary(path, "current", is_current=True)
+        assert cache.bytes_parsed - parsed == len(extra.encode())
+        expected = _compute_run_summary(
+            [_EDGE_STARTED, _ITER_COMPLETED, _EDGE_CONVERGED], "current", is_current=True
+        )
+        assert summary == expected
+
+    def test_rewritten_log_reparsed(self, tmp_path, backdate):
+        """A log rewritten in place (not appended to) is parsed from the start."""
+        from genesis_nav.readers.run_reader import RunSummaryCache
+        path = self._log(tmp_path / "events.jsonl", [_EDGE_CONVERGED])
+        backdate(tmp_path, 120.0)
+        cache = RunSummaryCache()
+        assert cache.summary(path, "r", is_current=False)["final_state"] == "CONVERGED"
+        self._log(path, [_EDGE_STARTED, _EDGE_STARTED])
+        backdate(tmp_path)
+        summary = cache.summary(path, "r", is_current=False)
+        assert summary["event_count"] == 2
+        assert summary["final_state"] == "ITERATING"
+
+    def test_unterminated_line_counted_but_not_committed(self, tmp_path):
+        """A partial last line counts once complete, without double counting."""
+        from genesis_nav.readers.run_reader import RunSummaryCache
+        path = tmp_path / "events.jsonl"
+        path.write_text(json.dumps(_EDGE_STARTED) + "\n" + json.dumps(_EDGE_CONVERGED))
+        cache = RunSummaryCache()
+        assert cache.summary(path, "r", is_current=False)["event_count"] == 2
+        with path.open("a") as fh:
+            fh.write("\n")
+        assert cache.summary(path, "r", is_current=False)["event_count"] == 2
+
+
 class TestBuildTimelineSegments:
     """Tests for _build_timeline_segments()."""
 
@@ -266,6 +333,48 @@ class TestReadRunTimeline:
         assert result["event_count"] == 1
 
 
+class TestSealedLog:
+    """Readers see events the engine has moved into sealed segments."""
+
+    @staticmethod
+    def _sealed_workspace(tmp_path: Path) -> Path:
+        """A workspace whose whole log is sealed, leaving events.jsonl empty."""
+        proj = _make_workspace(tmp_path, [_EDGE_STARTED, _ITER_COMPLETED, _EDGE_CONVERGED])
+        events_dir = proj / ".ai-workspace" / "events"
+        seg_dir = events_dir / "segments"
+        seg_dir.mkdir()
+        (events_dir / "events.jsonl").rename(seg_dir / "000001.jsonl")
+        (seg_dir / "manifest.json").write_text(json.dumps({"version": 1, "segments": ["000001.jsonl"]}))
+        (events_dir / "events.jsonl").write_text("")
+        return proj
+
+    def test_current_run_counts_sealed_events(self, tmp_path):
+        """REQ-F-HIST-001: the current run summary includes sealed events."""
+        from genesis_nav.readers.run_reader import read_current_run
+        summary = read_current_run(self._sealed_workspace(tmp_path))
+        assert summary["event_count"] == 3
+        assert summary["final_state"] == "CONVERGED"
+
+    def test_current_timeline_includes_sealed_events(self, tmp_path):
+        """REQ-F-HIST-003: the current timeline includes sealed events."""
+        from genesis_nav.readers.run_reader import read_run_timeline
+        assert read_run_timeline(self._sealed_workspace(tmp_path), "current")["event_count"] == 3
+
+    def test_tail_events_reach_into_segments(self, tmp_path):
+        """The tail reader continues into sealed segments past the active file."""
+        from genesis_nav.readers.event_reader import read_tail_events
+        events_path = self._sealed_workspace(tmp_path) / ".ai-workspace" / "events" / "events.jsonl"
+        assert [e["event_type"] for e in read_tail_events(events_path, 2)] == [
+            "iteration_completed", "edge_converged",
+        ]
+
+    def test_scanner_last_event_from_segments(self, tmp_path):
+        """The project scanner reads the last event time from sealed segments."""
+        from genesis_nav.scanner.workspace_scanner import _build_summary
+        proj = self._sealed_workspace(tmp_path)
+        assert _build_summary(proj, tmp_path, set()).last_event_at is not None
+
+
 # ---------------------------------------------------------------------------
 # API endpoint tests
 # ---------------------------------------------------------------------------
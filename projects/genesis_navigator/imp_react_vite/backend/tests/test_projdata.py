@@ -21,8 +21,14 @@ import pytest
 from fastapi.testclient import TestClient
 
 import genesis_nav.main as _main
+from genesis_nav.derived_cache import DERIVED_CACHE, DerivedStateCache, etag_matches
 from genesis_nav.main import create_app
-from genesis_nav.readers.event_reader import last_event_timestamp, read_events
+from genesis_nav.readers.event_reader import (
+    iter_events_reversed,
+    last_event_timestamp,
+    read_events,
+    read_tail_events,
+)
 from genesis_nav.readers.feature_reader import read_features
 from genesis_nav.readers.state_computer import (
     compute_hamiltonian,
@@ -119,6 +125,30 @@ class TestEventReader:
         """last_event_timestamp returns None for empty list."""
         assert last_event_timestamp([]) is None
 
+    def test_iter_events_reversed_across_chunks(self, tmp_path: Path) -> None:
+        """Events come back newest-first whatever the chunk size, skipping bad lines."""
+        path = tmp_path / "events.jsonl"
+        lines = [json.dumps({"n": i, "pad": "x" * (i * 7)}) for i in range(20)]
+        lines.insert(5, "not valid json")
+        path.write_text("\n".join(lines) + "\n\n")
+        for chunk_size in (1, 16, 100, 1 << 16):
+            ns = [e["n"] for e in iter_events_reversed(path, chunk_size=chunk_size)]
+            assert ns == list(range(19, -1, -1))
+
+    def test_iter_events_reversed_unterminated_last_line(self, tmp_path: Path) -> None:
+        """A final line without a newline is still returned first."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"n": 0}\n{"n": 1}')
+        assert [e["n"] for e in iter_events_reversed(path, chunk_size=4)] == [1, 0]
+
+    def test_read_tail_events(self, tmp_path: Path) -> None:
+        """read_tail_events returns the last n events in file order."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(json.dumps({"n": i}) + "\n" for i in range(100)))
+        assert [e["n"] for e in read_tail_events(path, 3)] == [97, 98, 99]
+        assert len(read_tail_events(path, 500)) == 100
+        assert read_tail_events(tmp_path / "missing.jsonl", 3) == []
+
 
 # ---------------------------------------------------------------------------
 # TestFeatureReader
@@ -509,3 +539,92 @@ class TestProjectDetailEndpoint:
         assert data["features"] == []
         assert data["total_edges"] == 0
         assert data["converged_edges"] == 0
+
+    def test_etag_and_304(self, tmp_workspace: tuple[Path, Callable], backdate) -> None:
+        """An unchanged project answers If-None-Match with 304 and no body."""
+        root, make_project = tmp_workspace
+        make_project("eta")
+        backdate(root)
+        self._set_root(root)
+        resp = self._client.get("/api/projects/eta")
+        etag = resp.headers["etag"]
+        resp = self._client.get("/api/projects/eta", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_changed_feature_changes_etag(
+        self, tmp_workspace: tuple[Path, Callable], backdate
+    ) -> None:
+        """Editing a feature vector invalidates the cached detail."""
+        root, make_project = tmp_workspace
+        project = make_project("theta")
+        _write_feature_yaml(_active_dir(project), "F1.yml", "feature_id: F1\nstatus: in_progress\n")
+        backdate(root, 120.0)
+        self._set_root(root)
+        resp = self._client.get("/api/projects/theta")
+        etag = resp.headers["etag"]
+        assert resp.json()["state"] == "ITERATING"
+
+        _write_feature_yaml(_active_dir(project), "F1.yml", "feature_id: F1\nstatus: converged\n")
+        backdate(root)
+        resp = self._client.get("/api/projects/theta", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert resp.json()["state"] == "CONVERGED"
+
+    def test_recently_modified_project_not_cached(
+        self, tmp_workspace: tuple[Path, Callable]
+    ) -> None:
+        """Inputs modified within the racy window get no ETag."""
+        root, make_project = tmp_workspace
+        make_project("iota")
+        self._set_root(root)
+        resp = self._client.get("/api/projects/iota")
+        assert resp.status_code == 200
+        assert "etag" not in resp.headers
+
+
+# ---------------------------------------------------------------------------
+# TestDerivedStateCache
+# ---------------------------------------------------------------------------
+
+
+class TestDerivedStateCache:
+    """Tests for the ETag-keyed derived state cache."""
+
+    def test_etag_matches(self) -> None:
+        """If-None-Match accepts lists, weak tags and the wildcard."""
+        assert etag_matches('"a"', '"a"')
+        assert etag_matches('"b", W/"a"', '"a"')
+        assert etag_matches("*", '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert not etag_matches(None, '"a"')
+        assert not etag_matches("*", None)
+
+    def test_hit_and_miss(self, tmp_path: Path) -> None:
+        """The value is recomputed only when the ETag changes."""
+        cache = DerivedStateCache()
+        calls: list[int] = []
+
+        def compute() -> int:
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get(tmp_path, "k", '"1"', compute) == 1
+        assert cache.get(tmp_path, "k", '"1"', compute) == 1
+        assert cache.get(tmp_path, "k", '"2"', compute) == 2
+        assert cache.get(tmp_path, "k", None, compute) == 3
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_lru_bound(self, tmp_path: Path) -> None:
+        """Least recently used slots are dropped beyond max_slots."""
+        cache = DerivedStateCache(max_slots=2)
+        for kind in ("a", "b", "c"):
+            cache.get(tmp_path, kind, '"1"', lambda: kind)
+        cache.get(tmp_path, "a", '"1"', lambda: "recomputed")
+        assert cache.misses == 4
+
+    def test_module_cache_clear(self) -> None:
+        """clear() empties the shared cache and resets its counters."""
+        DERIVED_CACHE.clear()
+        assert (DERIVED_CACHE.hits, DERIVED_CACHE.misses) == (0, 0)
@@ -9,9 +9,11 @@ GET /api/projects/{project_id}/queue endpoint.
 # Validates: REQ-F-QUEUE-002
 # Validates: REQ-F-QUEUE-003
 # Validates: REQ-F-API-004
+# Validates: REQ-NFR-PERF-002
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Callable
 
@@ -391,3 +393,31 @@ class TestQueueEndpoint:
         self._set_root(root)
         resp = self._client.get("/api/projects/no-such-project/queue")
         assert resp.status_code == 404
+
+    def test_etag_and_304(self, tmp_workspace: tuple[Path, Callable], backdate) -> None:
+        """An unchanged project answers If-None-Match with 304."""
+        root, make_project = tmp_workspace
+        make_project("epsilon")
+        backdate(root)
+        self._set_root(root)
+        etag = self._client.get("/api/projects/epsilon/queue").headers["etag"]
+        resp = self._client.get("/api/projects/epsilon/queue", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_new_event_changes_etag(
+        self, tmp_workspace: tuple[Path, Callable], backdate
+    ) -> None:
+        """Appending an event invalidates the cached queue."""
+        root, make_project = tmp_workspace
+        project = make_project("zeta")
+        backdate(root, 120.0)
+        self._set_root(root)
+        etag = self._client.get("/api/projects/zeta/queue").headers["etag"]
+
+        events = project / ".ai-workspace" / "events" / "events.jsonl"
+        with events.open("a") as fh:
+            fh.write(json.dumps(_iter_ev("REQ-F-A-001", 2)) + "\n")
+        backdate(root)
+        resp = self._client.get("/api/projects/zeta/queue", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
@@ -10,6 +10,7 @@ Structure
 ---------
 TestWorkspaceScanner   — scan_workspace() logic
 TestProjectIdentity    — derive_project_id() logic
+TestProjectCatalog     — cached project_id → path map and summaries
 TestProjectsEndpoint   — GET /api/projects via FastAPI TestClient
 TestReadOnlyInvariant  — zero-write guarantee (REQ-NFR-ARCH-002)
 """
@@ -17,6 +18,7 @@ TestReadOnlyInvariant  — zero-write guarantee (REQ-NFR-ARCH-002)
 from __future__ import annotations
 
 import json
+import os
 import time
 from pathlib import Path
 
@@ -26,6 +28,7 @@ from fastapi.testclient import TestClient
 import genesis_nav.main as _main
 from genesis_nav.main import app
 from genesis_nav.models.schemas import ProjectState, ProjectSummary
+from genesis_nav.scanner.catalog import ProjectCatalog, catalog_for
 from genesis_nav.scanner.project_identity import derive_project_id
 from genesis_nav.scanner.workspace_scanner import scan_workspace
 
@@ -574,6 +577,104 @@ class TestProjectIdentity:
         assert len({id_a, id_b, id_c}) == 3
 
 
+# ===========================================================================
+# TestProjectCatalog
+# ===========================================================================
+
+
+def _backdate(root: Path, seconds: float = 60.0) -> None:
+    """Move every mtime under *root* out of the catalog's racy window."""
+    old = time.time() - seconds
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (old, old))
+        os.utime(dirpath, (old, old))
+
+
+class TestProjectCatalog:
+    """Unit tests for ProjectCatalog — O(1) project resolution."""
+
+    def test_summaries_match_scan_workspace(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        make_project("alpha", active_features=["f1.yml"])
+        make_project("group/alpha")
+        make_project("beta")
+
+        expected = [(s.project_id, s.path) for s in scan_workspace(root)]
+        catalog = ProjectCatalog(root)
+        assert [(s.project_id, s.path) for s in catalog.summaries()] == expected
+        for project_id, path in reversed(expected):
+            first = next(p for pid, p in expected if pid == project_id)
+            assert catalog.get_path(project_id) == Path(first)
+
+    def test_known_id_resolved_without_rewalk(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        make_project("alpha")
+        _backdate(root)
+        catalog = ProjectCatalog(root)
+        catalog.get_path("alpha")
+        walks = catalog.walks
+        for _ in range(5):
+            assert catalog.get_path("alpha") == root.resolve() / "alpha"
+        catalog.summaries()
+        assert catalog.walks == walks
+
+    def test_new_project_found_on_miss(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        make_project("alpha")
+        _backdate(root)
+        catalog = ProjectCatalog(root)
+        assert catalog.get_path("beta") is None
+        make_project("beta")
+        assert catalog.get_path("beta") == root.resolve() / "beta"
+
+    def test_unknown_id_with_unchanged_tree_does_not_rewalk(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        make_project("alpha")
+        _backdate(root)
+        catalog = ProjectCatalog(root).refresh()
+        walks = catalog.walks
+        assert catalog.get_path("missing") is None
+        assert catalog.walks == walks
+
+    def test_removed_project_dropped(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        project = make_project("alpha")
+        catalog = ProjectCatalog(root)
+        assert catalog.get_path("alpha") is not None
+        (project / ".ai-workspace" / "events" / "events.jsonl").unlink()
+        (project / ".ai-workspace" / "events").rmdir()
+        (project / ".ai-workspace").rmdir()
+        assert catalog.get_path("alpha") is None
+
+    def test_summary_rebuilt_when_events_change(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        project = make_project("alpha")
+        catalog = ProjectCatalog(root)
+        assert catalog.summaries()[0].last_event_at == "2026-01-01T00:00:00Z"
+        events = project / ".ai-workspace" / "events" / "events.jsonl"
+        with events.open("a") as fh:
+            fh.write(json.dumps({"event_type": "x", "timestamp": "2026-02-01T00:00:00Z"}) + "\n")
+        assert catalog.summaries()[0].last_event_at == "2026-02-01T00:00:00Z"
+
+    def test_catalog_shared_per_root(self, tmp_path):
+        assert catalog_for(tmp_path) is catalog_for(tmp_path / ".")
+
+    def test_background_thread_starts_and_stops(self, tmp_workspace):
+        root, make_project = tmp_workspace
+        make_project("alpha")
+        catalog = ProjectCatalog(root, rescan_interval_s=0.01)
+        catalog.start()
+        try:
+            deadline = time.time() + 5
+            while catalog.walks == 0 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            catalog.stop()
+        assert catalog.walks >= 1
+        assert catalog._thread is None
+
+
 # ===========================================================================
 # TestProjectsEndpoint
 # ===========================================================================